@@ -86,6 +86,10 @@ arithmetic_binops_symbols = {
     'pow': '**',
 }
 
+# operators with integer operands that can have integer result, the others give float results
+int_result_binops = ('add', 'sub', 'mul')
+int_result_allowed_line = 'int_result_allowed = not (operands_are_series and fill_value_is_none)'
+
 comparison_binops_symbols = {
     'lt': '<',
     'gt': '>',
@@ -149,6 +153,8 @@ if __name__ == '__main__':
                 func_text = template_func_binop_ovld.replace('def ', f"@sdc_overload(sdc_{name})\ndef ", 1)
                 func_text = func_text.replace('binop', name)
                 func_text = func_text.replace(' + ', f' {arithmetic_binops_symbols[name]} ')
+                if name not in int_result_binops:
+                    func_text = func_text.replace(int_result_allowed_line, 'int_result_allowed = False')
                 file.write(f'\n\n{func_text}')
                 func_text = template_series_binop.replace('binop', name)
                 func_text = func_text.replace('def ', f"@sdc_overload_method(SeriesType, '{name}')\ndef ", 1)
@@ -39,15 +39,21 @@ import sdc.hiframes.boxing
 import sdc.timsort
 from sdc.decorators import jit
 
+import sdc.datatypes.hpat_pandas_dataframe_ewm_functions
+import sdc.datatypes.hpat_pandas_dataframe_expanding_functions
 import sdc.datatypes.hpat_pandas_dataframe_rolling_functions
+import sdc.datatypes.hpat_pandas_series_ewm_functions
+import sdc.datatypes.hpat_pandas_series_expanding_functions
 import sdc.datatypes.hpat_pandas_series_functions
 import sdc.datatypes.hpat_pandas_series_rolling_functions
 import sdc.datatypes.hpat_pandas_stringmethods_functions
 import sdc.datatypes.hpat_pandas_groupby_functions
+import sdc.datatypes.hpat_pandas_groupby_rolling_functions
 import sdc.datatypes.categorical.init
 import sdc.datatypes.series.init
 
 import sdc.extensions.indexes.range_index_ext
+import sdc.extensions.indexes.indexes_generic
 
 from ._version import get_versions
 
@@ -67,6 +73,7 @@ TODO: Needs to detect 'import Pandas' and align initialization according to it
 import sdc.rewrites.dataframe_constructor
 import sdc.rewrites.read_csv_consts
 import sdc.rewrites.dataframe_getitem_attribute
+import sdc.rewrites.series_arithmetic_fusion
 import sdc.datatypes.hpat_pandas_functions
 import sdc.datatypes.hpat_pandas_dataframe_functions
 
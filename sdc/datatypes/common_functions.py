@@ -46,6 +46,8 @@ import sdc
 from sdc.hiframes.api import isna
 from sdc.hiframes.pd_series_type import SeriesType
 from sdc.functions import numpy_like
+from sdc.functions.sort import (parallel_argsort, parallel_argsort_min_size, parallel_argsort_supported,
+                                parallel_radix_argsort)
 from sdc.str_arr_type import string_array_type, StringArrayType
 from sdc.datatypes.range_index_type import RangeIndexType
 from sdc.str_arr_ext import (num_total_chars, append_string_array_to,
@@ -209,6 +211,61 @@ def _hpat_ensure_array_capacity(new_size, arr):
     return res
 
 
+@sdc_register_jitable
+def _sdc_outer_join_sorted_merge(left, right, sorted_left, sorted_right, joined, lidx, ridx, fill):
+    """
+    Merges arrays in the order given by their stable sorting permutations in a way similar to pandas.join 'outer',
+    i.e. NaNs are never equal and are placed last, values equal in both arrays are joined as cartesian product.
+    Returns the size of the result and writes it into joined, lidx and ridx only if fill is True.
+    """
+    lsize, rsize = len(left), len(right)
+    i, j, k = 0, 0, 0
+    while (i < lsize and j < rsize):
+        left_pos, right_pos = sorted_left[i], sorted_right[j]
+        left_value, right_value = left[left_pos], right[right_pos]
+
+        if (left_value < right_value) or numpy.isnan(right_value):
+            if fill:
+                joined[k], lidx[k], ridx[k] = left_value, left_pos, -1
+            i += 1
+            k += 1
+        elif (left_value > right_value) or numpy.isnan(left_value):
+            if fill:
+                joined[k], lidx[k], ridx[k] = right_value, -1, right_pos
+            j += 1
+            k += 1
+        else:
+            # find ends of sequences of equal index values in left and right
+            ni, nj = i + 1, j + 1
+            while (ni < lsize and left[sorted_left[ni]] == left_value):
+                ni += 1
+            while (nj < rsize and right[sorted_right[nj]] == right_value):
+                nj += 1
+
+            if fill:
+                for s in range(i, ni):
+                    for t in range(j, nj):
+                        joined[k], lidx[k], ridx[k] = left_value, sorted_left[s], sorted_right[t]
+                        k += 1
+            else:
+                k += (ni - i) * (nj - j)
+            i = ni
+            j = nj
+
+    # fill the end of joined with remaining part of left or right
+    if fill:
+        for s in range(i, lsize):
+            joined[k], lidx[k], ridx[k] = left[sorted_left[s]], sorted_left[s], -1
+            k += 1
+        for t in range(j, rsize):
+            joined[k], lidx[k], ridx[k] = right[sorted_right[t]], -1, sorted_right[t]
+            k += 1
+    else:
+        k += (lsize - i) + (rsize - j)
+
+    return k
+
+
 def sdc_join_series_indexes(left, right):
     pass
 
@@ -258,104 +315,29 @@ def sdc_join_series_indexes_overload(left, right):
 
             def sdc_join_series_indexes_impl(left, right):
 
-                # allocate result arrays
-                lsize = len(left)
-                rsize = len(right)
-                est_total_size = int(1.1 * (lsize + rsize))
-
-                lidx = numpy.empty(est_total_size, numpy.int64)
-                ridx = numpy.empty(est_total_size, numpy.int64)
-                joined = numpy.empty(est_total_size, numba_common_dtype)
-
-                left_nan = []
-                right_nan = []
-                for i in range(lsize):
-                    if numpy.isnan(left[i]):
-                        left_nan.append(i)
-                for i in range(rsize):
-                    if numpy.isnan(right[i]):
-                        right_nan.append(i)
-
-                # sort arrays saving the old positions
-                sorted_left = numpy.argsort(left, kind='mergesort')
-                sorted_right = numpy.argsort(right, kind='mergesort')
-                # put the position of the nans in an increasing sequence
-                sorted_left[lsize-len(left_nan):] = left_nan
-                sorted_right[rsize-len(right_nan):] = right_nan
-
-                i, j, k = 0, 0, 0
-                while (i < lsize and j < rsize):
-                    joined = _hpat_ensure_array_capacity(k + 1, joined)
-                    lidx = _hpat_ensure_array_capacity(k + 1, lidx)
-                    ridx = _hpat_ensure_array_capacity(k + 1, ridx)
-
-                    left_index = left[sorted_left[i]]
-                    right_index = right[sorted_right[j]]
-
-                    if (left_index < right_index) or numpy.isnan(right_index):
-                        joined[k] = left_index
-                        lidx[k] = sorted_left[i]
-                        ridx[k] = -1
-                        i += 1
-                        k += 1
-                    elif (left_index > right_index) or numpy.isnan(left_index):
-                        joined[k] = right_index
-                        lidx[k] = -1
-                        ridx[k] = sorted_right[j]
-                        j += 1
-                        k += 1
-                    else:
-                        # find ends of sequences of equal index values in left and right
-                        ni, nj = i, j
-                        while (ni < lsize and left[sorted_left[ni]] == left_index):
-                            ni += 1
-                        while (nj < rsize and right[sorted_right[nj]] == right_index):
-                            nj += 1
-
-                        # join the blocks found into results
-                        for s in numpy.arange(i, ni, 1):
-                            block_size = nj - j
-                            to_joined = numpy.repeat(left_index, block_size)
-                            to_lidx = numpy.repeat(sorted_left[s], block_size)
-                            to_ridx = numpy.array([sorted_right[k] for k in numpy.arange(j, nj, 1)], numpy.int64)
-
-                            joined = _hpat_ensure_array_capacity(k + block_size, joined)
-                            lidx = _hpat_ensure_array_capacity(k + block_size, lidx)
-                            ridx = _hpat_ensure_array_capacity(k + block_size, ridx)
-
-                            joined[k:k + block_size] = to_joined
-                            lidx[k:k + block_size] = to_lidx
-                            ridx[k:k + block_size] = to_ridx
-                            k += block_size
-                        i = ni
-                        j = nj
-
-                # fill the end of joined with remaining part of left or right
-                if i < lsize:
-                    block_size = lsize - i
-                    joined = _hpat_ensure_array_capacity(k + block_size, joined)
-                    lidx = _hpat_ensure_array_capacity(k + block_size, lidx)
-                    ridx = _hpat_ensure_array_capacity(k + block_size, ridx)
-                    ridx[k: k + block_size] = numpy.repeat(-1, block_size)
-                    while i < lsize:
-                        joined[k] = left[sorted_left[i]]
-                        lidx[k] = sorted_left[i]
-                        i += 1
-                        k += 1
+                # already sorted indexes are merged as they are, others in order of their stable sort
+                # with NaNs placed last, which is parallel for large arrays
+                if numpy_like.is_monotonic(left):
+                    sorted_left = numpy.arange(len(left))
+                else:
+                    sorted_left = sdc_arrays_argsort(left, kind='mergesort')
+                if numpy_like.is_monotonic(right):
+                    sorted_right = numpy.arange(len(right))
+                else:
+                    sorted_right = sdc_arrays_argsort(right, kind='mergesort')
 
-                elif j < rsize:
-                    block_size = rsize - j
-                    joined = _hpat_ensure_array_capacity(k + block_size, joined)
-                    lidx = _hpat_ensure_array_capacity(k + block_size, lidx)
-                    ridx = _hpat_ensure_array_capacity(k + block_size, ridx)
-                    lidx[k: k + block_size] = numpy.repeat(-1, block_size)
-                    while j < rsize:
-                        joined[k] = right[sorted_right[j]]
-                        ridx[k] = sorted_right[j]
-                        j += 1
-                        k += 1
+                # the first pass finds the size of the result, so that it's allocated only once
+                empty_indexer = numpy.empty(0, numpy.int64)
+                size = _sdc_outer_join_sorted_merge(left, right, sorted_left, sorted_right,
+                                                    numpy.empty(0, numba_common_dtype), empty_indexer,
+                                                    empty_indexer, False)
+
+                joined = numpy.empty(size, numba_common_dtype)
+                lidx = numpy.empty(size, numpy.int64)
+                ridx = numpy.empty(size, numpy.int64)
+                _sdc_outer_join_sorted_merge(left, right, sorted_left, sorted_right, joined, lidx, ridx, True)
 
-                return joined[:k], lidx[:k], ridx[:k]
+                return joined, lidx, ridx
 
             return sdc_join_series_indexes_impl
 
@@ -520,8 +502,28 @@ def sdc_arrays_argsort_overload(A, kind='quicksort'):
     quicksort_func = quicksort.make_jit_quicksort().run_quicksort
 
     kind_is_default = isinstance(kind, str)
+    kind_is_radix = isinstance(kind, types.StringLiteral) and kind.literal_value == 'radix'
     if isinstance(A, types.Array):
+        # parallel argsort is stable, so it's used for large arrays regardless of kind
+        use_parallel_argsort = parallel_argsort_supported(A.dtype)
+
+        if kind_is_radix and use_parallel_argsort:
+            def _sdc_arrays_argsort_array_radix_impl(A, kind='quicksort'):
+                return parallel_radix_argsort(A)
+
+            return _sdc_arrays_argsort_array_radix_impl
+
+        if kind_is_radix:
+            # radix sort is stable, so stable sort is used for arrays it does not support
+            def _sdc_arrays_argsort_array_mergesort_impl(A, kind='quicksort'):
+                return numpy.argsort(A, kind='mergesort')
+
+            return _sdc_arrays_argsort_array_mergesort_impl
+
         def _sdc_arrays_argsort_array_impl(A, kind='quicksort'):
+            if use_parallel_argsort == True and len(A) >= parallel_argsort_min_size:  # noqa
+                return parallel_argsort(A)
+
             _kind = 'quicksort' if kind_is_default == True else kind  # noqa
             return numpy.argsort(A, kind=_kind)
 
@@ -540,7 +542,7 @@ def sdc_arrays_argsort_overload(A, kind='quicksort'):
                 zipped = list(zip(list(data), list(keys)))
                 zipped = quicksort_func(zipped)
                 argsorted = [zipped[i][1] for i in numpy.arange(len(data))]
-            elif kind == 'mergesort':
+            elif kind == 'mergesort' or kind == 'radix':
                 sdc.hiframes.sort.local_sort((data, ), (keys, ))
                 argsorted = list(keys)
             else:
@@ -0,0 +1,182 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+from numba.core.types import Boolean, Omitted
+from sdc.datatypes.hpat_pandas_dataframe_expanding_functions import (
+    check_df_window_pair_types, gen_df_window_method_impl)
+from sdc.datatypes.hpat_pandas_ewm_types import DataFrameEWMType
+from sdc.utilities.sdc_typing_utils import TypeChecker
+from sdc.utilities.utils import sdc_overload_method
+
+
+sdc_pandas_dataframe_ewm_docstring_tmpl = """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.core.window.EWM.{method_name}
+{limitations_block}
+    .. seealso::
+        :ref:`DataFrame.ewm <pandas.DataFrame.ewm>`
+            Calling object with a DataFrame.
+        :ref:`Series.ewm <pandas.Series.ewm>`
+            Calling object with a Series.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas DataFrame method :meth:`pandas.DataFrame.ewm.{method_name}()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_rolling.TestRolling.test_df_ewm
+
+    Parameters
+    ----------
+    self: :class:`pandas.DataFrame.ewm`
+        input arg{extra_params}
+
+    Returns
+    -------
+    :obj:`pandas.DataFrame`
+         returns :obj:`pandas.DataFrame` object
+"""
+
+
+def gen_df_ewm_method_impl(method_name, self, args=None, kws=None, other=None):
+    """Generate df.ewm method implementation based on name of the method"""
+    window = ('ewm(com=self._com, min_periods=self._min_periods, adjust=self._adjust, '
+              'ignore_na=self._ignore_na, axis=self._axis)')
+
+    return gen_df_window_method_impl(window, method_name, self, args=args, kws=kws, other=other)
+
+
+def check_df_ewm_bias_type(ty_checker, bias):
+    """Check type of parameter bias of df.ewm methods"""
+    if not isinstance(bias, (bool, Boolean, Omitted)):
+        ty_checker.raise_exc(bias, 'bool', 'bias')
+
+
+@sdc_overload_method(DataFrameEWMType, 'corr')
+def sdc_pandas_dataframe_ewm_corr(self, other=None, pairwise=None):
+
+    ty_checker = TypeChecker('Method ewm.corr().')
+    ty_checker.check(self, DataFrameEWMType)
+
+    check_df_window_pair_types(ty_checker, other, pairwise)
+
+    kws = {'other': 'None', 'pairwise': 'None'}
+
+    return gen_df_ewm_method_impl('corr', self, kws=kws, other=other)
+
+
+@sdc_overload_method(DataFrameEWMType, 'cov')
+def sdc_pandas_dataframe_ewm_cov(self, other=None, pairwise=None, bias=False):
+
+    ty_checker = TypeChecker('Method ewm.cov().')
+    ty_checker.check(self, DataFrameEWMType)
+
+    check_df_window_pair_types(ty_checker, other, pairwise)
+    check_df_ewm_bias_type(ty_checker, bias)
+
+    kws = {'other': 'None', 'pairwise': 'None', 'bias': 'False'}
+
+    return gen_df_ewm_method_impl('cov', self, kws=kws, other=other)
+
+
+@sdc_overload_method(DataFrameEWMType, 'mean')
+def sdc_pandas_dataframe_ewm_mean(self):
+
+    ty_checker = TypeChecker('Method ewm.mean().')
+    ty_checker.check(self, DataFrameEWMType)
+
+    return gen_df_ewm_method_impl('mean', self)
+
+
+@sdc_overload_method(DataFrameEWMType, 'std')
+def sdc_pandas_dataframe_ewm_std(self, bias=False):
+
+    ty_checker = TypeChecker('Method ewm.std().')
+    ty_checker.check(self, DataFrameEWMType)
+
+    check_df_ewm_bias_type(ty_checker, bias)
+
+    return gen_df_ewm_method_impl('std', self, kws={'bias': 'False'})
+
+
+@sdc_overload_method(DataFrameEWMType, 'var')
+def sdc_pandas_dataframe_ewm_var(self, bias=False):
+
+    ty_checker = TypeChecker('Method ewm.var().')
+    ty_checker.check(self, DataFrameEWMType)
+
+    check_df_ewm_bias_type(ty_checker, bias)
+
+    return gen_df_ewm_method_impl('var', self, kws={'bias': 'False'})
+
+
+pair_params_doc = """
+    other: :obj:`DataFrame` or :obj:`Series`
+        Other DataFrame/Series.
+    pairwise: :obj:`bool`
+        Calculate pairwise combinations of columns within a DataFrame.
+        *unsupported*"""
+bias_param_doc = """
+    bias: :obj:`bool`
+        Use a standard estimation bias correction."""
+pair_limitations_doc = """
+    Limitations
+    -----------
+    Resulting DataFrame has default index. Pairwise combinations of columns are unsupported.
+    """
+
+sdc_pandas_dataframe_ewm_corr.__doc__ = sdc_pandas_dataframe_ewm_docstring_tmpl.format(**{
+    'method_name': 'corr',
+    'limitations_block': pair_limitations_doc,
+    'extra_params': pair_params_doc
+})
+
+sdc_pandas_dataframe_ewm_cov.__doc__ = sdc_pandas_dataframe_ewm_docstring_tmpl.format(**{
+    'method_name': 'cov',
+    'limitations_block': pair_limitations_doc,
+    'extra_params': pair_params_doc + bias_param_doc
+})
+
+sdc_pandas_dataframe_ewm_mean.__doc__ = sdc_pandas_dataframe_ewm_docstring_tmpl.format(**{
+    'method_name': 'mean',
+    'limitations_block': '',
+    'extra_params': ''
+})
+
+sdc_pandas_dataframe_ewm_std.__doc__ = sdc_pandas_dataframe_ewm_docstring_tmpl.format(**{
+    'method_name': 'std',
+    'limitations_block': '',
+    'extra_params': bias_param_doc
+})
+
+sdc_pandas_dataframe_ewm_var.__doc__ = sdc_pandas_dataframe_ewm_docstring_tmpl.format(**{
+    'method_name': 'var',
+    'limitations_block': '',
+    'extra_params': bias_param_doc
+})
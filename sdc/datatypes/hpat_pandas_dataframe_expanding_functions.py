@@ -0,0 +1,296 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+import numpy
+import pandas
+
+from numba.core.types import float64, Boolean, Integer, NoneType, Omitted
+from sdc.datatypes.hpat_pandas_expanding_types import DataFrameExpandingType
+from sdc.hiframes.pd_dataframe_type import DataFrameType
+from sdc.hiframes.pd_series_type import SeriesType
+from sdc.utilities.sdc_typing_utils import TypeChecker, kwsparams2list
+from sdc.utilities.utils import sdc_overload_method
+
+
+sdc_pandas_dataframe_expanding_docstring_tmpl = """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.core.window.Expanding.{method_name}
+{limitations_block}
+    .. seealso::
+        :ref:`DataFrame.expanding <pandas.DataFrame.expanding>`
+            Calling object with a DataFrame.
+        :ref:`Series.expanding <pandas.Series.expanding>`
+            Calling object with a Series.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas DataFrame method :meth:`pandas.DataFrame.expanding.{method_name}()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_rolling.TestRolling.test_df_expanding
+
+    Parameters
+    ----------
+    self: :class:`pandas.DataFrame.expanding`
+        input arg{extra_params}
+
+    Returns
+    -------
+    :obj:`pandas.DataFrame`
+         returns :obj:`pandas.DataFrame` object
+"""
+
+
+def gen_df_window_method_impl(window, method_name, self, args=None, kws=None, other=None):
+    """
+    Generate implementation of df.expanding/df.ewm method applying the method of series windows
+    to each column, e.g. window='expanding(self._min_periods, self._center, self._axis)'.
+    Columns are matched by name if other is DataFrame.
+    """
+    args = args or []
+    kwargs = kws or {}
+
+    impl_params = ['self'] + args + kwsparams2list(kwargs)
+    impl_params_as_str = ', '.join(impl_params)
+    window_name = window.split('(')[0]
+
+    impl_name = f'_df_{window_name}_{method_name}_impl'
+    func_lines = [f'def {impl_name}({impl_params_as_str}):']
+
+    none_other = 'other' in kwargs and (isinstance(other, (Omitted, NoneType)) or other is None)
+    if 'pairwise' in kwargs:
+        # pairwise results of other DataFrame or the DataFrame itself are unsupported
+        default_pairwise = none_other
+        func_lines += [
+            '  if pairwise is None:',
+            f'    _pairwise = {default_pairwise}',
+            '  else:',
+            '    _pairwise = pairwise',
+            '  if _pairwise:',
+            f'    raise ValueError("Method {window_name}.{method_name}(). The object pairwise\\n expected: False")'
+        ]
+
+    method_kws = {k: k for k in kwargs if not (none_other and k == 'other')}
+    data_columns = {col: idx for idx, col in enumerate(self.data.columns)}
+    all_columns = list(data_columns)
+    if isinstance(other, DataFrameType):
+        other_columns = {col: idx for idx, col in enumerate(other.columns)}
+        all_columns += [col for col in other_columns if col not in data_columns]
+
+        data_length = 'len(self._data._data[0][0])' if data_columns else '0'
+        other_length = 'len(other._data[0][0])' if other_columns else '0'
+        func_lines += [f'  length = max([{data_length}, {other_length}])']
+
+    results = []
+    for col in all_columns:
+        res_data = f'result_data_{col}'
+        if col not in data_columns or (isinstance(other, DataFrameType) and col not in other.columns):
+            func_lines += [
+                f'  {res_data} = numpy.empty(length, dtype=float64)',
+                f'  {res_data}[:] = numpy.nan'
+            ]
+            results.append((col, res_data))
+            continue
+
+        col_loc = self.data.column_loc[col]
+        type_id, col_id = col_loc.type_id, col_loc.col_id
+        func_lines += [
+            f'  data_{col} = self._data._data[{type_id}][{col_id}]',
+            f'  series_{col} = pandas.Series(data_{col})',
+        ]
+        if isinstance(other, DataFrameType):
+            other_col_loc = other.column_loc[col]
+            func_lines += [
+                f'  other_data_{col} = other._data[{other_col_loc.type_id}][{other_col_loc.col_id}]',
+                f'  other_series_{col} = pandas.Series(other_data_{col})',
+            ]
+            method_kws['other'] = f'other_series_{col}'
+            result_length = 'length'
+        else:
+            result_length = f'len(data_{col})'
+
+        method_params = ', '.join(args + kwsparams2list(method_kws))
+        func_lines += [
+            f'  window_{col} = series_{col}.{window}',
+            f'  result_{col} = window_{col}.{method_name}({method_params})',
+            f'  {res_data} = result_{col}._data[:{result_length}]'
+        ]
+        results.append((col, res_data))
+
+    data = ', '.join(f'"{col}": {data}' for col, data in results)
+    func_lines += [f'  return pandas.DataFrame({{{data}}})']
+    func_text = '\n'.join(func_lines)
+
+    global_vars = {'numpy': numpy, 'pandas': pandas, 'float64': float64}
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    _impl = loc_vars[impl_name]
+
+    return _impl
+
+
+def gen_df_expanding_method_impl(method_name, self, args=None, kws=None, other=None):
+    """Generate df.expanding method implementation based on name of the method"""
+    window = 'expanding(self._min_periods, self._center, self._axis)'
+
+    return gen_df_window_method_impl(window, method_name, self, args=args, kws=kws, other=other)
+
+
+def check_df_window_pair_types(ty_checker, other, pairwise):
+    """Check types of parameters of df.expanding/df.ewm methods corr() and cov()"""
+    accepted_other = (Omitted, NoneType, DataFrameType, SeriesType)
+    if not isinstance(other, accepted_other) and other is not None:
+        ty_checker.raise_exc(other, 'DataFrame, Series', 'other')
+
+    accepted_pairwise = (bool, Boolean, Omitted, NoneType)
+    if not isinstance(pairwise, accepted_pairwise) and pairwise is not None:
+        ty_checker.raise_exc(pairwise, 'bool', 'pairwise')
+
+
+@sdc_overload_method(DataFrameExpandingType, 'corr')
+def sdc_pandas_dataframe_expanding_corr(self, other=None, pairwise=None):
+
+    ty_checker = TypeChecker('Method expanding.corr().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    check_df_window_pair_types(ty_checker, other, pairwise)
+
+    kws = {'other': 'None', 'pairwise': 'None'}
+
+    return gen_df_expanding_method_impl('corr', self, kws=kws, other=other)
+
+
+@sdc_overload_method(DataFrameExpandingType, 'cov')
+def sdc_pandas_dataframe_expanding_cov(self, other=None, pairwise=None, ddof=1):
+
+    ty_checker = TypeChecker('Method expanding.cov().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    check_df_window_pair_types(ty_checker, other, pairwise)
+
+    if not isinstance(ddof, (int, Integer, Omitted)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    kws = {'other': 'None', 'pairwise': 'None', 'ddof': '1'}
+
+    return gen_df_expanding_method_impl('cov', self, kws=kws, other=other)
+
+
+@sdc_overload_method(DataFrameExpandingType, 'mean')
+def sdc_pandas_dataframe_expanding_mean(self):
+
+    ty_checker = TypeChecker('Method expanding.mean().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    return gen_df_expanding_method_impl('mean', self)
+
+
+@sdc_overload_method(DataFrameExpandingType, 'std')
+def sdc_pandas_dataframe_expanding_std(self, ddof=1):
+
+    ty_checker = TypeChecker('Method expanding.std().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    if not isinstance(ddof, (int, Integer, Omitted)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    return gen_df_expanding_method_impl('std', self, kws={'ddof': '1'})
+
+
+@sdc_overload_method(DataFrameExpandingType, 'sum')
+def sdc_pandas_dataframe_expanding_sum(self):
+
+    ty_checker = TypeChecker('Method expanding.sum().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    return gen_df_expanding_method_impl('sum', self)
+
+
+@sdc_overload_method(DataFrameExpandingType, 'var')
+def sdc_pandas_dataframe_expanding_var(self, ddof=1):
+
+    ty_checker = TypeChecker('Method expanding.var().')
+    ty_checker.check(self, DataFrameExpandingType)
+
+    if not isinstance(ddof, (int, Integer, Omitted)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    return gen_df_expanding_method_impl('var', self, kws={'ddof': '1'})
+
+
+pair_params_doc = """
+    other: :obj:`DataFrame` or :obj:`Series`
+        Other DataFrame/Series.
+    pairwise: :obj:`bool`
+        Calculate pairwise combinations of columns within a DataFrame.
+        *unsupported*"""
+ddof_param_doc = """
+    ddof: :obj:`int`
+        Delta Degrees of Freedom."""
+pair_limitations_doc = """
+    Limitations
+    -----------
+    Resulting DataFrame has default index. Pairwise combinations of columns are unsupported.
+    """
+
+sdc_pandas_dataframe_expanding_corr.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'corr',
+    'limitations_block': pair_limitations_doc,
+    'extra_params': pair_params_doc
+})
+
+sdc_pandas_dataframe_expanding_cov.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'cov',
+    'limitations_block': pair_limitations_doc,
+    'extra_params': pair_params_doc + ddof_param_doc
+})
+
+sdc_pandas_dataframe_expanding_mean.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'mean',
+    'limitations_block': '',
+    'extra_params': ''
+})
+
+sdc_pandas_dataframe_expanding_std.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'std',
+    'limitations_block': '',
+    'extra_params': ddof_param_doc
+})
+
+sdc_pandas_dataframe_expanding_sum.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'sum',
+    'limitations_block': '',
+    'extra_params': ''
+})
+
+sdc_pandas_dataframe_expanding_var.__doc__ = sdc_pandas_dataframe_expanding_docstring_tmpl.format(**{
+    'method_name': 'var',
+    'limitations_block': '',
+    'extra_params': ddof_param_doc
+})
@@ -29,6 +29,7 @@
 | Also, it contains Numba internal operators which are required for DataFrame type handling
 '''
 
+import ast
 import numba
 import numpy
 import operator
@@ -39,8 +40,8 @@ from pandas.core.indexing import IndexingError
 
 from numba import types
 from numba import literally
-from numba.typed import List, Dict
 from numba.core.errors import TypingError
+from numba.np import numpy_support
 from pandas.core.indexing import IndexingError
 
 from sdc.hiframes.pd_dataframe_ext import DataFrameType
@@ -57,16 +58,21 @@ from sdc.hiframes.pd_series_type import SeriesType
 from sdc.datatypes.hpat_pandas_dataframe_getitem_types import (DataFrameGetitemAccessorType,
                                                                dataframe_getitem_accessor_init)
 from sdc.datatypes.common_functions import SDCLimitation
-from sdc.datatypes.hpat_pandas_dataframe_rolling_types import _hpat_pandas_df_rolling_init
+from sdc.datatypes.hpat_pandas_dataframe_rolling_types import (
+    _hpat_pandas_df_rolling_init, get_df_offset_rolling_init)
+from sdc.datatypes.hpat_pandas_ewm_types import (
+    _hpat_pandas_df_ewm_init, gen_sdc_pandas_ewm_overload_body, sdc_pandas_ewm_docstring_tmpl)
+from sdc.datatypes.hpat_pandas_expanding_types import (
+    _hpat_pandas_df_expanding_init, gen_sdc_pandas_expanding_overload_body,
+    sdc_pandas_expanding_docstring_tmpl)
 from sdc.datatypes.hpat_pandas_rolling_types import (
     gen_sdc_pandas_rolling_overload_body, sdc_pandas_rolling_docstring_tmpl)
-from sdc.datatypes.hpat_pandas_groupby_functions import init_dataframe_groupby, merge_groupby_dicts_inplace
+from sdc.datatypes.hpat_pandas_groupby_functions import init_dataframe_groupby
+from sdc.functions.groupby import build_group_index, lexsort_permutation
 from sdc.hiframes.pd_dataframe_ext import get_dataframe_data
 from sdc.utilities.utils import sdc_overload, sdc_overload_method, sdc_overload_attribute
-from sdc.hiframes.api import isna
 from sdc.functions.numpy_like import getitem_by_mask, find_idx
 from sdc.datatypes.common_functions import _sdc_take, sdc_reindex_series
-from sdc.utilities.prange_utils import parallel_chunks
 
 
 @sdc_overload_attribute(DataFrameType, 'index')
@@ -797,10 +803,21 @@ def mean_overload(df, axis=None, skipna=None, level=None, numeric_only=None):
 
 
 sdc_pandas_dataframe_rolling = sdc_overload_method(DataFrameType, 'rolling')(
-    gen_sdc_pandas_rolling_overload_body(_hpat_pandas_df_rolling_init, DataFrameType))
+    gen_sdc_pandas_rolling_overload_body(_hpat_pandas_df_rolling_init, DataFrameType,
+                                         offset_initializer=get_df_offset_rolling_init))
 sdc_pandas_dataframe_rolling.__doc__ = sdc_pandas_rolling_docstring_tmpl.format(
     ty='DataFrame', ty_lower='dataframe')
 
+sdc_pandas_dataframe_expanding = sdc_overload_method(DataFrameType, 'expanding')(
+    gen_sdc_pandas_expanding_overload_body(_hpat_pandas_df_expanding_init, DataFrameType))
+sdc_pandas_dataframe_expanding.__doc__ = sdc_pandas_expanding_docstring_tmpl.format(
+    ty='DataFrame', ty_lower='dataframe')
+
+sdc_pandas_dataframe_ewm = sdc_overload_method(DataFrameType, 'ewm')(
+    gen_sdc_pandas_ewm_overload_body(_hpat_pandas_df_ewm_init, DataFrameType))
+sdc_pandas_dataframe_ewm.__doc__ = sdc_pandas_ewm_docstring_tmpl.format(
+    ty='DataFrame', ty_lower='dataframe')
+
 
 @sdc_overload_method(DataFrameType, 'std')
 def std_overload(df, axis=None, skipna=None, level=None, ddof=1, numeric_only=None):
@@ -2919,9 +2936,11 @@ def sdc_pandas_dataframe_groupby(self, by=None, axis=0, level=None, as_index=Tru
 
     Limitations
     -----------
-    - Parameters ``axis``, ``level``, ``as_index``, ``group_keys``, ``squeeze`` and ``observed`` \
+    - Parameters ``axis``, ``level``, ``group_keys``, ``squeeze`` and ``observed`` \
 are currently unsupported by Intel Scalable Dataframe Compiler
-    - Parameter ``by`` is supported as single literal column name only
+    - Parameter ``by`` is supported as literal column name or tuple or list of literal column names only
+    - Parameter ``as_index`` is supported as literal value only
+    - Grouping by multiple columns is supported with ``as_index=False`` only, as MultiIndex is not supported
     - Mutating the contents of a DataFrame between creating a groupby object and calling it's methods is unsupported
 
     Examples
@@ -2982,47 +3001,50 @@ are currently unsupported by Intel Scalable Dataframe Compiler
         Returns a groupby object that contains information about the groups.
 """
 
-    if not isinstance(by, types.StringLiteral):
+    if isinstance(by, types.StringLiteral):
+        by_columns = (by.literal_value, )
+    elif isinstance(by, types.BaseTuple) and all(isinstance(a, types.StringLiteral) for a in by):
+        by_columns = tuple(a.literal_value for a in by)
+    elif isinstance(by, types.List) and getattr(by, 'initial_value', None) is not None:
+        by_columns = tuple(by.initial_value)
+    else:
         return None
 
-    column_id = self.columns.index(by.literal_value)
-    list_type = types.ListType(types.int64)
-    by_type = self.data[column_id].dtype
-
-    col_loc = self.column_loc[by.literal_value]
-    type_id, col_id = col_loc.type_id, col_loc.col_id
-
-    def sdc_pandas_dataframe_groupby_impl(self, by=None, axis=0, level=None, as_index=True, sort=True,
-                                          group_keys=True, squeeze=False, observed=False):
-
-        by_column_data = self._data[type_id][col_id]
-        chunks = parallel_chunks(len(by_column_data))
-        dict_parts = [Dict.empty(by_type, list_type) for _ in range(len(chunks))]
-
-        # filling separate dict of by_value -> positions for each chunk of initial array
-        for i in numba.prange(len(chunks)):
-            chunk = chunks[i]
-            res = dict_parts[i]
-            for j in range(chunk.start, chunk.stop):
-                if isna(by_column_data, j):
-                    continue
-                value = by_column_data[j]
-                group_list = res.get(value)
-                if group_list is None:
-                    new_group_list = List.empty_list(types.int64)
-                    new_group_list.append(j)
-                    res[value] = new_group_list
-                else:
-                    group_list.append(j)
-
-        # merging all dict parts into a single resulting dict
-        res_dict = dict_parts[0]
-        for i in range(1, len(chunks)):
-            res_dict = merge_groupby_dicts_inplace(res_dict, dict_parts[i])
-
-        return init_dataframe_groupby(self, column_id, res_dict, sort)
+    _func_name = 'Method DataFrame.groupby().'
+    ty_checker = TypeChecker(_func_name)
+
+    if isinstance(as_index, types.Omitted):
+        as_index = as_index.value
+    elif isinstance(as_index, types.Literal):
+        as_index = as_index.literal_value
+    elif not isinstance(as_index, bool):
+        ty_checker.raise_exc(as_index, 'literal bool', 'as_index')
+
+    if as_index and len(by_columns) > 1:
+        raise TypingError('{} Grouping by multiple columns is supported with as_index=False only. '
+                          'Given: by={}'.format(_func_name, by_columns))
+
+    # by columns are passed to init_dataframe_groupby as literal ids, and
+    # multiple by columns are grouped by as a tuple of arrays
+    by_col_ids = tuple(self.columns.index(name) for name in by_columns)
+    by_col_ids_literal = f'{by_col_ids[0]}' if len(by_col_ids) == 1 else f'{by_col_ids}'
+    by_data = ', '.join(f'self._data[{self.column_loc[name].type_id}][{self.column_loc[name].col_id}]'
+                        for name in by_columns)
+    by_data = by_data if len(by_columns) == 1 else f'({by_data}, )'
+
+    func_text = '\n'.join([
+        'def sdc_pandas_dataframe_groupby_impl(self, by=None, axis=0, level=None, as_index=True, sort=True,',
+        '                                      group_keys=True, squeeze=False, observed=False):',
+        f'  by_data = {by_data}',
+        '  group_index = build_group_index(by_data, sort)',
+        f'  return init_dataframe_groupby(self, {by_col_ids_literal}, group_index, sort, {as_index})',
+    ])
+    global_vars = {'build_group_index': build_group_index,
+                   'init_dataframe_groupby': init_dataframe_groupby}
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
 
-    return sdc_pandas_dataframe_groupby_impl
+    return loc_vars['sdc_pandas_dataframe_groupby_impl']
 
 
 def df_set_column_index_codelines(self):
@@ -3359,3 +3381,323 @@ def sdc_pandas_dataframe_reset_index(self, level=None, drop=False, inplace=False
 
     raise SDCLimitation('Method {}(). Parameter drop is only supported as a literal.'.format(func_name))
 
+
+def sdc_pandas_dataframe_sort_values_codegen(self, by_columns, ascending):
+    """
+    Example of generated implementation:
+        def _df_sort_values_impl(self, by, axis=0, ascending=True, inplace=False, kind='quicksort',
+                                 na_position='last'):
+          if not (na_position == 'last' or na_position == 'first'):
+            raise ValueError("Method sort_values(). Unsupported parameter. Given na_position != 'last' or 'first'")
+          if len(ascending) != 2:
+            raise ValueError("Method sort_values(). Length of ascending != length of by")
+          by_data = (self._data[0][0], self._data[1][0], )
+          perm = lexsort_permutation(by_data, (ascending[0], ascending[1], ), na_position == 'last')
+          result_0 = _sdc_take(self._data[0][0], perm)
+          result_1 = _sdc_take(self._data[1][0], perm)
+          res_index = _sdc_take(self._index, perm)
+          return pandas.DataFrame({"A": result_0, "B": result_1}, index=res_index)
+    """
+    func_lines = [
+        'def _df_sort_values_impl(self, by, axis=0, ascending=True, inplace=False, kind=\'quicksort\',',
+        '                         na_position=\'last\'):',
+        '  if not (na_position == \'last\' or na_position == \'first\'):',
+        '    raise ValueError("Method sort_values(). Unsupported parameter. '
+        'Given na_position != \'last\' or \'first\'")',
+    ]
+
+    nkeys = len(by_columns)
+    if isinstance(ascending, (types.List, types.BaseTuple)):
+        func_lines += [f'  if len(ascending) != {nkeys}:',
+                       '    raise ValueError("Method sort_values(). Length of ascending != length of by")']
+        ascending_tuple = ', '.join(f'ascending[{i}]' for i in range(nkeys))
+    else:
+        ascending_tuple = ', '.join('ascending' for _ in range(nkeys))
+
+    by_data = ', '.join(f'self._data[{self.column_loc[c].type_id}][{self.column_loc[c].col_id}]'
+                        for c in by_columns)
+    func_lines += [f'  by_data = ({by_data}, )',
+                   f'  perm = lexsort_permutation(by_data, ({ascending_tuple}, ), na_position == \'last\')']
+
+    results = []
+    for i, c in enumerate(self.columns):
+        col_loc = self.column_loc[c]
+        type_id, col_id = col_loc.type_id, col_loc.col_id
+        func_lines += [f'  result_{i} = _sdc_take(self._data[{type_id}][{col_id}], perm)']
+        results.append((c, f'result_{i}'))
+
+    if isinstance(self.index, types.NoneType):
+        func_lines += ['  res_index = perm']
+    else:
+        func_lines += ['  res_index = _sdc_take(self._index, perm)']
+
+    data = ', '.join(f'"{col}": {data}' for col, data in results)
+    func_lines += [f'  return pandas.DataFrame({{{data}}}, index=res_index)']
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'pandas': pandas,
+                   'lexsort_permutation': lexsort_permutation,
+                   '_sdc_take': _sdc_take}
+
+    return func_text, global_vars
+
+
+@sdc_overload_method(DataFrameType, 'sort_values')
+def sdc_pandas_dataframe_sort_values(self, by, axis=0, ascending=True, inplace=False, kind='quicksort',
+                                     na_position='last'):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.DataFrame.sort_values
+
+    Limitations
+    -----------
+    - Parameter ``by`` is supported as literal column name or tuple or list of literal column names only
+    - Parameters ``axis`` and ``inplace`` are supported only with default values
+    - Parameter ``kind`` is ignored, sorting is always stable, i.e. the same as with ``kind='mergesort'``
+
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/dataframe/dataframe_sort_values.py
+        :language: python
+        :lines: 35-
+        :caption: Sort by the values along columns.
+        :name: ex_dataframe_sort_values
+
+    .. command-output:: python ./dataframe/dataframe_sort_values.py
+        :cwd: ../../../examples
+
+    .. seealso::
+        :ref:`Series.sort_values <pandas.Series.sort_values>`
+            Sort by the values.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Pandas DataFrame method :meth:`pandas.DataFrame.sort_values` implementation.
+
+    Rows are ordered by all key columns with a single permutation, computed by the stable sort of
+    combined codes of key values, and then all columns are gathered by this permutation.
+
+    .. only:: developer
+
+       Test: python -m sdc.runtests -k sdc.tests.test_dataframe.TestDataFrame.test_df_sort_values*
+    """
+
+    _func_name = 'Method sort_values().'
+    ty_checker = TypeChecker(_func_name)
+    ty_checker.check(self, DataFrameType)
+
+    if isinstance(by, types.StringLiteral):
+        by_columns = (by.literal_value, )
+    elif isinstance(by, types.BaseTuple) and all(isinstance(a, types.StringLiteral) for a in by):
+        by_columns = tuple(a.literal_value for a in by)
+    elif isinstance(by, types.List) and getattr(by, 'initial_value', None) is not None:
+        by_columns = tuple(by.initial_value)
+    else:
+        ty_checker.raise_exc(by, 'literal str or list of literal str', 'by')
+
+    for column in by_columns:
+        if column not in self.columns:
+            raise TypingError('{} Column {} not found. Given: by={}'.format(_func_name, column, by_columns))
+
+    if not (isinstance(axis, types.Omitted) or axis == 0):
+        raise TypingError('{} Unsupported parameter axis. Given: {}'.format(_func_name, axis))
+
+    if not (isinstance(ascending, (types.Omitted, types.Boolean, bool))
+            or (isinstance(ascending, (types.List, types.UniTuple)) and isinstance(ascending.dtype, types.Boolean))):
+        ty_checker.raise_exc(ascending, 'bool or list of bool', 'ascending')
+
+    if isinstance(ascending, types.UniTuple) and len(ascending) != len(by_columns):
+        raise TypingError('{} Length of ascending != length of by. Given: ascending={}, by={}'.format(
+            _func_name, ascending, by_columns))
+
+    if not (isinstance(inplace, types.Omitted) or inplace is False):
+        raise TypingError('{} Unsupported parameter inplace. Given: {}'.format(_func_name, inplace))
+
+    if not isinstance(kind, (types.Omitted, types.UnicodeType, types.StringLiteral, str)):
+        ty_checker.raise_exc(kind, 'str', 'kind')
+
+    if not isinstance(na_position, (types.Omitted, types.UnicodeType, types.StringLiteral, str)):
+        ty_checker.raise_exc(na_position, 'str', 'na_position')
+
+    func_text, global_vars = sdc_pandas_dataframe_sort_values_codegen(self, by_columns, ascending)
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+
+    return loc_vars['_df_sort_values_impl']
+
+
+df_eval_binops = {
+    ast.Add: '+',
+    ast.Sub: '-',
+    ast.Mult: '*',
+    ast.FloorDiv: '//',
+    ast.Mod: '%',
+    ast.Pow: '**',
+}
+df_eval_unaryops = {
+    ast.UAdd: '+',
+    ast.USub: '-',
+}
+df_eval_cmpops = {
+    ast.Eq: '==',
+    ast.NotEq: '!=',
+    ast.Lt: '<',
+    ast.LtE: '<=',
+    ast.Gt: '>',
+    ast.GtE: '>=',
+}
+
+
+def df_eval_element_expr(node, columns, float_columns, _func_name):
+    """
+    Translate expression tree over column names into expression over elements col_<k>[i],
+    names of the used columns are appended to the columns list.
+    Operands of true division are cast to float64, so that division by integer zero gives inf as in pandas.
+    """
+    def translate_float(node):
+        element_expr = translate(node)
+        if isinstance(node, ast.Name) and node.id in float_columns:
+            return element_expr
+        return 'numpy.float64({})'.format(element_expr)
+
+    def translate(node):
+        if isinstance(node, ast.Name):
+            if node.id not in columns:
+                columns.append(node.id)
+            return 'col_{}[i]'.format(columns.index(node.id))
+
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Div):
+            return '({} / {})'.format(translate_float(node.left), translate_float(node.right))
+
+        if isinstance(node, ast.BinOp) and type(node.op) in df_eval_binops:
+            return '({} {} {})'.format(translate(node.left), df_eval_binops[type(node.op)], translate(node.right))
+
+        if isinstance(node, ast.UnaryOp) and type(node.op) in df_eval_unaryops:
+            return '({}{})'.format(df_eval_unaryops[type(node.op)], translate(node.operand))
+
+        if isinstance(node, ast.Compare) and len(node.ops) == 1 and type(node.ops[0]) in df_eval_cmpops:
+            return '({} {} {})'.format(translate(node.left), df_eval_cmpops[type(node.ops[0])],
+                                       translate(node.comparators[0]))
+
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            return repr(node.value)
+
+        raise TypingError('{} Unsupported expression: {}'.format(_func_name, ast.dump(node)))
+
+    return translate(node)
+
+
+def sdc_pandas_dataframe_eval_codegen(self, expr, _func_name):
+    """
+    Generate implementation evaluating arithmetic expression over columns element by element
+    in a single parallel loop, so no intermediate arrays are allocated
+    """
+    try:
+        tree = ast.parse(expr.strip(), mode='eval')
+    except SyntaxError:
+        raise TypingError('{} Invalid expression. Given: {}'.format(_func_name, expr))
+
+    float_columns = [name for name, column in zip(self.columns, self.data) if isinstance(column.dtype, types.Float)]
+
+    columns = []
+    element_expr = df_eval_element_expr(tree.body, columns, float_columns, _func_name)
+
+    dtypes = {}
+    for name in columns:
+        if name not in self.columns:
+            raise TypingError('{} Column {} not found. Given: expr={}'.format(_func_name, name, expr))
+        col_dtype = self.data[self.columns.index(name)].dtype
+        if not isinstance(col_dtype, (types.Number, types.Boolean)):
+            raise TypingError('{} Column {} is not numeric. Given: {}'.format(_func_name, name, col_dtype))
+        dtypes[name] = numpy_support.as_dtype(col_dtype)
+
+    # result dtype is the one numpy gives evaluating the whole expression over arrays of columns dtypes
+    with numpy.errstate(all='ignore'):
+        empty_columns = {name: numpy.empty(0, dtype=dtype) for name, dtype in dtypes.items()}
+        result_dtype = eval(compile(tree, '<expr>', 'eval'), {'__builtins__': {}}, empty_columns).dtype
+
+    func_lines = ['def _df_eval_impl(self, expr, inplace=False):']
+    for k, name in enumerate(columns):
+        col_loc = self.column_loc[name]
+        func_lines.append(f'  col_{k} = self._data[{col_loc.type_id}][{col_loc.col_id}]')
+    func_lines += [
+        f'  length = {df_length_expr(self)}',
+        '  result = numpy.empty(length, dtype=result_dtype)',
+        '  for i in numba.prange(length):',
+        f'    result[i] = {element_expr}',
+        '  return pandas.Series(result, index=self._index)',
+    ]
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'numpy': numpy, 'numba': numba, 'pandas': pandas, 'result_dtype': result_dtype}
+
+    return func_text, global_vars
+
+
+@sdc_overload_method(DataFrameType, 'eval')
+def sdc_pandas_dataframe_eval(self, expr, inplace=False):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.DataFrame.eval
+
+    Limitations
+    -----------
+    - Parameter ``expr`` is supported as literal string only
+    - Expression can contain numeric column names, numeric literals, arithmetic operators
+      ``+``, ``-``, ``*``, ``/``, ``//``, ``%``, ``**`` and single comparisons, assignments are unsupported
+    - Floor division and modulo of integer columns by zero are not checked, results differ from pandas inf and NaN
+    - Parameter ``inplace`` is supported only with default value ``False``
+
+    Examples
+    --------
+    .. literalinclude:: ../../../examples/dataframe/dataframe_eval.py
+        :language: python
+        :lines: 35-
+        :caption: Evaluate an arithmetic expression over columns in a single pass.
+        :name: ex_dataframe_eval
+
+    .. command-output:: python ./dataframe/dataframe_eval.py
+        :cwd: ../../../examples
+
+    .. seealso::
+        :ref:`DataFrame.apply <pandas.DataFrame.apply>`
+            Apply a function along an axis of the DataFrame.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Pandas DataFrame method :meth:`pandas.DataFrame.eval` implementation.
+
+    The expression is parsed at compile time and translated into a single parallel loop computing
+    the whole expression per row, so e.g. ``(A * B + C) / D - E`` makes one pass over the columns
+    and allocates only the result instead of a temporary Series per operator.
+
+    .. only:: developer
+
+       Test: python -m sdc.runtests -k sdc.tests.test_dataframe.TestDataFrame.test_df_eval*
+    """
+
+    _func_name = 'Method eval().'
+    ty_checker = TypeChecker(_func_name)
+    ty_checker.check(self, DataFrameType)
+
+    if isinstance(expr, types.UnicodeType):
+        def sdc_pandas_dataframe_eval_unicode_impl(self, expr, inplace=False):
+            # literally raises special exception to call eval with literal expr value got from unicode
+            return literally(expr)
+
+        return sdc_pandas_dataframe_eval_unicode_impl
+
+    if not isinstance(expr, types.StringLiteral):
+        ty_checker.raise_exc(expr, 'str', 'expr')
+
+    if not (isinstance(inplace, types.Omitted) or inplace is False):
+        raise TypingError('{} Unsupported parameter inplace. Given: {}'.format(_func_name, inplace))
+
+    func_text, global_vars = sdc_pandas_dataframe_eval_codegen(self, expr.literal_value, _func_name)
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+
+    return loc_vars['_df_eval_impl']
@@ -29,7 +29,12 @@ import pandas
 from numba.core.types import (float64, Boolean, Integer, Number, Omitted,
                          NoneType, StringLiteral, UnicodeType)
 from sdc.utilities.sdc_typing_utils import TypeChecker, kwsparams2list
+from sdc.datatypes.common_functions import SDCLimitation
 from sdc.datatypes.hpat_pandas_dataframe_rolling_types import DataFrameRollingType
+from sdc.datatypes.hpat_pandas_series_rolling_functions import (gen_rolling_agg_kernel, gen_rolling_agg_method_impl,
+                                                                rolling_agg_check_types)
+from sdc.datatypes.hpat_pandas_series_rolling_types import _hpat_pandas_series_offset_rolling_init
+from sdc.functions.window import centered_window_bounds, offset_window_bounds
 from sdc.hiframes.pd_dataframe_ext import get_dataframe_data
 from sdc.hiframes.pd_dataframe_type import DataFrameType
 from sdc.hiframes.pd_series_type import SeriesType
@@ -90,6 +95,9 @@ def df_rolling_params_codegen():
 
 
 def df_rolling_method_other_df_codegen(method_name, self, other, args=None, kws=None):
+    if self.offset:
+        raise SDCLimitation(f"Method rolling.{method_name}(). Unsupported parameter. Given 'window': offset")
+
     args = args or []
     kwargs = kws or {}
 
@@ -164,27 +172,51 @@ def df_rolling_method_other_df_codegen(method_name, self, other, args=None, kws=
     return func_text, global_vars
 
 
-def df_rolling_method_main_codegen(method_params, df_columns, column_loc, method_name):
+def df_rolling_method_main_codegen(method_params, self, method_name):
     rolling_params = df_rolling_params_codegen()
     method_params_as_str = ', '.join(method_params)
+    df_columns, column_loc = self.data.columns, self.data.column_loc
 
     results = []
     func_lines = []
+    if self.offset:
+        # series are indexed by times to be rolled over the same windows, column on is kept as is
+        if self.on_column is None:
+            func_lines += ['  times = self._data._index']
+        else:
+            on_loc = column_loc[self.on_column]
+            func_lines += [f'  times = self._data._data[{on_loc.type_id}][{on_loc.col_id}]']
+        offset_rolling_params = rolling_params.replace('self._on', 'None')
+
     for idx, col in enumerate(df_columns):
         col_loc = column_loc[col]
         type_id, col_id = col_loc.type_id, col_loc.col_id
         res_data = f'result_data_{col}'
-        func_lines += [
-            f'  data_{col} = self._data._data[{type_id}][{col_id}]',
-            f'  series_{col} = pandas.Series(data_{col})',
-            f'  rolling_{col} = series_{col}.rolling({rolling_params})',
-            f'  result_{col} = rolling_{col}.{method_name}({method_params_as_str})',
-            f'  {res_data} = result_{col}._data[:len(data_{col})]'
-        ]
+        if self.offset and col == self.on_column:
+            func_lines += [f'  {res_data} = times']
+        elif self.offset:
+            func_lines += [
+                f'  data_{col} = self._data._data[{type_id}][{col_id}]',
+                f'  series_{col} = pandas.Series(data_{col}, times)',
+                f'  rolling_{col} = series_offset_rolling_init(series_{col}, {offset_rolling_params})',
+                f'  result_{col} = rolling_{col}.{method_name}({method_params_as_str})',
+                f'  {res_data} = result_{col}._data'
+            ]
+        else:
+            func_lines += [
+                f'  data_{col} = self._data._data[{type_id}][{col_id}]',
+                f'  series_{col} = pandas.Series(data_{col})',
+                f'  rolling_{col} = series_{col}.rolling({rolling_params})',
+                f'  result_{col} = rolling_{col}.{method_name}({method_params_as_str})',
+                f'  {res_data} = result_{col}._data[:len(data_{col})]'
+            ]
         results.append((col, res_data))
 
     data = ', '.join(f'"{col}": {data}' for col, data in results)
-    func_lines += [f'  return pandas.DataFrame({{{data}}})']
+    if self.offset and not isinstance(self.data.index, NoneType):
+        func_lines += [f'  return pandas.DataFrame({{{data}}}, index=self._data._index)']
+    else:
+        func_lines += [f'  return pandas.DataFrame({{{data}}})']
 
     return func_lines
 
@@ -212,12 +244,12 @@ def gen_df_rolling_method_other_none_codegen(rewrite_name=None):
                 f'    raise ValueError("Method rolling.{_method_name}(). The object pairwise\\n expected: False")'
             ]
         method_params = args + ['{}={}'.format(k, k) for k in kwargs if k != 'other']
-        func_lines += df_rolling_method_main_codegen(method_params, self.data.columns, self.data.column_loc,
-                                                     method_name)
+        func_lines += df_rolling_method_main_codegen(method_params, self, method_name)
 
         func_text = '\n'.join(func_lines)
 
-        global_vars = {'pandas': pandas}
+        global_vars = {'pandas': pandas,
+                       'series_offset_rolling_init': _hpat_pandas_series_offset_rolling_init}
 
         return func_text, global_vars
 
@@ -239,11 +271,11 @@ def df_rolling_method_codegen(method_name, self, args=None, kws=None):
     func_lines = [f'def {impl_name}({impl_params_as_str}):']
 
     method_params = args + ['{}={}'.format(k, k) for k in kwargs]
-    func_lines += df_rolling_method_main_codegen(method_params, self.data.columns,
-                                                 self.data.column_loc, method_name)
+    func_lines += df_rolling_method_main_codegen(method_params, self, method_name)
     func_text = '\n'.join(func_lines)
 
-    global_vars = {'pandas': pandas}
+    global_vars = {'pandas': pandas,
+                   'series_offset_rolling_init': _hpat_pandas_series_offset_rolling_init}
 
     return func_text, global_vars
 
@@ -288,6 +320,76 @@ def gen_df_rolling_method_impl(method_name, self, args=None, kws=None):
     return _impl
 
 
+@sdc_overload_method(DataFrameRollingType, 'agg')
+@sdc_overload_method(DataFrameRollingType, 'aggregate')
+def sdc_pandas_dataframe_rolling_agg(self, func):
+
+    ty_checker = TypeChecker('Method rolling.agg().')
+    ty_checker.check(self, DataFrameRollingType)
+
+    func_names = rolling_agg_check_types(ty_checker, self, func)
+    if isinstance(func_names, str):
+        return gen_rolling_agg_method_impl(func_names)
+
+    df_columns, column_loc = self.data.columns, self.data.column_loc
+    # columns of the same dtype are stored in one list, which is aggregated by a single kernel call
+    type_ids = []
+    for idx, col in enumerate(df_columns):
+        if self.offset and col == self.on_column:
+            continue
+        if not isinstance(self.data.data[idx].dtype, Number):
+            ty_checker.raise_exc(self.data.data[idx], 'numeric array', f'column {col}')
+        if column_loc[col].type_id not in type_ids:
+            type_ids.append(column_loc[col].type_id)
+
+    func_lines = ['def _df_rolling_agg_impl(self, func):']
+    if self.offset:
+        if self.on_column is None:
+            func_lines += ['  times = self._data._index']
+        else:
+            on_loc = column_loc[self.on_column]
+            func_lines += [f'  times = self._data._data[{on_loc.type_id}][{on_loc.col_id}]']
+        func_lines += ['  starts, ends = offset_window_bounds(times, self._window, self._closed)']
+        func_lines += [f'  results_{t} = bounds_kernel(self._data._data[{t}], starts, ends, self._min_periods, 1)'
+                       for t in type_ids]
+    elif type_ids:
+        func_lines += [f'  length = len(self._data._data[{type_ids[0]}][0])',
+                       '  if self._center:',
+                       '    starts, ends = centered_window_bounds(length, self._window)']
+        func_lines += [f'    results_{t} = bounds_kernel(self._data._data[{t}], starts, ends, self._min_periods, 1)'
+                       for t in type_ids]
+        func_lines += ['  else:']
+        func_lines += [f'    results_{t} = fixed_kernel(self._data._data[{t}], self._window, self._min_periods, 1)'
+                       for t in type_ids]
+
+    # names of the resulting columns are flattened as multi-level columns are not supported
+    results = []
+    for col in df_columns:
+        if self.offset and col == self.on_column:
+            results.append(f'\'{col}\': times')
+            continue
+        col_loc = column_loc[col]
+        results += [f'\'{col}_{func_name}\': results_{col_loc.type_id}[{k}][{col_loc.col_id}]'
+                    for k, func_name in enumerate(func_names)]
+
+    data = ', '.join(results)
+    if self.offset and not isinstance(self.data.index, NoneType):
+        func_lines += [f'  return pandas.DataFrame({{{data}}}, index=self._data._index)']
+    else:
+        func_lines += [f'  return pandas.DataFrame({{{data}}})']
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'pandas': pandas,
+                   'centered_window_bounds': centered_window_bounds,
+                   'offset_window_bounds': offset_window_bounds,
+                   'fixed_kernel': gen_rolling_agg_kernel(func_names),
+                   'bounds_kernel': gen_rolling_agg_kernel(func_names, offset=True)}
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+
+    return loc_vars['_df_rolling_agg_impl']
+
+
 @sdc_overload_method(DataFrameRollingType, 'apply')
 def sdc_pandas_dataframe_rolling_apply(self, func, raw=None):
 
@@ -387,12 +489,18 @@ def sdc_pandas_dataframe_rolling_max(self):
 
 
 @sdc_overload_method(DataFrameRollingType, 'mean')
-def sdc_pandas_dataframe_rolling_mean(self):
+def sdc_pandas_dataframe_rolling_mean(self, std=None, tau=None):
 
     ty_checker = TypeChecker('Method rolling.mean().')
     ty_checker.check(self, DataFrameRollingType)
 
-    return gen_df_rolling_method_impl('mean', self)
+    if not isinstance(std, (Omitted, NoneType, Number)) and std is not None:
+        ty_checker.raise_exc(std, 'float', 'std')
+
+    if not isinstance(tau, (Omitted, NoneType, Number)) and tau is not None:
+        ty_checker.raise_exc(tau, 'float', 'tau')
+
+    return gen_df_rolling_method_impl('mean', self, kws={'std': 'None', 'tau': 'None'})
 
 
 @sdc_overload_method(DataFrameRollingType, 'median')
@@ -452,12 +560,18 @@ def sdc_pandas_dataframe_rolling_std(self, ddof=1):
 
 
 @sdc_overload_method(DataFrameRollingType, 'sum')
-def sdc_pandas_dataframe_rolling_sum(self):
+def sdc_pandas_dataframe_rolling_sum(self, std=None, tau=None):
 
     ty_checker = TypeChecker('Method rolling.sum().')
     ty_checker.check(self, DataFrameRollingType)
 
-    return gen_df_rolling_method_impl('sum', self)
+    if not isinstance(std, (Omitted, NoneType, Number)) and std is not None:
+        ty_checker.raise_exc(std, 'float', 'std')
+
+    if not isinstance(tau, (Omitted, NoneType, Number)) and tau is not None:
+        ty_checker.raise_exc(tau, 'float', 'tau')
+
+    return gen_df_rolling_method_impl('sum', self, kws={'std': 'None', 'tau': 'None'})
 
 
 @sdc_overload_method(DataFrameRollingType, 'var')
@@ -472,6 +586,26 @@ def sdc_pandas_dataframe_rolling_var(self, ddof=1):
     return gen_df_rolling_method_impl('var', self, kws={'ddof': '1'})
 
 
+sdc_pandas_dataframe_rolling_agg.__doc__ = sdc_pandas_dataframe_rolling_docstring_tmpl.format(**{
+    'method_name': 'agg',
+    'example_caption': 'Calculate several rolling aggregations at once.',
+    'limitations_block':
+    """
+    Limitations
+    -----------
+    - Supported ``func`` is a name or a list of names of the following methods:
+    count, kurt, max, mean, min, skew, std, sum, var.
+    - All the aggregations of a column are calculated with a single pass over its data.
+    - Names of the resulting columns are flattened as ``<column>_<func>`` since multi-level columns are unsupported.
+    - DataFrame elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
+    """,
+    'extra_params':
+    """
+    func: :obj:`str` or :obj:`list` of :obj:`str`
+        Names of aggregation methods.
+    """
+})
+
 sdc_pandas_dataframe_rolling_apply.__doc__ = sdc_pandas_dataframe_rolling_docstring_tmpl.format(**{
     'method_name': 'apply',
     'example_caption': 'Calculate the rolling apply.',
@@ -564,7 +698,13 @@ sdc_pandas_dataframe_rolling_mean.__doc__ = sdc_pandas_dataframe_rolling_docstri
     -----------
     DataFrame elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
     """,
-    'extra_params': ''
+    'extra_params':
+    """
+    std: :obj:`float`
+        Standard deviation of gaussian window (win_type='gaussian').
+    tau: :obj:`float`
+        Decay of exponential window (win_type='exponential').
+    """
 })
 
 sdc_pandas_dataframe_rolling_median.__doc__ = sdc_pandas_dataframe_rolling_docstring_tmpl.format(**{
@@ -640,7 +780,13 @@ sdc_pandas_dataframe_rolling_sum.__doc__ = sdc_pandas_dataframe_rolling_docstrin
     -----------
     DataFrame elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
     """,
-    'extra_params': ''
+    'extra_params':
+    """
+    std: :obj:`float`
+        Standard deviation of gaussian window (win_type='gaussian').
+    tau: :obj:`float`
+        Decay of exponential window (win_type='exponential').
+    """
 })
 
 sdc_pandas_dataframe_rolling_var.__doc__ = sdc_pandas_dataframe_rolling_docstring_tmpl.format(**{
@@ -31,10 +31,11 @@ from sdc.datatypes.hpat_pandas_rolling_types import (
 
 class DataFrameRollingType(RollingType):
     """Type definition for pandas.DataFrame.rolling functions handling."""
-    def __init__(self, data, win_type=None, on=None, closed=None):
+    def __init__(self, data, win_type=None, on=None, closed=None, offset=False, on_column=None):
         super(DataFrameRollingType, self).__init__('DataFrameRollingType',
                                                    data, win_type=win_type,
-                                                   on=on, closed=closed)
+                                                   on=on, closed=closed,
+                                                   offset=offset, on_column=on_column)
 
 
 @register_model(DataFrameRollingType)
@@ -46,3 +47,13 @@ class DataFrameRollingTypeModel(RollingTypeModel):
 
 _hpat_pandas_df_rolling_init = intrinsic(gen_hpat_pandas_rolling_init(
     DataFrameRollingType))
+_hpat_pandas_df_offset_rolling_inits = {}
+
+
+def get_df_offset_rolling_init(on_column=None):
+    """Get initializer of DataFrame rolling over windows given by a period of time of index or on_column"""
+    if on_column not in _hpat_pandas_df_offset_rolling_inits:
+        _hpat_pandas_df_offset_rolling_inits[on_column] = intrinsic(gen_hpat_pandas_rolling_init(
+            DataFrameRollingType, offset=True, on_column=on_column))
+
+    return _hpat_pandas_df_offset_rolling_inits[on_column]
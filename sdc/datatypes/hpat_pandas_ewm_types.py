@@ -0,0 +1,247 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+import numpy
+
+from numba.core import cgutils, types
+from numba.core.datamodel import StructModel
+from numba.extending import intrinsic, make_attribute_wrapper, models, register_model
+from numba.core.typing.templates import signature
+from sdc.utilities.sdc_typing_utils import TypeChecker
+
+
+class EWMType(types.Type):
+    """Type definition for pandas.ewm functions handling."""
+    def __init__(self, ty, data):
+        self.data = data
+
+        super(EWMType, self).__init__('{}({})'.format(ty, data))
+
+
+class EWMTypeModel(StructModel):
+    """Model for EWMType type."""
+    def __init__(self, dmm, fe_type):
+        members = [
+            ('data', fe_type.data),
+            # decay is specified in terms of center of mass whichever parameter is given
+            ('com', types.float64),
+            ('min_periods', types.intp),
+            ('adjust', types.boolean),
+            ('ignore_na', types.boolean),
+            # axis is able to be unicode type
+            ('axis', types.intp),
+        ]
+        models.StructModel.__init__(self, dmm, fe_type, members)
+
+
+make_attribute_wrapper(EWMType, 'data', '_data')
+make_attribute_wrapper(EWMType, 'com', '_com')
+make_attribute_wrapper(EWMType, 'min_periods', '_min_periods')
+make_attribute_wrapper(EWMType, 'adjust', '_adjust')
+make_attribute_wrapper(EWMType, 'ignore_na', '_ignore_na')
+make_attribute_wrapper(EWMType, 'axis', '_axis')
+
+
+class SeriesEWMType(EWMType):
+    """Type definition for pandas.Series.ewm functions handling."""
+    def __init__(self, data):
+        super(SeriesEWMType, self).__init__('SeriesEWMType', data)
+
+
+@register_model(SeriesEWMType)
+class SeriesEWMTypeModel(EWMTypeModel):
+    """Model for SeriesEWMType type."""
+    def __init__(self, dmm, fe_type):
+        super(SeriesEWMTypeModel, self).__init__(dmm, fe_type)
+
+
+class DataFrameEWMType(EWMType):
+    """Type definition for pandas.DataFrame.ewm functions handling."""
+    def __init__(self, data):
+        super(DataFrameEWMType, self).__init__('DataFrameEWMType', data)
+
+
+@register_model(DataFrameEWMType)
+class DataFrameEWMTypeModel(EWMTypeModel):
+    """Model for DataFrameEWMType type."""
+    def __init__(self, dmm, fe_type):
+        super(DataFrameEWMTypeModel, self).__init__(dmm, fe_type)
+
+
+def gen_hpat_pandas_ewm_init(ty):
+    """Generate ewm initializer based on data type"""
+    def _hpat_pandas_ewm_init(typingctx, self, com, min_periods, adjust, ignore_na, axis):
+        """Internal Numba required function to register EWMType."""
+        ret_typ = ty(self)
+        sig = signature(ret_typ, self, com, min_periods, adjust, ignore_na, axis)
+
+        def _codegen(context, builder, sig, args):
+            """Create EWMTypeModel structure."""
+            data, com, min_periods, adjust, ignore_na, axis = args
+            ewm = cgutils.create_struct_proxy(sig.return_type)(context, builder)
+            ewm.data = data
+            ewm.com = context.cast(builder, com, sig.args[1], types.float64)
+            ewm.min_periods = context.cast(builder, min_periods, sig.args[2], types.intp)
+            ewm.adjust = context.cast(builder, adjust, sig.args[3], types.boolean)
+            ewm.ignore_na = context.cast(builder, ignore_na, sig.args[4], types.boolean)
+            ewm.axis = axis
+
+            if context.enable_nrt:
+                context.nrt.incref(builder, self, ewm.data)
+
+            return ewm._getvalue()
+
+        return sig, _codegen
+
+    return _hpat_pandas_ewm_init
+
+
+_hpat_pandas_series_ewm_init = intrinsic(gen_hpat_pandas_ewm_init(SeriesEWMType))
+_hpat_pandas_df_ewm_init = intrinsic(gen_hpat_pandas_ewm_init(DataFrameEWMType))
+
+
+def gen_sdc_pandas_ewm_overload_body(initializer, ty):
+    """Generate code of the overloaded method using associated DataType and constructor."""
+    def sdc_pandas_ewm(self, com=None, span=None, halflife=None, alpha=None,
+                       min_periods=0, adjust=True, ignore_na=False, axis=0):
+        ty_checker = TypeChecker('Method ewm().')
+        ty_checker.check(self, ty)
+
+        decay_accepted = (types.Omitted, types.NoneType, types.Number)
+        decay_params = {'com': com, 'span': span, 'halflife': halflife, 'alpha': alpha}
+        for name, param in decay_params.items():
+            if not isinstance(param, decay_accepted) and param is not None:
+                ty_checker.raise_exc(param, 'float', name)
+
+        if not isinstance(min_periods, (types.Omitted, types.Integer)) and min_periods != 0:
+            ty_checker.raise_exc(min_periods, 'int', 'min_periods')
+
+        bool_accepted = (types.Omitted, types.Boolean, bool)
+        if not isinstance(adjust, bool_accepted):
+            ty_checker.raise_exc(adjust, 'bool', 'adjust')
+
+        if not isinstance(ignore_na, bool_accepted):
+            ty_checker.raise_exc(ignore_na, 'bool', 'ignore_na')
+
+        axis_accepted = (types.Omitted, types.Integer, types.StringLiteral, types.UnicodeType)
+        if not isinstance(axis, axis_accepted) and axis != 0:
+            ty_checker.raise_exc(axis, 'int, str', 'axis')
+
+        given = {name: not (isinstance(param, (types.Omitted, types.NoneType)) or param is None)
+                 for name, param in decay_params.items()}
+        com_given, span_given = given['com'], given['span']
+        halflife_given, alpha_given = given['halflife'], given['alpha']
+        given_count = sum(given.values())
+
+        def sdc_pandas_ewm_impl(self, com=None, span=None, halflife=None, alpha=None,
+                                min_periods=0, adjust=True, ignore_na=False, axis=0):
+            if given_count > 1:
+                raise ValueError('comass, span, halflife, and alpha are mutually exclusive')
+
+            if given_count == 0:
+                raise ValueError('Must pass one of comass, span, halflife, or alpha')
+
+            comass = 0.
+            if com_given == True:  # noqa
+                if com < 0:
+                    raise ValueError('comass must satisfy: comass >= 0')
+                comass = com
+            if span_given == True:  # noqa
+                if span < 1:
+                    raise ValueError('span must satisfy: span >= 1')
+                comass = (span - 1) / 2.
+            if halflife_given == True:  # noqa
+                if halflife <= 0:
+                    raise ValueError('halflife must satisfy: halflife > 0')
+                decay = 1 - numpy.exp(numpy.log(0.5) / halflife)
+                comass = 1 / decay - 1
+            if alpha_given == True:  # noqa
+                if alpha <= 0 or alpha > 1:
+                    raise ValueError('alpha must satisfy: 0 < alpha <= 1')
+                comass = (1. - alpha) / alpha
+
+            if axis != 0:
+                raise ValueError('Method ewm(). The object axis\n expected: 0')
+
+            return initializer(self, comass, min_periods, adjust, ignore_na, axis)
+
+        return sdc_pandas_ewm_impl
+
+    return sdc_pandas_ewm
+
+
+sdc_pandas_ewm_docstring_tmpl = """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.{ty}.ewm
+
+    Limitations
+    -----------
+    Parameter ``axis`` is supported only with default value.
+
+    .. seealso::
+        :ref:`rolling <pandas.{ty}.rolling>`
+            Provides rolling window calculations.
+        :ref:`expanding <pandas.{ty}.expanding>`
+            Provides expanding transformations.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas {ty} attribute :attr:`pandas.{ty}.ewm` implementation
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_rolling.TestRolling.test_{ty_lower}_ewm
+
+    Parameters
+    ----------
+    self: :obj:`pandas.{ty}`
+        Input {ty}.
+    com: :obj:`float`
+        Specify decay in terms of center of mass.
+    span: :obj:`float`
+        Specify decay in terms of span.
+    halflife: :obj:`float`
+        Specify decay in terms of half-life.
+    alpha: :obj:`float`
+        Specify smoothing factor directly.
+    min_periods: :obj:`int`
+        Minimum number of observations in window required to have a value.
+    adjust: :obj:`bool`
+        Divide by decaying adjustment factor in beginning periods to account for imbalance in relative weightings.
+    ignore_na: :obj:`bool`
+        Ignore missing values when calculating weights.
+    axis: :obj:`int`, :obj:`str`
+        Axis along which the operation acts
+        0/None/'index' - row-wise operation
+        1/'columns'    - column-wise operation
+        *unsupported*
+
+    Returns
+    -------
+    :class:`pandas.{ty}.ewm`
+        Output class to manipulate with input data.
+"""
@@ -0,0 +1,193 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+from numba.core import cgutils, types
+from numba.core.datamodel import StructModel
+from numba.extending import intrinsic, make_attribute_wrapper, models, register_model
+from numba.core.typing.templates import signature
+from sdc.utilities.sdc_typing_utils import TypeChecker
+
+
+class ExpandingType(types.Type):
+    """Type definition for pandas.expanding functions handling."""
+    def __init__(self, ty, data):
+        self.data = data
+
+        super(ExpandingType, self).__init__('{}({})'.format(ty, data))
+
+
+class ExpandingTypeModel(StructModel):
+    """Model for ExpandingType type."""
+    def __init__(self, dmm, fe_type):
+        members = [
+            ('data', fe_type.data),
+            ('min_periods', types.intp),
+            ('center', types.boolean),
+            # axis is able to be unicode type
+            ('axis', types.intp),
+        ]
+        models.StructModel.__init__(self, dmm, fe_type, members)
+
+
+make_attribute_wrapper(ExpandingType, 'data', '_data')
+make_attribute_wrapper(ExpandingType, 'min_periods', '_min_periods')
+make_attribute_wrapper(ExpandingType, 'center', '_center')
+make_attribute_wrapper(ExpandingType, 'axis', '_axis')
+
+
+class SeriesExpandingType(ExpandingType):
+    """Type definition for pandas.Series.expanding functions handling."""
+    def __init__(self, data):
+        super(SeriesExpandingType, self).__init__('SeriesExpandingType', data)
+
+
+@register_model(SeriesExpandingType)
+class SeriesExpandingTypeModel(ExpandingTypeModel):
+    """Model for SeriesExpandingType type."""
+    def __init__(self, dmm, fe_type):
+        super(SeriesExpandingTypeModel, self).__init__(dmm, fe_type)
+
+
+class DataFrameExpandingType(ExpandingType):
+    """Type definition for pandas.DataFrame.expanding functions handling."""
+    def __init__(self, data):
+        super(DataFrameExpandingType, self).__init__('DataFrameExpandingType', data)
+
+
+@register_model(DataFrameExpandingType)
+class DataFrameExpandingTypeModel(ExpandingTypeModel):
+    """Model for DataFrameExpandingType type."""
+    def __init__(self, dmm, fe_type):
+        super(DataFrameExpandingTypeModel, self).__init__(dmm, fe_type)
+
+
+def gen_hpat_pandas_expanding_init(ty):
+    """Generate expanding initializer based on data type"""
+    def _hpat_pandas_expanding_init(typingctx, self, min_periods, center, axis):
+        """Internal Numba required function to register ExpandingType."""
+        ret_typ = ty(self)
+        sig = signature(ret_typ, self, min_periods, center, axis)
+
+        def _codegen(context, builder, sig, args):
+            """Create ExpandingTypeModel structure."""
+            data, min_periods, center, axis = args
+            expanding = cgutils.create_struct_proxy(sig.return_type)(context, builder)
+            expanding.data = data
+            expanding.min_periods = context.cast(builder, min_periods, sig.args[1], types.intp)
+            expanding.center = context.cast(builder, center, sig.args[2], types.boolean)
+            expanding.axis = axis
+
+            if context.enable_nrt:
+                context.nrt.incref(builder, self, expanding.data)
+
+            return expanding._getvalue()
+
+        return sig, _codegen
+
+    return _hpat_pandas_expanding_init
+
+
+_hpat_pandas_series_expanding_init = intrinsic(gen_hpat_pandas_expanding_init(SeriesExpandingType))
+_hpat_pandas_df_expanding_init = intrinsic(gen_hpat_pandas_expanding_init(DataFrameExpandingType))
+
+
+def gen_sdc_pandas_expanding_overload_body(initializer, ty):
+    """Generate code of the overloaded method using associated DataType and constructor."""
+    def sdc_pandas_expanding(self, min_periods=1, center=False, axis=0):
+        ty_checker = TypeChecker('Method expanding().')
+        ty_checker.check(self, ty)
+
+        if not isinstance(min_periods, (types.Omitted, types.Integer)) and min_periods != 1:
+            ty_checker.raise_exc(min_periods, 'int', 'min_periods')
+
+        center_accepted = (types.Omitted, types.Boolean)
+        if not isinstance(center, center_accepted) and center is not False:
+            ty_checker.raise_exc(center, 'bool', 'center')
+
+        axis_accepted = (types.Omitted, types.Integer, types.StringLiteral, types.UnicodeType)
+        if not isinstance(axis, axis_accepted) and axis != 0:
+            ty_checker.raise_exc(axis, 'int, str', 'axis')
+
+        def sdc_pandas_expanding_impl(self, min_periods=1, center=False, axis=0):
+            if min_periods < 0:
+                raise ValueError('min_periods must be >= 0')
+
+            if center != False:  # noqa
+                raise ValueError('Method expanding(). The object center\n expected: False')
+
+            if axis != 0:
+                raise ValueError('Method expanding(). The object axis\n expected: 0')
+
+            return initializer(self, min_periods, center, axis)
+
+        return sdc_pandas_expanding_impl
+
+    return sdc_pandas_expanding
+
+
+sdc_pandas_expanding_docstring_tmpl = """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.{ty}.expanding
+
+    Limitations
+    -----------
+    Parameters ``center`` and ``axis`` are supported only with default values.
+
+    .. seealso::
+        :ref:`rolling <pandas.{ty}.rolling>`
+            Provides rolling window calculations.
+        :ref:`ewm <pandas.{ty}.ewm>`
+            Provides exponential weighted functions.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas {ty} attribute :attr:`pandas.{ty}.expanding` implementation
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_rolling.TestRolling.test_{ty_lower}_expanding
+
+    Parameters
+    ----------
+    self: :obj:`pandas.{ty}`
+        Input {ty}.
+    min_periods: :obj:`int`
+        Minimum number of observations in window required to have a value.
+    center: :obj:`bool`
+        Set the labels at the center of the window.
+        *unsupported*
+    axis: :obj:`int`, :obj:`str`
+        Axis along which the operation acts
+        0/None/'index' - row-wise operation
+        1/'columns'    - column-wise operation
+        *unsupported*
+
+    Returns
+    -------
+    :class:`pandas.{ty}.expanding`
+        Output class to manipulate with input data.
+"""
@@ -40,57 +40,45 @@ from numba.extending import intrinsic
 from numba.core.registry import cpu_target
 from numba.core.typing import signature
 from numba import literally
+from numba.typed import Dict
 
-from sdc.datatypes.common_functions import sdc_arrays_argsort, _sdc_asarray, _sdc_take
+from sdc.datatypes.common_functions import _sdc_take
 from sdc.datatypes.hpat_pandas_groupby_types import DataFrameGroupByType, SeriesGroupByType
-from sdc.utilities.sdc_typing_utils import TypeChecker, kwsparams2list, sigparams2list
-from sdc.utilities.utils import (sdc_overload, sdc_overload_method, sdc_register_jitable)
+from sdc.functions.groupby import (gen_groupby_fused_reduce_impl, group_key, groupby_broadcast, groupby_cumcount,
+                                   groupby_quantile, groupby_reduce_acc_dtype, groupby_reduce_funcs,
+                                   groupby_reductions, groupby_transform_res_dtype, groupby_transforms,
+                                   rank_methods)
+from sdc.utilities.sdc_typing_utils import TypeChecker, kwsparams2list, literal_func_names, sigparams2list
+from sdc.utilities.utils import (sdc_overload, sdc_overload_attribute, sdc_overload_method,
+                                 sdc_register_jitable)
 from sdc.hiframes.pd_series_type import SeriesType
+from sdc.datatypes.range_index_type import RangeIndexType
 from sdc.str_ext import string_type
 
 
-performance_limitation = "This function may reveal slower performance than Pandas* on user system.\
-    Users should exercise a tradeoff between staying in JIT-region with that function or\
-    going back to interpreter mode."
-
-
-@sdc_register_jitable
-def merge_groupby_dicts_inplace(left, right):
-    """ Merges one internal groupby dictionary (right) into another one (left) and returns
-    the merging result. Used for aggregating partial dicts into single result. """
-
-    if not right:
-        return left
-
-    for key, right_group_list in right.items():
-        left_group_list = left.get(key)
-        if left_group_list is None:
-            left[key] = right_group_list
-        else:
-            left_group_list.extend(right_group_list)
-
-    return left
-
-
 @intrinsic
-def init_dataframe_groupby(typingctx, parent, column_id, data, sort, target_columns=None):
+def init_dataframe_groupby(typingctx, parent, by_col_ids, data, sort, as_index, target_columns=None):
+
+    if isinstance(by_col_ids, types.BaseTuple):
+        by_col_ids_literal = tuple(a.literal_value for a in by_col_ids)
+    else:
+        by_col_ids_literal = (by_col_ids.literal_value, )
 
     target_columns = types.none if target_columns is None else target_columns
     if isinstance(target_columns, types.NoneType):
         target_not_specified = True
-        selected_col_names = tuple([a for i, a in enumerate(parent.columns) if i != column_id.literal_value])
+        selected_col_names = tuple([a for i, a in enumerate(parent.columns) if i not in by_col_ids_literal])
     else:
         target_not_specified = False
         selected_col_names = tuple([a.literal_value for a in target_columns])
 
     n_target_cols = len(selected_col_names)
     def codegen(context, builder, signature, args):
-        parent_val, column_id_val, data_val, sort_val, target_columns = args
+        parent_val, _, data_val, sort_val, _, target_columns = args
         # create series struct and store values
         groupby_obj = cgutils.create_struct_proxy(
             signature.return_type)(context, builder)
         groupby_obj.parent = parent_val
-        groupby_obj.col_id = column_id_val
         groupby_obj.data = data_val
         groupby_obj.sort = sort_val
         groupby_obj.target_default = context.get_constant(types.bool_, target_not_specified)
@@ -111,8 +99,8 @@ def init_dataframe_groupby(typingctx, parent, column_id, data, sort, target_colu
 
         return groupby_obj._getvalue()
 
-    ret_typ = DataFrameGroupByType(parent, column_id, selected_col_names)
-    sig = signature(ret_typ, parent, column_id, data, sort, target_columns)
+    ret_typ = DataFrameGroupByType(parent, by_col_ids_literal, selected_col_names, as_index.literal_value)
+    sig = signature(ret_typ, parent, by_col_ids, data, sort, as_index, target_columns)
     return sig, codegen
 
 
@@ -140,6 +128,12 @@ def init_series_groupby(typingctx, parent, by_data, data, sort):
     return sig, codegen
 
 
+def _groupby_by_col_ids_literal(self):
+    """Returns literal string passing ids of columns DataFrameGroupBy object groups by to init_dataframe_groupby"""
+    by_col_ids = self.by_col_ids
+    return f'{by_col_ids[0]}' if len(by_col_ids) == 1 else f'{by_col_ids}'
+
+
 @sdc_overload(operator.getitem)
 def sdc_pandas_dataframe_getitem(self, idx):
 
@@ -151,33 +145,42 @@ def sdc_pandas_dataframe_getitem(self, idx):
         or (isinstance(idx, types.Tuple)
             and all(isinstance(a, types.StringLiteral) for a in idx))):
 
-        by_col_id_literal = self.col_id.literal_value
-        by_col_loc = self.parent.column_loc[self.parent.columns[by_col_id_literal]]
-        by_type_id, by_col_id = by_col_loc.type_id, by_col_loc.col_id
+        func_lines = [
+            'def sdc_pandas_dataframe_getitem_common_impl(self, idx):',
+            '  # calling getitem twice raises IndexError, just as in pandas',
+            '  if not self._target_default:',
+            '    raise IndexError("DataFrame.GroupBy.getitem: Columns already selected")',
+        ]
 
-        if idx_is_literal_str:
+        init_params = f'self._parent, {_groupby_by_col_ids_literal(self)}, self._data, self._sort, {self.as_index}'
+        if idx_is_literal_str and self.as_index and len(self.by_col_ids) == 1:
+            by_col_loc = self.parent.column_loc[self.parent.columns[self.by_col_ids[0]]]
             target_col_id_literal = self.parent.columns.index(idx.literal_value)
             target_col_loc = self.parent.column_loc[self.parent.columns[target_col_id_literal]]
-            target_type_id, target_col_id = target_col_loc.type_id, target_col_loc.col_id
-
-        def sdc_pandas_dataframe_getitem_common_impl(self, idx):
-
-            # calling getitem twice raises IndexError, just as in pandas
-            if not self._target_default:
-                raise IndexError("DataFrame.GroupBy.getitem: Columns already selected")
-
-            if idx_is_literal_str == True:  # noqa
-                # no need to pass index into this series, as we group by array
-                target_series = pandas.Series(
-                    data=self._parent._data[target_type_id][target_col_id],
-                    name=self._parent._columns[target_col_id_literal]
-                )
-                by_arr_data = self._parent._data[by_type_id][by_col_id]
-                return init_series_groupby(target_series, by_arr_data, self._data, self._sort)
-            else:
-                return init_dataframe_groupby(self._parent, by_col_id_literal, self._data, self._sort, idx)
 
-        return sdc_pandas_dataframe_getitem_common_impl
+            # no need to pass index into this series, as we group by array
+            func_lines += [
+                f'  target_series = pandas.Series(',
+                f'    data=self._parent._data[{target_col_loc.type_id}][{target_col_loc.col_id}],',
+                f'    name=self._parent._columns[{target_col_id_literal}]',
+                f'  )',
+                f'  by_arr_data = self._parent._data[{by_col_loc.type_id}][{by_col_loc.col_id}]',
+                f'  return init_series_groupby(target_series, by_arr_data, self._data, self._sort)',
+            ]
+        elif idx_is_literal_str:
+            # with group keys in columns result of aggregation is a DataFrame, just as in pandas
+            func_lines.append(f'  return init_dataframe_groupby({init_params}, (\'{idx.literal_value}\', ))')
+        else:
+            func_lines.append(f'  return init_dataframe_groupby({init_params}, idx)')
+
+        func_text = '\n'.join(func_lines)
+        global_vars = {'pandas': pandas,
+                       'init_series_groupby': init_series_groupby,
+                       'init_dataframe_groupby': init_dataframe_groupby}
+        loc_vars = {}
+        exec(func_text, global_vars, loc_vars)
+
+        return loc_vars['sdc_pandas_dataframe_getitem_common_impl']
 
     if isinstance(idx, types.UnicodeType):
         def sdc_pandas_dataframe_getitem_idx_unicode_str_impl(self, idx):
@@ -188,54 +191,165 @@ def sdc_pandas_dataframe_getitem(self, idx):
     return None
 
 
-def _sdc_pandas_groupby_generic_func_codegen(func_name, columns, column_loc,
+def _groupby_key_type(by_type):
+    """Returns type of the group key, which is a tuple for multiple key columns"""
+    if isinstance(by_type, types.BaseTuple):
+        return types.Tuple([a.dtype for a in by_type])
+
+    return by_type.dtype
+
+
+def _groupby_labels_type(index):
+    """Returns type of the array holding labels of grouped rows taken from parent index"""
+    if isinstance(index, (types.NoneType, RangeIndexType)):
+        return types.Array(types.int64, 1, 'C')
+
+    if isinstance(index, types.Array):
+        return types.Array(index.dtype, 1, 'C')
+
+    return index
+
+
+@sdc_overload_attribute(DataFrameGroupByType, 'ngroups')
+@sdc_overload_attribute(SeriesGroupByType, 'ngroups')
+def sdc_pandas_groupby_ngroups(self):
+    """
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Pandas API: pandas.core.groupby.GroupBy.ngroups implementation.
+
+    .. only:: developer
+       Test: python -m sdc.runtests -k sdc.tests.test_groupby.TestGroupBy.test_dataframe_groupby_ngroups
+    """
+
+    def sdc_pandas_groupby_ngroups_impl(self):
+        group_offsets = self._data[2]
+        return len(group_offsets) - 1
+
+    return sdc_pandas_groupby_ngroups_impl
+
+
+@sdc_overload_attribute(DataFrameGroupByType, 'indices')
+@sdc_overload_attribute(SeriesGroupByType, 'indices')
+def sdc_pandas_groupby_indices(self):
+    """
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Pandas API: pandas.core.groupby.GroupBy.indices implementation.
+
+    Returns typed dict mapping each group key to positions of its rows, positions
+    are sliced from the group index and no additional grouping pass is made.
+
+    .. only:: developer
+       Test: python -m sdc.runtests -k sdc.tests.test_groupby.TestGroupBy.test_dataframe_groupby_indices
+    """
+
+    key_type = _groupby_key_type(self.by_data)
+    positions_type = types.Array(types.int64, 1, 'C')
+
+    def sdc_pandas_groupby_indices_impl(self):
+        group_keys, _, group_offsets, group_positions = self._data
+
+        res = Dict.empty(key_type, positions_type)
+        for i in range(len(group_offsets) - 1):
+            res[group_key(group_keys, i)] = group_positions[group_offsets[i]:group_offsets[i + 1]].copy()
+
+        return res
+
+    return sdc_pandas_groupby_indices_impl
+
+
+@sdc_overload_attribute(DataFrameGroupByType, 'groups')
+@sdc_overload_attribute(SeriesGroupByType, 'groups')
+def sdc_pandas_groupby_groups(self):
+    """
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Pandas API: pandas.core.groupby.GroupBy.groups implementation.
+
+    Returns typed dict mapping each group key to the labels of its rows in the parent index.
+
+    .. only:: developer
+       Test: python -m sdc.runtests -k sdc.tests.test_groupby.TestGroupBy.test_dataframe_groupby_groups
+    """
+
+    key_type = _groupby_key_type(self.by_data)
+    index_is_none = isinstance(self.parent.index, types.NoneType)
+    labels_type = _groupby_labels_type(self.parent.index)
+
+    def sdc_pandas_groupby_groups_impl(self):
+        group_keys, _, group_offsets, group_positions = self._data
+
+        res = Dict.empty(key_type, labels_type)
+        for i in range(len(group_offsets) - 1):
+            group_rows = group_positions[group_offsets[i]:group_offsets[i + 1]]
+            if index_is_none == True:  # noqa
+                res[group_key(group_keys, i)] = group_rows.copy()
+            else:
+                res[group_key(group_keys, i)] = _sdc_take(self._parent._index, group_rows)
+
+        return res
+
+    return sdc_pandas_groupby_groups_impl
+
+
+def _sdc_pandas_groupby_index_codelines(groupby_obj, as_index=True):
+    """Generate code lines unpacking group index of groupby object and defining resulting index"""
+    return [
+        f'  group_keys, group_codes, group_offsets, group_positions = {groupby_obj}._data',
+        f'  res_index = {"group_keys" if as_index else "None"}',
+    ]
+
+
+def _sdc_pandas_groupby_key_columns(by_columns, as_index):
+    """Returns items of the resulting DataFrame dict holding group keys, which are the leading columns
+    of the result if as_index is False"""
+    if as_index:
+        return []
+
+    if len(by_columns) == 1:
+        return [f'\'{by_columns[0]}\': group_keys']
+
+    return [f'\'{name}\': group_keys[{k}]' for k, name in enumerate(by_columns)]
+
+
+def _sdc_pandas_groupby_reduce_codeline(func_name, data, result, acc_dtype, res_dtype, impl_params=None):
+    """Generate code line reducing data of each group with groupby_reductions[func_name] kernel"""
+    reduce_params = ['group_codes', 'group_offsets', 'group_positions', data, acc_dtype, res_dtype]
+    reduce_params.extend(kwsparams2list(impl_params or {}))
+    return f'  {result} = _groupby_{func_name}({", ".join(reduce_params)})'
+
+
+def _sdc_pandas_groupby_generic_func_codegen(func_name, columns, column_loc, by_columns, as_index,
                                              func_params, defaults, impl_params):
     all_params_as_str = ', '.join(sigparams2list(func_params, defaults))
-    extra_impl_params = ', '.join(kwsparams2list(impl_params))
 
     groupby_obj = f'{func_params[0]}'
     df = f'{groupby_obj}._parent'
-    groupby_dict = f'{groupby_obj}._data'
-    groupby_param_sort = f'{groupby_obj}._sort'
     column_names, column_ids = tuple(zip(*columns))
 
-    func_lines = [
-        f'def _dataframe_groupby_{func_name}_impl({all_params_as_str}):',
-        f'  group_keys = _sdc_asarray([key for key in {groupby_dict}])',
-        f'  res_index_len = len(group_keys)',
-        f'  if {groupby_param_sort}:',
-        f'    argsorted_index = sdc_arrays_argsort(group_keys, kind=\'mergesort\')',
-    ]
+    func_lines = [f'def _dataframe_groupby_{func_name}_impl({all_params_as_str}):']
+    func_lines.extend(_sdc_pandas_groupby_index_codelines(groupby_obj, as_index))
 
-    # TODO: remove conversion from Numba typed.List to reflected one while creating group_arr_{i}
     for i in range(len(columns)):
         col_loc = column_loc[column_names[i]]
         type_id, col_id = col_loc.type_id, col_loc.col_id
-        func_lines += [
-            f'  result_data_{i} = numpy.empty(res_index_len, dtype=res_arrays_dtypes[{i}])',
-            f'  column_data_{i} = {df}._data[{type_id}][{col_id}]',
-            f'  for j in numpy.arange(res_index_len):',
-            f'    idx = argsorted_index[j] if {groupby_param_sort} else j',
-            f'    group_arr_{i} = _sdc_take(column_data_{i}, list({groupby_dict}[group_keys[idx]]))',
-            f'    group_series_{i} = pandas.Series(group_arr_{i})',
-            f'    result_data_{i}[j] = group_series_{i}.{func_name}({extra_impl_params})',
-        ]
+        func_lines.append(f'  column_data_{i} = {df}._data[{type_id}][{col_id}]')
+
+        func_lines.append(_sdc_pandas_groupby_reduce_codeline(
+            func_name, f'column_data_{i}', f'result_data_{i}', f'acc_dtypes[{i}]', f'res_arrays_dtypes[{i}]',
+            impl_params))
 
-    data = ', '.join(f'\'{column_names[i]}\': result_data_{i}' for i in range(len(columns)))
-    func_lines.extend(['\n'.join([
-        f'  if {groupby_param_sort}:',
-        f'    res_index = _sdc_take(group_keys, argsorted_index)',
-        f'  else:',
-        f'    res_index = group_keys',
-        f'  return pandas.DataFrame({{{data}}}, index=res_index)'
-    ])])
+    res_columns = _sdc_pandas_groupby_key_columns(by_columns, as_index)
+    res_columns.extend(f'\'{column_names[i]}\': result_data_{i}' for i in range(len(columns)))
+
+    data = ', '.join(res_columns)
+    func_lines.append(f'  return pandas.DataFrame({{{data}}}, index=res_index)')
 
     func_text = '\n'.join(func_lines)
     global_vars = {'pandas': pandas,
                    'numpy': numpy,
-                   '_sdc_asarray': _sdc_asarray,
-                   '_sdc_take': _sdc_take,
-                   'sdc_arrays_argsort': sdc_arrays_argsort}
+                   f'_groupby_{func_name}': groupby_reductions[func_name]}
 
     return func_text, global_vars
 
@@ -243,39 +357,21 @@ def _sdc_pandas_groupby_generic_func_codegen(func_name, columns, column_loc,
 def _sdc_pandas_series_groupby_generic_func_codegen(func_name, func_params, defaults, impl_params):
 
     all_params_as_str = ', '.join(sigparams2list(func_params, defaults))
-    extra_impl_params = ', '.join(kwsparams2list(impl_params))
 
     groupby_obj = f'{func_params[0]}'
     series = f'{groupby_obj}._parent'
-    groupby_dict = f'{groupby_obj}._data'
-    groupby_param_sort = f'{groupby_obj}._sort'
 
-    # TODO: remove conversion from Numba typed.List to reflected one while creating group_arr_{i}
-    func_lines = [
-        f'def _series_groupby_{func_name}_impl({all_params_as_str}):',
-        f'  group_keys = _sdc_asarray([key for key in {groupby_dict}])',
-        f'  res_index_len = len(group_keys)',
-        f'  if {groupby_param_sort}:',
-        f'    argsorted_index = sdc_arrays_argsort(group_keys, kind=\'mergesort\')',
-        f'  result_data = numpy.empty(res_index_len, dtype=res_dtype)',
-        f'  for j in numpy.arange(res_index_len):',
-        f'    idx = argsorted_index[j] if {groupby_param_sort} else j',
-        f'    group_arr = _sdc_take({series}._data, list({groupby_dict}[group_keys[idx]]))',
-        f'    group_series = pandas.Series(group_arr)',
-        f'    result_data[j] = group_series.{func_name}({extra_impl_params})',
-        f'  if {groupby_param_sort}:',
-        f'    res_index = _sdc_take(group_keys, argsorted_index)',
-        f'  else:',
-        f'    res_index = group_keys',
-        f'  return pandas.Series(data=result_data, index=res_index, name={series}._name)'
-    ]
+    func_lines = [f'def _series_groupby_{func_name}_impl({all_params_as_str}):']
+    func_lines.extend(_sdc_pandas_groupby_index_codelines(groupby_obj))
+
+    func_lines.append(_sdc_pandas_groupby_reduce_codeline(
+        func_name, f'{series}._data', 'result_data', 'acc_dtype', 'res_dtype', impl_params))
+    func_lines.append(f'  return pandas.Series(data=result_data, index=res_index, name={series}._name)')
 
     func_text = '\n'.join(func_lines)
     global_vars = {'pandas': pandas,
                    'numpy': numpy,
-                   '_sdc_asarray': _sdc_asarray,
-                   '_sdc_take': _sdc_take,
-                   'sdc_arrays_argsort': sdc_arrays_argsort}
+                   f'_groupby_{func_name}': groupby_reductions[func_name]}
 
     return func_text, global_vars
 
@@ -309,22 +405,27 @@ def sdc_pandas_dataframe_groupby_apply_func(self, func_name, func_args, defaults
 
     df_column_types = self.parent.data
     df_column_names = self.parent.columns
-    by_column_id = self.col_id.literal_value
+    by_columns = tuple(df_column_names[i] for i in self.by_col_ids)
     selected_cols_set = set(self.target_columns)
+    if not self.as_index:
+        selected_cols_set -= set(by_columns)
     subject_columns = [(name, i) for i, name in enumerate(df_column_names) if name in selected_cols_set]
 
     # resolve types of result dataframe columns
     res_arrays_dtypes = tuple(
         _groupby_resolve_impl_func_type(
-            ty_arr.dtype, func_name
-            ).return_type for i, ty_arr in enumerate(df_column_types) if i != by_column_id)
+            df_column_types[i].dtype, func_name
+            ).return_type for _, i in subject_columns)
+    acc_dtypes = tuple(groupby_reduce_acc_dtype(func_name, df_column_types[i].dtype) for _, i in subject_columns)
 
     groupby_func_name = f'_dataframe_groupby_{func_name}_impl'
     func_text, global_vars = _sdc_pandas_groupby_generic_func_codegen(
-        func_name, subject_columns, self.parent.column_loc, func_args, defaults, impl_args)
+        func_name, subject_columns, self.parent.column_loc, by_columns, self.as_index,
+        func_args, defaults, impl_args)
 
     # capture result column types into generated func context
     global_vars['res_arrays_dtypes'] = res_arrays_dtypes
+    global_vars['acc_dtypes'] = acc_dtypes
 
     loc_vars = {}
     exec(func_text, global_vars, loc_vars)
@@ -347,6 +448,96 @@ def sdc_pandas_series_groupby_apply_func(self, func_name, func_args, defaults=No
 
     # capture result column types into generated func context
     global_vars['res_dtype'] = res_dtype
+    global_vars['acc_dtype'] = groupby_reduce_acc_dtype(func_name, self.parent.dtype)
+
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+    _groupby_method_impl = loc_vars[groupby_func_name]
+
+    return _groupby_method_impl
+
+
+def _groupby_transformed_columns(self):
+    """Returns list of (name, data, dtype) of columns processed by groupby transformations and quantile,
+    which are all selected columns except for the keys for DataFrameGroupBy and grouped data for SeriesGroupBy"""
+    if isinstance(self, SeriesGroupByType):
+        return [(None, 'self._parent._data', self.parent.dtype)]
+
+    by_columns = set(self.parent.columns[i] for i in self.by_col_ids)
+    transformed_columns = []
+    for i, name in enumerate(self.parent.columns):
+        if name not in self.target_columns or name in by_columns:
+            continue
+        col_loc = self.parent.column_loc[name]
+        col_data = f'self._parent._data[{col_loc.type_id}][{col_loc.col_id}]'
+        transformed_columns.append((name, col_data, self.parent.data[i].dtype))
+
+    return transformed_columns
+
+
+def _groupby_check_numeric_columns(self, ty_checker):
+    for name, _, dtype in _groupby_transformed_columns(self):
+        if not isinstance(dtype, (types.Number, types.Boolean)):
+            ty_checker.raise_exc(dtype, 'number', 'self.parent.dtype' if name is None else f'column {name} dtype')
+
+
+def sdc_pandas_groupby_transform_apply_func(self, func_name, func_args, defaults=None, impl_args=None):
+    """
+    Generate implementation of groupby method returning object of the same shape as grouped one, i.e.
+    each column is transformed by groupby_transforms[func_name] kernel writing results directly to the rows
+    of groups, or by groupby reduction func_name which result is broadcast to the rows of groups.
+    """
+
+    defaults = defaults or {}
+    impl_args = impl_args or {}
+
+    all_params_as_str = ', '.join(sigparams2list(func_args, defaults))
+    transformed_columns = _groupby_transformed_columns(self)
+    is_reduction = func_name in groupby_reductions
+
+    res_dtypes, acc_dtypes = [], []
+    for _, _, dtype in transformed_columns:
+        if is_reduction:
+            res_dtypes.append(_groupby_resolve_impl_func_type(dtype, func_name).return_type)
+            acc_dtypes.append(groupby_reduce_acc_dtype(func_name, dtype))
+        else:
+            res_dtypes.append(groupby_transform_res_dtype(func_name, dtype))
+    # rows not belonging to any group are missing in the result unless it cannot hold NaN
+    fill_values = tuple(numpy.nan if isinstance(dtype, types.Float) else 0 for dtype in res_dtypes)
+
+    groupby_func_name = f'_groupby_{func_name}_transform_impl'
+    func_lines = [f'def {groupby_func_name}({all_params_as_str}):',
+                  f'  group_keys, group_codes, group_offsets, group_positions = self._data']
+    for i, (_, col_data, _) in enumerate(transformed_columns):
+        if is_reduction:
+            func_lines.extend([
+                f'  group_values_{i} = _groupby_{func_name}(group_codes, group_offsets, group_positions, {col_data}, '
+                f'acc_dtypes[{i}], res_dtypes[{i}])',
+                f'  result_data_{i} = _groupby_broadcast(group_codes, group_values_{i}, fill_values[{i}])'
+            ])
+        else:
+            transform_params = ', '.join(['group_codes', 'group_offsets', 'group_positions', col_data,
+                                          f'res_dtypes[{i}]', f'fill_values[{i}]'] + kwsparams2list(impl_args))
+            func_lines.append(f'  result_data_{i} = _groupby_{func_name}({transform_params})')
+
+    if isinstance(self, SeriesGroupByType):
+        func_lines.append(
+            '  return pandas.Series(data=result_data_0, index=self._parent._index, name=self._parent._name)')
+    else:
+        data = ', '.join(f'\'{name}\': result_data_{i}' for i, (name, _, _) in enumerate(transformed_columns))
+        func_lines.append(f'  return pandas.DataFrame({{{data}}}, index=self._parent._index)')
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'pandas': pandas,
+                   'numpy': numpy,
+                   'res_dtypes': tuple(res_dtypes),
+                   'acc_dtypes': tuple(acc_dtypes),
+                   'fill_values': fill_values,
+                   '_groupby_broadcast': groupby_broadcast}
+    if is_reduction:
+        global_vars[f'_groupby_{func_name}'] = groupby_reductions[func_name]
+    else:
+        global_vars[f'_groupby_{func_name}'] = groupby_transforms[func_name]
 
     loc_vars = {}
     exec(func_text, global_vars, loc_vars)
@@ -355,6 +546,231 @@ def sdc_pandas_series_groupby_apply_func(self, func_name, func_args, defaults=No
     return _groupby_method_impl
 
 
+def _sdc_pandas_groupby_quantile_codegen(self, q_is_scalar):
+    """
+    Generate implementation of GroupBy.quantile() selecting all quantiles of a column from its values
+    sorted within groups. If q is a sequence, rows of the result go in the order of groups and then
+    of quantiles, so the resulting index holds group keys repeated for each quantile.
+    """
+
+    is_series = isinstance(self, SeriesGroupByType)
+    as_index = is_series or self.as_index
+    transformed_columns = _groupby_transformed_columns(self)
+
+    func_lines = [
+        'def _groupby_quantile_impl(self, q=0.5, interpolation=\'linear\'):',
+        '  group_keys, group_codes, group_offsets, group_positions = self._data',
+        f'  quantiles = {"numpy.array([q])" if q_is_scalar else "numpy.asarray(q)"}',
+        '  if numpy.any(quantiles < 0) or numpy.any(quantiles > 1):',
+        '    raise ValueError("Method GroupBy.quantile(). q must be between 0 and 1")',
+    ]
+
+    if not q_is_scalar:
+        # MultiIndex is not supported, so keys are repeated for each quantile
+        if is_series or len(self.by_col_ids) == 1:
+            repeated_keys = '_sdc_take(group_keys, key_rows)'
+        else:
+            repeated_keys = '({}, )'.format(
+                ', '.join(f'_sdc_take(group_keys[{k}], key_rows)' for k in range(len(self.by_col_ids))))
+        func_lines.extend([
+            '  key_rows = numpy.repeat(numpy.arange(len(group_offsets) - 1), len(quantiles))',
+            f'  group_keys = {repeated_keys}',
+        ])
+    func_lines.append(f'  res_index = {"group_keys" if as_index else "None"}')
+
+    for i, (_, col_data, _) in enumerate(transformed_columns):
+        func_lines.append(
+            f'  result_data_{i} = _groupby_quantile(group_codes, group_offsets, group_positions, {col_data}, '
+            f'quantiles).ravel()')
+
+    if is_series:
+        func_lines.append('  return pandas.Series(data=result_data_0, index=res_index, name=self._parent._name)')
+    else:
+        by_columns = tuple(self.parent.columns[i] for i in self.by_col_ids)
+        res_columns = _sdc_pandas_groupby_key_columns(by_columns, as_index)
+        res_columns.extend(f'\'{name}\': result_data_{i}' for i, (name, _, _) in enumerate(transformed_columns))
+        data = ', '.join(res_columns)
+        func_lines.append(f'  return pandas.DataFrame({{{data}}}, index=res_index)')
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'pandas': pandas,
+                   'numpy': numpy,
+                   '_sdc_take': _sdc_take,
+                   '_groupby_quantile': groupby_quantile}
+
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+
+    return loc_vars['_groupby_quantile_impl']
+
+
+def _groupby_agg_columns_funcs(func):
+    """Returns dict mapping column names to aggregation functions names given by literal dict func"""
+    if isinstance(func, types.LiteralStrKeyDict):
+        items = func.literal_value.items()
+    elif isinstance(func, types.DictType) and getattr(func, 'initial_value', None) is not None:
+        items = func.initial_value.items()
+    else:
+        return None
+
+    columns_funcs = {}
+    for column, column_func in items:
+        column = column.literal_value if isinstance(column, types.Literal) else column
+        columns_funcs[column] = literal_func_names(column_func)
+
+    return columns_funcs
+
+
+def _sdc_pandas_dataframe_groupby_agg_codegen(self, agg_columns):
+    """
+    Generate implementation of DataFrameGroupBy.agg() computing columns of the result defined by agg_columns,
+    list of tuples (column name, function name, result column name). All reductions of a column are made
+    with a single pass over its data.
+    """
+
+    df_column_types = self.parent.data
+    df_column_names = self.parent.columns
+    by_columns = tuple(df_column_names[i] for i in self.by_col_ids)
+
+    columns_funcs = {}
+    for column, func_name, _ in agg_columns:
+        column_funcs = columns_funcs.setdefault(column, [])
+        if func_name not in column_funcs:
+            column_funcs.append(func_name)
+
+    func_lines = ['def _dataframe_groupby_agg_impl(self, func):']
+    func_lines.extend(_sdc_pandas_groupby_index_codelines('self', self.as_index))
+    global_vars = {'pandas': pandas,
+                   'numpy': numpy}
+
+    for i, (column, func_names) in enumerate(columns_funcs.items()):
+        col_loc = self.parent.column_loc[column]
+        dtype = df_column_types[df_column_names.index(column)].dtype
+        res_dtypes = [_groupby_resolve_impl_func_type(dtype, func_name).return_type for func_name in func_names]
+        func_lines.append(f'  column_data_{i} = self._parent._data[{col_loc.type_id}][{col_loc.col_id}]')
+
+        reduce_ids = [k for k, func_name in enumerate(func_names) if func_name in groupby_reduce_funcs]
+        if reduce_ids:
+            fused_reduce = gen_groupby_fused_reduce_impl([func_names[k] for k in reduce_ids], dtype,
+                                                         [res_dtypes[k] for k in reduce_ids])
+            global_vars[f'_groupby_fused_reduce_{i}'] = sdc_register_jitable(fused_reduce)
+            results = ', '.join(f'result_data_{i}_{k}' for k in reduce_ids)
+            reduce_params = f'group_codes, group_offsets, group_positions, column_data_{i}'
+            func_lines.append(f'  {results}, = _groupby_fused_reduce_{i}({reduce_params})')
+
+        for k, func_name in enumerate(func_names):
+            if k in reduce_ids:
+                continue
+            global_vars.update({f'_groupby_{func_name}': groupby_reductions[func_name],
+                                f'acc_dtype_{i}_{k}': groupby_reduce_acc_dtype(func_name, dtype),
+                                f'res_dtype_{i}_{k}': res_dtypes[k]})
+            func_lines.append(_sdc_pandas_groupby_reduce_codeline(
+                func_name, f'column_data_{i}', f'result_data_{i}_{k}', f'acc_dtype_{i}_{k}', f'res_dtype_{i}_{k}'))
+
+    res_columns = _sdc_pandas_groupby_key_columns(by_columns, self.as_index)
+    column_ids = {column: i for i, column in enumerate(columns_funcs)}
+    for column, func_name, res_column in agg_columns:
+        i = column_ids[column]
+        k = columns_funcs[column].index(func_name)
+        res_columns.append(f'\'{res_column}\': result_data_{i}_{k}')
+
+    data = ', '.join(res_columns)
+    func_lines.append(f'  return pandas.DataFrame({{{data}}}, index=res_index)')
+
+    func_text = '\n'.join(func_lines)
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+
+    return loc_vars['_dataframe_groupby_agg_impl']
+
+
+def _sdc_pandas_series_groupby_agg_codegen(self, func_names):
+    """
+    Generate implementation of SeriesGroupBy.agg() returning DataFrame with columns named after
+    func_names. All reductions are made with a single pass over the series data.
+    """
+
+    dtype = self.parent.dtype
+    res_dtypes = [_groupby_resolve_impl_func_type(dtype, func_name).return_type for func_name in func_names]
+
+    func_lines = ['def _series_groupby_agg_impl(self, func):']
+    func_lines.extend(_sdc_pandas_groupby_index_codelines('self'))
+    global_vars = {'pandas': pandas,
+                   'numpy': numpy}
+
+    reduce_ids = [k for k, func_name in enumerate(func_names) if func_name in groupby_reduce_funcs]
+    if reduce_ids:
+        fused_reduce = gen_groupby_fused_reduce_impl([func_names[k] for k in reduce_ids], dtype,
+                                                     [res_dtypes[k] for k in reduce_ids])
+        global_vars['_groupby_fused_reduce'] = sdc_register_jitable(fused_reduce)
+        results = ', '.join(f'result_data_{k}' for k in reduce_ids)
+        func_lines.append(
+            f'  {results}, = _groupby_fused_reduce(group_codes, group_offsets, group_positions, self._parent._data)')
+
+    for k, func_name in enumerate(func_names):
+        if k in reduce_ids:
+            continue
+        global_vars.update({f'_groupby_{func_name}': groupby_reductions[func_name],
+                            f'acc_dtype_{k}': groupby_reduce_acc_dtype(func_name, dtype),
+                            f'res_dtype_{k}': res_dtypes[k]})
+        func_lines.append(_sdc_pandas_groupby_reduce_codeline(
+            func_name, 'self._parent._data', f'result_data_{k}', f'acc_dtype_{k}', f'res_dtype_{k}'))
+
+    data = ', '.join(f'\'{func_name}\': result_data_{k}' for k, func_name in enumerate(func_names))
+    func_lines.append(f'  return pandas.DataFrame({{{data}}}, index=res_index)')
+
+    func_text = '\n'.join(func_lines)
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+
+    return loc_vars['_series_groupby_agg_impl']
+
+
+@sdc_overload_method(DataFrameGroupByType, 'agg')
+@sdc_overload_method(DataFrameGroupByType, 'aggregate')
+def sdc_pandas_dataframe_groupby_agg(self, func):
+
+    method_name = 'GroupBy.agg().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, DataFrameGroupByType)
+
+    supported_funcs = set(series_method_to_func)
+    func_names = literal_func_names(func)
+    if isinstance(func_names, str):
+        if func_names not in supported_funcs:
+            ty_checker.raise_exc(func, 'str, sequence of str or literal dict', 'func')
+
+        # single function is applied to all columns just as by the method of the same name
+        return sdc_pandas_dataframe_groupby_apply_func(self, func_names, ['self', 'func'])
+
+    if func_names is not None:
+        by_columns = set(self.parent.columns[i] for i in self.by_col_ids)
+        columns_funcs = {column: func_names for column in self.target_columns
+                         if self.as_index or column not in by_columns}
+    else:
+        columns_funcs = _groupby_agg_columns_funcs(func)
+
+    if columns_funcs is None:
+        ty_checker.raise_exc(func, 'str, sequence of str or literal dict', 'func')
+
+    for column, column_funcs in columns_funcs.items():
+        column_funcs = (column_funcs, ) if isinstance(column_funcs, str) else column_funcs
+        if (column not in self.parent.columns
+                or column_funcs is None or not set(column_funcs) <= supported_funcs):
+            ty_checker.raise_exc(func, 'str, sequence of str or literal dict', 'func')
+
+    # names of the resulting columns are flattened as multi-level columns are not supported
+    flatten_names = any(not isinstance(fs, str) for fs in columns_funcs.values())
+    agg_columns = []
+    for column, column_funcs in columns_funcs.items():
+        column_funcs = (column_funcs, ) if isinstance(column_funcs, str) else column_funcs
+        for func_name in column_funcs:
+            res_column = f'{column}_{func_name}' if flatten_names else column
+            agg_columns.append((column, func_name, res_column))
+
+    return _sdc_pandas_dataframe_groupby_agg_codegen(self, agg_columns)
+
+
 @sdc_overload_method(DataFrameGroupByType, 'count')
 def sdc_pandas_dataframe_groupby_count(self):
 
@@ -367,6 +783,57 @@ def sdc_pandas_dataframe_groupby_count(self):
     return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
 
 
+@sdc_overload_method(DataFrameGroupByType, 'cumcount')
+@sdc_overload_method(SeriesGroupByType, 'cumcount')
+def sdc_pandas_groupby_cumcount(self, ascending=True):
+
+    method_name = 'GroupBy.cumcount().'
+    ty_checker = TypeChecker(method_name)
+
+    if not isinstance(ascending, (types.Omitted, bool, types.Boolean)):
+        ty_checker.raise_exc(ascending, 'bool', 'ascending')
+
+    def sdc_pandas_groupby_cumcount_impl(self, ascending=True):
+        group_keys, group_codes, group_offsets, group_positions = self._data
+        result = groupby_cumcount(group_codes, group_offsets, group_positions, ascending)
+        return pandas.Series(data=result, index=self._parent._index)
+
+    return sdc_pandas_groupby_cumcount_impl
+
+
+@sdc_overload_method(DataFrameGroupByType, 'cumsum')
+@sdc_overload_method(SeriesGroupByType, 'cumsum')
+def sdc_pandas_groupby_cumsum(self, *args):
+
+    method_name = 'GroupBy.cumsum().'
+    ty_checker = TypeChecker(method_name)
+    _groupby_check_numeric_columns(self, ty_checker)
+
+    method_args = ['self', '*args']
+    applied_func_name = 'cumsum'
+    return sdc_pandas_groupby_transform_apply_func(self, applied_func_name, method_args)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'diff')
+@sdc_overload_method(SeriesGroupByType, 'diff')
+def sdc_pandas_groupby_diff(self, periods=1):
+
+    method_name = 'GroupBy.diff().'
+    ty_checker = TypeChecker(method_name)
+    _groupby_check_numeric_columns(self, ty_checker)
+
+    if not isinstance(periods, (types.Omitted, int, types.Integer)):
+        ty_checker.raise_exc(periods, 'int', 'periods')
+
+    method_args = ['self', 'periods']
+    default_values = {'periods': 1}
+    impl_used_params = {'periods': 'periods'}
+
+    applied_func_name = 'diff'
+    return sdc_pandas_groupby_transform_apply_func(
+        self, applied_func_name, method_args, default_values, impl_used_params)
+
+
 @sdc_overload_method(DataFrameGroupByType, 'max')
 def sdc_pandas_dataframe_groupby_max(self):
 
@@ -427,6 +894,88 @@ def sdc_pandas_dataframe_groupby_prod(self):
     return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
 
 
+def _groupby_literal_str_param(param):
+    """Returns value of str parameter if it's known at compile time, None otherwise"""
+    if isinstance(param, str):
+        return param
+    if isinstance(param, types.Omitted):
+        return param.value
+    if isinstance(param, types.StringLiteral):
+        return param.literal_value
+
+    return None
+
+
+@sdc_overload_method(DataFrameGroupByType, 'quantile')
+@sdc_overload_method(SeriesGroupByType, 'quantile')
+def sdc_pandas_groupby_quantile(self, q=0.5, interpolation='linear'):
+
+    method_name = 'GroupBy.quantile().'
+    ty_checker = TypeChecker(method_name)
+    _groupby_check_numeric_columns(self, ty_checker)
+
+    q_is_scalar = isinstance(q, (types.Omitted, float, int, types.Number))
+    if not (q_is_scalar or isinstance(q, (types.List, types.UniTuple, types.Array))
+            and isinstance(q.dtype, types.Number)):
+        ty_checker.raise_exc(q, 'float or sequence of floats', 'q')
+
+    if _groupby_literal_str_param(interpolation) != 'linear':
+        ty_checker.raise_exc(interpolation, 'literal str \'linear\'', 'interpolation')
+
+    return _sdc_pandas_groupby_quantile_codegen(self, q_is_scalar)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'rank')
+@sdc_overload_method(SeriesGroupByType, 'rank')
+def sdc_pandas_groupby_rank(self, method='average', ascending=True, na_option='keep', pct=False):
+
+    method_name = 'GroupBy.rank().'
+    ty_checker = TypeChecker(method_name)
+    _groupby_check_numeric_columns(self, ty_checker)
+
+    method_value = _groupby_literal_str_param(method)
+    if method_value not in rank_methods:
+        ty_checker.raise_exc(method, f'literal str, one of {rank_methods}', 'method')
+
+    if not isinstance(ascending, (types.Omitted, bool, types.Boolean)):
+        ty_checker.raise_exc(ascending, 'bool', 'ascending')
+
+    if _groupby_literal_str_param(na_option) != 'keep':
+        ty_checker.raise_exc(na_option, 'literal str \'keep\'', 'na_option')
+
+    if not isinstance(pct, (types.Omitted, bool, types.Boolean)):
+        ty_checker.raise_exc(pct, 'bool', 'pct')
+
+    method_args = ['self', 'method', 'ascending', 'na_option', 'pct']
+    default_values = {'method': '\'average\'', 'ascending': True, 'na_option': '\'keep\'', 'pct': False}
+    # method is passed to the kernel as number of the method known at compile time
+    impl_used_params = {'method_id': rank_methods.index(method_value), 'ascending': 'ascending', 'pct': 'pct'}
+
+    applied_func_name = 'rank'
+    return sdc_pandas_groupby_transform_apply_func(
+        self, applied_func_name, method_args, default_values, impl_used_params)
+
+
+@sdc_overload_method(DataFrameGroupByType, 'shift')
+@sdc_overload_method(SeriesGroupByType, 'shift')
+def sdc_pandas_groupby_shift(self, periods=1):
+
+    method_name = 'GroupBy.shift().'
+    ty_checker = TypeChecker(method_name)
+    _groupby_check_numeric_columns(self, ty_checker)
+
+    if not isinstance(periods, (types.Omitted, int, types.Integer)):
+        ty_checker.raise_exc(periods, 'int', 'periods')
+
+    method_args = ['self', 'periods']
+    default_values = {'periods': 1}
+    impl_used_params = {'periods': 'periods'}
+
+    applied_func_name = 'shift'
+    return sdc_pandas_groupby_transform_apply_func(
+        self, applied_func_name, method_args, default_values, impl_used_params)
+
+
 @sdc_overload_method(DataFrameGroupByType, 'std')
 def sdc_pandas_dataframe_groupby_std(self, ddof=1, *args):
 
@@ -458,6 +1007,21 @@ def sdc_pandas_dataframe_groupby_sum(self):
     return sdc_pandas_dataframe_groupby_apply_func(self, applied_func_name, method_args)
 
 
+@sdc_overload_method(DataFrameGroupByType, 'transform')
+@sdc_overload_method(SeriesGroupByType, 'transform')
+def sdc_pandas_groupby_transform(self, func):
+
+    method_name = 'GroupBy.transform().'
+    ty_checker = TypeChecker(method_name)
+
+    func_name = literal_func_names(func)
+    if not (isinstance(func_name, str) and func_name in groupby_reductions):
+        ty_checker.raise_exc(func, f'literal str, one of {tuple(groupby_reductions)}', 'func')
+
+    method_args = ['self', 'func']
+    return sdc_pandas_groupby_transform_apply_func(self, func_name, method_args)
+
+
 @sdc_overload_method(DataFrameGroupByType, 'var')
 def sdc_pandas_dataframe_groupby_var(self, ddof=1, *args):
 
@@ -477,6 +1041,25 @@ def sdc_pandas_dataframe_groupby_var(self, ddof=1, *args):
         self, applied_func_name, method_args, default_values, impl_used_params)
 
 
+@sdc_overload_method(SeriesGroupByType, 'agg')
+@sdc_overload_method(SeriesGroupByType, 'aggregate')
+def sdc_pandas_series_groupby_agg(self, func):
+
+    method_name = 'GroupBy.agg().'
+    ty_checker = TypeChecker(method_name)
+    ty_checker.check(self, SeriesGroupByType)
+
+    func_names = literal_func_names(func)
+    supported_funcs = set(series_method_to_func)
+    if isinstance(func_names, str) and func_names in supported_funcs:
+        return sdc_pandas_series_groupby_apply_func(self, func_names, ['self', 'func'])
+
+    if isinstance(func_names, tuple) and set(func_names) <= supported_funcs:
+        return _sdc_pandas_series_groupby_agg_codegen(self, func_names)
+
+    ty_checker.raise_exc(func, 'str or sequence of str', 'func')
+
+
 @sdc_overload_method(SeriesGroupByType, 'count')
 def sdc_pandas_series_groupby_count(self):
 
@@ -634,17 +1217,37 @@ sdc_pandas_dataframe_groupby_docstring_tmpl = """
 """
 
 
-sdc_pandas_dataframe_groupby_count.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
-    'method_name': 'count',
-    'example_caption': 'Compute count of group, excluding missing values.',
+sdc_pandas_dataframe_groupby_agg.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'agg',
+    'example_caption': 'Compute several aggregations of group values.',
     'limitations_block':
-        f"""
+        """
         Limitations
         -----------
-        - {performance_limitation}
+        - Parameter ``func`` is supported as literal name, tuple or list of literal names of GroupBy methods \
+or literal dict mapping column names to them
+        - Multi-level columns are not supported, so if several functions are applied to a column, \
+resulting columns are named as '<column>_<function>'
         """,
     'see_also':
     """
+    .. seealso::
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params':
+    """
+    func: :obj:`str`, :obj:`tuple`, :obj:`list` or :obj:`dict`
+        Functions to use for aggregating the data"""
+})
+
+
+sdc_pandas_dataframe_groupby_count.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'count',
+    'example_caption': 'Compute count of group, excluding missing values.',
+    'limitations_block': '',
+    'see_also':
+    """
     .. seealso::
         :ref:`Series.groupby <pandas.Series.groupby>`
             Group Series using a mapper or by a Series of columns.
@@ -658,12 +1261,7 @@ sdc_pandas_dataframe_groupby_count.__doc__ = sdc_pandas_dataframe_groupby_docstr
 sdc_pandas_dataframe_groupby_max.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
     'method_name': 'max',
     'example_caption': 'Compute max of group values.',
-    'limitations_block':
-        f"""
-        Limitations
-        -----------
-        - {performance_limitation}
-        """,
+    'limitations_block': '',
     'see_also': '',
     'extra_params': ''
 })
@@ -672,12 +1270,7 @@ sdc_pandas_dataframe_groupby_max.__doc__ = sdc_pandas_dataframe_groupby_docstrin
 sdc_pandas_dataframe_groupby_mean.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
     'method_name': 'mean',
     'example_caption': 'Compute mean of groups, excluding missing values.',
-    'limitations_block':
-        f"""
-        Limitations
-        -----------
-        - {performance_limitation}
-        """,
+    'limitations_block': '',
     'see_also':
     """
     .. seealso::
@@ -693,12 +1286,7 @@ sdc_pandas_dataframe_groupby_mean.__doc__ = sdc_pandas_dataframe_groupby_docstri
 sdc_pandas_dataframe_groupby_median.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
     'method_name': 'median',
     'example_caption': 'Compute median of groups, excluding missing values.',
-    'limitations_block':
-        f"""
-        Limitations
-        -----------
-        - {performance_limitation}
-        """,
+    'limitations_block': '',
     'see_also':
     """
     .. seealso::
@@ -714,12 +1302,7 @@ sdc_pandas_dataframe_groupby_median.__doc__ = sdc_pandas_dataframe_groupby_docst
 sdc_pandas_dataframe_groupby_min.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
     'method_name': 'min',
     'example_caption': 'Compute min of group values.',
-    'limitations_block':
-        f"""
-        Limitations
-        -----------
-        - {performance_limitation}
-        """,
+    'limitations_block': '',
     'see_also': '',
     'extra_params': ''
 })
@@ -728,12 +1311,7 @@ sdc_pandas_dataframe_groupby_min.__doc__ = sdc_pandas_dataframe_groupby_docstrin
 sdc_pandas_dataframe_groupby_prod.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
     'method_name': 'prod',
     'example_caption': 'Compute prod of group values.',
-    'limitations_block':
-        f"""
-        Limitations
-        -----------
-        - {performance_limitation}
-        """,
+    'limitations_block': '',
     'see_also': '',
     'extra_params': ''
 })
@@ -742,12 +1320,7 @@ sdc_pandas_dataframe_groupby_prod.__doc__ = sdc_pandas_dataframe_groupby_docstri
 sdc_pandas_dataframe_groupby_std.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
     'method_name': 'std',
     'example_caption': 'Compute standard deviation of groups, excluding missing values.',
-    'limitations_block':
-        f"""
-        Limitations
-        -----------
-        - {performance_limitation}
-        """,
+    'limitations_block': '',
     'see_also':
     """
     .. seealso::
@@ -763,12 +1336,7 @@ sdc_pandas_dataframe_groupby_std.__doc__ = sdc_pandas_dataframe_groupby_docstrin
 sdc_pandas_dataframe_groupby_sum.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
     'method_name': 'sum',
     'example_caption': 'Compute sum of groups, excluding missing values.',
-    'limitations_block':
-        f"""
-        Limitations
-        -----------
-        - {performance_limitation}
-        """,
+    'limitations_block': '',
     'see_also': '',
     'extra_params': ''
 })
@@ -777,19 +1345,153 @@ sdc_pandas_dataframe_groupby_sum.__doc__ = sdc_pandas_dataframe_groupby_docstrin
 sdc_pandas_dataframe_groupby_var.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
     'method_name': 'var',
     'example_caption': 'Compute variance of groups, excluding missing values.',
+    'limitations_block': '',
+    'see_also':
+    """
+    .. seealso::
+        :ref:`Series.groupby <pandas.Series.groupby>`
+            Group Series using a mapper or by a Series of columns.
+        :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
+            Group DataFrame using a mapper or by a Series of columns.
+    """,
+    'extra_params': ''
+})
+
+
+sdc_pandas_groupby_cumcount.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'cumcount',
+    'example_caption': 'Number each item in each group from 0 to the length of that group - 1.',
     'limitations_block':
-        f"""
+        """
         Limitations
         -----------
-        - {performance_limitation}
+        - Rows with missing key values are numbered as 0
         """,
     'see_also':
     """
     .. seealso::
-        :ref:`Series.groupby <pandas.Series.groupby>`
-            Group Series using a mapper or by a Series of columns.
         :ref:`DataFrame.groupby <pandas.DataFrame.groupby>`
             Group DataFrame using a mapper or by a Series of columns.
     """,
+    'extra_params':
+    """
+    ascending: :obj:`bool`
+        If False, number in reverse, from length of group - 1 to 0"""
+})
+
+
+sdc_pandas_groupby_cumsum.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'cumsum',
+    'example_caption': 'Cumulative sum for each group.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Only numeric columns are supported
+        - Rows with missing key values are set to NaN, or to 0 if the result is integer
+        """,
+    'see_also': '',
     'extra_params': ''
 })
+
+
+sdc_pandas_groupby_diff.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'diff',
+    'example_caption': 'First discrete difference of element within each group.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Only numeric columns are supported
+        - Parameter ``axis`` is unsupported
+        """,
+    'see_also': '',
+    'extra_params':
+    """
+    periods: :obj:`int`
+        Periods to shift for calculating difference"""
+})
+
+
+sdc_pandas_groupby_quantile.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'quantile',
+    'example_caption': 'Return group values at the given quantile.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Only numeric columns are supported
+        - Parameter ``interpolation`` is supported with default value 'linear' only
+        - MultiIndex is not supported, so if ``q`` is a sequence, index of the result holds group keys \
+repeated for each quantile
+        """,
+    'see_also': '',
+    'extra_params':
+    """
+    q: :obj:`float` or array-like
+        Value(s) between 0 and 1 providing the quantile(s) to compute
+    interpolation: :obj:`str`
+        Method to use when the desired quantile falls between two points"""
+})
+
+
+sdc_pandas_groupby_rank.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'rank',
+    'example_caption': 'Provide the rank of values within each group.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Only numeric columns are supported
+        - Parameter ``method`` is supported as literal string only
+        - Parameter ``na_option`` is supported with default value 'keep' only
+        - Parameter ``axis`` is unsupported
+        """,
+    'see_also': '',
+    'extra_params':
+    """
+    method: :obj:`str`
+        How to rank the group of records that have the same value: 'average', 'min', 'max', 'first' or 'dense'
+    ascending: :obj:`bool`
+        Rank in ascending order
+    na_option: :obj:`str`
+        How to rank NaN values
+    pct: :obj:`bool`
+        Compute percentage rank of data within each group"""
+})
+
+
+sdc_pandas_groupby_shift.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'shift',
+    'example_caption': 'Shift each group by periods observations.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Only numeric columns are supported
+        - Parameters ``freq``, ``axis`` and ``fill_value`` are unsupported
+        """,
+    'see_also': '',
+    'extra_params':
+    """
+    periods: :obj:`int`
+        Number of periods to shift"""
+})
+
+
+sdc_pandas_groupby_transform.__doc__ = sdc_pandas_dataframe_groupby_docstring_tmpl.format(**{
+    'method_name': 'transform',
+    'example_caption': 'Broadcast result of group reduction to the rows of each group.',
+    'limitations_block':
+        """
+        Limitations
+        -----------
+        - Parameter ``func`` is supported as literal name of GroupBy reduction method only
+        - Rows with missing key values are set to NaN, or to 0 if the result is integer
+        """,
+    'see_also': '',
+    'extra_params':
+    """
+    func: :obj:`str`
+        Name of the reduction method to broadcast"""
+})
@@ -0,0 +1,313 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+| GroupBy.rolling() methods are calculated by the kernels of rolling windows given by bounds:
+| rows are reordered by groups once (rows of each group keep their order), so each group is a contiguous
+| range of rows, and bounds of windows are limited by the ranges of groups. The kernels process
+| parallel chunks of all the reordered rows, so groups of any sizes are computed in parallel,
+| then the results are written back to the original order of rows.
+"""
+
+import numpy
+import pandas
+
+from numba.core import types
+
+from sdc.datatypes.common_functions import _sdc_take
+from sdc.datatypes.hpat_pandas_groupby_functions import (_groupby_check_numeric_columns,
+                                                         _groupby_transformed_columns)
+from sdc.datatypes.hpat_pandas_groupby_rolling_types import (
+    DataFrameGroupByRollingType, SeriesGroupByRollingType, _hpat_pandas_df_groupby_rolling_init,
+    _hpat_pandas_series_groupby_rolling_init, gen_sdc_pandas_groupby_rolling_overload_body)
+from sdc.datatypes.hpat_pandas_groupby_types import DataFrameGroupByType, SeriesGroupByType
+from sdc.datatypes.hpat_pandas_series_rolling_functions import (
+    rolling_apply_bounds, rolling_order_stat_bounds, sdc_pandas_series_rolling_count_kernels,
+    sdc_pandas_series_rolling_kurt_kernels, sdc_pandas_series_rolling_max_kernels,
+    sdc_pandas_series_rolling_mean_kernels, sdc_pandas_series_rolling_min_kernels,
+    sdc_pandas_series_rolling_skew_kernels, sdc_pandas_series_rolling_std_kernels,
+    sdc_pandas_series_rolling_sum_kernels, sdc_pandas_series_rolling_var_kernels)
+from sdc.functions.groupby import groupby_scatter
+from sdc.functions.window import group_window_bounds
+from sdc.utilities.sdc_typing_utils import TypeChecker, sigparams2list
+from sdc.utilities.utils import sdc_overload_method
+
+
+sdc_pandas_groupby_rolling_docstring_tmpl = """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.core.window.RollingGroupby.{method_name}
+
+    Limitations
+    -----------
+    Windows are of fixed size only, parameters ``win_type``, ``on`` and ``closed`` are unsupported.
+    Result keeps the original order and index of rows instead of the index of groups keys
+    since multi-level indexes are unsupported, rows belonging to no group are NaN.
+{limitations_block}
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas GroupBy method :meth:`pandas.core.window.RollingGroupby.{method_name}()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_groupby.TestGroupBy.test_series_groupby_rolling
+
+    Parameters
+    ----------
+    self: :class:`pandas.core.window.RollingGroupby`
+        input arg{extra_params}
+
+    Returns
+    -------
+    :obj:`pandas.Series` or :obj:`pandas.DataFrame`
+         returns object of the same shape as grouped one
+"""
+
+
+def sdc_pandas_groupby_rolling_apply_func(self, kernel, func_args, defaults=None, kernel_params=None,
+                                          prologue=None):
+    """
+    Generate implementation of GroupBy.rolling() method computing each column by
+    kernel(sorted_data, starts, ends, min_periods, *kernel_params) over rows sorted by groups
+    """
+    defaults = defaults or {}
+    all_params_as_str = ', '.join(sigparams2list(func_args, defaults))
+    kernel_params_as_str = ', '.join(['starts', 'ends', 'self._min_periods'] + (kernel_params or []))
+    transformed_columns = _groupby_transformed_columns(self.groupby)
+
+    func_lines = ['def _groupby_rolling_impl({}):'.format(all_params_as_str)]
+    func_lines.extend(prologue or [])
+    func_lines.extend([
+        '  groupby = self._groupby',
+        '  group_keys, group_codes, group_offsets, group_positions = groupby._data',
+        '  starts, ends = group_window_bounds(group_offsets, self._window, self._center)',
+    ])
+    for i, (_, col_data, _) in enumerate(transformed_columns):
+        col_data = col_data.replace('self.', 'groupby.', 1)
+        func_lines.extend([
+            f'  sorted_data_{i} = _sdc_take({col_data}, group_positions)',
+            f'  sorted_result_{i} = _rolling_kernel(sorted_data_{i}, {kernel_params_as_str})',
+            f'  result_data_{i} = groupby_scatter(group_codes, group_positions, sorted_result_{i}, numpy.nan)',
+        ])
+
+    if isinstance(self, SeriesGroupByRollingType):
+        func_lines.append(
+            '  return pandas.Series(data=result_data_0, index=groupby._parent._index, name=groupby._parent._name)')
+    else:
+        data = ', '.join(f'\'{name}\': result_data_{i}' for i, (name, _, _) in enumerate(transformed_columns))
+        func_lines.append(f'  return pandas.DataFrame({{{data}}}, index=groupby._parent._index)')
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'pandas': pandas,
+                   'numpy': numpy,
+                   '_sdc_take': _sdc_take,
+                   '_rolling_kernel': kernel,
+                   'group_window_bounds': group_window_bounds,
+                   'groupby_scatter': groupby_scatter}
+
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+
+    return loc_vars['_groupby_rolling_impl']
+
+
+def gen_sdc_pandas_groupby_rolling_method(method_name, kernels):
+    """Generate GroupBy.rolling() method without parameters computed by bounds kernel of Series.rolling()"""
+    def sdc_pandas_groupby_rolling_method(self):
+        ty_checker = TypeChecker(f'Method rolling.{method_name}().')
+        _groupby_check_numeric_columns(self.groupby, ty_checker)
+
+        _, bounds_kernel = kernels
+        return sdc_pandas_groupby_rolling_apply_func(self, bounds_kernel, ['self'], kernel_params=['0'])
+
+    sdc_pandas_groupby_rolling_method.__name__ = f'sdc_pandas_groupby_rolling_{method_name}'
+    sdc_pandas_groupby_rolling_method.__doc__ = sdc_pandas_groupby_rolling_docstring_tmpl.format(**{
+        'method_name': method_name,
+        'limitations_block': '',
+        'extra_params': ''
+    })
+
+    return sdc_pandas_groupby_rolling_method
+
+
+def gen_sdc_pandas_groupby_rolling_ddof_method(method_name, kernels):
+    """Generate GroupBy.rolling() method with parameter ddof computed by bounds kernel of Series.rolling()"""
+    def sdc_pandas_groupby_rolling_ddof_method(self, ddof=1):
+        ty_checker = TypeChecker(f'Method rolling.{method_name}().')
+        _groupby_check_numeric_columns(self.groupby, ty_checker)
+
+        if not isinstance(ddof, (int, types.Integer, types.Omitted)):
+            ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+        _, bounds_kernel = kernels
+        return sdc_pandas_groupby_rolling_apply_func(self, bounds_kernel, ['self', 'ddof'], {'ddof': 1},
+                                                     kernel_params=['ddof'])
+
+    sdc_pandas_groupby_rolling_ddof_method.__name__ = f'sdc_pandas_groupby_rolling_{method_name}'
+    sdc_pandas_groupby_rolling_ddof_method.__doc__ = sdc_pandas_groupby_rolling_docstring_tmpl.format(**{
+        'method_name': method_name,
+        'limitations_block': '',
+        'extra_params':
+        """
+    ddof: :obj:`int`
+        Delta Degrees of Freedom."""
+    })
+
+    return sdc_pandas_groupby_rolling_ddof_method
+
+
+sdc_pandas_series_groupby_rolling = sdc_overload_method(SeriesGroupByType, 'rolling')(
+    gen_sdc_pandas_groupby_rolling_overload_body(_hpat_pandas_series_groupby_rolling_init, SeriesGroupByType))
+sdc_pandas_dataframe_groupby_rolling = sdc_overload_method(DataFrameGroupByType, 'rolling')(
+    gen_sdc_pandas_groupby_rolling_overload_body(_hpat_pandas_df_groupby_rolling_init, DataFrameGroupByType))
+
+
+@sdc_overload_method(DataFrameGroupByRollingType, 'apply')
+@sdc_overload_method(SeriesGroupByRollingType, 'apply')
+def sdc_pandas_groupby_rolling_apply(self, func, raw=None):
+
+    ty_checker = TypeChecker('Method rolling.apply().')
+    _groupby_check_numeric_columns(self.groupby, ty_checker)
+
+    raw_accepted = (types.Omitted, types.NoneType, types.Boolean)
+    if not isinstance(raw, raw_accepted) and raw is not None:
+        ty_checker.raise_exc(raw, 'bool', 'raw')
+
+    return sdc_pandas_groupby_rolling_apply_func(self, rolling_apply_bounds, ['self', 'func', 'raw'],
+                                                 {'raw': None}, kernel_params=['func'])
+
+
+@sdc_overload_method(DataFrameGroupByRollingType, 'median')
+@sdc_overload_method(SeriesGroupByRollingType, 'median')
+def sdc_pandas_groupby_rolling_median(self):
+
+    ty_checker = TypeChecker('Method rolling.median().')
+    _groupby_check_numeric_columns(self.groupby, ty_checker)
+
+    return sdc_pandas_groupby_rolling_apply_func(self, rolling_order_stat_bounds, ['self'],
+                                                 kernel_params=['0.5', 'median=True'])
+
+
+@sdc_overload_method(DataFrameGroupByRollingType, 'quantile')
+@sdc_overload_method(SeriesGroupByRollingType, 'quantile')
+def sdc_pandas_groupby_rolling_quantile(self, quantile, interpolation='linear'):
+
+    ty_checker = TypeChecker('Method rolling.quantile().')
+    _groupby_check_numeric_columns(self.groupby, ty_checker)
+
+    if not isinstance(quantile, types.Number):
+        ty_checker.raise_exc(quantile, 'float', 'quantile')
+
+    str_types = (types.Omitted, types.StringLiteral, types.UnicodeType)
+    if not isinstance(interpolation, str_types) and interpolation != 'linear':
+        ty_checker.raise_exc(interpolation, 'str', 'interpolation')
+
+    prologue = [
+        '  if quantile < 0 or quantile > 1:',
+        '    raise ValueError(\'quantile value not in [0, 1]\')',
+        '  if interpolation != \'linear\':',
+        '    raise ValueError(\'interpolation value not "linear"\')',
+    ]
+    return sdc_pandas_groupby_rolling_apply_func(self, rolling_order_stat_bounds,
+                                                 ['self', 'quantile', 'interpolation'],
+                                                 {'interpolation': '\'linear\''},
+                                                 kernel_params=['quantile'], prologue=prologue)
+
+
+sdc_pandas_series_groupby_rolling.__doc__ = sdc_pandas_groupby_rolling_docstring_tmpl.format(**{
+    'method_name': 'rolling',
+    'limitations_block': '',
+    'extra_params':
+    """
+    window: :obj:`int`
+        Size of the moving window.
+    min_periods: :obj:`int`
+        Minimum number of observations in window required to have a value.
+    center: :obj:`bool`
+        Set the labels at the center of the window."""
+})
+sdc_pandas_dataframe_groupby_rolling.__doc__ = sdc_pandas_series_groupby_rolling.__doc__
+
+sdc_pandas_groupby_rolling_apply.__doc__ = sdc_pandas_groupby_rolling_docstring_tmpl.format(**{
+    'method_name': 'apply',
+    'limitations_block':
+    """
+    Supported ``raw`` only can be `None` or `True`. Parameters ``args``, ``kwargs`` unsupported.
+""",
+    'extra_params':
+    """
+    func:
+        A single value producer.
+    raw: :obj:`bool`
+        False : passes each row or column as a Series to the function.
+        True or None : the passed function will receive ndarray objects instead."""
+})
+
+sdc_pandas_groupby_rolling_median.__doc__ = sdc_pandas_groupby_rolling_docstring_tmpl.format(**{
+    'method_name': 'median',
+    'limitations_block': '',
+    'extra_params': ''
+})
+
+sdc_pandas_groupby_rolling_quantile.__doc__ = sdc_pandas_groupby_rolling_docstring_tmpl.format(**{
+    'method_name': 'quantile',
+    'limitations_block':
+    """
+    Supported ``interpolation`` only can be `'linear'`.
+""",
+    'extra_params':
+    """
+    quantile: :obj:`float`
+        Quantile to compute. 0 <= quantile <= 1.
+    interpolation: :obj:`str`
+        This optional parameter specifies the interpolation method to use."""
+})
+
+
+groupby_rolling_methods = {
+    'count': sdc_pandas_series_rolling_count_kernels,
+    'kurt': sdc_pandas_series_rolling_kurt_kernels,
+    'max': sdc_pandas_series_rolling_max_kernels,
+    'mean': sdc_pandas_series_rolling_mean_kernels,
+    'min': sdc_pandas_series_rolling_min_kernels,
+    'skew': sdc_pandas_series_rolling_skew_kernels,
+    'sum': sdc_pandas_series_rolling_sum_kernels,
+}
+groupby_rolling_ddof_methods = {
+    'std': sdc_pandas_series_rolling_std_kernels,
+    'var': sdc_pandas_series_rolling_var_kernels,
+}
+
+for method_name, kernels in groupby_rolling_methods.items():
+    overload = gen_sdc_pandas_groupby_rolling_method(method_name, kernels)
+    for ty in (SeriesGroupByRollingType, DataFrameGroupByRollingType):
+        sdc_overload_method(ty, method_name)(overload)
+
+for method_name, kernels in groupby_rolling_ddof_methods.items():
+    overload = gen_sdc_pandas_groupby_rolling_ddof_method(method_name, kernels)
+    for ty in (SeriesGroupByRollingType, DataFrameGroupByRollingType):
+        sdc_overload_method(ty, method_name)(overload)
@@ -0,0 +1,172 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+from numba.core import cgutils, types
+from numba.core.datamodel import StructModel
+from numba.extending import intrinsic, make_attribute_wrapper, models, register_model
+from numba.core.typing.templates import signature
+from sdc.utilities.sdc_typing_utils import TypeChecker
+
+
+class GroupByRollingType(types.Type):
+    """Type definition for pandas.core.groupby.GroupBy.rolling functions handling."""
+    def __init__(self, ty, groupby):
+        self.groupby = groupby
+
+        super(GroupByRollingType, self).__init__('{}({})'.format(ty, groupby))
+
+
+class GroupByRollingTypeModel(StructModel):
+    """Model for GroupByRollingType type."""
+    def __init__(self, dmm, fe_type):
+        members = [
+            ('groupby', fe_type.groupby),
+            ('window', types.intp),
+            ('min_periods', types.intp),
+            ('center', types.boolean),
+        ]
+        models.StructModel.__init__(self, dmm, fe_type, members)
+
+
+make_attribute_wrapper(GroupByRollingType, 'groupby', '_groupby')
+make_attribute_wrapper(GroupByRollingType, 'window', '_window')
+make_attribute_wrapper(GroupByRollingType, 'min_periods', '_min_periods')
+make_attribute_wrapper(GroupByRollingType, 'center', '_center')
+
+
+class SeriesGroupByRollingType(GroupByRollingType):
+    """Type definition for pandas.core.groupby.SeriesGroupBy.rolling functions handling."""
+    def __init__(self, groupby):
+        super(SeriesGroupByRollingType, self).__init__('SeriesGroupByRollingType', groupby)
+
+
+@register_model(SeriesGroupByRollingType)
+class SeriesGroupByRollingTypeModel(GroupByRollingTypeModel):
+    """Model for SeriesGroupByRollingType type."""
+    def __init__(self, dmm, fe_type):
+        super(SeriesGroupByRollingTypeModel, self).__init__(dmm, fe_type)
+
+
+class DataFrameGroupByRollingType(GroupByRollingType):
+    """Type definition for pandas.core.groupby.DataFrameGroupBy.rolling functions handling."""
+    def __init__(self, groupby):
+        super(DataFrameGroupByRollingType, self).__init__('DataFrameGroupByRollingType', groupby)
+
+
+@register_model(DataFrameGroupByRollingType)
+class DataFrameGroupByRollingTypeModel(GroupByRollingTypeModel):
+    """Model for DataFrameGroupByRollingType type."""
+    def __init__(self, dmm, fe_type):
+        super(DataFrameGroupByRollingTypeModel, self).__init__(dmm, fe_type)
+
+
+def gen_hpat_pandas_groupby_rolling_init(ty):
+    """Generate groupby rolling initializer based on groupby type"""
+    def _hpat_pandas_groupby_rolling_init(typingctx, self, window, min_periods, center):
+        """Internal Numba required function to register GroupByRollingType."""
+        ret_typ = ty(self)
+        sig = signature(ret_typ, self, window, min_periods, center)
+
+        def _codegen(context, builder, sig, args):
+            """Create GroupByRollingTypeModel structure."""
+            groupby, window, min_periods, center = args
+            rolling = cgutils.create_struct_proxy(sig.return_type)(context, builder)
+            rolling.groupby = groupby
+            rolling.window = context.cast(builder, window, sig.args[1], types.intp)
+            rolling.min_periods = context.cast(builder, min_periods, sig.args[2], types.intp)
+            rolling.center = context.cast(builder, center, sig.args[3], types.boolean)
+
+            if context.enable_nrt:
+                context.nrt.incref(builder, self, rolling.groupby)
+
+            return rolling._getvalue()
+
+        return sig, _codegen
+
+    return _hpat_pandas_groupby_rolling_init
+
+
+_hpat_pandas_series_groupby_rolling_init = intrinsic(gen_hpat_pandas_groupby_rolling_init(SeriesGroupByRollingType))
+_hpat_pandas_df_groupby_rolling_init = intrinsic(gen_hpat_pandas_groupby_rolling_init(DataFrameGroupByRollingType))
+
+
+def gen_sdc_pandas_groupby_rolling_overload_body(initializer, ty):
+    """Generate code of the overloaded method using associated GroupBy type and constructor."""
+    def sdc_pandas_groupby_rolling(self, window, min_periods=None, center=False,
+                                   win_type=None, on=None, axis=0, closed=None):
+        ty_checker = TypeChecker('Method GroupBy.rolling().')
+        ty_checker.check(self, ty)
+
+        if not isinstance(window, types.Integer):
+            ty_checker.raise_exc(window, 'int', 'window')
+
+        minp_accepted = (types.Omitted, types.NoneType, types.Integer)
+        if not isinstance(min_periods, minp_accepted) and min_periods is not None:
+            ty_checker.raise_exc(min_periods, 'None, int', 'min_periods')
+
+        center_accepted = (types.Omitted, types.Boolean)
+        if not isinstance(center, center_accepted) and center is not False:
+            ty_checker.raise_exc(center, 'bool', 'center')
+
+        none_accepted = (types.Omitted, types.NoneType)
+        if not isinstance(win_type, none_accepted) and win_type is not None:
+            ty_checker.raise_exc(win_type, 'None', 'win_type')
+
+        if not isinstance(on, none_accepted) and on is not None:
+            ty_checker.raise_exc(on, 'None', 'on')
+
+        axis_accepted = (types.Omitted, types.Integer, types.StringLiteral, types.UnicodeType)
+        if not isinstance(axis, axis_accepted) and axis != 0:
+            ty_checker.raise_exc(axis, 'int, str', 'axis')
+
+        if not isinstance(closed, none_accepted) and closed is not None:
+            ty_checker.raise_exc(closed, 'None', 'closed')
+
+        nan_minp = isinstance(min_periods, (types.Omitted, types.NoneType)) or min_periods is None
+
+        def sdc_pandas_groupby_rolling_impl(self, window, min_periods=None, center=False,
+                                            win_type=None, on=None, axis=0, closed=None):
+            if window < 0:
+                raise ValueError('window must be non-negative')
+
+            if nan_minp == True:  # noqa
+                minp = window
+            else:
+                minp = min_periods
+
+            if minp < 0:
+                raise ValueError('min_periods must be >= 0')
+            if minp > window:
+                raise ValueError('min_periods must be <= window')
+
+            if axis != 0:
+                raise ValueError('Method GroupBy.rolling(). The object axis\n expected: 0')
+
+            return initializer(self, window, minp, center)
+
+        return sdc_pandas_groupby_rolling_impl
+
+    return sdc_pandas_groupby_rolling
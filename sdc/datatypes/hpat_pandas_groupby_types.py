@@ -28,39 +28,60 @@
 import numba
 from numba import types
 from numba.extending import (models, register_model, make_attribute_wrapper)
+from sdc.str_arr_type import string_array_type
 from sdc.str_ext import string_type
 
 
+def groupby_index_type(by_type):
+    """
+    Type of group index (keys, codes, offsets, positions) built for grouping by array of by_type,
+    see sdc.functions.groupby.build_group_index
+    """
+    if isinstance(by_type, types.BaseTuple):
+        keys_type = types.Tuple([groupby_index_type(a).types[0] for a in by_type])
+    elif by_type == string_array_type:
+        keys_type = string_array_type
+    else:
+        keys_type = types.Array(by_type.dtype, 1, 'C')
+    int64_array_type = types.Array(types.int64, 1, 'C')
+
+    return types.Tuple([keys_type, int64_array_type, int64_array_type, int64_array_type])
+
+
 class DataFrameGroupByType(types.Type):
     """
     Type definition for DataFrameGroupBy functions handling.
     """
 
-    def __init__(self, parent, col_id, target_columns):
+    def __init__(self, parent, by_col_ids, target_columns, as_index=True):
         self.parent = parent
-        self.col_id = col_id
+        self.by_col_ids = by_col_ids
         self.target_columns = target_columns
+        self.as_index = as_index
         super(DataFrameGroupByType, self).__init__(
-            name="DataFrameGroupByType({}, {})".format(parent, col_id, target_columns))
+            name="DataFrameGroupByType({}, {}, {}, {})".format(parent, by_col_ids, target_columns, as_index))
 
     @property
     def key(self):
-        return self.parent, self.col_id, self.target_columns
+        return self.parent, self.by_col_ids, self.target_columns, self.as_index
+
+    @property
+    def by_data(self):
+        """Type of the array data is grouped by, tuple of arrays types for multiple keys"""
+        if len(self.by_col_ids) == 1:
+            return self.parent.data[self.by_col_ids[0]]
+
+        return types.Tuple([self.parent.data[i] for i in self.by_col_ids])
 
 
 @register_model(DataFrameGroupByType)
 class DataFrameGroupByModel(models.StructModel):
     def __init__(self, dmm, fe_type):
-        by_series_dtype = fe_type.parent.data[fe_type.col_id.literal_value].dtype
-        ty_data = types.containers.DictType(
-            by_series_dtype,
-            types.containers.ListType(types.int64)
-        )
+        ty_data = groupby_index_type(fe_type.by_data)
 
         n_target_cols = len(fe_type.target_columns)
         members = [
             ('parent', fe_type.parent),
-            ('col_id', types.int64),
             ('data', ty_data),
             ('sort', types.bool_),
             ('target_default', types.bool_),
@@ -70,7 +91,6 @@ class DataFrameGroupByModel(models.StructModel):
 
 
 make_attribute_wrapper(DataFrameGroupByType, 'parent', '_parent')
-make_attribute_wrapper(DataFrameGroupByType, 'col_id', '_col_id')
 make_attribute_wrapper(DataFrameGroupByType, 'data', '_data')
 make_attribute_wrapper(DataFrameGroupByType, 'sort', '_sort')
 make_attribute_wrapper(DataFrameGroupByType, 'target_default', '_target_default')
@@ -96,11 +116,7 @@ class SeriesGroupByType(types.Type):
 @register_model(SeriesGroupByType)
 class SeriesGroupByModel(models.StructModel):
     def __init__(self, dmm, fe_type):
-        by_dtype = fe_type.by_data.dtype
-        ty_data = types.containers.DictType(
-            by_dtype,
-            types.containers.ListType(types.int64)
-        )
+        ty_data = groupby_index_type(fe_type.by_data)
 
         members = [
             ('parent', fe_type.parent),
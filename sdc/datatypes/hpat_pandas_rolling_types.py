@@ -28,21 +28,32 @@ from numba.core import cgutils, types
 from numba.core.datamodel import StructModel
 from numba.extending import make_attribute_wrapper, models
 from numba.core.typing.templates import signature
+from sdc.functions.window import closed_endpoints, offset_to_nanoseconds, window_weights
+from sdc.hiframes.pd_dataframe_type import DataFrameType
 from sdc.utilities.sdc_typing_utils import TypeChecker
 
 
 class RollingType(types.Type):
     """Type definition for pandas.rolling functions handling."""
-    def __init__(self, ty, data, win_type=None, on=None, closed=None):
+    def __init__(self, ty, data, win_type=None, on=None, closed=None, offset=False, on_column=None):
         self.data = data
         self.win_type = win_type or types.none
         self.on = on or types.none
         self.closed = closed or types.none
+        # window is a period of time in nanoseconds rather than a number of rows
+        self.offset = offset
+        # name of the column with times of rows, index is used if it is None
+        self.on_column = on_column
 
-        name_tmpl = '{}({}, win_type={}, on={}, closed={})'
-        name = name_tmpl.format(ty, data, self.win_type, self.on, self.closed)
+        name_tmpl = '{}({}, win_type={}, on={}, closed={}, offset={}, on_column={})'
+        name = name_tmpl.format(ty, data, self.win_type, self.on, self.closed, self.offset, self.on_column)
         super(RollingType, self).__init__(name)
 
+    @property
+    def weighted(self):
+        """Window values are weighted according to win_type"""
+        return not isinstance(self.win_type, (types.Omitted, types.NoneType))
+
 
 class RollingTypeModel(StructModel):
     """Model for RollingType type."""
@@ -72,13 +83,13 @@ make_attribute_wrapper(RollingType, 'axis', '_axis')
 make_attribute_wrapper(RollingType, 'closed', '_closed')
 
 
-def gen_hpat_pandas_rolling_init(ty):
+def gen_hpat_pandas_rolling_init(ty, offset=False, on_column=None):
     """Generate rolling initializer based on data type"""
     def _hpat_pandas_rolling_init(typingctx, self, window, min_periods=None,
                                   center=False, win_type=None,
                                   on=None, axis=0, closed=None):
         """Internal Numba required function to register RollingType."""
-        ret_typ = ty(self, win_type, on, closed)
+        ret_typ = ty(self, win_type, on, closed, offset=offset, on_column=on_column)
         sig = signature(ret_typ, self, window, min_periods,
                         center, win_type, on, axis, closed)
 
@@ -105,15 +116,50 @@ def gen_hpat_pandas_rolling_init(ty):
     return _hpat_pandas_rolling_init
 
 
-def gen_sdc_pandas_rolling_overload_body(initializer, ty):
-    """Generate code of the overloaded method using associated DataType and constructor."""
+def gen_sdc_pandas_rolling_offset_impl(offset_initializer, nan_minp):
+    """Generate rolling initialization for windows given by a fixed frequency offset, e.g. '5min'"""
+    def sdc_pandas_rolling_offset_impl(self, window, min_periods=None, center=False,
+                                       win_type=None, on=None, axis=0, closed=None):
+        window_ns = offset_to_nanoseconds(window)
+
+        if nan_minp == True:  # noqa
+            minp = 1
+        else:
+            minp = min_periods
+
+        if minp < 0:
+            raise ValueError('min_periods must be >= 0')
+
+        if center != False:  # noqa
+            raise ValueError('Method rolling(). The object center\n expected: False')
+
+        if win_type is not None:
+            raise ValueError('Method rolling(). The object win_type\n expected: None')
+
+        if axis != 0:
+            raise ValueError('Method rolling(). The object axis\n expected: 0')
+
+        # validate closed
+        closed_endpoints(closed)
+
+        return offset_initializer(self, window_ns, minp, center, win_type, on, axis, closed)
+
+    return sdc_pandas_rolling_offset_impl
+
+
+def gen_sdc_pandas_rolling_overload_body(initializer, ty, offset_initializer=None):
+    """
+    Generate code of the overloaded method using associated DataType and constructor.
+    offset_initializer(on_column) returns constructor of rolling over windows given by a period of time.
+    """
     def sdc_pandas_rolling(self, window, min_periods=None, center=False,
                            win_type=None, on=None, axis=0, closed=None):
         ty_checker = TypeChecker('Method rolling().')
         ty_checker.check(self, ty)
 
-        if not isinstance(window, types.Integer):
-            ty_checker.raise_exc(window, 'int', 'window')
+        offset_window = isinstance(window, (types.StringLiteral, types.UnicodeType))
+        if not isinstance(window, types.Integer) and not offset_window:
+            ty_checker.raise_exc(window, 'int, str', 'window')
 
         minp_accepted = (types.Omitted, types.NoneType, types.Integer)
         if not isinstance(min_periods, minp_accepted) and min_periods is not None:
@@ -139,11 +185,39 @@ def gen_sdc_pandas_rolling_overload_body(initializer, ty):
 
         nan_minp = isinstance(min_periods, (types.Omitted, types.NoneType)) or min_periods is None
 
+        if offset_window and offset_initializer is not None:
+            on_column = None
+            times = self.index
+            if not (isinstance(on, (types.Omitted, types.NoneType)) or on is None):
+                if not isinstance(self, DataFrameType):
+                    ty_checker.raise_exc(on, 'None', 'on')
+                if not isinstance(on, types.StringLiteral) or on.literal_value not in self.columns:
+                    ty_checker.raise_exc(on, 'const str naming a column', 'on')
+
+                on_column = on.literal_value
+                times = self.data[self.columns.index(on_column)]
+
+            if not (isinstance(times, types.Array) and isinstance(times.dtype, types.NPDatetime)):
+                ty_checker.raise_exc(times, 'DatetimeIndex or datetime64 column', 'on' if on_column else 'index')
+
+            return gen_sdc_pandas_rolling_offset_impl(offset_initializer(on_column), nan_minp)
+
+        if offset_window:
+            ty_checker.raise_exc(window, 'int', 'window')
+
+        weighted = not (isinstance(win_type, (types.Omitted, types.NoneType)) or win_type is None)
+
         def sdc_pandas_rolling_impl(self, window, min_periods=None, center=False,
                                     win_type=None, on=None, axis=0, closed=None):
             if window < 0:
                 raise ValueError('window must be non-negative')
 
+            if weighted == True:  # noqa
+                if window == 0:
+                    raise ValueError('window must be > 0')
+                # validate win_type
+                window_weights(win_type, 1, 1., 1.)
+
             if nan_minp == True:  # noqa
                 minp = window
             else:
@@ -154,12 +228,6 @@ def gen_sdc_pandas_rolling_overload_body(initializer, ty):
             if minp > window:
                 raise ValueError('min_periods must be <= window')
 
-            if center != False:  # noqa
-                raise ValueError('Method rolling(). The object center\n expected: False')
-
-            if win_type is not None:
-                raise ValueError('Method rolling(). The object win_type\n expected: None')
-
             if on is not None:
                 raise ValueError('Method rolling(). The object on\n expected: None')
 
@@ -183,7 +251,14 @@ sdc_pandas_rolling_docstring_tmpl = """
 
     Limitations
     -----------
-    Parameters ``center``, ``win_type``, ``on``, ``axis`` and ``closed`` are supported only with default values.
+    Parameter ``axis`` is supported only with default value.
+    Parameter ``win_type`` supports 'triang', 'hamming', 'gaussian' and 'exponential' windows,
+    weighted windows provide methods ``sum`` and ``mean`` only.
+    Window given by an offset requires monotonic datetime64 index or datetime64 column given by ``on``
+    and supports fixed frequency offsets only, e.g. '5min', '1s' or '2D'.
+    Parameters ``on`` and ``closed`` are supported only with window given by an offset,
+    parameters ``center`` and ``win_type`` are not supported with window given by an offset.
+    Methods ``corr`` and ``cov`` are not supported with window given by an offset.
 
     Examples
     --------
@@ -196,7 +271,7 @@ sdc_pandas_rolling_docstring_tmpl = """
     .. command-output:: python ./{ty_lower}/rolling/{ty_lower}_rolling_min.py
        :cwd: ../../../examples
 
-    .. todo:: Add support of parameters ``center``, ``win_type``, ``on``, ``axis`` and ``closed``
+    .. todo:: Add support of parameter ``axis``
 
     .. seealso::
         :ref:`expanding <pandas.{ty}.expanding>`
@@ -222,13 +297,10 @@ sdc_pandas_rolling_docstring_tmpl = """
         Minimum number of observations in window required to have a value.
     center: :obj:`bool`
         Set the labels at the center of the window.
-        *unsupported*
     win_type: :obj:`str`
         Provide a window type.
-        *unsupported*
     on: :obj:`str`
         Column on which to calculate the rolling window.
-        *unsupported*
     axis: :obj:`int`, :obj:`str`
         Axis along which the operation acts
         0/None/'index' - row-wise operation
@@ -236,7 +308,6 @@ sdc_pandas_rolling_docstring_tmpl = """
         *unsupported*
     closed: :obj:`str`
         Make the interval closed on the ‘right’, ‘left’, ‘both’ or ‘neither’ endpoints.
-        *unsupported*
 
     Returns
     -------
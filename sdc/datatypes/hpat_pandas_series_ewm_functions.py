@@ -0,0 +1,503 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Exponentially weighted moments are computed by the recurrence of pandas ewma/ewmcov.
+The recurrence is a linear scan, so it is parallelized over chunks in three passes:
+the observations of each chunk are summarized as a weighted group independently of preceding chunks,
+the summaries are merged sequentially to get the state at the beginning of each chunk,
+then the recurrence is run within each chunk starting from that state.
+"""
+
+import numpy
+import pandas
+
+from numba import prange
+from numba.core.types import float64, Boolean, NoneType, Omitted
+
+from sdc.datatypes.hpat_pandas_ewm_types import SeriesEWMType
+from sdc.hiframes.pd_series_type import SeriesType
+from sdc.utilities.prange_utils import parallel_chunks
+from sdc.utilities.sdc_typing_utils import TypeChecker
+from sdc.utilities.utils import sdc_overload_method, sdc_register_jitable
+
+
+hpat_pandas_series_ewm_docstring_tmpl = """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.core.window.EWM.{method_name}
+{limitations_block}
+    .. seealso::
+        :ref:`Series.ewm <pandas.Series.ewm>`
+            Calling object with a Series.
+        :ref:`DataFrame.ewm <pandas.DataFrame.ewm>`
+            Calling object with a DataFrame.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas Series method :meth:`pandas.Series.ewm.{method_name}()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_rolling.TestRolling.test_series_ewm
+
+    Parameters
+    ----------
+    self: :class:`pandas.Series.ewm`
+        input arg{extra_params}
+
+    Returns
+    -------
+    :obj:`pandas.Series`
+         returns :obj:`pandas.Series` object
+"""
+
+
+@sdc_register_jitable
+def ewm_values(main_arr, other_arr, idx, min_length):
+    """Get pair of values, pairs out of the shorter array are missing."""
+    if idx < min_length:
+        return float64(main_arr[idx]), float64(other_arr[idx])
+
+    return numpy.nan, numpy.nan
+
+
+@sdc_register_jitable
+def ewm_update(x, y, moments, old_wt, new_wt):
+    """Calculate weighted means and covariances with new observation."""
+    mean_x, mean_y, cov_xy, var_x, var_y = moments
+    old_mean_x, old_mean_y = mean_x, mean_y
+    total_wt = old_wt + new_wt
+    # avoid numerical errors on constant series
+    if mean_x != x:
+        mean_x = (old_wt * old_mean_x + new_wt * x) / total_wt
+    if mean_y != y:
+        mean_y = (old_wt * old_mean_y + new_wt * y) / total_wt
+
+    dx, dy = old_mean_x - mean_x, old_mean_y - mean_y
+    cov_xy = (old_wt * (cov_xy + dx * dy) + new_wt * (x - mean_x) * (y - mean_y)) / total_wt
+    var_x = (old_wt * (var_x + dx * dx) + new_wt * (x - mean_x) * (x - mean_x)) / total_wt
+    var_y = (old_wt * (var_y + dy * dy) + new_wt * (y - mean_y) * (y - mean_y)) / total_wt
+
+    return mean_x, mean_y, cov_xy, var_x, var_y
+
+
+@sdc_register_jitable
+def ewm_step(x, y, state, alpha, adjust, ignore_na):
+    """Calculate the state of exponentially weighted moments with new values."""
+    moments, sum_wt, sum_wt2, nobs = state
+    is_observation = numpy.isfinite(x) and numpy.isfinite(y)
+    if nobs > 0:
+        if is_observation or not ignore_na:
+            old_wt_factor = 1. - alpha
+            sum_wt *= old_wt_factor
+            sum_wt2 *= old_wt_factor * old_wt_factor
+            if is_observation:
+                new_wt = 1. if adjust else alpha
+                moments = ewm_update(x, y, moments, sum_wt, new_wt)
+                sum_wt += new_wt
+                sum_wt2 += new_wt * new_wt
+                if not adjust:
+                    sum_wt2 /= sum_wt * sum_wt
+                    sum_wt = 1.
+    elif is_observation:
+        moments = (x, y, 0., 0., 0.)
+
+    if is_observation:
+        nobs += 1
+
+    return moments, sum_wt, sum_wt2, nobs
+
+
+@sdc_register_jitable
+def ewm_decay(state, count, alpha):
+    """Calculate the state of exponentially weighted moments after count missing values."""
+    moments, sum_wt, sum_wt2, nobs = state
+    if nobs == 0 or count == 0:
+        return state
+
+    decay = (1. - alpha) ** count
+
+    return moments, sum_wt * decay, sum_wt2 * decay * decay, nobs
+
+
+@sdc_register_jitable
+def ewm_chunk_summary(main_arr, other_arr, start, stop, min_length, alpha, adjust, ignore_na):
+    """
+    Summarize observations of the chunk as a weighted group. The first observation is kept apart,
+    because its weight depends on preceding chunks, the rest ones form the group of weight rest_wt
+    relatively to the weight of the first observation and the preceding ones decayed to prefix_wt.
+    """
+    old_wt_factor = 1. - alpha
+    new_wt = 1. if adjust else alpha
+
+    nobs = 0
+    # number of decays of preceding observations up to the first observation and after the last one
+    lead, tail = 0, 0
+    first_x, first_y = 0., 0.
+    prefix_wt, rest_wt, rest_wt2 = 1., 0., 0.
+    rest = (0., 0., 0., 0., 0.)
+    for idx in range(start, stop):
+        x, y = ewm_values(main_arr, other_arr, idx, min_length)
+        is_observation = numpy.isfinite(x) and numpy.isfinite(y)
+        if is_observation or not ignore_na:
+            tail += 1
+
+        if not is_observation:
+            continue
+
+        nobs += 1
+        if nobs == 1:
+            lead, tail = tail, 0
+            first_x, first_y = x, y
+            continue
+
+        decay = old_wt_factor ** tail
+        tail = 0
+        prefix_wt *= decay
+        rest_wt *= decay
+        rest_wt2 *= decay * decay
+        rest = ewm_update(x, y, rest, rest_wt, new_wt)
+        rest_wt += new_wt
+        rest_wt2 += new_wt * new_wt
+        if not adjust:
+            total_wt = prefix_wt + rest_wt
+            prefix_wt /= total_wt
+            rest_wt /= total_wt
+            rest_wt2 /= total_wt * total_wt
+
+    if nobs == 0:
+        lead, tail = tail, 0
+
+    return nobs, lead, tail, first_x, first_y, prefix_wt, rest_wt, rest_wt2, rest
+
+
+@sdc_register_jitable
+def ewm_merge_summary(state, summary, alpha, adjust, ignore_na):
+    """Calculate the state of exponentially weighted moments after the chunk given by summary."""
+    nobs, lead, tail, first_x, first_y, prefix_wt, rest_wt, rest_wt2, rest = summary
+    if nobs == 0:
+        return ewm_decay(state, lead, alpha)
+
+    state = ewm_decay(state, lead - 1, alpha)
+    moments, sum_wt, sum_wt2, total_nobs = ewm_step(first_x, first_y, state, alpha, adjust, ignore_na)
+    if rest_wt > 0:
+        mean_x, mean_y, cov_xy, var_x, var_y = moments
+        rest_mean_x, rest_mean_y, rest_cov_xy, rest_var_x, rest_var_y = rest
+        prefix_sum_wt = sum_wt * prefix_wt
+        total_wt = prefix_sum_wt + rest_wt
+        prefix_ratio, rest_ratio = prefix_sum_wt / total_wt, rest_wt / total_wt
+        dx, dy = mean_x - rest_mean_x, mean_y - rest_mean_y
+        moments = (prefix_ratio * mean_x + rest_ratio * rest_mean_x,
+                   prefix_ratio * mean_y + rest_ratio * rest_mean_y,
+                   prefix_ratio * cov_xy + rest_ratio * rest_cov_xy + prefix_ratio * rest_ratio * dx * dy,
+                   prefix_ratio * var_x + rest_ratio * rest_var_x + prefix_ratio * rest_ratio * dx * dx,
+                   prefix_ratio * var_y + rest_ratio * rest_var_y + prefix_ratio * rest_ratio * dy * dy)
+        sum_wt2 = sum_wt2 * prefix_wt * prefix_wt + rest_wt2
+        sum_wt = total_wt
+    else:
+        sum_wt *= prefix_wt
+        sum_wt2 *= prefix_wt * prefix_wt
+
+    return ewm_decay((moments, sum_wt, sum_wt2, total_nobs + nobs - 1), tail, alpha)
+
+
+def gen_ewm_kernel(get_result):
+    """Generate kernel calculating exponentially weighted results over pairs of values"""
+    def kernel(main_arr, other_arr, alpha, adjust, ignore_na, minp, bias):
+        min_length = min(len(main_arr), len(other_arr))
+        length = max(len(main_arr), len(other_arr))
+        output_arr = numpy.empty(length, dtype=float64)
+
+        chunks = parallel_chunks(length)
+        empty_summary = ewm_chunk_summary(main_arr, other_arr, 0, 0, min_length, alpha, adjust, ignore_na)
+        summaries = [empty_summary] * len(chunks)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            summaries[i] = ewm_chunk_summary(main_arr, other_arr, chunk.start, chunk.stop, min_length,
+                                             alpha, adjust, ignore_na)
+
+        state = ((numpy.nan, numpy.nan, 0., 0., 0.), 1., 1., 0)
+        chunk_states = [state] * len(chunks)
+        for i in range(len(chunks)):
+            chunk_states[i] = state
+            state = ewm_merge_summary(state, summaries[i], alpha, adjust, ignore_na)
+
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            chunk_state = chunk_states[i]
+            for idx in range(chunk.start, chunk.stop):
+                x, y = ewm_values(main_arr, other_arr, idx, min_length)
+                chunk_state = ewm_step(x, y, chunk_state, alpha, adjust, ignore_na)
+                output_arr[idx] = get_result(chunk_state, minp, bias)
+
+        return output_arr
+
+    return sdc_register_jitable(kernel)
+
+
+@sdc_register_jitable
+def ewm_zsqrt(value):
+    """Square root of non-negative value, zero otherwise"""
+    if value < 0:
+        return 0.
+
+    return numpy.sqrt(value)
+
+
+@sdc_register_jitable
+def ewm_bias_correction(state, value, bias):
+    """Get the value corrected for statistical bias if needed."""
+    if bias:
+        return value
+
+    moments, sum_wt, sum_wt2, nobs = state
+    numerator = sum_wt * sum_wt
+    denominator = numerator - sum_wt2
+    if denominator > 0.:
+        return numerator / denominator * value
+
+    return numpy.nan
+
+
+@sdc_register_jitable
+def ewm_mean_result(state, minp, bias):
+    """Get result mean taking into account min periods."""
+    moments, sum_wt, sum_wt2, nobs = state
+    if nobs < max(minp, 1):
+        return numpy.nan
+
+    return moments[0]
+
+
+@sdc_register_jitable
+def ewm_cov_result(state, minp, bias):
+    """Get result cov taking into account min periods."""
+    moments, sum_wt, sum_wt2, nobs = state
+    if nobs < max(minp, 1):
+        return numpy.nan
+
+    return ewm_bias_correction(state, moments[2], bias)
+
+
+@sdc_register_jitable
+def ewm_std_result(state, minp, bias):
+    """Get result std taking into account min periods."""
+    return ewm_zsqrt(ewm_cov_result(state, minp, bias))
+
+
+@sdc_register_jitable
+def ewm_corr_result(state, minp, bias):
+    """Get result corr taking into account min periods."""
+    moments, sum_wt, sum_wt2, nobs = state
+    if nobs < max(minp, 1):
+        return numpy.nan
+
+    mean_x, mean_y, cov_xy, var_x, var_y = moments
+    denominator = ewm_zsqrt(var_x * var_y)
+    if denominator == 0.:
+        if cov_xy == 0. or numpy.isnan(cov_xy):
+            return numpy.nan
+        return cov_xy * numpy.inf
+
+    return cov_xy / denominator
+
+
+ewm_corr_kernel = gen_ewm_kernel(ewm_corr_result)
+ewm_cov_kernel = gen_ewm_kernel(ewm_cov_result)
+ewm_mean_kernel = gen_ewm_kernel(ewm_mean_result)
+ewm_std_kernel = gen_ewm_kernel(ewm_std_result)
+
+
+def gen_sdc_pandas_series_ewm_impl(kernel):
+    """Generate series ewm methods implementations based on kernel"""
+    def impl(self):
+        input_series = self._data
+        input_arr = input_series._data
+        alpha = 1. / (1. + self._com)
+        output_arr = kernel(input_arr, input_arr, alpha, self._adjust, self._ignore_na,
+                            self._min_periods, True)
+
+        return pandas.Series(output_arr, input_series._index,
+                             name=input_series._name)
+    return impl
+
+
+def gen_sdc_pandas_series_ewm_bias_impl(kernel):
+    """Generate series ewm methods implementations with parameter bias"""
+    def impl(self, bias=False):
+        input_series = self._data
+        input_arr = input_series._data
+        alpha = 1. / (1. + self._com)
+        output_arr = kernel(input_arr, input_arr, alpha, self._adjust, self._ignore_na,
+                            self._min_periods, bias)
+
+        return pandas.Series(output_arr, input_series._index,
+                             name=input_series._name)
+    return impl
+
+
+def _hpat_pandas_series_ewm_check_types(ty_checker, other=None, pairwise=None, bias=False):
+    """Check types of parameters of series.ewm methods"""
+    accepted_other = (bool, Omitted, NoneType, SeriesType)
+    if not isinstance(other, accepted_other) and other is not None:
+        ty_checker.raise_exc(other, 'Series', 'other')
+
+    accepted_pairwise = (bool, Boolean, Omitted, NoneType)
+    if not isinstance(pairwise, accepted_pairwise) and pairwise is not None:
+        ty_checker.raise_exc(pairwise, 'bool', 'pairwise')
+
+    if not isinstance(bias, (bool, Boolean, Omitted)):
+        ty_checker.raise_exc(bias, 'bool', 'bias')
+
+
+@sdc_overload_method(SeriesEWMType, 'corr')
+def hpat_pandas_series_ewm_corr(self, other=None, pairwise=None):
+
+    ty_checker = TypeChecker('Method ewm.corr().')
+    ty_checker.check(self, SeriesEWMType)
+
+    _hpat_pandas_series_ewm_check_types(ty_checker, other=other, pairwise=pairwise)
+
+    nan_other = isinstance(other, (Omitted, NoneType)) or other is None
+
+    def hpat_pandas_series_ewm_corr_impl(self, other=None, pairwise=None):
+        main_arr = self._data._data
+        if nan_other == True:  # noqa
+            other_arr = main_arr
+        else:
+            other_arr = other._data
+
+        alpha = 1. / (1. + self._com)
+        output_arr = ewm_corr_kernel(main_arr, other_arr, alpha, self._adjust, self._ignore_na,
+                                     self._min_periods, True)
+
+        return pandas.Series(output_arr)
+
+    return hpat_pandas_series_ewm_corr_impl
+
+
+@sdc_overload_method(SeriesEWMType, 'cov')
+def hpat_pandas_series_ewm_cov(self, other=None, pairwise=None, bias=False):
+
+    ty_checker = TypeChecker('Method ewm.cov().')
+    ty_checker.check(self, SeriesEWMType)
+
+    _hpat_pandas_series_ewm_check_types(ty_checker, other=other, pairwise=pairwise, bias=bias)
+
+    nan_other = isinstance(other, (Omitted, NoneType)) or other is None
+
+    def hpat_pandas_series_ewm_cov_impl(self, other=None, pairwise=None, bias=False):
+        main_arr = self._data._data
+        if nan_other == True:  # noqa
+            other_arr = main_arr
+        else:
+            other_arr = other._data
+
+        alpha = 1. / (1. + self._com)
+        output_arr = ewm_cov_kernel(main_arr, other_arr, alpha, self._adjust, self._ignore_na,
+                                    self._min_periods, bias)
+
+        return pandas.Series(output_arr)
+
+    return hpat_pandas_series_ewm_cov_impl
+
+
+@sdc_overload_method(SeriesEWMType, 'mean')
+def hpat_pandas_series_ewm_mean(self):
+
+    ty_checker = TypeChecker('Method ewm.mean().')
+    ty_checker.check(self, SeriesEWMType)
+
+    return gen_sdc_pandas_series_ewm_impl(ewm_mean_kernel)
+
+
+@sdc_overload_method(SeriesEWMType, 'std')
+def hpat_pandas_series_ewm_std(self, bias=False):
+
+    ty_checker = TypeChecker('Method ewm.std().')
+    ty_checker.check(self, SeriesEWMType)
+
+    _hpat_pandas_series_ewm_check_types(ty_checker, bias=bias)
+
+    return gen_sdc_pandas_series_ewm_bias_impl(ewm_std_kernel)
+
+
+@sdc_overload_method(SeriesEWMType, 'var')
+def hpat_pandas_series_ewm_var(self, bias=False):
+
+    ty_checker = TypeChecker('Method ewm.var().')
+    ty_checker.check(self, SeriesEWMType)
+
+    _hpat_pandas_series_ewm_check_types(ty_checker, bias=bias)
+
+    return gen_sdc_pandas_series_ewm_bias_impl(ewm_cov_kernel)
+
+
+pair_params_doc = """
+    other: :obj:`DataFrame` or :obj:`Series`
+        Other DataFrame/Series.
+    pairwise: :obj:`bool`
+        Not relevant for Series."""
+bias_param_doc = """
+    bias: :obj:`bool`
+        Use a standard estimation bias correction."""
+pair_limitations_doc = """
+    Limitations
+    -----------
+    Resulting DataFrame/Series has default index and name.
+    """
+
+hpat_pandas_series_ewm_corr.__doc__ = hpat_pandas_series_ewm_docstring_tmpl.format(**{
+    'method_name': 'corr',
+    'limitations_block': pair_limitations_doc,
+    'extra_params': pair_params_doc
+})
+
+hpat_pandas_series_ewm_cov.__doc__ = hpat_pandas_series_ewm_docstring_tmpl.format(**{
+    'method_name': 'cov',
+    'limitations_block': pair_limitations_doc,
+    'extra_params': pair_params_doc + bias_param_doc
+})
+
+hpat_pandas_series_ewm_mean.__doc__ = hpat_pandas_series_ewm_docstring_tmpl.format(**{
+    'method_name': 'mean',
+    'limitations_block': '',
+    'extra_params': ''
+})
+
+hpat_pandas_series_ewm_std.__doc__ = hpat_pandas_series_ewm_docstring_tmpl.format(**{
+    'method_name': 'std',
+    'limitations_block': '',
+    'extra_params': bias_param_doc
+})
+
+hpat_pandas_series_ewm_var.__doc__ = hpat_pandas_series_ewm_docstring_tmpl.format(**{
+    'method_name': 'var',
+    'limitations_block': '',
+    'extra_params': bias_param_doc
+})
@@ -0,0 +1,395 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+import numpy
+import pandas
+
+from numba import prange
+from numba.core.types import float64, BaseTuple, Boolean, Integer, NoneType, Omitted
+
+from sdc.datatypes.hpat_pandas_expanding_types import SeriesExpandingType
+from sdc.datatypes.hpat_pandas_series_rolling_functions import (
+    central_std_result_or_nan, central_var_result_or_nan, corr_result_or_nan, cov_result_or_nan, kahan_add,
+    mean_result_or_nan, put_corr, put_cov_aligned, put_sum, put_var, result_or_nan)
+from sdc.hiframes.pd_series_type import SeriesType
+from sdc.utilities.prange_utils import parallel_chunks
+from sdc.utilities.sdc_typing_utils import TypeChecker
+from sdc.utilities.utils import sdc_overload, sdc_overload_method, sdc_register_jitable
+
+
+hpat_pandas_series_expanding_docstring_tmpl = """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+    Pandas API: pandas.core.window.Expanding.{method_name}
+{limitations_block}
+    .. seealso::
+        :ref:`Series.expanding <pandas.Series.expanding>`
+            Calling object with a Series.
+        :ref:`DataFrame.expanding <pandas.DataFrame.expanding>`
+            Calling object with a DataFrame.
+        :ref:`Series.rolling.{method_name} <pandas.core.window.Rolling.{method_name}>`
+            Similar method over windows of fixed size.
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+
+    Pandas Series method :meth:`pandas.Series.expanding.{method_name}()` implementation.
+
+    .. only:: developer
+
+    Test: python -m sdc.runtests -k sdc.tests.test_rolling.TestRolling.test_series_expanding
+
+    Parameters
+    ----------
+    self: :class:`pandas.Series.expanding`
+        input arg{extra_params}
+
+    Returns
+    -------
+    :obj:`pandas.Series`
+         returns :obj:`pandas.Series` object
+"""
+
+
+def add_results(left, right):
+    pass
+
+
+@sdc_overload(add_results)
+def add_results_overload(left, right):
+    """Combine the window sums of two consecutive parts of data"""
+    if not isinstance(left, BaseTuple):
+        def add_results_impl(left, right):
+            return left + right
+
+        return add_results_impl
+
+    sums = ', '.join(f'left[{i}] + right[{i}]' for i in range(len(left)))
+    func_text = f'def add_results_impl(left, right):\n  return ({sums},)\n'
+    loc_vars = {}
+    exec(func_text, {}, loc_vars)
+
+    return loc_vars['add_results_impl']
+
+
+@sdc_register_jitable
+def merge_sums(left_nfinite, left, right_nfinite, right):
+    """Merge the window sums of two consecutive parts of data"""
+    return add_results(left, right)
+
+
+@sdc_register_jitable
+def merge_var(left_nfinite, left, right_nfinite, right):
+    """Merge the window means and sums of squared deviations of two consecutive parts of data (Chan's method)"""
+    if right_nfinite == 0:
+        return left
+
+    if left_nfinite == 0:
+        return right
+
+    left_mean, compensation, left_m2 = left
+    right_mean, _, right_m2 = right
+    nfinite = left_nfinite + right_nfinite
+    delta = right_mean - left_mean
+    mean, compensation = kahan_add(left_mean, compensation, delta * right_nfinite / nfinite)
+    m2 = left_m2 + right_m2 + delta * delta * left_nfinite * right_nfinite / nfinite
+
+    return mean, compensation, m2
+
+
+def gen_expanding_kernel(put, get_result=result_or_nan, init_result=0., use_ddof=False, merge=merge_sums):
+    """
+    Generate kernel calculating results over expanding windows based on put func.
+    The window results of each parallel chunk are calculated in the first pass,
+    the results of preceding chunks are merged and carried over into the chunks in the second pass.
+    """
+    def kernel(input_arr, minp, ddof):
+        length = len(input_arr)
+        output_arr = numpy.empty(length, dtype=float64)
+
+        chunks = parallel_chunks(length)
+        chunk_sums = [(0, init_result)] * len(chunks)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            nfinite = 0
+            result = init_result
+            for idx in range(chunk.start, chunk.stop):
+                nfinite, result = put(input_arr[idx], nfinite, result)
+            chunk_sums[i] = (nfinite, result)
+
+        total_nfinite = 0
+        total_result = init_result
+        for i in range(len(chunks)):
+            chunk_nfinite, chunk_result = chunk_sums[i]
+            chunk_sums[i] = (total_nfinite, total_result)
+            total_result = merge(total_nfinite, total_result, chunk_nfinite, chunk_result)
+            total_nfinite += chunk_nfinite
+
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            nfinite, result = chunk_sums[i]
+            for idx in range(chunk.start, chunk.stop):
+                nfinite, result = put(input_arr[idx], nfinite, result)
+                if use_ddof == True:  # noqa
+                    output_arr[idx] = get_result(nfinite, minp, result, ddof)
+                else:
+                    output_arr[idx] = get_result(nfinite, minp, result)
+
+        return output_arr
+
+    return sdc_register_jitable(kernel)
+
+
+def gen_expanding_pair_kernel(put, get_result, init_result, use_ddof=False):
+    """
+    Generate kernel calculating results over pairs of values of expanding windows based on put func,
+    see gen_expanding_kernel. Pairs out of the shorter array are skipped.
+    """
+    def kernel(main_arr, other_arr, minp, ddof):
+        min_length = min(len(main_arr), len(other_arr))
+        length = max(len(main_arr), len(other_arr))
+        output_arr = numpy.empty(length, dtype=float64)
+
+        chunks = parallel_chunks(length)
+        chunk_sums = [(0, init_result)] * len(chunks)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            nfinite = 0
+            result = init_result
+            for idx in range(chunk.start, min(chunk.stop, min_length)):
+                nfinite, result = put(main_arr[idx], other_arr[idx], nfinite, result)
+            chunk_sums[i] = (nfinite, result)
+
+        total_nfinite = 0
+        total_result = init_result
+        for i in range(len(chunks)):
+            chunk_nfinite, chunk_result = chunk_sums[i]
+            chunk_sums[i] = (total_nfinite, total_result)
+            total_nfinite += chunk_nfinite
+            total_result = add_results(total_result, chunk_result)
+
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            nfinite, result = chunk_sums[i]
+            for idx in range(chunk.start, chunk.stop):
+                if idx < min_length:
+                    nfinite, result = put(main_arr[idx], other_arr[idx], nfinite, result)
+                if use_ddof == True:  # noqa
+                    output_arr[idx] = get_result(nfinite, minp, result, ddof)
+                else:
+                    output_arr[idx] = get_result(nfinite, minp, result)
+
+        return output_arr
+
+    return sdc_register_jitable(kernel)
+
+
+expanding_mean_kernel = gen_expanding_kernel(put_sum, get_result=mean_result_or_nan)
+expanding_sum_kernel = gen_expanding_kernel(put_sum)
+expanding_var_kernel = gen_expanding_kernel(put_var, get_result=central_var_result_or_nan,
+                                            init_result=(0., 0., 0.), use_ddof=True, merge=merge_var)
+expanding_std_kernel = gen_expanding_kernel(put_var, get_result=central_std_result_or_nan,
+                                            init_result=(0., 0., 0.), use_ddof=True, merge=merge_var)
+expanding_corr_kernel = gen_expanding_pair_kernel(put_corr, corr_result_or_nan, (0., 0., 0., 0., 0.))
+expanding_cov_kernel = gen_expanding_pair_kernel(put_cov_aligned, cov_result_or_nan, (0., 0., 0., 0.),
+                                                 use_ddof=True)
+
+
+def gen_sdc_pandas_series_expanding_impl(kernel):
+    """Generate series expanding methods implementations based on kernel"""
+    def impl(self):
+        input_series = self._data
+        output_arr = kernel(input_series._data, self._min_periods, 0)
+
+        return pandas.Series(output_arr, input_series._index,
+                             name=input_series._name)
+    return impl
+
+
+def gen_sdc_pandas_series_expanding_ddof_impl(kernel):
+    """Generate series expanding methods implementations with parameter ddof"""
+    def impl(self, ddof=1):
+        input_series = self._data
+        output_arr = kernel(input_series._data, self._min_periods, ddof)
+
+        return pandas.Series(output_arr, input_series._index,
+                             name=input_series._name)
+    return impl
+
+
+def _hpat_pandas_series_expanding_pair_check_types(ty_checker, other, pairwise):
+    """Check types of parameters of series.expanding.corr()/cov()"""
+    accepted_other = (bool, Omitted, NoneType, SeriesType)
+    if not isinstance(other, accepted_other) and other is not None:
+        ty_checker.raise_exc(other, 'Series', 'other')
+
+    accepted_pairwise = (bool, Boolean, Omitted, NoneType)
+    if not isinstance(pairwise, accepted_pairwise) and pairwise is not None:
+        ty_checker.raise_exc(pairwise, 'bool', 'pairwise')
+
+
+@sdc_overload_method(SeriesExpandingType, 'corr')
+def hpat_pandas_series_expanding_corr(self, other=None, pairwise=None):
+
+    ty_checker = TypeChecker('Method expanding.corr().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    _hpat_pandas_series_expanding_pair_check_types(ty_checker, other, pairwise)
+
+    nan_other = isinstance(other, (Omitted, NoneType)) or other is None
+
+    def hpat_pandas_series_expanding_corr_impl(self, other=None, pairwise=None):
+        main_arr = self._data._data
+        if nan_other == True:  # noqa
+            other_arr = main_arr
+        else:
+            other_arr = other._data
+
+        output_arr = expanding_corr_kernel(main_arr, other_arr, self._min_periods, 0)
+
+        return pandas.Series(output_arr)
+
+    return hpat_pandas_series_expanding_corr_impl
+
+
+@sdc_overload_method(SeriesExpandingType, 'cov')
+def hpat_pandas_series_expanding_cov(self, other=None, pairwise=None, ddof=1):
+
+    ty_checker = TypeChecker('Method expanding.cov().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    _hpat_pandas_series_expanding_pair_check_types(ty_checker, other, pairwise)
+
+    if not isinstance(ddof, (int, Integer, Omitted)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    nan_other = isinstance(other, (Omitted, NoneType)) or other is None
+
+    def hpat_pandas_series_expanding_cov_impl(self, other=None, pairwise=None, ddof=1):
+        main_arr = self._data._data
+        if nan_other == True:  # noqa
+            other_arr = main_arr
+        else:
+            other_arr = other._data
+
+        output_arr = expanding_cov_kernel(main_arr, other_arr, self._min_periods, ddof)
+
+        return pandas.Series(output_arr)
+
+    return hpat_pandas_series_expanding_cov_impl
+
+
+@sdc_overload_method(SeriesExpandingType, 'mean')
+def hpat_pandas_series_expanding_mean(self):
+
+    ty_checker = TypeChecker('Method expanding.mean().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    return gen_sdc_pandas_series_expanding_impl(expanding_mean_kernel)
+
+
+@sdc_overload_method(SeriesExpandingType, 'std')
+def hpat_pandas_series_expanding_std(self, ddof=1):
+
+    ty_checker = TypeChecker('Method expanding.std().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    if not isinstance(ddof, (int, Integer, Omitted)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    return gen_sdc_pandas_series_expanding_ddof_impl(expanding_std_kernel)
+
+
+@sdc_overload_method(SeriesExpandingType, 'sum')
+def hpat_pandas_series_expanding_sum(self):
+
+    ty_checker = TypeChecker('Method expanding.sum().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    return gen_sdc_pandas_series_expanding_impl(expanding_sum_kernel)
+
+
+@sdc_overload_method(SeriesExpandingType, 'var')
+def hpat_pandas_series_expanding_var(self, ddof=1):
+
+    ty_checker = TypeChecker('Method expanding.var().')
+    ty_checker.check(self, SeriesExpandingType)
+
+    if not isinstance(ddof, (int, Integer, Omitted)):
+        ty_checker.raise_exc(ddof, 'int', 'ddof')
+
+    return gen_sdc_pandas_series_expanding_ddof_impl(expanding_var_kernel)
+
+
+pair_params_doc = """
+    other: :obj:`DataFrame` or :obj:`Series`
+        Other DataFrame/Series.
+    pairwise: :obj:`bool`
+        Not relevant for Series."""
+ddof_param_doc = """
+    ddof: :obj:`int`
+        Delta Degrees of Freedom."""
+pair_limitations_doc = """
+    Limitations
+    -----------
+    Resulting DataFrame/Series has default index and name.
+    """
+
+hpat_pandas_series_expanding_corr.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'corr',
+    'limitations_block': pair_limitations_doc,
+    'extra_params': pair_params_doc
+})
+
+hpat_pandas_series_expanding_cov.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'cov',
+    'limitations_block': pair_limitations_doc,
+    'extra_params': pair_params_doc + ddof_param_doc
+})
+
+hpat_pandas_series_expanding_mean.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'mean',
+    'limitations_block': '',
+    'extra_params': ''
+})
+
+hpat_pandas_series_expanding_std.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'std',
+    'limitations_block': '',
+    'extra_params': ddof_param_doc
+})
+
+hpat_pandas_series_expanding_sum.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'sum',
+    'limitations_block': '',
+    'extra_params': ''
+})
+
+hpat_pandas_series_expanding_var.__doc__ = hpat_pandas_series_expanding_docstring_tmpl.format(**{
+    'method_name': 'var',
+    'limitations_block': '',
+    'extra_params': ddof_param_doc
+})
@@ -42,7 +42,7 @@ from numba.extending import intrinsic
 from numba import types
 from numba.core import cgutils
 from numba.np import numpy_support
-from numba.typed import List, Dict
+from numba.typed import Dict
 from numba import prange
 from numba.np.arraymath import get_isnan
 from pandas.core.indexing import IndexingError
@@ -54,9 +54,15 @@ from sdc.utilities.sdc_typing_utils import (TypeChecker, check_index_is_numeric,
                                             has_python_value)
 from sdc.datatypes.range_index_type import RangeIndexType
 from sdc.datatypes.common_functions import (sdc_join_series_indexes, sdc_arrays_argsort, sdc_reindex_series)
+from sdc.datatypes.hpat_pandas_ewm_types import (
+    _hpat_pandas_series_ewm_init, gen_sdc_pandas_ewm_overload_body, sdc_pandas_ewm_docstring_tmpl)
+from sdc.datatypes.hpat_pandas_expanding_types import (
+    _hpat_pandas_series_expanding_init, gen_sdc_pandas_expanding_overload_body,
+    sdc_pandas_expanding_docstring_tmpl)
 from sdc.datatypes.hpat_pandas_rolling_types import (
     gen_sdc_pandas_rolling_overload_body, sdc_pandas_rolling_docstring_tmpl)
-from sdc.datatypes.hpat_pandas_series_rolling_types import _hpat_pandas_series_rolling_init
+from sdc.datatypes.hpat_pandas_series_rolling_types import (
+    _hpat_pandas_series_rolling_init, get_series_offset_rolling_init)
 from sdc.datatypes.hpat_pandas_stringmethods_types import StringMethodsType
 from sdc.datatypes.hpat_pandas_getitem_types import SeriesGetitemAccessorType
 from sdc.hiframes.pd_series_type import SeriesType
@@ -68,8 +74,12 @@ from sdc.str_arr_ext import (str_arr_is_na, str_arr_set_na, num_total_chars,
 from sdc.utilities.utils import to_array, sdc_overload, sdc_overload_method, sdc_overload_attribute
 from sdc import sdc_autogenerated
 from sdc.functions import numpy_like
+from sdc.functions.sort import (parallel_argsort, parallel_argsort_min_size, parallel_argsort_supported,
+                                parallel_radix_argsort)
 from sdc.hiframes.api import isna
 from sdc.datatypes.hpat_pandas_groupby_functions import init_series_groupby
+from sdc.functions.groupby import build_group_index
+from sdc.extensions.indexes.indexes_generic import sdc_indexes_build_map_positions, sdc_indexes_get_positions
 from sdc.utilities.prange_utils import parallel_chunks
 
 from .pandas_series_functions import apply
@@ -217,16 +227,11 @@ def hpat_pandas_series_accessor_getitem(self, idx):
         if isinstance(idx, (types.Array, types.List)):
             def hpat_pandas_series_loc_array_impl(self, idx):
                 index = self._series.index
-                data = self._series._data
-                size = len(index)
-                data_res = []
-                index_res = []
-                for value in idx:
-                    mask = numpy.zeros(shape=size, dtype=numpy.bool_)
-                    for i in numba.prange(size):
-                        mask[i] = index[i] == value
-                    data_res.extend(data[mask])
-                    index_res.extend(index[mask])
+                # single pass over the index builds the label lookup table instead of a scan per label
+                map_positions = sdc_indexes_build_map_positions(index)
+                positions = sdc_indexes_get_positions(map_positions, idx)
+                data_res = common_functions._sdc_take(self._series._data, positions)
+                index_res = common_functions._sdc_take(index, positions)
 
                 return pandas.Series(data=data_res, index=index_res, name=self._series._name)
 
@@ -1137,7 +1142,7 @@ def hpat_pandas_series_nsmallest(self, n=5, keep='first'):
             raise ValueError("Method nsmallest(). Unsupported parameter. Given 'keep' != 'first'")
 
         # mergesort is used for stable sorting of repeated values
-        indices = self._data.argsort(kind='mergesort')[:max(n, 0)]
+        indices = sdc_arrays_argsort(self._data, kind='mergesort')[:max(n, 0)]
 
         return self.take(indices)
 
@@ -1200,14 +1205,20 @@ def hpat_pandas_series_nlargest(self, n=5, keep='first'):
     if not isinstance(keep, (types.Omitted, str, types.UnicodeType, types.StringLiteral)):
         ty_checker.raise_exc(keep, 'str', 'keep')
 
+    use_parallel_argsort = parallel_argsort_supported(self.dtype)
+
     def hpat_pandas_series_nlargest_impl(self, n=5, keep='first'):
         if keep != 'first':
             raise ValueError("Method nlargest(). Unsupported parameter. Given 'keep' != 'first'")
 
-        # data: [0, 1, -1, 1, 0] -> [1, 1, 0, 0, -1]
-        # index: [0, 1,  2, 3, 4] -> [1, 3, 0, 4,  2] (not [3, 1, 4, 0, 2])
-        # subtract 1 to ensure reverse ordering at boundaries
-        indices = (-self._data - 1).argsort(kind='mergesort')[:max(n, 0)]
+        if use_parallel_argsort == True and len(self._data) >= parallel_argsort_min_size:  # noqa
+            # parallel argsort keeps original order of repeated values when sorting in descending order
+            indices = parallel_argsort(self._data, False)[:max(n, 0)]
+        else:
+            # data: [0, 1, -1, 1, 0] -> [1, 1, 0, 0, -1]
+            # index: [0, 1,  2, 3, 4] -> [1, 3, 0, 4,  2] (not [3, 1, 4, 0, 2])
+            # subtract 1 to ensure reverse ordering at boundaries
+            indices = (-self._data - 1).argsort(kind='mergesort')[:max(n, 0)]
 
         return self.take(indices)
 
@@ -1665,10 +1676,21 @@ def hpat_pandas_series_index(self):
 
 
 hpat_pandas_series_rolling = sdc_overload_method(SeriesType, 'rolling')(
-    gen_sdc_pandas_rolling_overload_body(_hpat_pandas_series_rolling_init, SeriesType))
+    gen_sdc_pandas_rolling_overload_body(_hpat_pandas_series_rolling_init, SeriesType,
+                                         offset_initializer=get_series_offset_rolling_init))
 hpat_pandas_series_rolling.__doc__ = sdc_pandas_rolling_docstring_tmpl.format(
     ty='Series', ty_lower='series')
 
+hpat_pandas_series_expanding = sdc_overload_method(SeriesType, 'expanding')(
+    gen_sdc_pandas_expanding_overload_body(_hpat_pandas_series_expanding_init, SeriesType))
+hpat_pandas_series_expanding.__doc__ = sdc_pandas_expanding_docstring_tmpl.format(
+    ty='Series', ty_lower='series')
+
+hpat_pandas_series_ewm = sdc_overload_method(SeriesType, 'ewm')(
+    gen_sdc_pandas_ewm_overload_body(_hpat_pandas_series_ewm_init, SeriesType))
+hpat_pandas_series_ewm.__doc__ = sdc_pandas_ewm_docstring_tmpl.format(
+    ty='Series', ty_lower='series')
+
 
 @sdc_overload_attribute(SeriesType, 'size')
 def hpat_pandas_series_size(self):
@@ -1770,6 +1792,120 @@ def hpat_pandas_series_ndim(self):
     return hpat_pandas_series_ndim_impl
 
 
+@sdc_overload_attribute(SeriesType, 'is_monotonic')
+@sdc_overload_attribute(SeriesType, 'is_monotonic_increasing')
+def hpat_pandas_series_is_monotonic_increasing(self):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+
+    Pandas API: pandas.Series.is_monotonic_increasing
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Pandas Series attribute :attr:`pandas.Series.is_monotonic_increasing` implementation
+
+    .. only:: developer
+        Test: python -m sdc.runtests sdc.tests.test_series.TestSeries.test_series_getattr_is_monotonic
+    """
+
+    _func_name = 'Attribute is_monotonic_increasing.'
+
+    ty_checker = TypeChecker(_func_name)
+    ty_checker.check(self, SeriesType)
+
+    def hpat_pandas_series_is_monotonic_increasing_impl(self):
+        return numpy_like.is_monotonic(self._data, True)
+
+    return hpat_pandas_series_is_monotonic_increasing_impl
+
+
+@sdc_overload_attribute(SeriesType, 'is_monotonic_decreasing')
+def hpat_pandas_series_is_monotonic_decreasing(self):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+
+    Pandas API: pandas.Series.is_monotonic_decreasing
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Pandas Series attribute :attr:`pandas.Series.is_monotonic_decreasing` implementation
+
+    .. only:: developer
+        Test: python -m sdc.runtests sdc.tests.test_series.TestSeries.test_series_getattr_is_monotonic
+    """
+
+    _func_name = 'Attribute is_monotonic_decreasing.'
+
+    ty_checker = TypeChecker(_func_name)
+    ty_checker.check(self, SeriesType)
+
+    def hpat_pandas_series_is_monotonic_decreasing_impl(self):
+        return numpy_like.is_monotonic(self._data, False)
+
+    return hpat_pandas_series_is_monotonic_decreasing_impl
+
+
+@sdc_overload_attribute(SeriesType, 'is_unique')
+def hpat_pandas_series_is_unique(self):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+
+    Pandas API: pandas.Series.is_unique
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Pandas Series attribute :attr:`pandas.Series.is_unique` implementation
+
+    .. only:: developer
+        Test: python -m sdc.runtests sdc.tests.test_series.TestSeries.test_series_getattr_is_unique
+    """
+
+    _func_name = 'Attribute is_unique.'
+
+    ty_checker = TypeChecker(_func_name)
+    ty_checker.check(self, SeriesType)
+
+    def hpat_pandas_series_is_unique_impl(self):
+        return self.nunique(dropna=False) == len(self._data)
+
+    return hpat_pandas_series_is_unique_impl
+
+
+@sdc_overload_attribute(SeriesType, 'hasnans')
+def hpat_pandas_series_hasnans(self):
+    """
+    Intel Scalable Dataframe Compiler User Guide
+    ********************************************
+
+    Pandas API: pandas.Series.hasnans
+
+    Intel Scalable Dataframe Compiler Developer Guide
+    *************************************************
+    Pandas Series attribute :attr:`pandas.Series.hasnans` implementation
+
+    .. only:: developer
+        Test: python -m sdc.runtests sdc.tests.test_series.TestSeries.test_series_getattr_hasnans
+    """
+
+    _func_name = 'Attribute hasnans.'
+
+    ty_checker = TypeChecker(_func_name)
+    ty_checker.check(self, SeriesType)
+
+    def hpat_pandas_series_hasnans_impl(self):
+        nan_count = 0
+        for i in prange(len(self._data)):
+            if isna(self._data, i):
+                nan_count += 1
+
+        return nan_count > 0
+
+    return hpat_pandas_series_hasnans_impl
+
+
 @sdc_overload_attribute(SeriesType, 'T')
 def hpat_pandas_series_T(self):
     """
@@ -3755,7 +3891,8 @@ def hpat_pandas_series_argsort(self, axis=0, kind='quicksort', order=None):
     -----------
     - Parameter ``axis`` is supported only with default value ``0``.
     - Parameter ``order`` is supported only with default value ``None``.
-    - Parameter ``kind`` is supported only with values ``'mergesort'`` and ``'quicksort'``.
+    - Parameter ``kind`` is supported only with values ``'mergesort'``, ``'quicksort'`` and ``'radix'``.
+    - Parameter ``kind='radix'`` selects stable parallel radix sort, which is not available in pandas.
     - This function may reveal slower performance than Pandas* on user system. Users should exercise a tradeoff
     between staying in JIT-region with that function or going back to interpreter mode.
 
@@ -3804,55 +3941,52 @@ def hpat_pandas_series_argsort(self, axis=0, kind='quicksort', order=None):
 
     if not isinstance(self.index, types.NoneType):
         def hpat_pandas_series_argsort_idx_impl(self, axis=0, kind='quicksort', order=None):
-            if kind != 'quicksort' and kind != 'mergesort':
-                raise ValueError("Method argsort(). Unsupported parameter. Given 'kind' != 'quicksort' or 'mergesort'")
-            if kind == 'mergesort':
-                #It is impossible to use numpy.argsort(self._data, kind=kind) since numba gives typing error
-                sort = numpy.argsort(self._data, kind='mergesort')
-            else:
-                sort = numpy.argsort(self._data)
-            na = self.isna().sum()
-            result = numpy.empty(len(self._data), dtype=numpy.int64)
+            if kind != 'quicksort' and kind != 'mergesort' and kind != 'radix':
+                raise ValueError("Method argsort(). Unsupported parameter. "
+                                 "Given 'kind' != 'quicksort', 'mergesort' or 'radix'")
             na_data_arr = sdc.hiframes.api.get_nan_mask(self._data)
             if kind == 'mergesort':
-                sort_nona = numpy.argsort(self._data[~na_data_arr], kind='mergesort')
+                #It is impossible to use sdc_arrays_argsort(self._data, kind=kind) since numba gives typing error
+                sort_nona = sdc_arrays_argsort(self._data[~na_data_arr], kind='mergesort')
+            elif kind == 'radix':
+                sort_nona = sdc_arrays_argsort(self._data[~na_data_arr], kind='radix')
             else:
-                sort_nona = numpy.argsort(self._data[~na_data_arr])
-            q = 0
-            for id, i in enumerate(sort):
-                if id in set(sort[len(self._data) - na:]):
-                    q += 1
+                sort_nona = sdc_arrays_argsort(self._data[~na_data_arr])
+
+            # missing values get -1, others get positions sorting values with missing ones excluded
+            result = numpy.empty(len(self._data), dtype=numpy.int64)
+            nona_count = 0
+            for i in range(len(self._data)):
+                if na_data_arr[i]:
+                    result[i] = -1
                 else:
-                    result[id] = sort_nona[id - q]
-            for i in sort[len(self._data) - na:]:
-                result[i] = -1
+                    result[i] = sort_nona[nona_count]
+                    nona_count += 1
 
             return pandas.Series(result, self._index)
 
         return hpat_pandas_series_argsort_idx_impl
 
     def hpat_pandas_series_argsort_noidx_impl(self, axis=0, kind='quicksort', order=None):
-        if kind != 'quicksort' and kind != 'mergesort':
-            raise ValueError("Method argsort(). Unsupported parameter. Given 'kind' != 'quicksort' or 'mergesort'")
-        if kind == 'mergesort':
-            sort = numpy.argsort(self._data, kind='mergesort')
-        else:
-            sort = numpy.argsort(self._data)
-        na = self.isna().sum()
-        result = numpy.empty(len(self._data), dtype=numpy.int64)
+        if kind != 'quicksort' and kind != 'mergesort' and kind != 'radix':
+            raise ValueError("Method argsort(). Unsupported parameter. "
+                             "Given 'kind' != 'quicksort', 'mergesort' or 'radix'")
         na_data_arr = sdc.hiframes.api.get_nan_mask(self._data)
         if kind == 'mergesort':
-            sort_nona = numpy.argsort(self._data[~na_data_arr], kind='mergesort')
+            sort_nona = sdc_arrays_argsort(self._data[~na_data_arr], kind='mergesort')
+        elif kind == 'radix':
+            sort_nona = sdc_arrays_argsort(self._data[~na_data_arr], kind='radix')
         else:
-            sort_nona = numpy.argsort(self._data[~na_data_arr])
-        q = 0
-        for id, i in enumerate(sort):
-            if id in set(sort[len(self._data) - na:]):
-                q += 1
+            sort_nona = sdc_arrays_argsort(self._data[~na_data_arr])
+
+        result = numpy.empty(len(self._data), dtype=numpy.int64)
+        nona_count = 0
+        for i in range(len(self._data)):
+            if na_data_arr[i]:
+                result[i] = -1
             else:
-                result[id] = sort_nona[id - q]
-        for i in sort[len(self._data) - na:]:
-            result[i] = -1
+                result[i] = sort_nona[nona_count]
+                nona_count += 1
 
         return pandas.Series(result)
 
@@ -3871,7 +4005,9 @@ def hpat_pandas_series_sort_values(self, axis=0, ascending=True, inplace=False,
     -----------
     - Parameter ``inplace`` is supported only with default value ``False``.
     - Parameter ``axis`` is currently unsupported by Intel Scalable Dataframe Compiler.
-    - Parameter ``kind`` is supported only with values ``'mergesort'`` and ``'quicksort'``.
+    - Parameter ``kind`` is supported only with values ``'mergesort'``, ``'quicksort'`` and ``'radix'``.
+    - Parameter ``kind='radix'`` selects stable parallel radix sort, which is not available in pandas.
+      Large integer and datetime Series are sorted with it regardless of ``kind``.
     - This function may reveal slower performance than Pandas* on user system. Users should exercise a tradeoff
     between staying in JIT-region with that function or going back to interpreter mode.
 
@@ -3930,22 +4066,48 @@ def hpat_pandas_series_sort_values(self, axis=0, ascending=True, inplace=False,
     if not (inplace is False or isinstance(inplace, types.Omitted)):
         raise TypingError('{} Unsupported parameters. Given inplace: {}'.format(_func_name, inplace))
 
+    use_parallel_argsort = parallel_argsort_supported(self.dtype)
+
     def _sdc_pandas_series_sort_values_impl(
             self, axis=0, ascending=True, inplace=False, kind='quicksort', na_position='last'):
 
         common_functions._sdc_pandas_series_check_axis(axis)
 
-        if not (kind_is_none_or_default or kind in ('quicksort', 'mergesort')):
-            raise ValueError("Method sort_values(). Unsupported parameter. Given kind != 'quicksort', 'mergesort'")
+        if not (kind_is_none_or_default or kind in ('quicksort', 'mergesort', 'radix')):
+            raise ValueError("Method sort_values(). Unsupported parameter. "
+                             "Given kind != 'quicksort', 'mergesort', 'radix'")
 
         if na_position not in ('last', 'first'):
             raise ValueError("Method sort_values(). Unsupported parameter. Given na_position != 'last', 'first'")
 
+        use_radix = False
+        if kind_is_none_or_default == False:  # noqa
+            use_radix = kind == 'radix'
+
+        if use_parallel_argsort == True and (use_radix or len(self) >= parallel_argsort_min_size):  # noqa
+            # parallel argsort is stable and places NaNs last, while pandas reverses the order of equal values
+            # when sorting in descending order, so descending result is the reversed stable ascending one
+            if use_radix:
+                sorted_rows = parallel_radix_argsort(self._data, True)
+            else:
+                sorted_rows = parallel_argsort(self._data, True)
+            if not ascending or na_position == 'first':
+                nans_start = len(self) - sdc.hiframes.api.get_nan_mask(self._data).sum()
+                if not ascending:
+                    sorted_rows = numpy.concatenate((sorted_rows[:nans_start][::-1], sorted_rows[nans_start:]))
+                if na_position == 'first':
+                    sorted_rows = numpy.concatenate((sorted_rows[nans_start:], sorted_rows[:nans_start]))
+
+            return pandas.Series(data=self._data[sorted_rows], index=self.index[sorted_rows], name=self._name)
+
         data_nan_mask = sdc.hiframes.api.get_nan_mask(self._data)
         good = ~data_nan_mask
 
         if kind_is_none_or_default == True:  # noqa
             argsort_res = sdc_arrays_argsort(self._data[good], kind='quicksort')
+        elif use_radix:
+            # radix sort is stable, so stable sort is used for data it does not support
+            argsort_res = sdc_arrays_argsort(self._data[good], kind='mergesort')
         else:
             argsort_res = sdc_arrays_argsort(self._data[good], kind=kind)
         if not ascending:
@@ -4833,24 +4995,15 @@ are currently unsupported by Intel Scalable Dataframe Compiler
     if not (observed is False or isinstance(observed, types.Omitted)):
         raise TypingError('{} Unsupported parameters. Given inplace: {}'.format(_func_name, observed))
 
-    by_type = by.dtype
-    list_type = types.ListType(types.int64)
     def sdc_pandas_series_groupby_impl(self, by=None, axis=0, level=None, as_index=True, sort=True,
                                        group_keys=True, squeeze=False, observed=False):
 
         if len(self) != len(by):
             raise ValueError("Series.groupby(). Grouper and axis must be same length")
 
-        grouped = Dict.empty(by_type, list_type)
-        for i in numpy.arange(len(by)):
-            if isna(by, i):
-                continue
-            value = by[i]
-            group_list = grouped.get(value, List.empty_list(types.int64))
-            group_list.append(i)
-            grouped[value] = group_list
+        group_index = build_group_index(by, sort)
 
-        return init_series_groupby(self, by, grouped, sort)
+        return init_series_groupby(self, by, group_index, sort)
 
     return sdc_pandas_series_groupby_impl
 
@@ -27,24 +27,17 @@
 import numpy
 import pandas
 
-from functools import partial
-
 from numba import prange
-from numba.extending import register_jitable
 from numba.core.types import (float64, Boolean, Integer, NoneType, Number,
                          Omitted, StringLiteral, UnicodeType)
 
-from sdc.datatypes.common_functions import _almost_equal
+from sdc.datatypes.common_functions import SDCLimitation, _almost_equal
 from sdc.datatypes.hpat_pandas_series_rolling_types import SeriesRollingType
-from sdc.functions.statistics import skew_formula
+from sdc.functions.window import centered_window_bounds, offset_window_bounds, window_weights
 from sdc.hiframes.pd_series_type import SeriesType
-from sdc.utilities.prange_utils import parallel_chunks
-from sdc.utilities.sdc_typing_utils import TypeChecker
-from sdc.utilities.utils import sdc_overload_method, sdc_register_jitable
-
-
-# disabling parallel execution for rolling due to numba issue https://github.com/numba/numba/issues/5098
-sdc_rolling_overload = partial(sdc_overload_method, parallel=False)
+from sdc.utilities.prange_utils import parallel_chunks, parallel_window_chunks
+from sdc.utilities.sdc_typing_utils import TypeChecker, literal_func_names
+from sdc.utilities.utils import sdc_overload, sdc_overload_method, sdc_register_jitable
 
 
 hpat_pandas_series_rolling_docstring_tmpl = """
@@ -110,98 +103,174 @@ def arr_apply(arr, func):
 
 
 @sdc_register_jitable
-def arr_mean(arr):
-    """Calculate mean of values"""
-    if len(arr) == 0:
-        return numpy.nan
-
-    return arr.mean()
+def fenwick_add(tree, pos, delta):
+    """Add delta to the count of values with rank pos in Fenwick tree."""
+    pos += 1
+    while pos < len(tree):
+        tree[pos] += delta
+        pos += pos & -pos
 
 
 @sdc_register_jitable
-def arr_median(arr):
-    """Calculate median of values"""
-    if len(arr) == 0:
-        return numpy.nan
+def fenwick_kth(tree, k, top_step):
+    """Find rank of the k-th (0-based) smallest value counted in Fenwick tree."""
+    pos = 0
+    step = top_step
+    while step > 0:
+        next_pos = pos + step
+        if next_pos < len(tree) and tree[next_pos] <= k:
+            pos = next_pos
+            k -= tree[pos]
+        step >>= 1
 
-    return numpy.median(arr)
+    return pos
 
 
 @sdc_register_jitable
-def arr_quantile(arr, q):
-    """Calculate quantile of values"""
-    if len(arr) == 0:
+def order_stat_result(tree, top_step, sorted_values, nfinite, minp, quantile, median=False):
+    """Get quantile (or median) of the window values counted in Fenwick tree over ranks of sorted values."""
+    if nfinite == 0 or nfinite < minp:
         return numpy.nan
 
-    return numpy.quantile(arr, q)
-
-
-def gen_hpat_pandas_series_rolling_impl(rolling_func):
-    """Generate series rolling methods implementations based on input func"""
-    def impl(self):
-        win = self._window
-        minp = self._min_periods
-
-        input_series = self._data
-        input_arr = input_series._data
-        length = len(input_arr)
-        output_arr = numpy.empty(length, dtype=float64)
+    position = quantile * (nfinite - 1)
+    below = int(numpy.floor(position))
+    fraction = position - below
+    below_value = sorted_values[fenwick_kth(tree, below, top_step)]
+    if fraction == 0:
+        return below_value
 
-        def apply_minp(arr, minp):
-            finite_arr = arr[numpy.isfinite(arr)]
-            if len(finite_arr) < minp:
-                return numpy.nan
-            else:
-                return rolling_func(finite_arr)
+    above_value = sorted_values[fenwick_kth(tree, below + 1, top_step)]
+    if median:
+        return (below_value + above_value) / 2
 
-        boundary = min(win, length)
-        for i in prange(boundary):
-            arr_range = input_arr[:i + 1]
-            output_arr[i] = apply_minp(arr_range, minp)
+    return below_value + (above_value - below_value) * fraction
 
-        for i in prange(boundary, length):
-            arr_range = input_arr[i + 1 - win:i + 1]
-            output_arr[i] = apply_minp(arr_range, minp)
 
-        return pandas.Series(output_arr, input_series._index, name=input_series._name)
+@sdc_register_jitable
+def rolling_order_stat(input_arr, win, minp, quantile, median=False):
+    """
+    Calculate rolling quantile (or median) of finite values with linear interpolation.
+    Values of each parallel chunk (with its prelude) are ranked with one sort, then the window is kept
+    as counts of ranks in Fenwick tree, so put, pop and search of k-th smallest value take O(log n).
+    """
+    length = len(input_arr)
+    output_arr = numpy.empty(length, dtype=float64)
+
+    chunks = parallel_window_chunks(length, win)
+    for i in prange(len(chunks)):
+        chunk = chunks[i]
+
+        if win == 0:
+            for idx in range(chunk.start, chunk.stop):
+                output_arr[idx] = result_or_nan(0, minp, numpy.nan)
+            continue
+
+        prelude_start = max(0, chunk.start - win + 1)
+        values = input_arr[prelude_start:chunk.stop]
+        size = len(values)
+
+        order = numpy.argsort(values)
+        sorted_values = values[order]
+        ranks = numpy.empty(size, dtype=numpy.int64)
+        for k in range(size):
+            ranks[order[k]] = k
+
+        tree = numpy.zeros(size + 1, dtype=numpy.int64)
+        top_step = 1
+        while 2 * top_step <= size:
+            top_step *= 2
+
+        nfinite = 0
+        for k in range(size):
+            pop_k = k - win
+            if pop_k >= 0 and numpy.isfinite(values[pop_k]):
+                fenwick_add(tree, ranks[pop_k], -1)
+                nfinite -= 1
+
+            if numpy.isfinite(values[k]):
+                fenwick_add(tree, ranks[k], 1)
+                nfinite += 1
+
+            idx = prelude_start + k
+            if idx < chunk.start:
+                continue
 
-    return impl
+            output_arr[idx] = order_stat_result(tree, top_step, sorted_values, nfinite, minp,
+                                                quantile, median=median)
 
+    return output_arr
 
-def gen_hpat_pandas_series_rolling_ddof_impl(rolling_func):
-    """Generate series rolling methods implementations with parameter ddof"""
-    def impl(self, ddof=1):
-        win = self._window
-        minp = self._min_periods
 
+@sdc_register_jitable
+def rolling_order_stat_bounds(input_arr, starts, ends, minp, quantile, median=False):
+    """
+    Calculate quantile (or median) of finite values of windows input_arr[starts[idx]:ends[idx]]
+    with non-decreasing bounds, see rolling_order_stat.
+    """
+    length = len(input_arr)
+    output_arr = numpy.empty(length, dtype=float64)
+
+    chunks = parallel_chunks(length)
+    for i in prange(len(chunks)):
+        chunk = chunks[i]
+        chunk_start = starts[chunk.start]
+        values = input_arr[chunk_start:max(chunk_start, ends[chunk.stop - 1])]
+        size = len(values)
+
+        order = numpy.argsort(values)
+        sorted_values = values[order]
+        ranks = numpy.empty(size, dtype=numpy.int64)
+        for k in range(size):
+            ranks[order[k]] = k
+
+        tree = numpy.zeros(size + 1, dtype=numpy.int64)
+        top_step = 1
+        while 2 * top_step <= size:
+            top_step *= 2
+
+        nfinite = 0
+        window_start = window_stop = chunk_start
+        for idx in range(chunk.start, chunk.stop):
+            for k in range(window_stop - chunk_start, ends[idx] - chunk_start):
+                if numpy.isfinite(values[k]):
+                    fenwick_add(tree, ranks[k], 1)
+                    nfinite += 1
+
+            for k in range(window_start - chunk_start, starts[idx] - chunk_start):
+                if numpy.isfinite(values[k]):
+                    fenwick_add(tree, ranks[k], -1)
+                    nfinite -= 1
+
+            window_start, window_stop = starts[idx], ends[idx]
+            output_arr[idx] = order_stat_result(tree, top_step, sorted_values, nfinite, minp,
+                                                quantile, median=median)
+
+    return output_arr
+
+
+def gen_hpat_pandas_rolling_series_median_impl(offset=False):
+    """Generate series rolling median implementation, see gen_sdc_pandas_series_rolling_impl"""
+    def impl(self):
         input_series = self._data
-        input_arr = input_series._data
-        length = len(input_arr)
-        output_arr = numpy.empty(length, dtype=float64)
-
-        def apply_minp(arr, ddof, minp):
-            finite_arr = arr[numpy.isfinite(arr)]
-            if len(finite_arr) < minp:
-                return numpy.nan
-            else:
-                return rolling_func(finite_arr, ddof)
-
-        boundary = min(win, length)
-        for i in prange(boundary):
-            arr_range = input_arr[:i + 1]
-            output_arr[i] = apply_minp(arr_range, ddof, minp)
-
-        for i in prange(boundary, length):
-            arr_range = input_arr[i + 1 - win:i + 1]
-            output_arr[i] = apply_minp(arr_range, ddof, minp)
+        if offset == True or self._center:  # noqa
+            starts, ends = rolling_window_bounds(self)
+            output_arr = rolling_order_stat_bounds(input_series._data, starts, ends, self._min_periods,
+                                                   0.5, median=True)
+        else:
+            output_arr = rolling_order_stat(input_series._data, self._window, self._min_periods, 0.5, median=True)
 
         return pandas.Series(output_arr, input_series._index, name=input_series._name)
-
     return impl
 
 
-hpat_pandas_rolling_series_median_impl = register_jitable(
-    gen_hpat_pandas_series_rolling_impl(arr_median))
+@sdc_register_jitable
+def kahan_add(total, compensation, value):
+    """Add value to the total keeping low-order bits lost by the addition in compensation (Kahan summation)."""
+    y = value - compensation
+    t = total + y
+    compensation = (t - total) - y
+
+    return t, compensation
 
 
 @sdc_register_jitable
@@ -300,132 +369,89 @@ def put_cov(x, y, nfinite, result, align_finiteness=False):
 
 @sdc_register_jitable
 def put_kurt(value, nfinite, result):
-    """Calculate the window sums for kurt with new value."""
-    _sum, square_sum, cube_sum, fourth_degree_sum = result
+    """Calculate the window mean and central moments for kurt with new value."""
+    mean, compensation, m2, m3, m4 = result
     if numpy.isfinite(value):
         nfinite += 1
-        _sum += value
-        square_sum += value * value
-        cube_sum += value * value * value
-        fourth_degree_sum += value * value * value * value
+        delta = value - mean
+        delta_n = delta / nfinite
+        term = delta * delta_n * (nfinite - 1)
+        mean, compensation = kahan_add(mean, compensation, delta_n)
+        m4 += (term * delta_n * delta_n * (nfinite * nfinite - 3 * nfinite + 3)
+               + 6. * delta_n * delta_n * m2 - 4. * delta_n * m3)
+        m3 += term * delta_n * (nfinite - 2) - 3. * delta_n * m2
+        m2 += term
 
-    return nfinite, (_sum, square_sum, cube_sum, fourth_degree_sum)
+    return nfinite, (mean, compensation, m2, m3, m4)
 
 
 @sdc_register_jitable
 def pop_kurt(value, nfinite, result):
-    """Calculate the window sums for kurt without old value."""
-    _sum, square_sum, cube_sum, fourth_degree_sum = result
-    if numpy.isfinite(value):
-        nfinite -= 1
-        _sum -= value
-        square_sum -= value * value
-        cube_sum -= value * value * value
-        fourth_degree_sum -= value * value * value * value
-
-    return nfinite, (_sum, square_sum, cube_sum, fourth_degree_sum)
-
-
-@sdc_register_jitable
-def calc_max(arr, idx, win_size):
-    """Recalculate the window max based on data, index and window size."""
-    start = max(0, idx - win_size + 1)
-    nfinite = 0
-    result = numpy.nan
-    for i in range(start, idx + 1):
-        value = arr[i]
-        nfinite, result = put_max(value, nfinite, result)
-
-    return nfinite, result
-
-
-@sdc_register_jitable
-def pop_max(value, nfinite, result, arr, idx, win_size):
-    """Calculate the window max without old value."""
+    """Calculate the window mean and central moments for kurt without old value."""
+    mean, compensation, m2, m3, m4 = result
     if numpy.isfinite(value):
         nfinite -= 1
-        if nfinite:
-            if value == result:
-                return calc_max(arr, idx, win_size)
-        else:
-            result = numpy.nan
-
-    return nfinite, result
+        if nfinite == 0:
+            return nfinite, (0., 0., 0., 0., 0.)
 
+        mean, compensation = kahan_add(mean, compensation, (mean - value) / nfinite)
+        # moments are restored by reverting put of the value to the rest of the window
+        delta = value - mean
+        delta_n = delta / (nfinite + 1)
+        term = delta * delta_n * nfinite
+        m2 -= term
+        m3 -= term * delta_n * (nfinite - 1) - 3. * delta_n * m2
+        m4 -= (term * delta_n * delta_n * ((nfinite + 1) * (nfinite + 1) - 3 * (nfinite + 1) + 3)
+               + 6. * delta_n * delta_n * m2 - 4. * delta_n * m3)
 
-@sdc_register_jitable
-def put_max(value, nfinite, result):
-    """Calculate the window max with new value."""
-    if numpy.isfinite(value):
-        nfinite += 1
-        if numpy.isnan(result) or value > result:
-            result = value
-
-    return nfinite, result
+    return nfinite, (mean, compensation, m2, m3, m4)
 
 
 @sdc_register_jitable
-def calc_min(arr, idx, win_size):
-    """Recalculate the window min based on data, index and window size."""
-    start = max(0, idx - win_size + 1)
-    nfinite = 0
-    result = numpy.nan
-    for i in range(start, idx + 1):
-        value = arr[i]
-        nfinite, result = put_min(value, nfinite, result)
-
-    return nfinite, result
+def greater(left, right):
+    """Check if the left value displaces the right one from the window max candidates."""
+    return left > right
 
 
 @sdc_register_jitable
-def pop_min(value, nfinite, result, arr, idx, win_size):
-    """Calculate the window min without old value."""
-    if numpy.isfinite(value):
-        nfinite -= 1
-        if nfinite:
-            if value == result:
-                return calc_min(arr, idx, win_size)
-        else:
-            result = numpy.nan
-
-    return nfinite, result
-
-
-@sdc_register_jitable
-def put_min(value, nfinite, result):
-    """Calculate the window min with new value."""
-    if numpy.isfinite(value):
-        nfinite += 1
-        if numpy.isnan(result) or value < result:
-            result = value
-
-    return nfinite, result
+def less(left, right):
+    """Check if the left value displaces the right one from the window min candidates."""
+    return left < right
 
 
 @sdc_register_jitable
 def put_skew(value, nfinite, result):
-    """Calculate the window sums for skew with new value."""
-    _sum, square_sum, cube_sum = result
+    """Calculate the window mean and central moments for skew with new value."""
+    mean, compensation, m2, m3 = result
     if numpy.isfinite(value):
         nfinite += 1
-        _sum += value
-        square_sum += value * value
-        cube_sum += value * value * value
+        delta = value - mean
+        delta_n = delta / nfinite
+        term = delta * delta_n * (nfinite - 1)
+        mean, compensation = kahan_add(mean, compensation, delta_n)
+        m3 += term * delta_n * (nfinite - 2) - 3. * delta_n * m2
+        m2 += term
 
-    return nfinite, (_sum, square_sum, cube_sum)
+    return nfinite, (mean, compensation, m2, m3)
 
 
 @sdc_register_jitable
 def pop_skew(value, nfinite, result):
-    """Calculate the window sums for skew without old value."""
-    _sum, square_sum, cube_sum = result
+    """Calculate the window mean and central moments for skew without old value."""
+    mean, compensation, m2, m3 = result
     if numpy.isfinite(value):
         nfinite -= 1
-        _sum -= value
-        square_sum -= value * value
-        cube_sum -= value * value * value
+        if nfinite == 0:
+            return nfinite, (0., 0., 0., 0.)
+
+        mean, compensation = kahan_add(mean, compensation, (mean - value) / nfinite)
+        delta = value - mean
+        delta_n = delta / (nfinite + 1)
+        term = delta * delta_n * nfinite
+        m2 -= term
+        m3 -= term * delta_n * (nfinite - 1) - 3. * delta_n * m2
 
-    return nfinite, (_sum, square_sum, cube_sum)
+    return nfinite, (mean, compensation, m2, m3)
 
 
 @sdc_register_jitable
@@ -449,27 +475,32 @@ def put_sum(value, nfinite, result):
 
 
 @sdc_register_jitable
-def pop_sum2(value, nfinite, result):
-    """Calculate the window sums of first/second degree without old value."""
-    _sum, square_sum = result
+def pop_var(value, nfinite, result):
+    """Calculate the window mean and sum of squared deviations from it without old value."""
+    mean, compensation, m2 = result
     if numpy.isfinite(value):
         nfinite -= 1
-        _sum -= value
-        square_sum -= value * value
+        if nfinite == 0:
+            return nfinite, (0., 0., 0.)
 
-    return nfinite, (_sum, square_sum)
+        delta = value - mean
+        mean, compensation = kahan_add(mean, compensation, -delta / nfinite)
+        m2 -= delta * (value - mean)
+
+    return nfinite, (mean, compensation, m2)
 
 
 @sdc_register_jitable
-def put_sum2(value, nfinite, result):
-    """Calculate the window sums of first/second degree with new value."""
-    _sum, square_sum = result
+def put_var(value, nfinite, result):
+    """Calculate the window mean and sum of squared deviations from it with new value (Welford's method)."""
+    mean, compensation, m2 = result
     if numpy.isfinite(value):
         nfinite += 1
-        _sum += value
-        square_sum += value * value
+        delta = value - mean
+        mean, compensation = kahan_add(mean, compensation, delta / nfinite)
+        m2 += delta * (value - mean)
 
-    return nfinite, (_sum, square_sum)
+    return nfinite, (mean, compensation, m2)
 
 
 @sdc_register_jitable
@@ -520,17 +551,12 @@ def kurt_result_or_nan(nfinite, minp, result):
     if nfinite < max(4, minp):
         return numpy.nan
 
-    _sum, square_sum, cube_sum, fourth_degree_sum = result
+    _mean, _compensation, m2, _m3, m4 = result
+    if m2 <= 0:
+        return 0.
 
     n = nfinite
-    m2 = (square_sum - _sum * _sum / n) / n
-    m4 = (fourth_degree_sum - 4*_sum*cube_sum/n + 6*_sum*_sum*square_sum/n/n - 3*_sum*_sum*_sum*_sum/n/n/n) / n
-    res = 0 if m2 == 0 else m4 / m2 ** 2.0
-
-    if (n > 2) & (m2 > 0):
-        res = 1.0/(n-2)/(n-3) * ((n**2-1.0)*m4/m2**2.0 - 3*(n-1)**2.0)
-
-    return res
+    return ((n * n - 1.) * m4 * n / (m2 * m2) - 3. * (n - 1.) ** 2) / ((n - 2.) * (n - 3.))
 
 
 @sdc_register_jitable
@@ -548,9 +574,12 @@ def skew_result_or_nan(nfinite, minp, result):
     if nfinite < max(3, minp):
         return numpy.nan
 
-    _sum, square_sum, cube_sum = result
+    _mean, _compensation, m2, m3 = result
+    if m2 <= 0:
+        return numpy.nan
 
-    return skew_formula(nfinite, _sum, square_sum, cube_sum)
+    n = nfinite
+    return numpy.sqrt(n - 1.) * n / (n - 2.) * m3 / m2 ** 1.5
 
 
 @sdc_register_jitable
@@ -563,36 +592,30 @@ def ddof_result(nfinite, minp, result, ddof):
 
 
 @sdc_register_jitable
-def var_result_or_nan(nfinite, minp, result, ddof):
-    """Get result var taking into account min periods."""
+def central_var_result_or_nan(nfinite, minp, result, ddof):
+    """Get result var from the sum of squared deviations taking into account min periods."""
     if nfinite < max(1, minp):
         return numpy.nan
 
-    _sum, square_sum = result
-    res = (square_sum - _sum * _sum / nfinite) / nfinite
+    _mean, _compensation, m2 = result
+    res = max(m2, 0.) / nfinite if nfinite > 1 else 0.
 
     return ddof_result(nfinite, minp, res, ddof)
 
 
 @sdc_register_jitable
-def std_result_or_nan(nfinite, minp, result, ddof):
-    """Get result std taking into account min periods."""
-    return var_result_or_nan(nfinite, minp, result, ddof) ** 0.5
+def central_std_result_or_nan(nfinite, minp, result, ddof):
+    """Get result std from the sum of squared deviations taking into account min periods."""
+    return central_var_result_or_nan(nfinite, minp, result, ddof) ** 0.5
 
 
-def gen_sdc_pandas_series_rolling_impl(pop, put, get_result=result_or_nan,
-                                       init_result=numpy.nan):
-    """Generate series rolling methods implementations based on pop/put funcs"""
-    def impl(self):
-        win = self._window
-        minp = self._min_periods
-
-        input_series = self._data
-        input_arr = input_series._data
+def gen_rolling_fixed_kernel(pop, put, get_result=result_or_nan, init_result=numpy.nan, use_ddof=False):
+    """Generate kernel calculating results over windows of fixed size based on pop/put funcs"""
+    def kernel(input_arr, win, minp, ddof):
         length = len(input_arr)
         output_arr = numpy.empty(length, dtype=float64)
 
-        chunks = parallel_chunks(length)
+        chunks = parallel_window_chunks(length, win)
         for i in prange(len(chunks)):
             chunk = chunks[i]
             nfinite = 0
@@ -600,7 +623,10 @@ def gen_sdc_pandas_series_rolling_impl(pop, put, get_result=result_or_nan,
 
             if win == 0:
                 for idx in range(chunk.start, chunk.stop):
-                    output_arr[idx] = get_result(nfinite, minp, result)
+                    if use_ddof == True:  # noqa
+                        output_arr[idx] = get_result(nfinite, minp, result, ddof)
+                    else:
+                        output_arr[idx] = get_result(nfinite, minp, result)
                 continue
 
             prelude_start = max(0, chunk.start - win + 1)
@@ -616,28 +642,32 @@ def gen_sdc_pandas_series_rolling_impl(pop, put, get_result=result_or_nan,
             for idx in range(interlude_start, interlude_stop):
                 value = input_arr[idx]
                 nfinite, result = put(value, nfinite, result)
-                output_arr[idx] = get_result(nfinite, minp, result)
+                if use_ddof == True:  # noqa
+                    output_arr[idx] = get_result(nfinite, minp, result, ddof)
+                else:
+                    output_arr[idx] = get_result(nfinite, minp, result)
 
             for idx in range(interlude_stop, chunk.stop):
                 put_value = input_arr[idx]
                 pop_value = input_arr[idx - win]
                 nfinite, result = put(put_value, nfinite, result)
                 nfinite, result = pop(pop_value, nfinite, result)
-                output_arr[idx] = get_result(nfinite, minp, result)
+                if use_ddof == True:  # noqa
+                    output_arr[idx] = get_result(nfinite, minp, result, ddof)
+                else:
+                    output_arr[idx] = get_result(nfinite, minp, result)
 
-        return pandas.Series(output_arr, input_series._index,
-                             name=input_series._name)
-    return impl
+        return output_arr
 
+    return sdc_register_jitable(kernel)
 
-def gen_sdc_pandas_series_rolling_minmax_impl(pop, put, init_result=numpy.nan):
-    """Generate series rolling min/max implementations based on pop/put funcs"""
-    def impl(self):
-        win = self._window
-        minp = self._min_periods
 
-        input_series = self._data
-        input_arr = input_series._data
+def gen_rolling_bounds_kernel(pop, put, get_result=result_or_nan, init_result=numpy.nan, use_ddof=False):
+    """
+    Generate kernel calculating results over windows input_arr[starts[idx]:ends[idx]] based on pop/put funcs.
+    Both bounds are non-decreasing, so each value is put and popped at most once per parallel chunk.
+    """
+    def kernel(input_arr, starts, ends, minp, ddof):
         length = len(input_arr)
         output_arr = numpy.empty(length, dtype=float64)
 
@@ -647,49 +677,483 @@ def gen_sdc_pandas_series_rolling_minmax_impl(pop, put, init_result=numpy.nan):
             nfinite = 0
             result = init_result
 
+            window_start = window_stop = starts[chunk.start]
+            for idx in range(chunk.start, chunk.stop):
+                for pos in range(window_stop, ends[idx]):
+                    nfinite, result = put(input_arr[pos], nfinite, result)
+
+                for pos in range(window_start, starts[idx]):
+                    nfinite, result = pop(input_arr[pos], nfinite, result)
+
+                window_start, window_stop = starts[idx], ends[idx]
+                if use_ddof == True:  # noqa
+                    output_arr[idx] = get_result(nfinite, minp, result, ddof)
+                else:
+                    output_arr[idx] = get_result(nfinite, minp, result)
+
+        return output_arr
+
+    return sdc_register_jitable(kernel)
+
+
+def gen_rolling_minmax_fixed_kernel(dominates):
+    """
+    Generate kernel calculating min/max over windows of fixed size based on comparison func.
+    Indices of window values, which can still become the window extreme, are kept in a monotonic deque
+    stored in a ring buffer: each value is pushed and popped at most once, so the total work is O(n).
+    """
+    def kernel(input_arr, win, minp, ddof):
+        length = len(input_arr)
+        output_arr = numpy.empty(length, dtype=float64)
+
+        # window never holds more than this number of values
+        capacity = max(1, min(win, length))
+
+        chunks = parallel_chunks(length)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            nfinite = 0
+
             if win == 0:
                 for idx in range(chunk.start, chunk.stop):
-                    output_arr[idx] = result_or_nan(nfinite, minp, result)
+                    output_arr[idx] = result_or_nan(nfinite, minp, numpy.nan)
                 continue
 
-            prelude_start = max(0, chunk.start - win + 1)
-            prelude_stop = chunk.start
+            deque = numpy.empty(capacity, dtype=numpy.int64)
+            head = 0
+            size = 0
 
-            interlude_start = prelude_stop
-            interlude_stop = min(prelude_start + win, chunk.stop)
+            prelude_start = max(0, chunk.start - win + 1)
+            for idx in range(prelude_start, chunk.stop):
+                pop_idx = idx - win
+                if pop_idx >= prelude_start and numpy.isfinite(input_arr[pop_idx]):
+                    nfinite -= 1
+                    if size > 0 and deque[head] == pop_idx:
+                        head = head + 1 if head + 1 < capacity else 0
+                        size -= 1
 
-            for idx in range(prelude_start, prelude_stop):
                 value = input_arr[idx]
-                nfinite, result = put(value, nfinite, result)
+                if numpy.isfinite(value):
+                    nfinite += 1
+                    # values dominated by the new one can not become the window extreme anymore
+                    while size > 0:
+                        tail = head + size - 1
+                        if tail >= capacity:
+                            tail -= capacity
+                        if dominates(input_arr[deque[tail]], value):
+                            break
+                        size -= 1
+
+                    tail = head + size
+                    if tail >= capacity:
+                        tail -= capacity
+                    deque[tail] = idx
+                    size += 1
+
+                if idx >= chunk.start:
+                    result = input_arr[deque[head]] if size > 0 else numpy.nan
+                    output_arr[idx] = result_or_nan(nfinite, minp, result)
 
-            for idx in range(interlude_start, interlude_stop):
-                value = input_arr[idx]
-                nfinite, result = put(value, nfinite, result)
-                output_arr[idx] = result_or_nan(nfinite, minp, result)
+        return output_arr
 
-            for idx in range(interlude_stop, chunk.stop):
-                put_value = input_arr[idx]
-                pop_value = input_arr[idx - win]
-                nfinite, result = put(put_value, nfinite, result)
-                nfinite, result = pop(pop_value, nfinite, result,
-                                      input_arr, idx, win)
+    return sdc_register_jitable(kernel)
+
+
+def gen_rolling_minmax_bounds_kernel(dominates):
+    """
+    Generate kernel calculating min/max over windows input_arr[starts[idx]:ends[idx]] based on comparison func
+    with monotonic deque of indices, see gen_rolling_minmax_fixed_kernel.
+    """
+    def kernel(input_arr, starts, ends, minp, ddof):
+        length = len(input_arr)
+        output_arr = numpy.empty(length, dtype=float64)
+
+        chunks = parallel_chunks(length)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            nfinite = 0
+
+            window_start = window_stop = starts[chunk.start]
+            # all the windows of the chunk are within this range of indices
+            capacity = max(1, ends[chunk.stop - 1] - window_start)
+            deque = numpy.empty(capacity, dtype=numpy.int64)
+            head = 0
+            size = 0
+
+            for idx in range(chunk.start, chunk.stop):
+                for pos in range(window_stop, ends[idx]):
+                    value = input_arr[pos]
+                    if not numpy.isfinite(value):
+                        continue
+
+                    nfinite += 1
+                    while size > 0:
+                        tail = head + size - 1
+                        if tail >= capacity:
+                            tail -= capacity
+                        if dominates(input_arr[deque[tail]], value):
+                            break
+                        size -= 1
+
+                    tail = head + size
+                    if tail >= capacity:
+                        tail -= capacity
+                    deque[tail] = pos
+                    size += 1
+
+                for pos in range(window_start, starts[idx]):
+                    if not numpy.isfinite(input_arr[pos]):
+                        continue
+
+                    nfinite -= 1
+                    if size > 0 and deque[head] == pos:
+                        head = head + 1 if head + 1 < capacity else 0
+                        size -= 1
+
+                window_start, window_stop = starts[idx], ends[idx]
+                result = input_arr[deque[head]] if size > 0 else numpy.nan
                 output_arr[idx] = result_or_nan(nfinite, minp, result)
 
+        return output_arr
+
+    return sdc_register_jitable(kernel)
+
+
+@sdc_register_jitable
+def rolling_weighted(input_arr, weights, minp, center, average):
+    """
+    Calculate weighted sum (or average) of finite values of windows of fixed size
+    as convolution with the given weights, parallel chunks of output values are independent.
+    """
+    length = len(input_arr)
+    win = len(weights)
+    offset = (win - 1) // 2 if center else 0
+    output_arr = numpy.empty(length, dtype=float64)
+
+    chunks = parallel_chunks(length)
+    for i in prange(len(chunks)):
+        chunk = chunks[i]
+        for idx in range(chunk.start, chunk.stop):
+            window_start = idx + offset - win + 1
+            nfinite = 0
+            result = 0.
+            weights_sum = 0.
+            for k in range(max(0, -window_start), min(win, length - window_start)):
+                value = input_arr[window_start + k]
+                if numpy.isfinite(value):
+                    nfinite += 1
+                    result += value * weights[k]
+                    weights_sum += weights[k]
+
+            if nfinite == 0 or nfinite < minp:
+                output_arr[idx] = numpy.nan
+            elif average:
+                output_arr[idx] = result / weights_sum if weights_sum != 0 else numpy.nan
+            else:
+                output_arr[idx] = result
+
+    return output_arr
+
+
+def rolling_window_bounds(self):
+    pass
+
+
+@sdc_overload(rolling_window_bounds)
+def rolling_window_bounds_overload(self):
+    """Calculate bounds of windows given by a period of time or centered windows of fixed size"""
+    if self.offset:
+        def rolling_offset_window_bounds_impl(self):
+            return offset_window_bounds(self._data._index, self._window, self._closed)
+
+        return rolling_offset_window_bounds_impl
+
+    def rolling_centered_window_bounds_impl(self):
+        return centered_window_bounds(len(self._data._data), self._window)
+
+    return rolling_centered_window_bounds_impl
+
+
+def gen_sdc_pandas_series_rolling_impl(fixed_kernel, bounds_kernel, offset=False):
+    """
+    Generate series rolling methods implementations based on kernels calculating results
+    over windows of fixed size and over windows given by bounds (centered or time-based windows)
+    """
+    def impl(self):
+        input_series = self._data
+        if offset == True or self._center:  # noqa
+            starts, ends = rolling_window_bounds(self)
+            output_arr = bounds_kernel(input_series._data, starts, ends, self._min_periods, 0)
+        else:
+            output_arr = fixed_kernel(input_series._data, self._window, self._min_periods, 0)
+
         return pandas.Series(output_arr, input_series._index,
                              name=input_series._name)
     return impl
 
 
-def gen_sdc_pandas_series_rolling_ddof_impl(pop, put, get_result=ddof_result,
-                                            init_result=numpy.nan):
-    """Generate series rolling ddof implementations based on pop/put funcs"""
+def gen_sdc_pandas_series_rolling_ddof_impl(fixed_kernel, bounds_kernel, offset=False):
+    """Generate series rolling ddof implementations, see gen_sdc_pandas_series_rolling_impl"""
     def impl(self, ddof=1):
-        win = self._window
-        minp = self._min_periods
+        input_series = self._data
+        if offset == True or self._center:  # noqa
+            starts, ends = rolling_window_bounds(self)
+            output_arr = bounds_kernel(input_series._data, starts, ends, self._min_periods, ddof)
+        else:
+            output_arr = fixed_kernel(input_series._data, self._window, self._min_periods, ddof)
+
+        return pandas.Series(output_arr, input_series._index,
+                             name=input_series._name)
+    return impl
+
 
+def gen_sdc_pandas_series_rolling_weighted_impl(fixed_kernel, bounds_kernel, offset=False,
+                                                weighted=False, average=False):
+    """
+    Generate series rolling sum/mean implementations, which support weighted windows (win_type),
+    see gen_sdc_pandas_series_rolling_impl
+    """
+    def impl(self, std=None, tau=None):
         input_series = self._data
-        input_arr = input_series._data
-        length = len(input_arr)
+        if weighted == True:  # noqa
+            weights = window_weights(self._win_type, self._window, std, tau)
+            output_arr = rolling_weighted(input_series._data, weights, self._min_periods, self._center, average)
+        elif offset == True or self._center:  # noqa
+            starts, ends = rolling_window_bounds(self)
+            output_arr = bounds_kernel(input_series._data, starts, ends, self._min_periods, 0)
+        else:
+            output_arr = fixed_kernel(input_series._data, self._window, self._min_periods, 0)
+
+        return pandas.Series(output_arr, input_series._index,
+                             name=input_series._name)
+    return impl
+
+
+sdc_pandas_series_rolling_count_kernels = (
+    gen_rolling_fixed_kernel(pop_count, put_count, get_result=result, init_result=0.),
+    gen_rolling_bounds_kernel(pop_count, put_count, get_result=result, init_result=0.))
+sdc_pandas_series_rolling_kurt_kernels = (
+    gen_rolling_fixed_kernel(pop_kurt, put_kurt, get_result=kurt_result_or_nan, init_result=(0., 0., 0., 0., 0.)),
+    gen_rolling_bounds_kernel(pop_kurt, put_kurt, get_result=kurt_result_or_nan, init_result=(0., 0., 0., 0., 0.)))
+sdc_pandas_series_rolling_max_kernels = (
+    gen_rolling_minmax_fixed_kernel(greater), gen_rolling_minmax_bounds_kernel(greater))
+sdc_pandas_series_rolling_mean_kernels = (
+    gen_rolling_fixed_kernel(pop_sum, put_sum, get_result=mean_result_or_nan, init_result=0.),
+    gen_rolling_bounds_kernel(pop_sum, put_sum, get_result=mean_result_or_nan, init_result=0.))
+sdc_pandas_series_rolling_min_kernels = (
+    gen_rolling_minmax_fixed_kernel(less), gen_rolling_minmax_bounds_kernel(less))
+sdc_pandas_series_rolling_skew_kernels = (
+    gen_rolling_fixed_kernel(pop_skew, put_skew, get_result=skew_result_or_nan, init_result=(0., 0., 0., 0.)),
+    gen_rolling_bounds_kernel(pop_skew, put_skew, get_result=skew_result_or_nan, init_result=(0., 0., 0., 0.)))
+sdc_pandas_series_rolling_sum_kernels = (
+    gen_rolling_fixed_kernel(pop_sum, put_sum, init_result=0.),
+    gen_rolling_bounds_kernel(pop_sum, put_sum, init_result=0.))
+sdc_pandas_series_rolling_var_kernels = (
+    gen_rolling_fixed_kernel(pop_var, put_var, get_result=central_var_result_or_nan, init_result=(0., 0., 0.),
+                             use_ddof=True),
+    gen_rolling_bounds_kernel(pop_var, put_var, get_result=central_var_result_or_nan, init_result=(0., 0., 0.),
+                              use_ddof=True))
+sdc_pandas_series_rolling_std_kernels = (
+    gen_rolling_fixed_kernel(pop_var, put_var, get_result=central_std_result_or_nan, init_result=(0., 0., 0.),
+                             use_ddof=True),
+    gen_rolling_bounds_kernel(pop_var, put_var, get_result=central_std_result_or_nan, init_result=(0., 0., 0.),
+                              use_ddof=True))
+
+
+def gen_minmax_deque_funcs(dominates):
+    """
+    Generate put/pop/result funcs keeping indices of the window extreme candidates in a monotonic deque
+    stored in a ring buffer, see gen_rolling_minmax_fixed_kernel. The deque state is (buffer, head, size).
+    """
+    def put(input_arr, pos, nfinite, result):
+        deque, head, size = result
+        value = input_arr[pos]
+        if not numpy.isfinite(value):
+            return nfinite, result
+
+        capacity = len(deque)
+        while size > 0:
+            tail = head + size - 1
+            if tail >= capacity:
+                tail -= capacity
+            if dominates(input_arr[deque[tail]], value):
+                break
+            size -= 1
+
+        tail = head + size
+        if tail >= capacity:
+            tail -= capacity
+        deque[tail] = pos
+
+        return nfinite + 1, (deque, head, size + 1)
+
+    def pop(input_arr, pos, nfinite, result):
+        deque, head, size = result
+        if not numpy.isfinite(input_arr[pos]):
+            return nfinite, result
+
+        if size > 0 and deque[head] == pos:
+            head = head + 1 if head + 1 < len(deque) else 0
+            size -= 1
+
+        return nfinite - 1, (deque, head, size)
+
+    def get_result(input_arr, nfinite, minp, result):
+        deque, head, size = result
+        extreme = input_arr[deque[head]] if size > 0 else numpy.nan
+
+        return result_or_nan(nfinite, minp, extreme)
+
+    return sdc_register_jitable(put), sdc_register_jitable(pop), sdc_register_jitable(get_result)
+
+
+# window accumulators shared by the aggregations: put/pop funcs and initial result
+rolling_agg_accumulators = {
+    'count': (put_count, pop_count, 0.),
+    'kurt': (put_kurt, pop_kurt, (0., 0., 0., 0., 0.)),
+    'skew': (put_skew, pop_skew, (0., 0., 0., 0.)),
+    'sum': (put_sum, pop_sum, 0.),
+    'var': (put_var, pop_var, (0., 0., 0.)),
+}
+# accumulators of indices of the window extreme candidates: put/pop/result funcs
+rolling_agg_deques = {
+    'max': gen_minmax_deque_funcs(greater),
+    'min': gen_minmax_deque_funcs(less),
+}
+# aggregations: name of the accumulator, func getting result and whether the func takes ddof
+rolling_agg_funcs = {
+    'count': ('count', result, False),
+    'kurt': ('kurt', kurt_result_or_nan, False),
+    'max': ('max', rolling_agg_deques['max'][2], False),
+    'mean': ('sum', mean_result_or_nan, False),
+    'min': ('min', rolling_agg_deques['min'][2], False),
+    'skew': ('skew', skew_result_or_nan, False),
+    'std': ('var', central_std_result_or_nan, True),
+    'sum': ('sum', result_or_nan, False),
+    'var': ('var', central_var_result_or_nan, True),
+}
+
+
+def gen_rolling_agg_kernel(func_names, offset=False):
+    """
+    Generate kernel calculating rolling aggregations func_names over each array of the list of arrays
+    with a single pass over the data: every window value is put and popped once per accumulator and
+    the aggregations sharing an accumulator (e.g. sum and mean) are calculated from the same window sums.
+    Windows are either of fixed size or given by bounds, see gen_rolling_bounds_kernel.
+    Parallel chunks of all the arrays are processed in a single parallel loop.
+    """
+    accumulators = []
+    for func_name in func_names:
+        accumulator = rolling_agg_funcs[func_name][0]
+        if accumulator not in accumulators:
+            accumulators.append(accumulator)
+
+    use_deque = any(accumulator in rolling_agg_deques for accumulator in accumulators)
+    global_vars = {'numpy': numpy, 'float64': float64, 'prange': prange, 'parallel_chunks': parallel_chunks,
+                   'parallel_window_chunks': parallel_window_chunks}
+
+    if offset:
+        func_lines = ['def _rolling_agg_kernel(input_arrs, starts, ends, minp, ddof):']
+    else:
+        func_lines = ['def _rolling_agg_kernel(input_arrs, win, minp, ddof):']
+
+    func_lines += ['  ncolumns = len(input_arrs)',
+                   '  length = len(input_arrs[0])']
+    for k in range(len(func_names)):
+        func_lines.append(f'  output_{k} = numpy.empty((ncolumns, length), dtype=float64)')
+
+    if offset:
+        func_lines.append('  chunks = parallel_chunks(length)')
+    else:
+        func_lines.append('  chunks = parallel_window_chunks(length, win)')
+    func_lines += ['  nchunks = len(chunks)',
+                   '  for i in prange(ncolumns * nchunks):',
+                   '    column = i // nchunks',
+                   '    chunk = chunks[i % nchunks]',
+                   '    input_arr = input_arrs[column]']
+    if offset:
+        func_lines.append('    window_start = window_stop = starts[chunk.start]')
+    else:
+        func_lines.append('    window_start = window_stop = max(0, chunk.start + 1 - win)')
+
+    if use_deque:
+        # all the windows of the chunk are within this range of indices
+        last_stop = 'ends[chunk.stop - 1]' if offset else 'chunk.stop'
+        func_lines.append(f'    capacity = max(1, {last_stop} - window_start)')
+
+    put_lines, pop_lines = [], []
+    for accumulator in accumulators:
+        func_lines.append(f'    nfinite_{accumulator} = 0')
+        if accumulator in rolling_agg_deques:
+            put, pop, _ = rolling_agg_deques[accumulator]
+            func_lines.append(f'    result_{accumulator} = (numpy.empty(capacity, dtype=numpy.int64), 0, 0)')
+            put_args, pop_args = 'input_arr, pos', 'input_arr, pos'
+        else:
+            put, pop, init_result = rolling_agg_accumulators[accumulator]
+            global_vars[f'init_result_{accumulator}'] = init_result
+            func_lines.append(f'    result_{accumulator} = init_result_{accumulator}')
+            put_args, pop_args = 'input_arr[pos]', 'input_arr[pos]'
+
+        global_vars.update({f'put_{accumulator}': put, f'pop_{accumulator}': pop})
+        state = f'nfinite_{accumulator}, result_{accumulator}'
+        put_lines.append(f'        {state} = put_{accumulator}({put_args}, {state})')
+        pop_lines.append(f'        {state} = pop_{accumulator}({pop_args}, {state})')
+
+    func_lines.append('    for idx in range(chunk.start, chunk.stop):')
+    if offset:
+        func_lines.append('      start, stop = starts[idx], ends[idx]')
+    else:
+        func_lines.append('      start, stop = max(0, idx + 1 - win), idx + 1')
+
+    func_lines.append('      for pos in range(window_stop, stop):')
+    func_lines += put_lines
+    func_lines.append('      for pos in range(window_start, start):')
+    func_lines += pop_lines
+    func_lines.append('      window_start, window_stop = start, stop')
+
+    for k, func_name in enumerate(func_names):
+        accumulator, get_result, use_ddof = rolling_agg_funcs[func_name]
+        global_vars[f'get_result_{k}'] = get_result
+        result_args = [f'nfinite_{accumulator}', 'minp', f'result_{accumulator}']
+        if accumulator in rolling_agg_deques:
+            result_args.insert(0, 'input_arr')
+        if use_ddof:
+            result_args.append('ddof')
+        func_lines.append(f'      output_{k}[column, idx] = get_result_{k}({", ".join(result_args)})')
+
+    outputs = ', '.join(f'output_{k}' for k in range(len(func_names)))
+    func_lines.append(f'  return {outputs},')
+
+    func_text = '\n'.join(func_lines)
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+
+    return sdc_register_jitable(loc_vars['_rolling_agg_kernel'])
+
+
+def rolling_agg_check_types(ty_checker, self, func):
+    """Check types of rolling.agg() parameters, returns name of aggregation function or tuple of names"""
+    if self.weighted:
+        ty_checker.raise_exc(self.win_type, 'None', 'win_type')
+
+    func_names = literal_func_names(func)
+    if func_names is None:
+        ty_checker.raise_exc(func, 'str or sequence of str', 'func')
+
+    if not set((func_names, ) if isinstance(func_names, str) else func_names) <= set(rolling_agg_funcs):
+        ty_checker.raise_exc(func, f'any of {sorted(rolling_agg_funcs)}', 'func')
+
+    return func_names
+
+
+def gen_rolling_pair_bounds_kernel(pop, put, get_result, init_result, use_ddof=False):
+    """
+    Generate kernel calculating results over pairs of values of windows given by bounds based on pop/put funcs,
+    see gen_rolling_bounds_kernel. Pairs out of the shorter array are skipped.
+    """
+    def kernel(main_arr, other_arr, starts, ends, minp, ddof):
+        min_length = min(len(main_arr), len(other_arr))
+        length = len(starts)
         output_arr = numpy.empty(length, dtype=float64)
 
         chunks = parallel_chunks(length)
@@ -698,94 +1162,178 @@ def gen_sdc_pandas_series_rolling_ddof_impl(pop, put, get_result=ddof_result,
             nfinite = 0
             result = init_result
 
-            if win == 0:
-                for idx in range(chunk.start, chunk.stop):
+            window_start = window_stop = starts[chunk.start]
+            for idx in range(chunk.start, chunk.stop):
+                for pos in range(window_stop, min(ends[idx], min_length)):
+                    nfinite, result = put(main_arr[pos], other_arr[pos], nfinite, result)
+
+                for pos in range(window_start, min(starts[idx], min_length)):
+                    nfinite, result = pop(main_arr[pos], other_arr[pos], nfinite, result)
+
+                window_start, window_stop = starts[idx], ends[idx]
+                if use_ddof == True:  # noqa
                     output_arr[idx] = get_result(nfinite, minp, result, ddof)
-                continue
+                else:
+                    output_arr[idx] = get_result(nfinite, minp, result)
 
-            prelude_start = max(0, chunk.start - win + 1)
-            prelude_stop = chunk.start
+        return output_arr
 
-            interlude_start = prelude_stop
-            interlude_stop = min(prelude_start + win, chunk.stop)
+    return sdc_register_jitable(kernel)
 
-            for idx in range(prelude_start, prelude_stop):
-                value = input_arr[idx]
-                nfinite, result = put(value, nfinite, result)
 
-            for idx in range(interlude_start, interlude_stop):
-                value = input_arr[idx]
-                nfinite, result = put(value, nfinite, result)
-                output_arr[idx] = get_result(nfinite, minp, result, ddof)
+@sdc_register_jitable
+def pop_cov_aligned(x, y, nfinite, result):
+    """Calculate the window sums for cov without old value aligning values by finiteness."""
+    return pop_cov(x, y, nfinite, result, align_finiteness=True)
 
-            for idx in range(interlude_stop, chunk.stop):
-                put_value = input_arr[idx]
-                pop_value = input_arr[idx - win]
-                nfinite, result = put(put_value, nfinite, result)
-                nfinite, result = pop(pop_value, nfinite, result)
-                output_arr[idx] = get_result(nfinite, minp, result, ddof)
 
-        return pandas.Series(output_arr, input_series._index,
-                             name=input_series._name)
-    return impl
+@sdc_register_jitable
+def put_cov_aligned(x, y, nfinite, result):
+    """Calculate the window sums for cov with new value aligning values by finiteness."""
+    return put_cov(x, y, nfinite, result, align_finiteness=True)
+
+
+rolling_corr_bounds_kernel = gen_rolling_pair_bounds_kernel(
+    pop_corr, put_corr, corr_result_or_nan, (0., 0., 0., 0., 0.))
+rolling_cov_bounds_kernel = gen_rolling_pair_bounds_kernel(
+    pop_cov, put_cov, cov_result_or_nan, (0., 0., 0., 0.), use_ddof=True)
+rolling_cov_aligned_bounds_kernel = gen_rolling_pair_bounds_kernel(
+    pop_cov_aligned, put_cov_aligned, cov_result_or_nan, (0., 0., 0., 0.), use_ddof=True)
+
+
+@sdc_register_jitable
+def nonfinite_prefix_counts(input_arr):
+    """Calculate numbers of non-finite values in input_arr[:idx] for every idx from 0 to len(input_arr)"""
+    length = len(input_arr)
+    counts = numpy.empty(length + 1, dtype=numpy.int64)
+    counts[0] = 0
+    for idx in range(length):
+        counts[idx + 1] = counts[idx] + (0 if numpy.isfinite(input_arr[idx]) else 1)
+
+    return counts
+
+
+@sdc_register_jitable
+def apply_window(input_arr, start, stop, nonfinite, func, minp):
+    """
+    Apply function to the window input_arr[start:stop] taking into account min periods.
+    Window without non-finite values is passed as a view, otherwise infinities are replaced with NaNs in a copy.
+    """
+    nnonfinite = nonfinite[stop] - nonfinite[start]
+    if stop - start - nnonfinite < minp:
+        return numpy.nan
+
+    window = input_arr[start:stop]
+    if nnonfinite == 0:
+        return arr_apply(window, func)
+
+    finite_window = window.copy()
+    finite_window[numpy.isinf(window)] = numpy.nan
 
+    return arr_apply(finite_window, func)
 
-sdc_pandas_series_rolling_count_impl = gen_sdc_pandas_series_rolling_impl(
-    pop_count, put_count, get_result=result, init_result=0.)
-sdc_pandas_series_rolling_kurt_impl = gen_sdc_pandas_series_rolling_impl(
-    pop_kurt, put_kurt, get_result=kurt_result_or_nan,
-    init_result=(0., 0., 0., 0.))
-sdc_pandas_series_rolling_max_impl = gen_sdc_pandas_series_rolling_minmax_impl(
-    pop_max, put_max)
-sdc_pandas_series_rolling_mean_impl = gen_sdc_pandas_series_rolling_impl(
-    pop_sum, put_sum, get_result=mean_result_or_nan, init_result=0.)
-sdc_pandas_series_rolling_min_impl = gen_sdc_pandas_series_rolling_minmax_impl(
-    pop_min, put_min)
-sdc_pandas_series_rolling_skew_impl = gen_sdc_pandas_series_rolling_impl(
-    pop_skew, put_skew, get_result=skew_result_or_nan, init_result=(0., 0., 0.))
-sdc_pandas_series_rolling_sum_impl = gen_sdc_pandas_series_rolling_impl(
-    pop_sum, put_sum, init_result=0.)
-sdc_pandas_series_rolling_var_impl = gen_sdc_pandas_series_rolling_ddof_impl(
-    pop_sum2, put_sum2, get_result=var_result_or_nan, init_result=(0., 0.))
-sdc_pandas_series_rolling_std_impl = gen_sdc_pandas_series_rolling_ddof_impl(
-    pop_sum2, put_sum2, get_result=std_result_or_nan, init_result=(0., 0.))
-
-
-@sdc_rolling_overload(SeriesRollingType, 'apply')
+
+@sdc_register_jitable
+def rolling_apply_fixed(input_arr, win, minp, func):
+    """Apply function over windows of fixed size"""
+    length = len(input_arr)
+    output_arr = numpy.empty(length, dtype=float64)
+    nonfinite = nonfinite_prefix_counts(input_arr)
+
+    chunks = parallel_chunks(length)
+    for i in prange(len(chunks)):
+        chunk = chunks[i]
+        for idx in range(chunk.start, chunk.stop):
+            start = max(0, idx + 1 - win)
+            output_arr[idx] = apply_window(input_arr, start, idx + 1, nonfinite, func, minp)
+
+    return output_arr
+
+
+@sdc_register_jitable
+def rolling_apply_bounds(input_arr, starts, ends, minp, func):
+    """Apply function over windows input_arr[starts[idx]:ends[idx]]"""
+    length = len(input_arr)
+    output_arr = numpy.empty(length, dtype=float64)
+    nonfinite = nonfinite_prefix_counts(input_arr)
+
+    chunks = parallel_chunks(length)
+    for i in prange(len(chunks)):
+        chunk = chunks[i]
+        for idx in range(chunk.start, chunk.stop):
+            output_arr[idx] = apply_window(input_arr, starts[idx], ends[idx], nonfinite, func, minp)
+
+    return output_arr
+
+
+def gen_rolling_agg_method_impl(func_name):
+    """Generate rolling.agg() implementation applying single function just as the method of the same name"""
+    func_text = f'def _rolling_agg_impl(self, func):\n  return self.{func_name}()'
+    loc_vars = {}
+    exec(func_text, {}, loc_vars)
+
+    return loc_vars['_rolling_agg_impl']
+
+
+@sdc_overload_method(SeriesRollingType, 'agg')
+@sdc_overload_method(SeriesRollingType, 'aggregate')
+def hpat_pandas_series_rolling_agg(self, func):
+
+    ty_checker = TypeChecker('Method rolling.agg().')
+    ty_checker.check(self, SeriesRollingType)
+
+    func_names = rolling_agg_check_types(ty_checker, self, func)
+    if isinstance(func_names, str):
+        return gen_rolling_agg_method_impl(func_names)
+
+    offset = self.offset
+    fixed_kernel = gen_rolling_agg_kernel(func_names)
+    bounds_kernel = gen_rolling_agg_kernel(func_names, offset=True)
+
+    func_lines = ['def _series_rolling_agg_impl(self, func):',
+                  '  input_series = self._data',
+                  '  input_arrs = [input_series._data]',
+                  '  if offset == True or self._center:  # noqa',
+                  '    starts, ends = rolling_window_bounds(self)',
+                  '    results = bounds_kernel(input_arrs, starts, ends, self._min_periods, 1)',
+                  '  else:',
+                  '    results = fixed_kernel(input_arrs, self._window, self._min_periods, 1)']
+    data = ', '.join(f'\'{func_name}\': results[{k}][0]' for k, func_name in enumerate(func_names))
+    func_lines.append(f'  return pandas.DataFrame({{{data}}}, index=input_series._index)')
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'pandas': pandas, 'offset': offset, 'rolling_window_bounds': rolling_window_bounds,
+                   'fixed_kernel': fixed_kernel, 'bounds_kernel': bounds_kernel}
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+
+    return loc_vars['_series_rolling_agg_impl']
+
+
+@sdc_overload_method(SeriesRollingType, 'apply')
 def hpat_pandas_series_rolling_apply(self, func, raw=None):
 
     ty_checker = TypeChecker('Method rolling.apply().')
     ty_checker.check(self, SeriesRollingType)
 
+    if self.weighted:
+        ty_checker.raise_exc(self.win_type, 'None', 'win_type')
+
     raw_accepted = (Omitted, NoneType, Boolean)
     if not isinstance(raw, raw_accepted) and raw is not None:
         ty_checker.raise_exc(raw, 'bool', 'raw')
 
-    def hpat_pandas_rolling_series_apply_impl(self, func, raw=None):
-        win = self._window
-        minp = self._min_periods
+    offset = self.offset
 
+    def hpat_pandas_rolling_series_apply_impl(self, func, raw=None):
         input_series = self._data
         input_arr = input_series._data
-        length = len(input_arr)
-        output_arr = numpy.empty(length, dtype=float64)
-
-        def culc_apply(arr, func, minp):
-            finite_arr = arr.copy()
-            finite_arr[numpy.isinf(arr)] = numpy.nan
-            if len(finite_arr) < minp:
-                return numpy.nan
-            else:
-                return arr_apply(finite_arr, func)
-
-        boundary = min(win, length)
-        for i in prange(boundary):
-            arr_range = input_arr[:i + 1]
-            output_arr[i] = culc_apply(arr_range, func, minp)
 
-        for i in prange(boundary, length):
-            arr_range = input_arr[i + 1 - win:i + 1]
-            output_arr[i] = culc_apply(arr_range, func, minp)
+        if offset == True or self._center:  # noqa
+            starts, ends = rolling_window_bounds(self)
+            output_arr = rolling_apply_bounds(input_arr, starts, ends, self._min_periods, func)
+        else:
+            output_arr = rolling_apply_fixed(input_arr, self._window, self._min_periods, func)
 
         return pandas.Series(output_arr, input_series._index, name=input_series._name)
 
@@ -798,10 +1346,16 @@ def hpat_pandas_series_rolling_corr(self, other=None, pairwise=None):
     ty_checker = TypeChecker('Method rolling.corr().')
     ty_checker.check(self, SeriesRollingType)
 
+    if self.weighted:
+        ty_checker.raise_exc(self.win_type, 'None', 'win_type')
+
     accepted_other = (bool, Omitted, NoneType, SeriesType)
     if not isinstance(other, accepted_other) and other is not None:
         ty_checker.raise_exc(other, 'Series', 'other')
 
+    if self.offset:
+        raise SDCLimitation(f"{ty_checker.func_name} Unsupported parameter. Given 'window': offset")
+
     accepted_pairwise = (bool, Boolean, Omitted, NoneType)
     if not isinstance(pairwise, accepted_pairwise) and pairwise is not None:
         ty_checker.raise_exc(pairwise, 'bool', 'pairwise')
@@ -824,9 +1378,14 @@ def hpat_pandas_series_rolling_corr(self, other=None, pairwise=None):
         other_arr_length = len(other_arr)
         min_length = min(main_arr_length, other_arr_length)
         length = max(main_arr_length, other_arr_length)
+        if self._center:
+            starts, ends = centered_window_bounds(length, win)
+            output_arr = rolling_corr_bounds_kernel(main_arr, other_arr, starts, ends, minp, 0)
+            return pandas.Series(output_arr)
+
         output_arr = numpy.empty(length, dtype=float64)
 
-        chunks = parallel_chunks(length)
+        chunks = parallel_window_chunks(length, win)
         for i in prange(len(chunks)):
             chunk = chunks[i]
             nfinite = 0
@@ -887,7 +1446,10 @@ def hpat_pandas_series_rolling_count(self):
     ty_checker = TypeChecker('Method rolling.count().')
     ty_checker.check(self, SeriesRollingType)
 
-    return sdc_pandas_series_rolling_count_impl
+    if self.weighted:
+        ty_checker.raise_exc(self.win_type, 'None', 'win_type')
+
+    return gen_sdc_pandas_series_rolling_impl(*sdc_pandas_series_rolling_count_kernels, offset=self.offset)
 
 
 def _hpat_pandas_series_rolling_cov_check_types(self, other=None,
@@ -896,10 +1458,16 @@ def _hpat_pandas_series_rolling_cov_check_types(self, other=None,
     ty_checker = TypeChecker('Method rolling.cov().')
     ty_checker.check(self, SeriesRollingType)
 
+    if self.weighted:
+        ty_checker.raise_exc(self.win_type, 'None', 'win_type')
+
     accepted_other = (bool, Omitted, NoneType, SeriesType)
     if not isinstance(other, accepted_other) and other is not None:
         ty_checker.raise_exc(other, 'Series', 'other')
 
+    if self.offset:
+        raise SDCLimitation(f"{ty_checker.func_name} Unsupported parameter. Given 'window': offset")
+
     accepted_pairwise = (bool, Boolean, Omitted, NoneType)
     if not isinstance(pairwise, accepted_pairwise) and pairwise is not None:
         ty_checker.raise_exc(pairwise, 'bool', 'pairwise')
@@ -911,6 +1479,10 @@ def _hpat_pandas_series_rolling_cov_check_types(self, other=None,
 def _gen_hpat_pandas_rolling_series_cov_impl(other, align_finiteness=False):
     """Generate series.rolling.cov() implementation based on series alignment"""
     nan_other = isinstance(other, (Omitted, NoneType)) or other is None
+    if align_finiteness:
+        bounds_kernel = rolling_cov_aligned_bounds_kernel
+    else:
+        bounds_kernel = rolling_cov_bounds_kernel
 
     def _impl(self, other=None, pairwise=None, ddof=1):
         win = self._window
@@ -928,9 +1500,14 @@ def _gen_hpat_pandas_rolling_series_cov_impl(other, align_finiteness=False):
         other_arr_length = len(other_arr)
         min_length = min(main_arr_length, other_arr_length)
         length = max(main_arr_length, other_arr_length)
+        if self._center:
+            starts, ends = centered_window_bounds(length, win)
+            output_arr = bounds_kernel(main_arr, other_arr, starts, ends, minp, ddof)
+            return pandas.Series(output_arr)
+
         output_arr = numpy.empty(length, dtype=float64)
 
-        chunks = parallel_chunks(length)
+        chunks = parallel_window_chunks(length, win)
         for i in prange(len(chunks)):
             chunk = chunks[i]
             nfinite = 0
@@ -1012,7 +1589,10 @@ def hpat_pandas_series_rolling_kurt(self):
     ty_checker = TypeChecker('Method rolling.kurt().')
     ty_checker.check(self, SeriesRollingType)
 
-    return sdc_pandas_series_rolling_kurt_impl
+    if self.weighted:
+        ty_checker.raise_exc(self.win_type, 'None', 'win_type')
+
+    return gen_sdc_pandas_series_rolling_impl(*sdc_pandas_series_rolling_kurt_kernels, offset=self.offset)
 
 
 @sdc_overload_method(SeriesRollingType, 'max')
@@ -1021,25 +1601,38 @@ def hpat_pandas_series_rolling_max(self):
     ty_checker = TypeChecker('Method rolling.max().')
     ty_checker.check(self, SeriesRollingType)
 
-    return sdc_pandas_series_rolling_max_impl
+    if self.weighted:
+        ty_checker.raise_exc(self.win_type, 'None', 'win_type')
+
+    return gen_sdc_pandas_series_rolling_impl(*sdc_pandas_series_rolling_max_kernels, offset=self.offset)
 
 
 @sdc_overload_method(SeriesRollingType, 'mean')
-def hpat_pandas_series_rolling_mean(self):
+def hpat_pandas_series_rolling_mean(self, std=None, tau=None):
 
     ty_checker = TypeChecker('Method rolling.mean().')
     ty_checker.check(self, SeriesRollingType)
 
-    return sdc_pandas_series_rolling_mean_impl
+    if not isinstance(std, (Omitted, NoneType, Number)) and std is not None:
+        ty_checker.raise_exc(std, 'float', 'std')
+
+    if not isinstance(tau, (Omitted, NoneType, Number)) and tau is not None:
+        ty_checker.raise_exc(tau, 'float', 'tau')
 
+    return gen_sdc_pandas_series_rolling_weighted_impl(*sdc_pandas_series_rolling_mean_kernels, offset=self.offset,
+                                                       weighted=self.weighted, average=True)
 
-@sdc_rolling_overload(SeriesRollingType, 'median')
+
+@sdc_overload_method(SeriesRollingType, 'median')
 def hpat_pandas_series_rolling_median(self):
 
     ty_checker = TypeChecker('Method rolling.median().')
     ty_checker.check(self, SeriesRollingType)
 
-    return hpat_pandas_rolling_series_median_impl
+    if self.weighted:
+        ty_checker.raise_exc(self.win_type, 'None', 'win_type')
+
+    return gen_hpat_pandas_rolling_series_median_impl(offset=self.offset)
 
 
 @sdc_overload_method(SeriesRollingType, 'min')
@@ -1048,14 +1641,20 @@ def hpat_pandas_series_rolling_min(self):
     ty_checker = TypeChecker('Method rolling.min().')
     ty_checker.check(self, SeriesRollingType)
 
-    return sdc_pandas_series_rolling_min_impl
+    if self.weighted:
+        ty_checker.raise_exc(self.win_type, 'None', 'win_type')
+
+    return gen_sdc_pandas_series_rolling_impl(*sdc_pandas_series_rolling_min_kernels, offset=self.offset)
 
-@sdc_rolling_overload(SeriesRollingType, 'quantile')
+@sdc_overload_method(SeriesRollingType, 'quantile')
 def hpat_pandas_series_rolling_quantile(self, quantile, interpolation='linear'):
 
     ty_checker = TypeChecker('Method rolling.quantile().')
     ty_checker.check(self, SeriesRollingType)
 
+    if self.weighted:
+        ty_checker.raise_exc(self.win_type, 'None', 'win_type')
+
     if not isinstance(quantile, Number):
         ty_checker.raise_exc(quantile, 'float', 'quantile')
 
@@ -1063,35 +1662,20 @@ def hpat_pandas_series_rolling_quantile(self, quantile, interpolation='linear'):
     if not isinstance(interpolation, str_types) and interpolation != 'linear':
         ty_checker.raise_exc(interpolation, 'str', 'interpolation')
 
+    offset = self.offset
+
     def hpat_pandas_rolling_series_quantile_impl(self, quantile, interpolation='linear'):
         if quantile < 0 or quantile > 1:
             raise ValueError('quantile value not in [0, 1]')
         if interpolation != 'linear':
             raise ValueError('interpolation value not "linear"')
 
-        win = self._window
-        minp = self._min_periods
-
         input_series = self._data
-        input_arr = input_series._data
-        length = len(input_arr)
-        output_arr = numpy.empty(length, dtype=float64)
-
-        def calc_quantile(arr, quantile, minp):
-            finite_arr = arr[numpy.isfinite(arr)]
-            if len(finite_arr) < minp:
-                return numpy.nan
-            else:
-                return arr_quantile(finite_arr, quantile)
-
-        boundary = min(win, length)
-        for i in prange(boundary):
-            arr_range = input_arr[:i + 1]
-            output_arr[i] = calc_quantile(arr_range, quantile, minp)
-
-        for i in prange(boundary, length):
-            arr_range = input_arr[i + 1 - win:i + 1]
-            output_arr[i] = calc_quantile(arr_range, quantile, minp)
+        if offset == True or self._center:  # noqa
+            starts, ends = rolling_window_bounds(self)
+            output_arr = rolling_order_stat_bounds(input_series._data, starts, ends, self._min_periods, quantile)
+        else:
+            output_arr = rolling_order_stat(input_series._data, self._window, self._min_periods, quantile)
 
         return pandas.Series(output_arr, input_series._index, name=input_series._name)
 
@@ -1104,7 +1688,10 @@ def hpat_pandas_series_rolling_skew(self):
     ty_checker = TypeChecker('Method rolling.skew().')
     ty_checker.check(self, SeriesRollingType)
 
-    return sdc_pandas_series_rolling_skew_impl
+    if self.weighted:
+        ty_checker.raise_exc(self.win_type, 'None', 'win_type')
+
+    return gen_sdc_pandas_series_rolling_impl(*sdc_pandas_series_rolling_skew_kernels, offset=self.offset)
 
 
 @sdc_overload_method(SeriesRollingType, 'std')
@@ -1113,19 +1700,29 @@ def hpat_pandas_series_rolling_std(self, ddof=1):
     ty_checker = TypeChecker('Method rolling.std().')
     ty_checker.check(self, SeriesRollingType)
 
+    if self.weighted:
+        ty_checker.raise_exc(self.win_type, 'None', 'win_type')
+
     if not isinstance(ddof, (int, Integer, Omitted)):
         ty_checker.raise_exc(ddof, 'int', 'ddof')
 
-    return sdc_pandas_series_rolling_std_impl
+    return gen_sdc_pandas_series_rolling_ddof_impl(*sdc_pandas_series_rolling_std_kernels, offset=self.offset)
 
 
 @sdc_overload_method(SeriesRollingType, 'sum')
-def hpat_pandas_series_rolling_sum(self):
+def hpat_pandas_series_rolling_sum(self, std=None, tau=None):
 
     ty_checker = TypeChecker('Method rolling.sum().')
     ty_checker.check(self, SeriesRollingType)
 
-    return sdc_pandas_series_rolling_sum_impl
+    if not isinstance(std, (Omitted, NoneType, Number)) and std is not None:
+        ty_checker.raise_exc(std, 'float', 'std')
+
+    if not isinstance(tau, (Omitted, NoneType, Number)) and tau is not None:
+        ty_checker.raise_exc(tau, 'float', 'tau')
+
+    return gen_sdc_pandas_series_rolling_weighted_impl(*sdc_pandas_series_rolling_sum_kernels, offset=self.offset,
+                                                       weighted=self.weighted, average=False)
 
 
 @sdc_overload_method(SeriesRollingType, 'var')
@@ -1134,12 +1731,34 @@ def hpat_pandas_series_rolling_var(self, ddof=1):
     ty_checker = TypeChecker('Method rolling.var().')
     ty_checker.check(self, SeriesRollingType)
 
+    if self.weighted:
+        ty_checker.raise_exc(self.win_type, 'None', 'win_type')
+
     if not isinstance(ddof, (int, Integer, Omitted)):
         ty_checker.raise_exc(ddof, 'int', 'ddof')
 
-    return sdc_pandas_series_rolling_var_impl
+    return gen_sdc_pandas_series_rolling_ddof_impl(*sdc_pandas_series_rolling_var_kernels, offset=self.offset)
 
 
+hpat_pandas_series_rolling_agg.__doc__ = hpat_pandas_series_rolling_docstring_tmpl.format(**{
+    'method_name': 'agg',
+    'example_caption': 'Calculate several rolling aggregations at once.',
+    'limitations_block':
+    """
+    Limitations
+    -----------
+    - Supported ``func`` is a name or a list of names of the following methods:
+    count, kurt, max, mean, min, skew, std, sum, var.
+    - All the aggregations are calculated with a single pass over the data.
+    - Series elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
+    """,
+    'extra_params':
+    """
+    func: :obj:`str` or :obj:`list` of :obj:`str`
+        Names of aggregation methods.
+    """
+})
+
 hpat_pandas_series_rolling_apply.__doc__ = hpat_pandas_series_rolling_docstring_tmpl.format(**{
     'method_name': 'apply',
     'example_caption': 'Calculate the rolling apply.',
@@ -1232,7 +1851,13 @@ hpat_pandas_series_rolling_mean.__doc__ = hpat_pandas_series_rolling_docstring_t
     -----------
     DataFrame/Series elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
     """,
-    'extra_params': ''
+    'extra_params':
+    """
+    std: :obj:`float`
+        Standard deviation of gaussian window (win_type='gaussian').
+    tau: :obj:`float`
+        Decay of exponential window (win_type='exponential').
+    """
 })
 
 hpat_pandas_series_rolling_median.__doc__ = hpat_pandas_series_rolling_docstring_tmpl.format(**{
@@ -1308,7 +1933,13 @@ hpat_pandas_series_rolling_sum.__doc__ = hpat_pandas_series_rolling_docstring_tm
     -----------
     DataFrame/Series elements cannot be max/min float/integer. Otherwise SDC and Pandas results are different.
     """,
-    'extra_params': ''
+    'extra_params':
+    """
+    std: :obj:`float`
+        Standard deviation of gaussian window (win_type='gaussian').
+    tau: :obj:`float`
+        Decay of exponential window (win_type='exponential').
+    """
 })
 
 hpat_pandas_series_rolling_var.__doc__ = hpat_pandas_series_rolling_docstring_tmpl.format(**{
@@ -31,10 +31,11 @@ from sdc.datatypes.hpat_pandas_rolling_types import (
 
 class SeriesRollingType(RollingType):
     """Type definition for pandas.Series.rolling functions handling."""
-    def __init__(self, data, win_type=None, on=None, closed=None):
+    def __init__(self, data, win_type=None, on=None, closed=None, offset=False, on_column=None):
         super(SeriesRollingType, self).__init__('SeriesRollingType',
                                                 data, win_type=win_type,
-                                                on=on, closed=closed)
+                                                on=on, closed=closed,
+                                                offset=offset, on_column=on_column)
 
 
 @register_model(SeriesRollingType)
@@ -46,3 +47,10 @@ class SeriesRollingTypeModel(RollingTypeModel):
 
 _hpat_pandas_series_rolling_init = intrinsic(gen_hpat_pandas_rolling_init(
     SeriesRollingType))
+_hpat_pandas_series_offset_rolling_init = intrinsic(gen_hpat_pandas_rolling_init(
+    SeriesRollingType, offset=True))
+
+
+def get_series_offset_rolling_init(on_column=None):
+    """Get initializer of Series rolling over windows given by a period of time"""
+    return _hpat_pandas_series_offset_rolling_init
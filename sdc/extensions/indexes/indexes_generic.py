@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# *****************************************************************************
+# Copyright (c) 2019-2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+import numpy
+
+from numba import types
+from numba.typed import Dict, List
+
+from sdc.datatypes.range_index_type import RangeIndexType
+from sdc.str_arr_type import StringArrayType
+from sdc.utilities.utils import sdc_overload
+
+
+def sdc_indexes_build_map_positions(index):
+    pass
+
+
+@sdc_overload(sdc_indexes_build_map_positions, jit_options={'parallel': False})
+def sdc_indexes_build_map_positions_overload(index):
+    """ Builds a hash table mapping each label of the index to the list of its positions (in ascending order),
+        so that subsequent label lookups cost O(1) instead of a full scan of the index """
+
+    if not isinstance(index, (types.Array, StringArrayType, RangeIndexType)):
+        return None
+
+    index_dtype = index.dtype
+
+    def sdc_indexes_build_map_positions_impl(index):
+        map_positions = Dict.empty(
+            key_type=index_dtype,
+            value_type=types.ListType(types.int64)
+        )
+        for i in range(len(index)):
+            value = index[i]
+            if value not in map_positions:
+                map_positions[value] = List.empty_list(types.int64)
+            map_positions[value].append(i)
+
+        return map_positions
+
+    return sdc_indexes_build_map_positions_impl
+
+
+def sdc_indexes_get_positions(map_positions, labels):
+    pass
+
+
+@sdc_overload(sdc_indexes_get_positions, jit_options={'parallel': False})
+def sdc_indexes_get_positions_overload(map_positions, labels):
+    """ Returns array of positions of all labels found in map_positions, in the order of labels.
+        Labels missing from the map are skipped """
+
+    if not isinstance(map_positions, types.DictType):
+        return None
+
+    def sdc_indexes_get_positions_impl(map_positions, labels):
+        res_size = 0
+        for label in labels:
+            if label in map_positions:
+                res_size += len(map_positions[label])
+
+        res = numpy.empty(res_size, dtype=numpy.int64)
+        current_pos = 0
+        for label in labels:
+            if label in map_positions:
+                positions = map_positions[label]
+                for j in range(len(positions)):
+                    res[current_pos] = positions[j]
+                    current_pos += 1
+
+        return res
+
+    return sdc_indexes_get_positions_impl
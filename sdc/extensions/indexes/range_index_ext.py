@@ -288,6 +288,50 @@ def pd_range_index_values_overload(self):
     return pd_range_index_values_impl
 
 
+@sdc_overload_attribute(RangeIndexType, 'is_monotonic_increasing')
+def pd_range_index_is_monotonic_increasing_overload(self):
+    if not isinstance(self, RangeIndexType):
+        return None
+
+    def pd_range_index_is_monotonic_increasing_impl(self):
+        return self._data.step > 0 or len(self._data) <= 1
+
+    return pd_range_index_is_monotonic_increasing_impl
+
+
+@sdc_overload_attribute(RangeIndexType, 'is_monotonic_decreasing')
+def pd_range_index_is_monotonic_decreasing_overload(self):
+    if not isinstance(self, RangeIndexType):
+        return None
+
+    def pd_range_index_is_monotonic_decreasing_impl(self):
+        return self._data.step < 0 or len(self._data) <= 1
+
+    return pd_range_index_is_monotonic_decreasing_impl
+
+
+@sdc_overload_attribute(RangeIndexType, 'is_unique')
+def pd_range_index_is_unique_overload(self):
+    if not isinstance(self, RangeIndexType):
+        return None
+
+    def pd_range_index_is_unique_impl(self):
+        return True
+
+    return pd_range_index_is_unique_impl
+
+
+@sdc_overload_attribute(RangeIndexType, 'hasnans')
+def pd_range_index_hasnans_overload(self):
+    if not isinstance(self, RangeIndexType):
+        return None
+
+    def pd_range_index_hasnans_impl(self):
+        return False
+
+    return pd_range_index_hasnans_impl
+
+
 @sdc_overload(len)
 def pd_range_index_len_overload(self):
     if not isinstance(self, RangeIndexType):
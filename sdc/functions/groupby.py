@@ -0,0 +1,1080 @@
+# -*- coding: utf-8 -*-
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+
+| This file contains groupby kernels operating on group index, i.e. on dense group codes (an array
+| mapping each row to the number of its group or to -1 if the row belongs to no group) and on
+| rows sorted by groups (positions of rows of group i are positions[offsets[i]:offsets[i + 1]])
+
+"""
+
+import numpy
+
+from numba import prange, types
+from numba.typed import Dict, List
+
+from sdc.datatypes.common_functions import _sdc_asarray, _sdc_take, sdc_arrays_argsort
+from sdc.functions.sort import parallel_argsort, parallel_argsort_supported
+from sdc.hiframes.api import isna
+from sdc.utilities.prange_utils import get_pool_size, parallel_chunks
+from sdc.utilities.utils import sdc_overload, sdc_register_jitable
+
+
+# data is factorized with hash partitioning if it has at least this number of rows
+# and more than a half of values in a sample of this size is unique
+partitioned_factorize_min_size = 1 << 16
+cardinality_sample_size = 1 << 14
+
+# combined sort codes of multiple keys are made dense before they could exceed this value
+max_sort_code = 1 << 62
+
+
+@sdc_register_jitable
+def hash_partition(value, nparts):
+    """Get partition of the value, hash is mixed so that sequential keys are spread across partitions evenly."""
+    mixed_hash = numpy.uint64(hash(value)) * numpy.uint64(0x9E3779B97F4A7C15)
+    return numpy.int64((mixed_hash >> numpy.uint64(32)) % numpy.uint64(nparts))
+
+
+def gen_chunked_factorize_impl(dtype, is_na):
+    """
+    Generates factorize implementation building hash table of each chunk of data in parallel and
+    merging unique values of all chunks afterwards, this merge is serial, so it's used when
+    the number of unique values is small compared to the data size.
+    """
+
+    def chunked_factorize_impl(data, sort):
+        size = len(data)
+        chunks = parallel_chunks(size)
+        nchunks = len(chunks)
+        codes = numpy.empty(size, dtype=numpy.int64)
+
+        # factorize each chunk of values separately, saving chunk-local codes
+        chunk_codes = [Dict.empty(dtype, types.int64) for _ in range(nchunks)]
+        chunk_keys = [List.empty_list(dtype) for _ in range(nchunks)]
+        for i in prange(nchunks):
+            chunk = chunks[i]
+            local_codes = chunk_codes[i]
+            local_keys = chunk_keys[i]
+            for j in range(chunk.start, chunk.stop):
+                if is_na(data, j):
+                    codes[j] = -1
+                    continue
+
+                value = data[j]
+                code = local_codes.get(value, -1)
+                if code < 0:
+                    code = len(local_keys)
+                    local_codes[value] = code
+                    local_keys.append(value)
+                codes[j] = code
+
+        # merge unique keys of all chunks, this step depends only on the number of unique values in chunks
+        global_codes = Dict.empty(dtype, types.int64)
+        unique_keys = List.empty_list(dtype)
+        code_maps = [numpy.empty(len(chunk_keys[i]), dtype=numpy.int64) for i in range(nchunks)]
+        for i in range(nchunks):
+            local_keys = chunk_keys[i]
+            code_map = code_maps[i]
+            for k in range(len(local_keys)):
+                key = local_keys[k]
+                code = global_codes.get(key, -1)
+                if code < 0:
+                    code = len(unique_keys)
+                    global_codes[key] = code
+                    unique_keys.append(key)
+                code_map[k] = code
+
+        nkeys = len(unique_keys)
+        keys = _sdc_asarray([key for key in unique_keys])
+        if sort:
+            argsorted_keys = sdc_arrays_argsort(keys, kind='mergesort')
+            ranks = numpy.empty(nkeys, dtype=numpy.int64)
+            for k in prange(nkeys):
+                ranks[argsorted_keys[k]] = k
+            for i in range(nchunks):
+                code_map = code_maps[i]
+                for k in range(len(code_map)):
+                    code_map[k] = ranks[code_map[k]]
+            keys = _sdc_take(keys, argsorted_keys)
+
+        # translate chunk-local codes into global ones
+        for i in prange(nchunks):
+            chunk = chunks[i]
+            code_map = code_maps[i]
+            for j in range(chunk.start, chunk.stop):
+                if codes[j] >= 0:
+                    codes[j] = code_map[codes[j]]
+
+        return keys, codes
+
+    return chunked_factorize_impl
+
+
+def gen_partitioned_factorize_impl(dtype, is_na):
+    """
+    Generates factorize implementation scattering rows into partitions by hash of their values, so that
+    all rows having the same value fall into one partition. Partitions are factorized in parallel and
+    independently, so no merge of hash tables is needed, which makes it scale with the number of threads
+    for data with many unique values.
+    """
+
+    def partitioned_factorize_impl(data, sort):
+        size = len(data)
+        nparts = get_pool_size()
+
+        part_codes = numpy.empty(size, dtype=numpy.int64)
+        for j in prange(size):
+            part_codes[j] = -1 if is_na(data, j) else hash_partition(data[j], nparts)
+        part_offsets, part_positions = group_offsets_positions(part_codes, nparts)
+
+        # rows of a partition are in the order of their appearance, so the first row of each
+        # value in a partition is the first row of this value in the data
+        codes = numpy.empty(size, dtype=numpy.int64)
+        part_first_rows = [List.empty_list(types.int64) for _ in range(nparts)]
+        for p in prange(nparts):
+            local_codes = Dict.empty(dtype, types.int64)
+            first_rows = part_first_rows[p]
+            for k in range(part_offsets[p], part_offsets[p + 1]):
+                j = part_positions[k]
+                value = data[j]
+                code = local_codes.get(value, -1)
+                if code < 0:
+                    code = len(first_rows)
+                    local_codes[value] = code
+                    first_rows.append(j)
+                codes[j] = code
+
+        part_bases = numpy.empty(nparts + 1, dtype=numpy.int64)
+        part_bases[0] = 0
+        for p in range(nparts):
+            part_bases[p + 1] = part_bases[p] + len(part_first_rows[p])
+
+        nkeys = part_bases[nparts]
+        first_rows = numpy.empty(nkeys, dtype=numpy.int64)
+        for p in prange(nparts):
+            local_first_rows = part_first_rows[p]
+            for k in range(len(local_first_rows)):
+                first_rows[part_bases[p] + k] = local_first_rows[k]
+
+        # numbers of values are ordered by values or by their first rows just as in chunked factorize
+        if sort:
+            order = sdc_arrays_argsort(_sdc_take(data, first_rows), kind='mergesort')
+        else:
+            order = sdc_arrays_argsort(first_rows, kind='mergesort')
+
+        ranks = numpy.empty(nkeys, dtype=numpy.int64)
+        for k in prange(nkeys):
+            ranks[order[k]] = k
+        keys = _sdc_take(data, first_rows[order])
+
+        for j in prange(size):
+            part = part_codes[j]
+            codes[j] = -1 if part < 0 else ranks[part_bases[part] + codes[j]]
+
+        return keys, codes
+
+    return partitioned_factorize_impl
+
+
+def gen_factorize_impl(dtype, is_na):
+    """
+    Generates implementation encoding data values as dense codes, returned as tuple (keys, codes), where keys
+    are unique values (sorted if sort is True, in the order of first occurrence otherwise) and codes[i] is
+    the number of data[i] in keys or -1 if is_na(data, i) is True.
+    Hash partitioned factorize is used if the share of unique values estimated on a sample of data is high.
+    """
+
+    chunked_factorize = sdc_register_jitable(gen_chunked_factorize_impl(dtype, is_na))
+    partitioned_factorize = sdc_register_jitable(gen_partitioned_factorize_impl(dtype, is_na))
+
+    def factorize_impl(data, sort):
+        size = len(data)
+        if get_pool_size() == 1 or size < partitioned_factorize_min_size:
+            return chunked_factorize(data, sort)
+
+        step = size // cardinality_sample_size
+        sample_values = Dict.empty(dtype, types.int64)
+        nvalues = 0
+        for i in range(cardinality_sample_size):
+            j = i * step
+            if is_na(data, j):
+                continue
+            sample_values[data[j]] = j
+            nvalues += 1
+
+        if 2 * len(sample_values) > nvalues:
+            return partitioned_factorize(data, sort)
+
+        return chunked_factorize(data, sort)
+
+    return factorize_impl
+
+
+def factorize(data, sort):
+    pass
+
+
+@sdc_overload(factorize)
+def factorize_overload(data, sort):
+    """Encodes data values as dense codes, NA values are encoded as -1, see gen_factorize_impl"""
+
+    return gen_factorize_impl(data.dtype, isna)
+
+
+@sdc_register_jitable
+def isna_code(codes, idx):
+    """Check if the row belongs to no group, i.e. its code is negative."""
+    return codes[idx] < 0
+
+
+factorize_codes = sdc_register_jitable(gen_factorize_impl(types.int64, isna_code))
+
+
+@sdc_register_jitable
+def combine_codes(codes, key_codes, nkeys):
+    """
+    Encodes pairs of codes as single int64 code (codes[i] * nkeys + key_codes[i]), which preserves
+    lexicographical order of pairs, -1 is used if any of the codes in a pair is negative.
+    """
+    size = len(codes)
+    res = numpy.empty(size, dtype=numpy.int64)
+    for i in prange(size):
+        if codes[i] < 0 or key_codes[i] < 0:
+            res[i] = -1
+        else:
+            res[i] = codes[i] * nkeys + key_codes[i]
+
+    return res
+
+
+@sdc_register_jitable
+def group_offsets_positions(codes, ngroups):
+    """
+    Makes counting sort of rows by group codes returning tuple (offsets, positions), where
+    positions[offsets[i]:offsets[i + 1]] are rows of i-th group in the order of their appearance.
+    """
+    size = len(codes)
+    chunks = parallel_chunks(size)
+    nchunks = len(chunks)
+
+    if nchunks * ngroups > size:
+        # per chunk counters would take more memory than the data, so rows are sorted by
+        # codes instead of counting sort, and groups start where codes of sorted rows change
+        sorted_rows = sdc_arrays_argsort(codes, kind='mergesort')
+        nas_count = 0
+        while nas_count < size and codes[sorted_rows[nas_count]] < 0:
+            nas_count += 1
+
+        positions = sorted_rows[nas_count:]
+        offsets = numpy.full(ngroups + 1, -1, dtype=numpy.int64)
+        offsets[ngroups] = len(positions)
+        for k in prange(len(positions)):
+            group = codes[positions[k]]
+            if k == 0 or codes[positions[k - 1]] != group:
+                offsets[group] = k
+
+        # groups without rows are empty and start where the next group starts
+        for group in range(ngroups - 1, -1, -1):
+            if offsets[group] < 0:
+                offsets[group] = offsets[group + 1]
+
+        return offsets, positions
+
+    counts = numpy.zeros((nchunks, ngroups), dtype=numpy.int64)
+    for i in prange(nchunks):
+        chunk = chunks[i]
+        for j in range(chunk.start, chunk.stop):
+            if codes[j] >= 0:
+                counts[i, codes[j]] += 1
+
+    offsets = numpy.empty(ngroups + 1, dtype=numpy.int64)
+    offsets[0] = 0
+    for group in range(ngroups):
+        group_size = 0
+        for i in range(nchunks):
+            group_size += counts[i, group]
+        offsets[group + 1] = offsets[group] + group_size
+
+    # each chunk scatters its rows starting from own offset within the group
+    for group in prange(ngroups):
+        position = offsets[group]
+        for i in range(nchunks):
+            chunk_group_size = counts[i, group]
+            counts[i, group] = position
+            position += chunk_group_size
+
+    positions = numpy.empty(offsets[ngroups], dtype=numpy.int64)
+    for i in prange(nchunks):
+        chunk = chunks[i]
+        for j in range(chunk.start, chunk.stop):
+            group = codes[j]
+            if group < 0:
+                continue
+            positions[counts[i, group]] = j
+            counts[i, group] += 1
+
+    return offsets, positions
+
+
+def build_group_index(by_data, sort):
+    pass
+
+
+@sdc_overload(build_group_index)
+def build_group_index_overload(by_data, sort):
+    """
+    Builds CSR-like group index of by_data values, returned as tuple (keys, codes, offsets, positions), where
+    keys are unique by_data values (sorted if sort is True) in the order of group numbers, codes is the group
+    number of each row (-1 for NA rows), and positions[offsets[i]:offsets[i + 1]] are rows of i-th group.
+
+    If by_data is a tuple of arrays, rows are grouped by composite keys and keys is a tuple of arrays.
+    Codes of key columns are combined pairwise into int64 composite codes, which are made dense again
+    after each step, so composite codes never overflow regardless of the number of key columns.
+    """
+
+    if not isinstance(by_data, types.BaseTuple):
+        def build_group_index_impl(by_data, sort):
+            keys, codes = factorize(by_data, sort)
+            offsets, positions = group_offsets_positions(codes, len(keys))
+
+            return keys, codes, offsets, positions
+
+        return build_group_index_impl
+
+    func_lines = ['def build_group_index_impl(by_data, sort):',
+                  '  keys_0, codes = factorize(by_data[0], sort)',
+                  '  ngroups = len(keys_0)']
+    for i in range(1, len(by_data)):
+        func_lines += [
+            f'  keys_{i}, codes_{i} = factorize(by_data[{i}], sort)',
+            f'  composite_keys, codes = factorize_codes(combine_codes(codes, codes_{i}, len(keys_{i})), sort)',
+            '  ngroups = len(composite_keys)',
+        ]
+
+    # key values of a group are taken from its first row
+    keys = ', '.join(f'_sdc_take(by_data[{i}], first_rows)' for i in range(len(by_data)))
+    func_lines += ['  offsets, positions = group_offsets_positions(codes, ngroups)',
+                   '  first_rows = positions[offsets[:-1]]',
+                   f'  return ({keys}, ), codes, offsets, positions']
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'factorize': factorize,
+                   'factorize_codes': factorize_codes,
+                   'combine_codes': combine_codes,
+                   'group_offsets_positions': group_offsets_positions,
+                   '_sdc_take': _sdc_take}
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+
+    return loc_vars['build_group_index_impl']
+
+
+def group_key(keys, idx):
+    pass
+
+
+@sdc_overload(group_key)
+def group_key_overload(keys, idx):
+    """Returns key of the group idx, i.e. a value or a tuple of values for composite keys"""
+
+    if not isinstance(keys, types.BaseTuple):
+        def group_key_impl(keys, idx):
+            return keys[idx]
+
+        return group_key_impl
+
+    values = ', '.join(f'keys[{i}][idx]' for i in range(len(keys)))
+    func_text = f'def group_key_impl(keys, idx):\n  return ({values}, )'
+    loc_vars = {}
+    exec(func_text, {}, loc_vars)
+
+    return loc_vars['group_key_impl']
+
+
+@sdc_register_jitable
+def sort_codes(codes, nkeys, ascending, na_last):
+    """
+    Maps codes of sorted keys to codes ordering rows by keys in the given direction, with NA rows
+    coded as the first or the last key, so the result codes are in range [0, nkeys].
+    """
+    size = len(codes)
+    res = numpy.empty(size, dtype=numpy.int64)
+    na_code = nkeys if na_last else 0
+    shift = 0 if na_last else 1
+    for i in prange(size):
+        code = codes[i]
+        if code < 0:
+            res[i] = na_code
+        elif ascending:
+            res[i] = code + shift
+        else:
+            res[i] = nkeys - 1 - code + shift
+
+    return res
+
+
+@sdc_register_jitable
+def combine_sort_codes(codes, ncodes, key_codes, nkeys):
+    """
+    Encodes pairs of sort codes as single int64 code preserving lexicographical order of pairs,
+    returns tuple (codes, ncodes). Codes are made dense first if the combined code may overflow.
+    """
+    radix = nkeys + 1
+    if ncodes > max_sort_code // radix:
+        code_keys, codes = factorize_codes(codes, True)
+        ncodes = len(code_keys)
+
+    size = len(codes)
+    res = numpy.empty(size, dtype=numpy.int64)
+    for i in prange(size):
+        res[i] = codes[i] * radix + key_codes[i]
+
+    return res, ncodes * radix
+
+
+def lexsort_permutation(by_data, ascending, na_last):
+    pass
+
+
+@sdc_overload(lexsort_permutation)
+def lexsort_permutation_overload(by_data, ascending, na_last):
+    """
+    Returns permutation stably sorting rows by tuple of key arrays by_data, where ascending is a tuple
+    of sort directions of each key and na_last defines if NA values are placed after all other values.
+
+    Each key is factorized into codes of its sorted unique values, codes are combined into a single
+    int64 code per row, so rows are ordered by all keys with one stable argsort. Single numeric key
+    is sorted directly with parallel argsort, which is stable in both directions.
+    """
+
+    if len(by_data) == 1 and isinstance(by_data[0], types.Array) and parallel_argsort_supported(by_data[0].dtype):
+        def lexsort_permutation_numeric_impl(by_data, ascending, na_last):
+            data = by_data[0]
+            perm = parallel_argsort(data, ascending[0])
+            if na_last:
+                return perm
+
+            # NA values are sorted last, so they are moved to the beginning keeping their order
+            size = len(perm)
+            nas_count = 0
+            while nas_count < size and isna(data, perm[size - 1 - nas_count]):
+                nas_count += 1
+
+            return numpy.concatenate((perm[size - nas_count:], perm[:size - nas_count]))
+
+        return lexsort_permutation_numeric_impl
+
+    func_lines = ['def lexsort_permutation_impl(by_data, ascending, na_last):',
+                  '  keys_0, codes_0 = factorize(by_data[0], True)',
+                  '  ncodes = len(keys_0) + 1',
+                  '  codes = sort_codes(codes_0, len(keys_0), ascending[0], na_last)']
+    for i in range(1, len(by_data)):
+        func_lines += [
+            f'  keys_{i}, codes_{i} = factorize(by_data[{i}], True)',
+            f'  key_codes = sort_codes(codes_{i}, len(keys_{i}), ascending[{i}], na_last)',
+            f'  codes, ncodes = combine_sort_codes(codes, ncodes, key_codes, len(keys_{i}))',
+        ]
+    func_lines += ['  return sdc_arrays_argsort(codes, kind=\'mergesort\')']
+
+    func_text = '\n'.join(func_lines)
+    global_vars = {'factorize': factorize,
+                   'sort_codes': sort_codes,
+                   'combine_sort_codes': combine_sort_codes,
+                   'sdc_arrays_argsort': sdc_arrays_argsort}
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+
+    return loc_vars['lexsort_permutation_impl']
+
+
+@sdc_register_jitable
+def update_noop(acc, chunk_id, group, data, idx, nvalues):
+    """Do not accumulate anything, only number of values is used."""
+    pass
+
+
+@sdc_register_jitable
+def merge_noop(acc, chunk_id, group, nvalues_left, nvalues_right):
+    """Do not merge anything, only number of values is used."""
+    pass
+
+
+@sdc_register_jitable
+def count_result(acc, group, nvalues, ddof):
+    """Get count of group values."""
+    return nvalues
+
+
+@sdc_register_jitable
+def update_sum(acc, chunk_id, group, data, idx, nvalues):
+    """Add value to the group sum."""
+    acc[chunk_id, group, 0] += data[idx]
+
+
+@sdc_register_jitable
+def merge_sum(acc, chunk_id, group, nvalues_left, nvalues_right):
+    """Add partial group sum of the chunk to the resulting one."""
+    acc[0, group, 0] += acc[chunk_id, group, 0]
+
+
+@sdc_register_jitable
+def sum_result(acc, group, nvalues, ddof):
+    """Get group sum."""
+    return acc[0, group, 0]
+
+
+@sdc_register_jitable
+def update_prod(acc, chunk_id, group, data, idx, nvalues):
+    """Multiply the group product by value."""
+    acc[chunk_id, group, 0] *= data[idx]
+
+
+@sdc_register_jitable
+def merge_prod(acc, chunk_id, group, nvalues_left, nvalues_right):
+    """Multiply the resulting group product by partial product of the chunk."""
+    acc[0, group, 0] *= acc[chunk_id, group, 0]
+
+
+@sdc_register_jitable
+def mean_result(acc, group, nvalues, ddof):
+    """Get group mean."""
+    if nvalues == 0:
+        return numpy.nan
+
+    return acc[0, group, 0] / nvalues
+
+
+@sdc_register_jitable
+def update_min(acc, chunk_id, group, data, idx, nvalues):
+    """Calculate the group min with new value."""
+    value = data[idx]
+    if nvalues == 1 or value < acc[chunk_id, group, 0]:
+        acc[chunk_id, group, 0] = value
+
+
+@sdc_register_jitable
+def merge_min(acc, chunk_id, group, nvalues_left, nvalues_right):
+    """Merge partial group min of the chunk into the resulting one."""
+    if nvalues_right == 0:
+        return
+
+    if nvalues_left == 0 or acc[chunk_id, group, 0] < acc[0, group, 0]:
+        acc[0, group, 0] = acc[chunk_id, group, 0]
+
+
+@sdc_register_jitable
+def update_max(acc, chunk_id, group, data, idx, nvalues):
+    """Calculate the group max with new value."""
+    value = data[idx]
+    if nvalues == 1 or value > acc[chunk_id, group, 0]:
+        acc[chunk_id, group, 0] = value
+
+
+@sdc_register_jitable
+def merge_max(acc, chunk_id, group, nvalues_left, nvalues_right):
+    """Merge partial group max of the chunk into the resulting one."""
+    if nvalues_right == 0:
+        return
+
+    if nvalues_left == 0 or acc[chunk_id, group, 0] > acc[0, group, 0]:
+        acc[0, group, 0] = acc[chunk_id, group, 0]
+
+
+@sdc_register_jitable
+def minmax_result(acc, group, nvalues, ddof):
+    """Get group min/max taking into account groups having no values."""
+    if nvalues == 0:
+        return numpy.nan
+
+    return acc[0, group, 0]
+
+
+@sdc_register_jitable
+def update_moments(acc, chunk_id, group, data, idx, nvalues):
+    """Calculate the group mean and sum of squared deviations with new value (Welford's algorithm)."""
+    value = data[idx]
+    mean = acc[chunk_id, group, 0]
+    delta = value - mean
+    mean += delta / nvalues
+    acc[chunk_id, group, 0] = mean
+    acc[chunk_id, group, 1] += delta * (value - mean)
+
+
+@sdc_register_jitable
+def merge_moments(acc, chunk_id, group, nvalues_left, nvalues_right):
+    """Merge partial group mean and sum of squared deviations of the chunk into the resulting ones."""
+    if nvalues_right == 0:
+        return
+
+    if nvalues_left == 0:
+        acc[0, group, 0] = acc[chunk_id, group, 0]
+        acc[0, group, 1] = acc[chunk_id, group, 1]
+        return
+
+    nvalues = nvalues_left + nvalues_right
+    delta = acc[chunk_id, group, 0] - acc[0, group, 0]
+    acc[0, group, 0] += delta * nvalues_right / nvalues
+    acc[0, group, 1] += acc[chunk_id, group, 1] + delta * delta * nvalues_left * nvalues_right / nvalues
+
+
+@sdc_register_jitable
+def var_result(acc, group, nvalues, ddof):
+    """Get group variance taking into account ddof."""
+    if nvalues <= ddof:
+        return numpy.nan
+
+    return acc[0, group, 1] / (nvalues - ddof)
+
+
+@sdc_register_jitable
+def std_result(acc, group, nvalues, ddof):
+    """Get group standard deviation taking into account ddof."""
+    return var_result(acc, group, nvalues, ddof) ** 0.5
+
+
+def gen_groupby_reduce_impl(update, merge, get_result, nstate=1, init_acc=0):
+    """
+    Generate groupby reduction kernel based on update/merge/get_result funcs.
+    Every chunk of rows is reduced into own accumulators, so all the values are traversed
+    in a single parallel pass, accumulators of all chunks are merged per group afterwards.
+    If there are too many groups to keep accumulators per chunk, every group is reduced
+    independently using positions of its rows, so that no merge is needed.
+    """
+    def impl(codes, offsets, positions, data, acc_dtype, res_dtype, ddof=1):
+        ngroups = len(offsets) - 1
+        chunks = parallel_chunks(len(codes))
+        nchunks = len(chunks)
+        result = numpy.empty(ngroups, dtype=res_dtype)
+
+        if nchunks * ngroups > len(codes):
+            acc = numpy.full((1, ngroups, nstate), init_acc, dtype=acc_dtype)
+            for group in prange(ngroups):
+                group_nvalues = 0
+                for k in range(offsets[group], offsets[group + 1]):
+                    j = positions[k]
+                    if isna(data, j):
+                        continue
+
+                    group_nvalues += 1
+                    update(acc, 0, group, data, j, group_nvalues)
+                result[group] = get_result(acc, group, group_nvalues, ddof)
+
+            return result
+
+        nvalues = numpy.zeros((nchunks, ngroups), dtype=numpy.int64)
+        acc = numpy.full((nchunks, ngroups, nstate), init_acc, dtype=acc_dtype)
+
+        for i in prange(nchunks):
+            chunk = chunks[i]
+            for j in range(chunk.start, chunk.stop):
+                group = codes[j]
+                if group < 0 or isna(data, j):
+                    continue
+
+                nvalues[i, group] += 1
+                update(acc, i, group, data, j, nvalues[i, group])
+
+        for group in prange(ngroups):
+            for i in range(1, nchunks):
+                merge(acc, i, group, nvalues[0, group], nvalues[i, group])
+                nvalues[0, group] += nvalues[i, group]
+            result[group] = get_result(acc, group, nvalues[0, group], ddof)
+
+        return result
+
+    return impl
+
+
+# reductions are defined by (update, merge, get_result, nstate, init_acc) of their accumulators
+groupby_reduce_funcs = {
+    'count': (update_noop, merge_noop, count_result, 1, 0),
+    'max': (update_max, merge_max, minmax_result, 1, 0),
+    'mean': (update_sum, merge_sum, mean_result, 1, 0),
+    'min': (update_min, merge_min, minmax_result, 1, 0),
+    'prod': (update_prod, merge_prod, sum_result, 1, 1),
+    'std': (update_moments, merge_moments, std_result, 2, 0),
+    'sum': (update_sum, merge_sum, sum_result, 1, 0),
+    'var': (update_moments, merge_moments, var_result, 2, 0),
+}
+
+
+@sdc_register_jitable
+def group_sorted_rows(codes, ngroups, data):
+    """
+    Get rows of groups ordered by values within each group, missing values last, so that rows of group i
+    are result[offsets[i]:offsets[i + 1]]. Rows are ordered by values with a single stable sort and then stably
+    distributed by groups with counting sort, so groups are not sorted one by one.
+    """
+    sorted_rows = sdc_arrays_argsort(data, kind='mergesort')
+    _, value_positions = group_offsets_positions(_sdc_take(codes, sorted_rows), ngroups)
+    return _sdc_take(sorted_rows, value_positions)
+
+
+@sdc_register_jitable
+def groupby_quantile(codes, offsets, positions, data, q):
+    """
+    Get quantiles q of group values using linear interpolation, missing values are skipped.
+    Returns array of shape (ngroups, len(q)) with quantiles of each group in a row.
+    """
+    ngroups = len(offsets) - 1
+    nquantiles = len(q)
+    value_rows = group_sorted_rows(codes, ngroups, data)
+    result = numpy.empty((ngroups, nquantiles), dtype=numpy.float64)
+
+    for group in prange(ngroups):
+        start, stop = offsets[group], offsets[group + 1]
+        nvalues = 0
+        while start + nvalues < stop and not isna(data, value_rows[start + nvalues]):
+            nvalues += 1
+
+        for i in range(nquantiles):
+            if nvalues == 0:
+                result[group, i] = numpy.nan
+                continue
+
+            position = q[i] * (nvalues - 1)
+            lower = numpy.int64(numpy.floor(position))
+            value = numpy.float64(data[value_rows[start + lower]])
+            if lower + 1 < nvalues:
+                value += (position - lower) * (data[value_rows[start + lower + 1]] - value)
+            result[group, i] = value
+
+    return result
+
+
+@sdc_register_jitable
+def groupby_median(codes, offsets, positions, data, acc_dtype, res_dtype, ddof=1):
+    """Get group medians, accumulator dtype and ddof are not used, but accepted as by the other reductions."""
+    return groupby_quantile(codes, offsets, positions, data, numpy.array([0.5])).ravel().astype(res_dtype)
+
+
+groupby_reductions = {
+    name: sdc_register_jitable(gen_groupby_reduce_impl(*reduce_func))
+    for name, reduce_func in groupby_reduce_funcs.items()
+}
+# median has no accumulators to be reduced in a single pass, so it selects values of sorted groups instead
+groupby_reductions['median'] = groupby_median
+
+
+def gen_groupby_fused_reduce_impl(func_names, dtype, res_dtypes):
+    """
+    Generate groupby kernel computing several reductions of values of dtype with a single pass over them,
+    kernel returns tuple of results of func_names reductions, which have res_dtypes.
+    Reductions with the same accumulators (e.g. sum and mean, var and std) share them, count uses
+    only number of values, which is accumulated anyway.
+    """
+
+    accumulators = []
+    acc_ids = []
+    for name in func_names:
+        update, merge, _, nstate, init_acc = groupby_reduce_funcs[name]
+        acc = (update, merge, nstate, init_acc, groupby_reduce_acc_dtype(name, dtype))
+        if acc not in accumulators:
+            accumulators.append(acc)
+        acc_ids.append(accumulators.index(acc))
+
+    global_vars = {'numpy': numpy, 'prange': prange, 'isna': isna, 'parallel_chunks': parallel_chunks}
+    acc_lines, group_acc_lines, update_lines, group_update_lines, merge_lines = [], [], [], [], []
+    for k, (update, merge, nstate, init_acc, acc_dtype) in enumerate(accumulators):
+        global_vars.update({f'update_{k}': update, f'merge_{k}': merge, f'acc_dtype_{k}': acc_dtype})
+        if update is update_noop:
+            acc_lines.append(f'  acc_{k} = numpy.empty((1, 1, 1), dtype=acc_dtype_{k})')
+            group_acc_lines.append(f'    acc_{k} = numpy.empty((1, 1, 1), dtype=acc_dtype_{k})')
+            continue
+
+        acc_lines.append(f'  acc_{k} = numpy.full((nchunks, ngroups, {nstate}), {init_acc}, dtype=acc_dtype_{k})')
+        group_acc_lines.append(f'    acc_{k} = numpy.full((1, ngroups, {nstate}), {init_acc}, dtype=acc_dtype_{k})')
+        update_lines.append(f'      update_{k}(acc_{k}, i, group, data, j, nvalues[i, group])')
+        group_update_lines.append(f'          update_{k}(acc_{k}, 0, group, data, j, group_nvalues)')
+        merge_lines.append(f'      merge_{k}(acc_{k}, i, group, nvalues[0, group], nvalues[i, group])')
+
+    result_lines, group_result_lines, res_alloc_lines = [], [], []
+    for r, name in enumerate(func_names):
+        global_vars.update({f'get_result_{r}': groupby_reduce_funcs[name][2], f'res_dtype_{r}': res_dtypes[r]})
+        res_alloc_lines.append(f'  result_{r} = numpy.empty(ngroups, dtype=res_dtype_{r})')
+        result_lines.append(f'    result_{r}[group] = get_result_{r}(acc_{acc_ids[r]}, group, nvalues[0, group], ddof)')
+        group_result_lines.append(
+            f'      result_{r}[group] = get_result_{r}(acc_{acc_ids[r]}, group, group_nvalues, ddof)')
+
+    results = ', '.join(f'result_{r}' for r in range(len(func_names)))
+    func_lines = [
+        'def impl(codes, offsets, positions, data, ddof=1):',
+        '  ngroups = len(offsets) - 1',
+        '  chunks = parallel_chunks(len(codes))',
+        '  nchunks = len(chunks)',
+        *res_alloc_lines,
+        '  if nchunks * ngroups > len(codes):',
+        *group_acc_lines,
+        '    for group in prange(ngroups):',
+        '      group_nvalues = 0',
+        '      for k in range(offsets[group], offsets[group + 1]):',
+        '        j = positions[k]',
+        '        if not isna(data, j):',
+        '          group_nvalues += 1',
+        *group_update_lines,
+        *group_result_lines,
+        f'    return ({results}, )',
+        '  nvalues = numpy.zeros((nchunks, ngroups), dtype=numpy.int64)',
+        *acc_lines,
+        '  for i in prange(nchunks):',
+        '    chunk = chunks[i]',
+        '    for j in range(chunk.start, chunk.stop):',
+        '      group = codes[j]',
+        '      if group < 0 or isna(data, j):',
+        '        continue',
+        '      nvalues[i, group] += 1',
+        *update_lines,
+        '  for group in prange(ngroups):',
+        '    for i in range(1, nchunks):',
+        *merge_lines,
+        '      nvalues[0, group] += nvalues[i, group]',
+        *result_lines,
+        f'  return ({results}, )',
+    ]
+
+    func_text = '\n'.join(func_lines)
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+
+    return loc_vars['impl']
+
+
+def groupby_reduce_acc_dtype(func_name, dtype):
+    """Get dtype of accumulators used by groupby reduction func_name applied to values of dtype"""
+    if func_name in ('min', 'max'):
+        return dtype
+
+    if func_name in ('sum', 'prod'):
+        if isinstance(dtype, types.Integer) and not dtype.signed:
+            return types.uint64
+        if isinstance(dtype, (types.Integer, types.Boolean)):
+            return types.int64
+
+    return types.float64
+
+
+@sdc_register_jitable
+def alloc_transform_result(codes, res_dtype, fill_value):
+    """Allocate result of groupby transformation aligned to rows, rows belonging to no group are set to fill_value."""
+    size = len(codes)
+    result = numpy.empty(size, dtype=res_dtype)
+    for j in prange(size):
+        if codes[j] < 0:
+            result[j] = fill_value
+
+    return result
+
+
+@sdc_register_jitable
+def groupby_broadcast(codes, group_values, fill_value):
+    """Broadcast values computed per group to rows of groups, rows belonging to no group are set to fill_value."""
+    size = len(codes)
+    result = numpy.empty(size, dtype=group_values.dtype)
+    for j in prange(size):
+        group = codes[j]
+        if group < 0:
+            result[j] = fill_value
+        else:
+            result[j] = group_values[group]
+
+    return result
+
+
+@sdc_register_jitable
+def groupby_scatter(codes, positions, sorted_values, fill_value):
+    """
+    Write values computed over rows sorted by groups back to the rows they were computed for,
+    rows belonging to no group are set to fill_value.
+    """
+    result = alloc_transform_result(codes, sorted_values.dtype, fill_value)
+    for k in prange(len(positions)):
+        result[positions[k]] = sorted_values[k]
+
+    return result
+
+
+@sdc_register_jitable
+def groupby_cumcount(codes, offsets, positions, ascending=True):
+    """Number each row within its group from 0 to the group size - 1."""
+    result = alloc_transform_result(codes, numpy.int64, 0)
+    ngroups = len(offsets) - 1
+    for group in prange(ngroups):
+        start, stop = offsets[group], offsets[group + 1]
+        for k in range(start, stop):
+            result[positions[k]] = k - start if ascending else stop - k - 1
+
+    return result
+
+
+@sdc_register_jitable
+def groupby_cumsum(codes, offsets, positions, data, res_dtype, fill_value):
+    """Cumulative sum of group values, missing values are skipped and kept in the result."""
+    result = alloc_transform_result(codes, res_dtype, fill_value)
+    ngroups = len(offsets) - 1
+    for group in prange(ngroups):
+        # the running sum is kept in the result row of the last non-missing value of the group
+        prev_row = -1
+        for k in range(offsets[group], offsets[group + 1]):
+            j = positions[k]
+            if isna(data, j):
+                result[j] = numpy.nan
+                continue
+
+            if prev_row < 0:
+                result[j] = data[j]
+            else:
+                result[j] = result[prev_row] + data[j]
+            prev_row = j
+
+    return result
+
+
+@sdc_register_jitable
+def groupby_shift(codes, offsets, positions, data, res_dtype, fill_value, periods=1):
+    """Shift group values by periods rows of the group, rows without counterpart within the group get NaN."""
+    result = alloc_transform_result(codes, res_dtype, fill_value)
+    ngroups = len(offsets) - 1
+    for group in prange(ngroups):
+        start, stop = offsets[group], offsets[group + 1]
+        for k in range(start, stop):
+            source = k - periods
+            if start <= source < stop:
+                result[positions[k]] = data[positions[source]]
+            else:
+                result[positions[k]] = numpy.nan
+
+    return result
+
+
+@sdc_register_jitable
+def groupby_diff(codes, offsets, positions, data, res_dtype, fill_value, periods=1):
+    """Difference of group value with the value periods rows of the group before."""
+    result = alloc_transform_result(codes, res_dtype, fill_value)
+    ngroups = len(offsets) - 1
+    for group in prange(ngroups):
+        start, stop = offsets[group], offsets[group + 1]
+        for k in range(start, stop):
+            j = positions[k]
+            source = k - periods
+            if start <= source < stop:
+                # values are subtracted in result dtype, so that unsigned values do not wrap around
+                result[j] = data[j]
+                result[j] -= data[positions[source]]
+            else:
+                result[j] = numpy.nan
+
+    return result
+
+
+# supported values of rank method parameter, kernel gets position of the method in this tuple
+rank_methods = ('average', 'min', 'max', 'first', 'dense')
+
+
+@sdc_register_jitable
+def groupby_rank(codes, offsets, positions, data, res_dtype, fill_value, method_id=0, ascending=True, pct=False):
+    """
+    Rank group values, ranks of equal values are defined by rank_methods[method_id], missing values get NaN.
+    Rows of each group are traversed in the order of values, see group_sorted_rows.
+    """
+    result = alloc_transform_result(codes, res_dtype, fill_value)
+    ngroups = len(offsets) - 1
+    value_rows = group_sorted_rows(codes, ngroups, data)
+
+    for group in prange(ngroups):
+        start, stop = offsets[group], offsets[group + 1]
+
+        # missing values are sorted last
+        nvalues = 0
+        ndistinct = 0
+        for k in range(start, stop):
+            j = value_rows[k]
+            if isna(data, j):
+                result[j] = numpy.nan
+                continue
+
+            if nvalues == 0 or data[j] != data[value_rows[k - 1]]:
+                ndistinct += 1
+            nvalues += 1
+
+        # equal values are ranked together as a block of consecutive rows
+        values_stop = start + nvalues
+        block_start = start
+        dense_rank = 0
+        while block_start < values_stop:
+            block_stop = block_start + 1
+            while block_stop < values_stop and data[value_rows[block_stop]] == data[value_rows[block_start]]:
+                block_stop += 1
+
+            dense_rank += 1
+            if ascending:
+                min_rank, max_rank = block_start - start + 1, block_stop - start
+                block_dense_rank = dense_rank
+            else:
+                min_rank, max_rank = values_stop - block_stop + 1, values_stop - block_start
+                block_dense_rank = ndistinct - dense_rank + 1
+
+            for k in range(block_start, block_stop):
+                if method_id == 0:
+                    rank = (min_rank + max_rank) / 2
+                elif method_id == 1:
+                    rank = min_rank
+                elif method_id == 2:
+                    rank = max_rank
+                elif method_id == 3:
+                    rank = min_rank + k - block_start
+                else:
+                    rank = block_dense_rank
+
+                if pct:
+                    rank = rank / (ndistinct if method_id == 4 else nvalues)
+                result[value_rows[k]] = rank
+
+            block_start = block_stop
+
+    return result
+
+
+# transformations returning values aligned to the rows of grouped data
+groupby_transforms = {
+    'cumsum': groupby_cumsum,
+    'diff': groupby_diff,
+    'rank': groupby_rank,
+    'shift': groupby_shift,
+}
+
+
+def groupby_transform_res_dtype(func_name, dtype):
+    """Get dtype of result of groupby transformation func_name applied to values of dtype"""
+    if func_name == 'cumsum' and isinstance(dtype, (types.Integer, types.Boolean)):
+        return groupby_reduce_acc_dtype('sum', dtype)
+
+    if func_name != 'rank' and isinstance(dtype, types.Float):
+        return dtype
+
+    return types.float64
@@ -1122,6 +1122,9 @@ def sdc_array_equal_overload(A, B):
             else:
                 if len(A) != len(B):
                     return False
+                # misaligned indexes usually differ at the ends, so check them before comparing all elements
+                if len(A) > 0 and (A[0] != B[0] or A[-1] != B[-1]):
+                    return False
                 # FIXME_Numba#5157: change to simple A == B when issue is resolved
                 eq_res_size = len(A)
                 eq_res = numpy.empty(eq_res_size, dtype=types.bool_)
@@ -1132,6 +1135,44 @@ def sdc_array_equal_overload(A, B):
         return sdc_array_equal_impl
 
 
+def is_monotonic(arr, increasing=True):
+    pass
+
+
+@sdc_overload(is_monotonic)
+def sdc_is_monotonic_overload(arr, increasing=True):
+    """
+    Checks if values of 1D array are sorted in the given direction, as in pandas arrays with missing values
+    are not sorted. Parallel chunks of adjacent pairs of values are checked independently.
+    """
+
+    if not isinstance(arr, (types.Array, StringArrayType)):
+        return None
+
+    def sdc_is_monotonic_impl(arr, increasing=True):
+        length = len(arr)
+        if length == 1:
+            return not isna(arr, 0)
+
+        unsorted = 0
+        chunks = parallel_chunks(length - 1)
+        for i in prange(len(chunks)):
+            chunk = chunks[i]
+            for idx in range(chunk.start, chunk.stop):
+                if increasing:
+                    is_sorted_pair = arr[idx] <= arr[idx + 1]
+                else:
+                    is_sorted_pair = arr[idx] >= arr[idx + 1]
+
+                if not is_sorted_pair or isna(arr, idx) or isna(arr, idx + 1):
+                    unsorted += 1
+                    break
+
+        return unsorted == 0
+
+    return sdc_is_monotonic_impl
+
+
 @sdc_overload(np.array)
 def sdc_np_array_overload(A):
     if isinstance(A, types.Array):
@@ -31,6 +31,7 @@ from numba.core import cgutils
 from numba import typed
 from numba import config
 import ctypes as ct
+import numpy
 
 from sdc import concurrent_sort
 
@@ -188,6 +189,20 @@ def load_symbols(name, sig, types):
 sort_map = load_symbols('parallel_sort', parallel_sort_arithm_sig, types_to_postfix)
 stable_sort_map = load_symbols('parallel_stable_sort', parallel_sort_arithm_sig, types_to_postfix)
 
+parallel_argsort_sig = ct.CFUNCTYPE(None, ct.c_void_p, ct.c_void_p, ct.c_uint64, ct.c_uint8)
+argsort_map = load_symbols('parallel_argsort', parallel_argsort_sig, types_to_postfix)
+radix_argsort_map = load_symbols('parallel_radix_argsort', parallel_argsort_sig, types_to_postfix)
+# datetime64 and timedelta64 values are sorted as int64 with NaT placed last
+radix_argsort_dt64 = bind('parallel_radix_argsort_dt64', parallel_argsort_sig)
+
+# shorter arrays are sorted faster by single-threaded numpy.argsort
+parallel_argsort_min_size = 1 << 16
+
+
+def parallel_argsort_supported(dtype):
+    """Checks if arrays of numba dtype can be sorted by parallel_argsort and parallel_radix_argsort"""
+    return dtype in types_to_postfix or isinstance(dtype, (types.NPDatetime, types.NPTimedelta))
+
 
 @intrinsic
 def list_itemsize(tyctx, list_ty):
@@ -276,3 +291,63 @@ def parallel_stable_sort_overload(arr):
         return parallel_stable_sort_sym(arr.ctypes, len(arr), item_size, adaptor(arr[0], arr[0]))
 
     return parallel_stable_sort_impl
+
+
+def parallel_radix_argsort(arr, ascending=True):
+    pass
+
+
+@overload(parallel_radix_argsort)
+def parallel_radix_argsort_overload(arr, ascending=True):
+    """
+    Returns indices that sort the array in parallel with LSD radix sort, NaNs are placed last and equal
+    values keep their original order, i.e. the result is the same as of parallel_argsort.
+    """
+
+    if not isinstance(arr, types.Array) or not parallel_argsort_supported(arr.dtype):
+        raise NotImplementedError
+
+    if arr.dtype in types_to_postfix:
+        argsort_f = radix_argsort_map[arr.dtype]
+    else:
+        argsort_f = radix_argsort_dt64
+
+    def parallel_radix_argsort_impl(arr, ascending=True):
+        data = numpy.ascontiguousarray(arr)
+        index = numpy.empty(len(data), dtype=numpy.int64)
+        argsort_f(index.ctypes, data.ctypes, len(data), numpy.uint8(ascending))
+        return index
+
+    return parallel_radix_argsort_impl
+
+
+def parallel_argsort(arr, ascending=True):
+    pass
+
+
+@overload(parallel_argsort)
+def parallel_argsort_overload(arr, ascending=True):
+    """
+    Returns indices that sort the array in parallel, NaNs are placed last and equal values
+    keep their original order, i.e. the result is the same as of the stable sort in both directions.
+    Integer, datetime64 and timedelta64 arrays are sorted with radix sort, float ones with comparison sort.
+    """
+
+    if not isinstance(arr, types.Array) or not parallel_argsort_supported(arr.dtype):
+        raise NotImplementedError
+
+    if not isinstance(arr.dtype, types.Float):
+        def parallel_argsort_radix_impl(arr, ascending=True):
+            return parallel_radix_argsort(arr, ascending)
+
+        return parallel_argsort_radix_impl
+
+    argsort_f = argsort_map[arr.dtype]
+
+    def parallel_argsort_impl(arr, ascending=True):
+        data = numpy.ascontiguousarray(arr)
+        index = numpy.empty(len(data), dtype=numpy.int64)
+        argsort_f(index.ctypes, data.ctypes, len(data), numpy.uint8(ascending))
+        return index
+
+    return parallel_argsort_impl
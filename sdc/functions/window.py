@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+
+| This file contains kernels calculating bounds of variable size windows, i.e. arrays starts and ends
+| such that the window of row i consists of rows starts[i] <= j < ends[i]
+
+"""
+
+import numpy
+
+from numba import prange, types
+
+from sdc.utilities.prange_utils import parallel_chunks
+from sdc.utilities.utils import sdc_overload, sdc_register_jitable
+
+
+@sdc_register_jitable
+def offset_to_nanoseconds(offset):
+    """Convert fixed frequency offset string, e.g. '5min' or '1s', to the number of nanoseconds"""
+    pos = 0
+    multiple = 0
+    while pos < len(offset) and '0' <= offset[pos] <= '9':
+        multiple = multiple * 10 + ord(offset[pos]) - ord('0')
+        pos += 1
+
+    if pos == 0:
+        multiple = 1
+
+    unit = offset[pos:]
+    if unit == 'ms':
+        nanoseconds = 1000000
+    elif unit == 'us':
+        nanoseconds = 1000
+    elif unit == 'ns':
+        nanoseconds = 1
+    elif unit == 'min' or unit == 'Min':
+        nanoseconds = 60000000000
+    else:
+        unit = unit.upper()
+        if unit == 'N':
+            nanoseconds = 1
+        elif unit == 'U':
+            nanoseconds = 1000
+        elif unit == 'L':
+            nanoseconds = 1000000
+        elif unit == 'S':
+            nanoseconds = 1000000000
+        elif unit == 'T':
+            nanoseconds = 60000000000
+        elif unit == 'H':
+            nanoseconds = 3600000000000
+        elif unit == 'D':
+            nanoseconds = 86400000000000
+        else:
+            raise ValueError('window must be an integer or a fixed frequency offset')
+
+    return multiple * nanoseconds
+
+
+def closed_endpoints(closed):
+    pass
+
+
+@sdc_overload(closed_endpoints)
+def closed_endpoints_overload(closed):
+    """Returns flags showing whether the left and the right endpoints of a window are included"""
+
+    if isinstance(closed, (types.Omitted, types.NoneType)) or closed is None:
+        def closed_endpoints_none_impl(closed):
+            return False, True
+
+        return closed_endpoints_none_impl
+
+    def closed_endpoints_impl(closed):
+        if closed == 'right':
+            return False, True
+        if closed == 'left':
+            return True, False
+        if closed == 'both':
+            return True, True
+        if closed == 'neither':
+            return False, False
+
+        raise ValueError("closed must be 'right', 'left', 'both' or 'neither'")
+
+    return closed_endpoints_impl
+
+
+@sdc_register_jitable
+def offset_window_bounds(times, window, closed):
+    """
+    Calculate bounds of windows covering the period of time of the given length (in nanoseconds)
+    which ends at the time of each row. Start of each parallel chunk is found with binary search,
+    after that both bounds only move forward, so it takes O(n).
+    """
+    values = times.view(numpy.int64)
+    length = len(values)
+
+    nonmonotonic = 0
+    for i in prange(1, length):
+        if values[i] < values[i - 1]:
+            nonmonotonic += 1
+
+    if nonmonotonic > 0:
+        raise ValueError('index must be monotonic')
+
+    left_closed, right_closed = closed_endpoints(closed)
+    # the window of row i consists of rows with times in [values[i] - window + left_shift, values[i]]
+    left_shift = 0 if left_closed else 1
+    right_shift = 1 if right_closed else 0
+
+    starts = numpy.empty(length, dtype=numpy.int64)
+    ends = numpy.empty(length, dtype=numpy.int64)
+
+    chunks = parallel_chunks(length)
+    for i in prange(len(chunks)):
+        chunk = chunks[i]
+        lower = values[chunk.start] - window + left_shift
+        start = min(numpy.searchsorted(values, lower), chunk.start)
+        for idx in range(chunk.start, chunk.stop):
+            lower = values[idx] - window + left_shift
+            while start < idx and values[start] < lower:
+                start += 1
+
+            starts[idx] = start
+            ends[idx] = idx + right_shift
+
+    return starts, ends
+
+
+@sdc_register_jitable
+def centered_window_bounds(length, window):
+    """
+    Calculate bounds of windows of fixed size with labels set at the center of the window,
+    i.e. the window of row i ends at row i + (window - 1) // 2, rows out of data are excluded.
+    """
+    offset = (window - 1) // 2 if window > 0 else 0
+    starts = numpy.empty(length, dtype=numpy.int64)
+    ends = numpy.empty(length, dtype=numpy.int64)
+    for i in prange(length):
+        stop = i + offset + 1
+        starts[i] = min(max(0, stop - window), length)
+        ends[i] = min(stop, length)
+
+    return starts, ends
+
+
+@sdc_register_jitable
+def group_window_bounds(offsets, window, center):
+    """
+    Calculate bounds of windows of fixed size over rows sorted by groups, where rows of group i are
+    offsets[i] <= j < offsets[i + 1], windows do not cross bounds of groups. Both bounds are non-decreasing.
+    """
+    ngroups = len(offsets) - 1
+    length = offsets[ngroups]
+    offset = (window - 1) // 2 if center and window > 0 else 0
+    starts = numpy.empty(length, dtype=numpy.int64)
+    ends = numpy.empty(length, dtype=numpy.int64)
+    for group in prange(ngroups):
+        group_start, group_stop = offsets[group], offsets[group + 1]
+        for i in range(group_start, group_stop):
+            stop = i + offset + 1
+            starts[i] = min(max(group_start, stop - window), group_stop)
+            ends[i] = min(stop, group_stop)
+
+    return starts, ends
+
+
+def window_weights(win_type, window, std, tau):
+    pass
+
+
+@sdc_overload(window_weights)
+def window_weights_overload(win_type, window, std, tau):
+    """
+    Calculate symmetric weights of window of the given type as scipy.signal.get_window does.
+    Supported window types are 'triang', 'hamming', 'gaussian' (requires std) and 'exponential' (requires tau).
+    """
+    std_given = not (isinstance(std, (types.Omitted, types.NoneType)) or std is None)
+    tau_given = not (isinstance(tau, (types.Omitted, types.NoneType)) or tau is None)
+
+    def window_weights_impl(win_type, window, std, tau):
+        positions = numpy.arange(window) - (window - 1) / 2
+        if win_type == 'triang':
+            return 1. - numpy.abs(positions) / ((window + 1) // 2)
+
+        if win_type == 'hamming':
+            if window == 1:
+                return numpy.ones(1)
+            return 0.54 + 0.46 * numpy.cos(2 * numpy.pi * positions / (window - 1))
+
+        if win_type == 'gaussian':
+            if std_given == True:  # noqa
+                return numpy.exp(-0.5 * (positions / std) ** 2)
+            raise ValueError('gaussian window requires std')
+
+        if win_type == 'exponential':
+            if tau_given == True:  # noqa
+                return numpy.exp(-numpy.abs(positions) / tau)
+            raise ValueError('exponential window requires tau')
+
+        raise ValueError('Invalid win_type, supported: triang, hamming, gaussian, exponential')
+
+    return window_weights_impl
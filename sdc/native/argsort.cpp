@@ -0,0 +1,123 @@
+// *****************************************************************************
+// Copyright (c) 2020, Intel Corporation All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+//     Redistributions of source code must retain the above copyright notice,
+//     this list of conditions and the following disclaimer.
+//
+//     Redistributions in binary form must reproduce the above copyright notice,
+//     this list of conditions and the following disclaimer in the documentation
+//     and/or other materials provided with the distribution.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+// EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// *****************************************************************************
+
+#include "utils.hpp"
+#include "tbb/parallel_for.h"
+#include "tbb/parallel_sort.h"
+
+#include <cmath>
+#include <memory>
+#include <type_traits>
+#include <utility>
+
+using namespace utils;
+
+namespace
+{
+
+template<class T>
+inline typename std::enable_if<std::is_floating_point<T>::value, bool>::type is_nan(T value)
+{
+    return std::isnan(value);
+}
+
+template<class T>
+inline typename std::enable_if<!std::is_floating_point<T>::value, bool>::type is_nan(T)
+{
+    return false;
+}
+
+// orders (value, position) pairs by values with NaNs last, equal values are ordered by positions,
+// so the result of unstable parallel sort is the same as of the stable one
+template<class T, bool ascending>
+struct value_position_less
+{
+    using item_type = std::pair<T, int64_t>;
+
+    inline bool operator()(const item_type& left, const item_type& right) const
+    {
+        auto left_nan  = is_nan(left.first);
+        auto right_nan = is_nan(right.first);
+        if (left_nan || right_nan)
+            return right_nan && (!left_nan || left.second < right.second);
+
+        if (ascending ? left.first < right.first : right.first < left.first)
+            return true;
+
+        if (ascending ? right.first < left.first : left.first < right.first)
+            return false;
+
+        return left.second < right.second;
+    }
+};
+
+template<class T>
+void parallel_argsort_(int64_t* index, const T* data, uint64_t len, bool ascending)
+{
+    using item_type = std::pair<T, int64_t>;
+
+    // values are sorted together with their positions to access memory sequentially while sorting
+    std::unique_ptr<item_type[]> items(new item_type[len]);
+    auto _items = items.get();
+
+    get_arena().execute([&]()
+    {
+        tbb::parallel_for(uint64_t(0), len, [&](uint64_t i) { _items[i] = item_type(data[i], i); });
+
+        if (ascending)
+            tbb::parallel_sort(_items, _items + len, value_position_less<T, true>());
+        else
+            tbb::parallel_sort(_items, _items + len, value_position_less<T, false>());
+
+        tbb::parallel_for(uint64_t(0), len, [&](uint64_t i) { index[i] = _items[i].second; });
+    });
+}
+
+} // namespace
+
+#define declare_argsort(prefix, ty) \
+void parallel_argsort_##prefix(void* index, void* begin, uint64_t len, uint8_t ascending) \
+{ parallel_argsort_<ty>(reinterpret_cast<int64_t*>(index), reinterpret_cast<ty*>(begin), len, ascending); }
+
+#define declare_int_argsort(bits) \
+declare_argsort(i##bits, int##bits##_t) \
+declare_argsort(u##bits, uint##bits##_t)
+
+extern "C"
+{
+
+declare_int_argsort(8)
+declare_int_argsort(16)
+declare_int_argsort(32)
+declare_int_argsort(64)
+
+declare_argsort(f32, float)
+declare_argsort(f64, double)
+
+}
+
+#undef declare_int_argsort
+#undef declare_argsort
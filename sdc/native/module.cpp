@@ -58,6 +58,32 @@ extern "C"
     void parallel_stable_sort_f32(void* begin, uint64_t len);
     void parallel_stable_sort_f64(void* begin, uint64_t len);
 
+    void parallel_argsort_i8(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_argsort_u8(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_argsort_i16(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_argsort_u16(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_argsort_i32(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_argsort_u32(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_argsort_i64(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_argsort_u64(void* index, void* begin, uint64_t len, uint8_t ascending);
+
+    void parallel_argsort_f32(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_argsort_f64(void* index, void* begin, uint64_t len, uint8_t ascending);
+
+    void parallel_radix_argsort_i8(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_radix_argsort_u8(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_radix_argsort_i16(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_radix_argsort_u16(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_radix_argsort_i32(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_radix_argsort_u32(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_radix_argsort_i64(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_radix_argsort_u64(void* index, void* begin, uint64_t len, uint8_t ascending);
+
+    void parallel_radix_argsort_f32(void* index, void* begin, uint64_t len, uint8_t ascending);
+    void parallel_radix_argsort_f64(void* index, void* begin, uint64_t len, uint8_t ascending);
+
+    void parallel_radix_argsort_dt64(void* index, void* begin, uint64_t len, uint8_t ascending);
+
     void set_number_of_threads(uint64_t threads)
     {
         utils::set_threads_num(threads);
@@ -108,6 +134,32 @@ PyMODINIT_FUNC PyInit_concurrent_sort()
     REGISTER(parallel_stable_sort_f32)
     REGISTER(parallel_stable_sort_f64)
 
+    REGISTER(parallel_argsort_i8)
+    REGISTER(parallel_argsort_u8)
+    REGISTER(parallel_argsort_i16)
+    REGISTER(parallel_argsort_u16)
+    REGISTER(parallel_argsort_i32)
+    REGISTER(parallel_argsort_u32)
+    REGISTER(parallel_argsort_i64)
+    REGISTER(parallel_argsort_u64)
+
+    REGISTER(parallel_argsort_f32)
+    REGISTER(parallel_argsort_f64)
+
+    REGISTER(parallel_radix_argsort_i8)
+    REGISTER(parallel_radix_argsort_u8)
+    REGISTER(parallel_radix_argsort_i16)
+    REGISTER(parallel_radix_argsort_u16)
+    REGISTER(parallel_radix_argsort_i32)
+    REGISTER(parallel_radix_argsort_u32)
+    REGISTER(parallel_radix_argsort_i64)
+    REGISTER(parallel_radix_argsort_u64)
+
+    REGISTER(parallel_radix_argsort_f32)
+    REGISTER(parallel_radix_argsort_f64)
+
+    REGISTER(parallel_radix_argsort_dt64)
+
     REGISTER(set_number_of_threads)
 #undef REGISTER
     return m;
@@ -0,0 +1,239 @@
+// *****************************************************************************
+// Copyright (c) 2020, Intel Corporation All rights reserved.
+//
+// Redistribution and use in source and binary forms, with or without
+// modification, are permitted provided that the following conditions are met:
+//
+//     Redistributions of source code must retain the above copyright notice,
+//     this list of conditions and the following disclaimer.
+//
+//     Redistributions in binary form must reproduce the above copyright notice,
+//     this list of conditions and the following disclaimer in the documentation
+//     and/or other materials provided with the distribution.
+//
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+// THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+// PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+// CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+// EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// *****************************************************************************
+
+#include "utils.hpp"
+#include "tbb/parallel_for.h"
+
+#include <cmath>
+#include <cstring>
+#include <limits>
+#include <memory>
+#include <type_traits>
+#include <vector>
+
+using namespace utils;
+
+namespace
+{
+
+constexpr int radix_bits = 8;
+constexpr uint64_t radix_size = uint64_t(1) << radix_bits;
+
+// each thread processes several contiguous chunks, chunks are not made smaller than this
+constexpr uint64_t min_chunk_size = 1 << 12;
+constexpr uint64_t chunks_per_thread = 4;
+
+template<class T>
+inline typename std::enable_if<std::is_floating_point<T>::value, bool>::type is_na(T value, bool)
+{
+    return std::isnan(value);
+}
+
+// integers have no NA values except NaT for datetime64 and timedelta64 stored as int64
+template<class T>
+inline typename std::enable_if<!std::is_floating_point<T>::value, bool>::type is_na(T value, bool has_nat)
+{
+    return has_nat && value == std::numeric_limits<T>::min();
+}
+
+// maps values to unsigned keys with the same order, floats use sign-flip trick:
+// negative values have all bits inverted, non-negative values have the sign bit set
+template<class T>
+inline typename std::enable_if<std::is_floating_point<T>::value, typename exact_void_data_type<sizeof(T)>::type>::type
+radix_key(T value)
+{
+    using key_type = typename exact_void_data_type<sizeof(T)>::type;
+    constexpr key_type sign_bit = key_type(1) << (8 * sizeof(T) - 1);
+
+    // -0.0 and 0.0 are equal, so they must get the same key
+    if (value == T(0))
+        value = T(0);
+
+    key_type bits;
+    std::memcpy(&bits, &value, sizeof(T));
+
+    return (bits & sign_bit) ? ~bits : (bits | sign_bit);
+}
+
+template<class T>
+inline typename std::enable_if<std::is_signed<T>::value && !std::is_floating_point<T>::value,
+                               typename exact_void_data_type<sizeof(T)>::type>::type
+radix_key(T value)
+{
+    using key_type = typename exact_void_data_type<sizeof(T)>::type;
+    constexpr key_type sign_bit = key_type(1) << (8 * sizeof(T) - 1);
+
+    return key_type(value) ^ sign_bit;
+}
+
+template<class T>
+inline typename std::enable_if<std::is_unsigned<T>::value, T>::type radix_key(T value)
+{
+    return value;
+}
+
+template<class key_type>
+struct radix_item
+{
+    key_type key;
+    int64_t position;
+};
+
+template<class T>
+void parallel_radix_argsort_(int64_t* index, const T* data, uint64_t len, bool ascending, bool has_nat)
+{
+    using key_type = typename exact_void_data_type<sizeof(T)>::type;
+    using item_type = radix_item<key_type>;
+
+    auto& arena = get_arena();
+    uint64_t max_chunks = chunks_per_thread * std::max(arena.max_concurrency(), 1);
+    uint64_t nchunks = std::max<uint64_t>(1, std::min(max_chunks, len / min_chunk_size));
+    uint64_t chunk_size = (len + nchunks - 1) / nchunks;
+
+    auto chunk_start = [&](uint64_t chunk) { return std::min(len, chunk * chunk_size); };
+
+    std::unique_ptr<item_type[]> items(new item_type[len]);
+    std::unique_ptr<item_type[]> buffer(new item_type[len]);
+    std::vector<uint64_t> counts(nchunks * radix_size);
+    std::vector<uint64_t> na_counts(nchunks + 1, 0);
+
+    auto src = items.get();
+    auto dst = buffer.get();
+
+    arena.execute([&]()
+    {
+        // NA values are excluded from sorting and placed last in the order of their positions,
+        // so every chunk first counts its NA values to know where to put its items
+        tbb::parallel_for(uint64_t(0), nchunks, [&](uint64_t chunk)
+        {
+            uint64_t count = 0;
+            for (uint64_t i = chunk_start(chunk); i < chunk_start(chunk + 1); ++i)
+                count += is_na(data[i], has_nat);
+
+            na_counts[chunk + 1] = count;
+        }, tbb::simple_partitioner());
+
+        for (uint64_t chunk = 0; chunk < nchunks; ++chunk)
+            na_counts[chunk + 1] += na_counts[chunk];
+
+        uint64_t nvalues = len - na_counts[nchunks];
+
+        tbb::parallel_for(uint64_t(0), nchunks, [&](uint64_t chunk)
+        {
+            uint64_t na_pos = nvalues + na_counts[chunk];
+            uint64_t pos = chunk_start(chunk) - na_counts[chunk];
+            for (uint64_t i = chunk_start(chunk); i < chunk_start(chunk + 1); ++i)
+            {
+                if (is_na(data[i], has_nat))
+                {
+                    index[na_pos++] = i;
+                    continue;
+                }
+
+                key_type key = radix_key(data[i]);
+                src[pos++] = item_type{ascending ? key : key_type(~key), int64_t(i)};
+            }
+        }, tbb::simple_partitioner());
+
+        // values are redistributed between chunks, so chunks are recomputed over non-NA items
+        uint64_t item_chunk_size = (nvalues + nchunks - 1) / nchunks;
+        auto item_chunk_start = [&](uint64_t chunk) { return std::min(nvalues, chunk * item_chunk_size); };
+
+        for (uint64_t shift = 0; shift < 8 * sizeof(key_type); shift += radix_bits)
+        {
+            tbb::parallel_for(uint64_t(0), nchunks, [&](uint64_t chunk)
+            {
+                auto chunk_counts = &counts[chunk * radix_size];
+                std::fill(chunk_counts, chunk_counts + radix_size, 0);
+                for (uint64_t i = item_chunk_start(chunk); i < item_chunk_start(chunk + 1); ++i)
+                    ++chunk_counts[(src[i].key >> shift) & (radix_size - 1)];
+            }, tbb::simple_partitioner());
+
+            // each chunk scatters its items of each digit starting from own offset, so the sort is stable
+            uint64_t offset = 0;
+            bool single_digit = false;
+            for (uint64_t digit = 0; digit < radix_size; ++digit)
+            {
+                uint64_t digit_start = offset;
+                for (uint64_t chunk = 0; chunk < nchunks; ++chunk)
+                {
+                    auto count = counts[chunk * radix_size + digit];
+                    counts[chunk * radix_size + digit] = offset;
+                    offset += count;
+                }
+
+                single_digit = single_digit || offset - digit_start == nvalues;
+            }
+
+            // all keys have the same digit, so this pass would not change the order
+            if (single_digit)
+                continue;
+
+            tbb::parallel_for(uint64_t(0), nchunks, [&](uint64_t chunk)
+            {
+                auto chunk_offsets = &counts[chunk * radix_size];
+                for (uint64_t i = item_chunk_start(chunk); i < item_chunk_start(chunk + 1); ++i)
+                    dst[chunk_offsets[(src[i].key >> shift) & (radix_size - 1)]++] = src[i];
+            }, tbb::simple_partitioner());
+
+            std::swap(src, dst);
+        }
+
+        tbb::parallel_for(uint64_t(0), nvalues, [&](uint64_t i) { index[i] = src[i].position; });
+    });
+}
+
+} // namespace
+
+#define declare_radix_argsort(prefix, ty, has_nat) \
+void parallel_radix_argsort_##prefix(void* index, void* begin, uint64_t len, uint8_t ascending) \
+{ \
+    parallel_radix_argsort_<ty>(reinterpret_cast<int64_t*>(index), reinterpret_cast<ty*>(begin), len, \
+                                ascending, has_nat); \
+}
+
+#define declare_int_radix_argsort(bits) \
+declare_radix_argsort(i##bits, int##bits##_t, false) \
+declare_radix_argsort(u##bits, uint##bits##_t, false)
+
+extern "C"
+{
+
+declare_int_radix_argsort(8)
+declare_int_radix_argsort(16)
+declare_int_radix_argsort(32)
+declare_int_radix_argsort(64)
+
+declare_radix_argsort(f32, float, false)
+declare_radix_argsort(f64, double, false)
+
+// datetime64 and timedelta64 values are int64 with NaT as the minimal value
+declare_radix_argsort(dt64, int64_t, true)
+
+}
+
+#undef declare_int_radix_argsort
+#undef declare_radix_argsort
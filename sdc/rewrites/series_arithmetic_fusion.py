@@ -0,0 +1,304 @@
+# *****************************************************************************
+# Copyright (c) 2020, Intel Corporation All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#     Redistributions of source code must retain the above copyright notice,
+#     this list of conditions and the following disclaimer.
+#
+#     Redistributions in binary form must reproduce the above copyright notice,
+#     this list of conditions and the following disclaimer in the documentation
+#     and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+# OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+# WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+# OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+import operator
+from collections import Counter
+
+import numba
+import numpy
+import pandas
+
+from numba import prange, types
+from numba.core.ir import Assign, Arg, Const, Del, Expr, FreeVar, Global, Var
+from numba.core.rewrites import register_rewrite, Rewrite
+
+from sdc.config import config_use_parallel_overloads
+from sdc.hiframes.pd_series_type import SeriesType
+from sdc.rewrites.ir_utils import make_assign
+from sdc.utilities.utils import update_jit_options
+
+
+series_fused_binops = {
+    operator.add: ('add', '+'),
+    operator.sub: ('sub', '-'),
+    operator.mul: ('mul', '*'),
+    operator.truediv: ('truediv', '/'),
+    operator.floordiv: ('floordiv', '//'),
+    operator.mod: ('mod', '%'),
+    operator.pow: ('pow', '**'),
+}
+
+# expressions that don't modify their operands, so they can be placed between fused operators
+series_fusion_safe_exprs = ('binop', 'unary', 'getattr', 'static_getitem', 'getitem', 'build_tuple', 'cast')
+
+series_fused_dispatchers = {}
+
+
+def is_fusable_series(ty):
+    """Checks if Series is numeric with default index, so that operators on it align data by positions"""
+    return (isinstance(ty, SeriesType) and isinstance(ty.data, types.Array)
+            and isinstance(ty.dtype, (types.Integer, types.Float)) and isinstance(ty.index, types.NoneType))
+
+
+def is_fusable_scalar(ty):
+    return isinstance(ty, (types.Integer, types.Float))
+
+
+def gen_series_fused_expr_impl(tree, leaves, typemap):
+    """
+    Generate function evaluating the tree of Series operators element by element in a single parallel loop.
+    Each operator mirrors arithmetic of its generated implementation (see sdc_function_templates.py):
+    operands of two Series are computed as float64, scalar is cast to the result dtype of its operator,
+    and each result is cast to the dtype of the Series the operator returns.
+    If Series operands have different lengths, they are aligned by regular operators instead.
+    """
+    args = ['arg_{}'.format(k) for k in range(len(leaves))]
+    series_args = [arg for arg, leaf in zip(args, leaves) if isinstance(typemap[leaf.name], SeriesType)]
+    global_vars = {'numpy': numpy, 'pandas': pandas, 'prange': prange, 'operator': operator}
+
+    def gen(node):
+        """Returns element expression, fallback expression and the Series argument the result takes name from"""
+        if isinstance(node, Var):
+            arg = args[leaves.index(node)]
+            if isinstance(typemap[node.name], SeriesType):
+                return 'data_{}[i]'.format(arg), arg, arg
+            return arg, arg, None
+
+        fn, left, right, result_type = node
+        func_name, symbol = series_fused_binops[fn]
+        left_expr, left_fallback, left_name = gen(left)
+        right_expr, right_fallback, right_name = gen(right)
+        dtype = 'dtype_{}'.format(len(global_vars))
+        global_vars[dtype] = result_type.dtype
+
+        if left_name is not None and right_name is not None:
+            element_expr = '{0}(numpy.float64({1}) {2} numpy.float64({3}))'.format(
+                dtype, left_expr, symbol, right_expr)
+            name = None
+        elif left_name is not None:
+            element_expr = '{0}({1} {2} {0}({3}))'.format(dtype, left_expr, symbol, right_expr)
+            name = left_name
+        else:
+            element_expr = '{0}({0}({1}) {2} {3})'.format(dtype, left_expr, symbol, right_expr)
+            name = right_name
+
+        fallback_expr = 'operator.{}({}, {})'.format(func_name, left_fallback, right_fallback)
+        return element_expr, fallback_expr, name
+
+    element_expr, fallback_expr, name = gen(tree)
+    global_vars['result_dtype'] = tree[3].dtype
+
+    func_lines = ['def _series_fused_expr_impl({}):'.format(', '.join(args)),
+                  '  size = len({})'.format(series_args[0])]
+    if len(series_args) > 1:
+        sizes_differ = ' or '.join('len({}) != size'.format(arg) for arg in series_args[1:])
+        func_lines += ['  if {}:'.format(sizes_differ),
+                       '    return {}'.format(fallback_expr)]
+    func_lines += ['  data_{0} = {0}._data'.format(arg) for arg in series_args]
+    func_lines += ['  result_data = numpy.empty(size, dtype=result_dtype)',
+                   '  for i in prange(size):',
+                   '    result_data[i] = {}'.format(element_expr)]
+    if name is None:
+        func_lines.append('  return pandas.Series(result_data)')
+    else:
+        func_lines.append('  return pandas.Series(result_data, index={0}._index, name={0}._name)'.format(name))
+
+    func_text = '\n'.join(func_lines)
+    loc_vars = {}
+    exec(func_text, global_vars, loc_vars)
+
+    dtypes = tuple(value for name, value in global_vars.items() if 'dtype' in name)
+
+    return func_text, loc_vars['_series_fused_expr_impl'], dtypes
+
+
+@register_rewrite('after-inference')
+class RewriteSeriesArithmeticFusion(Rewrite):
+    """
+    Search for chains of arithmetic operators on numeric Series with default indexes, whose intermediate
+    results are used only by the next operator, and replace each chain with a call of generated function
+    evaluating it in a single parallel loop, so no intermediate Series are allocated:
+    $0.3 = S1 * S2        ->  $0.5 = call $_series_fused_expr(S1, S2, S3)
+    $0.5 = $0.3 + S3
+    """
+
+    def match(self, func_ir, block, typemap, calltypes):
+        self.func_ir = func_ir
+        self.block = block
+        self.typemap = typemap
+        self.calltypes = calltypes
+        self.fused = fused = {}
+
+        operators = {}
+        for inst in block.body:
+            if (isinstance(inst, Assign) and self._is_fusable_binop(inst.value)
+                    and is_fusable_series(typemap[inst.target.name])):
+                operators[inst.target.name] = inst
+        if len(operators) < 2:
+            return False
+
+        uses = Counter()
+        for other_block in func_ir.blocks.values():
+            for inst in other_block.body:
+                if isinstance(inst, Del):
+                    continue
+                used_vars = inst.value.list_vars() if isinstance(inst, Assign) else inst.list_vars()
+                uses.update(var.name for var in used_vars)
+
+        # operators whose result is used only as an operand of the next operator of the same block
+        operands = Counter(var.name for inst in operators.values() for var in (inst.value.lhs, inst.value.rhs))
+        inner = {name for name in operators
+                 if uses[name] == 1 and operands[name] == 1 and len(func_ir._definitions[name]) == 1}
+
+        for name, inst in operators.items():
+            if name in inner:
+                continue
+            chain = []
+            leaves = []
+            tree = self._build_tree(inst, operators, inner, chain, leaves)
+            if not chain or not self._chain_is_safe(inst, chain, leaves):
+                continue
+
+            call_type = self._type_fused_call(tree, leaves, typemap[name])
+            if call_type is not None:
+                fused[inst] = (chain, leaves, call_type)
+
+        return len(fused) > 0
+
+    def apply(self):
+        removed = set()
+        for chain, _, _ in self.fused.values():
+            removed.update(chain)
+        removed_names = {inst.target.name for inst in removed}
+
+        # positions of the first statement of each chain, leaves must not be deleted before the chain root
+        body = self.block.body
+        positions = {inst: k for k, inst in enumerate(body)}
+        pending_dels = {}
+        for root, (chain, leaves, _) in self.fused.items():
+            start, stop = min(positions[inst] for inst in chain), positions[root]
+            for k in range(start, stop):
+                if isinstance(body[k], Del) and body[k].value in {var.name for var in leaves}:
+                    pending_dels.setdefault(body[k], []).append(stop)
+
+        new_block = self.block.copy()
+        new_block.clear()
+        postponed = {}
+        for k, inst in enumerate(body):
+            if inst in removed:
+                continue
+            if isinstance(inst, Del) and inst.value in removed_names:
+                continue
+            if inst in pending_dels:
+                postponed.setdefault(max(pending_dels[inst]), []).append(inst)
+                continue
+
+            if inst in self.fused:
+                _, leaves, (dispatcher, fnty, signature) = self.fused[inst]
+                func_assign = make_assign(Global(dispatcher.py_func.__name__, dispatcher, inst.loc),
+                                          self.block.scope, self.func_ir, inst.loc, prefix='$_series_fused_expr')
+                self.typemap[func_assign.target.name] = fnty
+                new_block.append(func_assign)
+
+                call = Expr.call(func_assign.target, list(leaves), (), inst.loc)
+                self.calltypes[call] = signature
+                self.func_ir._definitions[inst.target.name] = [call]
+                inst = Assign(value=call, target=inst.target, loc=inst.loc)
+
+            new_block.append(inst)
+            for del_inst in postponed.pop(k, []):
+                new_block.append(del_inst)
+
+        for name in removed_names:
+            self.func_ir._definitions.pop(name, None)
+
+        return new_block
+
+    def _is_fusable_binop(self, expr):
+        if not (isinstance(expr, Expr) and expr.op == 'binop' and expr.fn in series_fused_binops):
+            return False
+
+        operand_types = [self.typemap[expr.lhs.name], self.typemap[expr.rhs.name]]
+        if not any(isinstance(ty, SeriesType) for ty in operand_types):
+            return False
+
+        return all(is_fusable_series(ty) or is_fusable_scalar(ty) for ty in operand_types)
+
+    def _build_tree(self, inst, operators, inner, chain, leaves):
+        """Returns tree of (operator, left, right, result type) with variables as leaves"""
+        def build(var):
+            if var.name in inner:
+                chain.append(operators[var.name])
+                return self._build_tree(operators[var.name], operators, inner, chain, leaves)
+
+            if var not in leaves:
+                leaves.append(var)
+            return var
+
+        expr = inst.value
+        return expr.fn, build(expr.lhs), build(expr.rhs), self.typemap[inst.target.name]
+
+    def _chain_is_safe(self, root, chain, leaves):
+        """Checks that leaves are defined once and can't be modified by statements the chain spans"""
+        if any(len(self.func_ir._definitions[var.name]) != 1 for var in leaves):
+            return False
+
+        body = self.block.body
+        start, stop = min(body.index(inst) for inst in chain), body.index(root)
+        for inst in body[start:stop]:
+            if isinstance(inst, Del):
+                continue
+            if not isinstance(inst, Assign):
+                return False
+            value = inst.value
+            if isinstance(value, Expr) and value.op not in series_fusion_safe_exprs:
+                return False
+            if not isinstance(value, (Expr, Arg, Const, FreeVar, Global, Var)):
+                return False
+
+        return True
+
+    def _type_fused_call(self, tree, leaves, result_type):
+        """Compiles function evaluating the tree and returns its dispatcher, type and call signature"""
+        func_text, func, dtypes = gen_series_fused_expr_impl(tree, leaves, self.typemap)
+        key = (func_text, dtypes)
+        dispatcher = series_fused_dispatchers.get(key)
+        if dispatcher is None:
+            dispatcher = numba.njit(**update_jit_options({}, None, config_use_parallel_overloads))(func)
+            series_fused_dispatchers[key] = dispatcher
+
+        fnty = types.Dispatcher(dispatcher)
+        arg_types = tuple(self.typemap[var.name] for var in leaves)
+        try:
+            signature = self.pipeline.typingctx.resolve_function_type(fnty, arg_types, {})
+        except Exception:
+            # chains that fail to compile are evaluated operator by operator as before
+            return None
+
+        if signature is None or signature.return_type != result_type:
+            return None
+
+        return dispatcher, fnty, signature
@@ -41,7 +41,8 @@ from numba.core.errors import TypingError
 from numba import types
 
 from sdc.utilities.sdc_typing_utils import (TypeChecker, check_index_is_numeric, check_types_comparable,
-                                            find_common_dtype_from_numpy_dtypes, find_index_common_dtype)
+                                            find_common_dtype_from_numpy_dtypes, find_index_common_dtype,
+                                            find_operator_result_dtype)
 from sdc.datatypes.common_functions import (sdc_join_series_indexes, )
 from sdc.hiframes.api import isna
 from sdc.hiframes.pd_series_type import SeriesType
@@ -61,17 +62,27 @@ def sdc_binop_ovld(self, other, fill_value=None):
     operands_are_series = self_is_series and other_is_series
     fill_value_is_none = isinstance(fill_value, (types.NoneType, types.Omitted)) or fill_value is None
 
+    # result dtype follows numpy promotion of operands dtypes, e.g. float32 series stay float32, but
+    # integer results are float64 if missing values can be introduced by alignment of series and for
+    # division, modulo and power, since pandas gives inf and nan for zero divisors and negative powers
+    # (autogen_sources.py sets int_result_allowed to False for these operators)
+    int_result_allowed = not (operands_are_series and fill_value_is_none)
+    result_dtype = find_operator_result_dtype(lambda a, b: a + b, self, other,
+                                              fill_value=None if fill_value_is_none else fill_value)
+    if isinstance(result_dtype, (types.Integer, types.Boolean)) and not int_result_allowed:
+        result_dtype = types.float64
+
     # specializations for numeric series only
     if not operands_are_series:
         def sdc_binop_impl(self, other, fill_value=None):
 
             series = self if self_is_series == True else other  # noqa
-            result_data = numpy.empty(len(series._data), dtype=numpy.float64)
+            result_data = numpy.empty(len(series._data), dtype=result_dtype)
             series_data = numpy_like.fillna(series._data, inplace=False, value=fill_value)
             if self_is_series == True:  # noqa
-                _self, _other = series_data, numpy.float64(other)
+                _self, _other = series_data, result_dtype(other)
             else:
-                _self, _other = numpy.float64(self), series_data
+                _self, _other = result_dtype(self), series_data
 
             result_data[:] = _self + _other
             return pandas.Series(result_data, index=series._index, name=series._name)
@@ -85,7 +96,7 @@ def sdc_binop_ovld(self, other, fill_value=None):
 
                 left_size, right_size = len(self._data), len(other._data)
                 max_data_size = max(left_size, right_size)
-                result_data = numpy.empty(max_data_size, dtype=numpy.float64)
+                result_data = numpy.empty(max_data_size, dtype=result_dtype)
 
                 _fill_value = numpy.nan if fill_value_is_none == True else fill_value  # noqa
                 for i in numba.prange(max_data_size):
@@ -124,7 +135,7 @@ def sdc_binop_ovld(self, other, fill_value=None):
                 # TODO: replace below with core join(how='outer', return_indexers=True) when implemented
                 joined_index, left_indexer, right_indexer = sdc_join_series_indexes(left_index, right_index)
                 result_size = len(joined_index)
-                result_data = numpy.empty(result_size, dtype=numpy.float64)
+                result_data = numpy.empty(result_size, dtype=result_dtype)
                 for i in numba.prange(result_size):
                     left_pos, right_pos = left_indexer[i], right_indexer[i]
                     left_nan = (left_pos == -1 or numpy.isnan(self._data[left_pos]))
@@ -34,7 +34,7 @@ import unittest
 from itertools import permutations, product
 from numba import types
 from numba.core.config import IS_32BITS
-from numba import literal_unroll
+from numba import literal_unroll, literally
 from numba.core.errors import TypingError
 from pandas.core.indexing import IndexingError
 
@@ -48,7 +48,7 @@ from sdc.tests.test_utils import (check_numba_version,
                                   count_parfor_OneDs,
                                   count_parfor_REPs,
                                   dist_IR_contains,
-                                  gen_df, gen_df_int_cols,
+                                  gen_df, gen_df_int_cols, gen_frand_array,
                                   get_start_end,
                                   skip_numba_jit,
                                   test_global_input_data_float64,
@@ -869,7 +869,6 @@ class TestDataFrame(TestCase):
         hpat_func = self.jit(test_impl)
         np.testing.assert_almost_equal(hpat_func(df.copy()), test_impl(df))
 
-    @skip_numba_jit
     def test_sort_values_copy(self):
         def test_impl(df):
             df2 = df.sort_values('A')
@@ -935,6 +934,87 @@ class TestDataFrame(TestCase):
         hpat_func = self.jit(test_impl)
         self.assertTrue((hpat_func(df) == sorted_df.B.values).all())
 
+    def test_df_sort_values_multiple_columns(self):
+        def test_impl(df, ascending, na_position):
+            return df.sort_values(by=['A', 'B', 'C'], ascending=ascending, kind='mergesort', na_position=na_position)
+        hpat_func = self.jit(test_impl)
+
+        n = 1211
+        np.random.seed(0)
+        A = np.random.randint(0, 5, n).astype(np.float64)
+        A[::13] = np.nan
+        df = pd.DataFrame({'A': A,
+                           'B': np.random.choice(['a', 'bb', '', 'ab'], n),
+                           'C': np.random.randint(-3, 3, n),
+                           'D': np.arange(n)},
+                          index=np.random.ranf(n))
+        ascending_values = [True, False, [True, False, True], [False, True, False]]
+        for ascending, na_position in product(ascending_values, ['first', 'last']):
+            with self.subTest(ascending=ascending, na_position=na_position):
+                pd.testing.assert_frame_equal(hpat_func(df, ascending, na_position),
+                                              test_impl(df, ascending, na_position))
+
+    def test_df_sort_values_single_column(self):
+        def test_impl(df, by, ascending, na_position):
+            return df.sort_values(by=literally(by), ascending=ascending, kind='mergesort', na_position=na_position)
+        hpat_func = self.jit(test_impl)
+
+        n = 1 << 17
+        np.random.seed(0)
+        A = np.random.randint(0, 1000, n).astype(np.float64)
+        A[np.random.randint(0, n, 1000)] = np.nan
+        df = pd.DataFrame({'A': A, 'B': np.random.randint(0, 1000, n), 'C': np.arange(n)})
+        for by, ascending, na_position in product(['A', 'B'], [True, False], ['first', 'last']):
+            with self.subTest(by=by, ascending=ascending, na_position=na_position):
+                pd.testing.assert_frame_equal(hpat_func(df, by, ascending, na_position),
+                                              test_impl(df, by, ascending, na_position))
+
+    def test_df_sort_values_ascending_length(self):
+        def test_impl(df):
+            return df.sort_values(by=['A', 'B'], ascending=[True, False, True])
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame({'A': [1, 2, 1], 'B': [3., 2., 1.]})
+        with self.assertRaises(ValueError) as raises:
+            hpat_func(df)
+        self.assertIn('Length of ascending != length of by', str(raises.exception))
+
+    def test_df_eval(self):
+        exprs = ['(A * B + C) / D - E', 'A / C', '-A // 3 + C % 4', 'B ** 2 - 0.5 * D', 'A + B > C * 1.5']
+        n = 1001
+        np.random.seed(0)
+        data = {'A': np.random.randint(-100, 100, n),
+                'B': gen_frand_array(n, nancount=n // 7),
+                'C': np.random.randint(-3, 3, n).astype(np.int32),
+                'D': np.random.ranf(n),
+                'E': np.arange(n, dtype=np.float32),
+                'F': ['a'] * n}
+        for expr, index in product(exprs, [None, np.arange(n) * 2]):
+            df = pd.DataFrame(data, index=index)
+            with self.subTest(expr=expr, index=index):
+                def test_impl(df):
+                    return df.eval(expr)
+                hpat_func = self.jit(test_impl)
+                pd.testing.assert_series_equal(hpat_func(df), test_impl(df))
+
+    def test_df_eval_unicode_expr(self):
+        def test_impl(df, expr):
+            return df.eval(expr)
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame({'A': [1., 2., np.nan, 4.], 'B': [3, 2, 1, 0]})
+        pd.testing.assert_series_equal(hpat_func(df, 'A * B - 1'), test_impl(df, 'A * B - 1'))
+
+    def test_df_eval_unknown_column(self):
+        def test_impl(df):
+            return df.eval('A + Z')
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame({'A': [1., 2., 3.]})
+        with self.assertRaises(TypingError) as raises:
+            hpat_func(df)
+        self.assertIn('Column Z not found', str(raises.exception))
+
     @skip_numba_jit
     def test_sort_parallel_single_col(self):
         # create `kde.parquet` file
@@ -31,6 +31,7 @@ import platform
 import pyarrow.parquet as pq
 import unittest
 from itertools import product
+from numba.core.errors import TypingError
 
 import sdc
 from sdc.tests.test_base import TestCase
@@ -283,6 +284,44 @@ class TestGroupBy(TestCase):
         # TODO: implement index classes, as current indexes do not have names
         pd.testing.assert_frame_equal(result, result_ref, check_names=False)
 
+    def test_dataframe_groupby_quantile(self):
+        def test_impl(df, q):
+            return df.groupby('A').quantile(q)
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        for q in [0.5, 0, 1, 0.25, 0.9]:
+            with self.subTest(q=q):
+                result = hpat_func(df, q)
+                result_ref = test_impl(df, q)
+                # TODO: implement index classes, as current indexes do not have names
+                pd.testing.assert_frame_equal(result, result_ref, check_names=False)
+
+    def test_dataframe_groupby_quantile_seq(self):
+        def test_impl(df, q):
+            return df.groupby('A').quantile(q)
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        q = [0.1, 0.5, 0.75]
+        result = hpat_func(df, q)
+        # MultiIndex is not supported, so resulting index holds keys repeated for each quantile
+        result_ref = test_impl(df, q).reset_index(level=-1, drop=True)
+        pd.testing.assert_frame_equal(result, result_ref, check_names=False)
+
+    def test_series_groupby_quantile(self):
+        def test_impl(S, by, q):
+            return S.groupby(by).quantile(q)
+        hpat_func = self.jit(test_impl)
+
+        n, m = 1000, 300
+        np.random.seed(0)
+        S = pd.Series(gen_frand_array(n, nancount=n // 3))
+        by = np.random.choice(np.arange(m), n)
+        for q in [0.5, 0.3]:
+            with self.subTest(q=q):
+                pd.testing.assert_series_equal(hpat_func(S, by, q), test_impl(S, by, q))
+
     def test_dataframe_groupby_prod(self):
         def test_impl(df):
             return df.groupby('A').prod()
@@ -399,6 +438,414 @@ class TestGroupBy(TestCase):
         # TODO: implement index classes, as current indexes do not have names
         pd.testing.assert_frame_equal(result_jit, result_ref, check_names=False)
 
+    def test_dataframe_groupby_reductions_many_groups(self):
+        test_impls = {
+            'count': lambda df: df.groupby('A').count(),
+            'max': lambda df: df.groupby('A').max(),
+            'mean': lambda df: df.groupby('A').mean(),
+            'min': lambda df: df.groupby('A').min(),
+            'prod': lambda df: df.groupby('A').prod(),
+            'std': lambda df: df.groupby('A').std(),
+            'sum': lambda df: df.groupby('A').sum(),
+            'var': lambda df: df.groupby('A').var(),
+        }
+
+        n, m = 1000, 300
+        np.random.seed(0)
+        df = pd.DataFrame({
+                    'A': np.random.choice(np.arange(m), n),
+                    'B': np.random.randint(-5, 5, n),
+                    'C': gen_frand_array(n, nancount=n // 3),
+        })
+
+        for method_name, test_impl in test_impls.items():
+            with self.subTest(method=method_name):
+                hpat_func = self.jit(test_impl)
+                result = hpat_func(df)
+                result_ref = test_impl(df)
+                # TODO: implement index classes, as current indexes do not have names
+                pd.testing.assert_frame_equal(result, result_ref, check_names=False)
+
+    def test_series_groupby_reductions_many_groups(self):
+        test_impls = {
+            'count': lambda S, by: S.groupby(by).count(),
+            'max': lambda S, by: S.groupby(by).max(),
+            'mean': lambda S, by: S.groupby(by).mean(),
+            'min': lambda S, by: S.groupby(by).min(),
+            'std': lambda S, by: S.groupby(by).std(),
+            'sum': lambda S, by: S.groupby(by).sum(),
+            'var': lambda S, by: S.groupby(by).var(),
+        }
+
+        n, m = 1000, 300
+        np.random.seed(0)
+        S = pd.Series(gen_frand_array(n, nancount=n // 3))
+        by = np.random.choice(np.arange(m), n)
+
+        for method_name, test_impl in test_impls.items():
+            with self.subTest(method=method_name):
+                hpat_func = self.jit(test_impl)
+                result = hpat_func(S, by)
+                result_ref = test_impl(S, by)
+                pd.testing.assert_series_equal(result, result_ref, check_names=False)
+
+    def test_dataframe_groupby_reductions_high_cardinality(self):
+        test_impls = {
+            'count': lambda df, sort: df.groupby('A', sort=sort).count(),
+            'mean': lambda df, sort: df.groupby('A', sort=sort).mean(),
+            'min': lambda df, sort: df.groupby('A', sort=sort).min(),
+            'std': lambda df, sort: df.groupby('A', sort=sort).std(),
+            'sum': lambda df, sort: df.groupby('A', sort=sort).sum(),
+        }
+
+        # most of the keys are unique, so that partitioned factorization is used
+        n = 1 << 17
+        np.random.seed(0)
+        df = pd.DataFrame({
+                    'A': np.random.randint(0, n, n),
+                    'B': np.random.randint(-5, 5, n),
+                    'C': gen_frand_array(n, nancount=n // 3),
+        })
+
+        for (method_name, test_impl), sort in product(test_impls.items(), [True, False]):
+            with self.subTest(method=method_name, sort=sort):
+                hpat_func = self.jit(test_impl)
+                result = hpat_func(df, sort)
+                result_ref = test_impl(df, sort)
+                # TODO: implement index classes, as current indexes do not have names
+                pd.testing.assert_frame_equal(result, result_ref, check_names=False)
+
+    def test_group_offsets_positions_empty_groups(self):
+        from sdc.functions.groupby import group_offsets_positions
+
+        def test_impl(codes, ngroups):
+            return group_offsets_positions(codes, ngroups)
+        hpat_func = self.jit(test_impl)
+
+        # codes 0, 3 and the last ones are unused, -1 marks rows not in any group
+        codes = np.array([2, 1, -1, 4, 2, 1, 4, -1, 2], dtype=np.int64)
+        for ngroups in [5, 7, 100]:
+            with self.subTest(ngroups=ngroups):
+                offsets, positions = hpat_func(codes, ngroups)
+                valid = np.nonzero(codes >= 0)[0]
+                positions_ref = valid[np.argsort(codes[valid], kind='mergesort')]
+                offsets_ref = np.searchsorted(codes[positions_ref], np.arange(ngroups + 1))
+                np.testing.assert_array_equal(offsets, offsets_ref)
+                np.testing.assert_array_equal(positions, positions_ref)
+
+    def test_dataframe_groupby_as_index_false(self):
+        def test_impl(df):
+            return df.groupby('A', as_index=False).sum()
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        pd.testing.assert_frame_equal(hpat_func(df), test_impl(df))
+
+    def test_dataframe_groupby_multiple_keys(self):
+        # pandas interprets tuple 'by' as a list of keys with a warning, so jitted impls use tuples
+        test_impls = {
+            'count': (lambda df, sort: df.groupby(['A', 'B'], as_index=False, sort=sort).count(),
+                      lambda df, sort: df.groupby(('A', 'B'), as_index=False, sort=sort).count()),
+            'max': (lambda df, sort: df.groupby(['A', 'B'], as_index=False, sort=sort).max(),
+                    lambda df, sort: df.groupby(('A', 'B'), as_index=False, sort=sort).max()),
+            'mean': (lambda df, sort: df.groupby(['A', 'B'], as_index=False, sort=sort).mean(),
+                     lambda df, sort: df.groupby(('A', 'B'), as_index=False, sort=sort).mean()),
+            'sum': (lambda df, sort: df.groupby(['A', 'B'], as_index=False, sort=sort).sum(),
+                    lambda df, sort: df.groupby(('A', 'B'), as_index=False, sort=sort).sum()),
+        }
+
+        n, m = 1000, 30
+        np.random.seed(0)
+        df = pd.DataFrame({
+                    'A': np.random.choice(np.arange(m), n),
+                    'B': np.random.choice(['a', 'bb', 'ccc', 'dd'], n),
+                    'C': gen_frand_array(n, nancount=n // 3),
+                    'D': np.random.randint(-5, 5, n),
+        })
+
+        for method_name, sort in product(test_impls, [True, False]):
+            with self.subTest(method=method_name, sort=sort):
+                test_impl, jit_impl = test_impls[method_name]
+                hpat_func = self.jit(jit_impl)
+                pd.testing.assert_frame_equal(hpat_func(df, sort), test_impl(df, sort))
+
+    def test_dataframe_groupby_multiple_keys_getitem(self):
+        def test_impl(df):
+            return df.groupby(['A', 'C'], as_index=False)['B'].sum()
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame({'A': [2, 1, 1, 1, 2, 2, 1], 'B': [-8, 2, 3, 1, 5, 6, 7],
+                           'C': [3, 5, 6, 5, 4, 4, 3]})
+        pd.testing.assert_frame_equal(hpat_func(df), test_impl(df))
+
+    def test_dataframe_groupby_multiple_keys_as_index(self):
+        def test_impl(df):
+            return df.groupby(('A', 'C')).sum()
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame({'A': [2, 1, 1, 1, 2, 2, 1], 'B': [-8, 2, 3, 1, 5, 6, 7],
+                           'C': [3, 5, 6, 5, 4, 4, 3]})
+        with self.assertRaises(TypingError) as raises:
+            hpat_func(df)
+        msg = 'Grouping by multiple columns is supported with as_index=False only'
+        self.assertIn(msg, str(raises.exception))
+
+    def test_dataframe_groupby_multiple_keys_indices(self):
+        def test_impl(df):
+            return df.groupby(['A', 'C'], as_index=False).indices
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame({'A': [2, 1, 1, 1, 2, 2, 1], 'B': [-8, 2, 3, 1, 5, 6, 7],
+                           'C': [3, 5, 6, 5, 4, 4, 3]})
+        result = hpat_func(df)
+        result_ref = test_impl(df)
+        self.assertEqual(sorted(result.keys()), sorted(result_ref.keys()))
+        for key in result_ref:
+            np.testing.assert_array_equal(result[key], result_ref[key])
+
+    def test_dataframe_groupby_agg_str(self):
+        def test_impl(df):
+            return df.groupby('A').agg('sum')
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        pd.testing.assert_frame_equal(hpat_func(df), test_impl(df), check_names=False)
+
+    def test_dataframe_groupby_agg_seq(self):
+        def gen_test_impl(do_jit=False):
+            def test_impl(df):
+                if do_jit == True:  # noqa
+                    return df.groupby('A').agg(('min', 'max', 'mean', 'median', 'count'))
+                else:
+                    return df.groupby('A').agg(['min', 'max', 'mean', 'median', 'count'])
+
+            return test_impl
+
+        test_impl = gen_test_impl()
+        hpat_func = self.jit(gen_test_impl(do_jit=True))
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        result_ref = test_impl(df)
+        # multi-level columns are not supported, so names of resulting columns are flattened
+        result_ref.columns = ['_'.join(column) for column in result_ref.columns]
+        pd.testing.assert_frame_equal(hpat_func(df), result_ref, check_names=False)
+
+    def test_dataframe_groupby_agg_dict(self):
+        def gen_test_impl(do_jit=False):
+            def test_impl(df):
+                if do_jit == True:  # noqa
+                    return df.groupby('A').agg({'D': ('min', 'max', 'mean', 'var'), 'B': 'sum'})
+                else:
+                    return df.groupby('A').agg({'D': ['min', 'max', 'mean', 'var'], 'B': 'sum'})
+
+            return test_impl
+
+        test_impl = gen_test_impl()
+        hpat_func = self.jit(gen_test_impl(do_jit=True))
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        result_ref = test_impl(df)
+        result_ref.columns = ['_'.join(column) for column in result_ref.columns]
+        pd.testing.assert_frame_equal(hpat_func(df), result_ref, check_names=False)
+
+    def test_dataframe_groupby_agg_dict_str(self):
+        def test_impl(df):
+            return df.groupby('A').agg({'D': 'max', 'B': 'sum'})
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        pd.testing.assert_frame_equal(hpat_func(df), test_impl(df), check_names=False)
+
+    def test_series_groupby_agg_seq(self):
+        def gen_test_impl(do_jit=False):
+            def test_impl(S, by):
+                if do_jit == True:  # noqa
+                    return S.groupby(by).aggregate(('sum', 'mean', 'std', 'count'))
+                else:
+                    return S.groupby(by).aggregate(['sum', 'mean', 'std', 'count'])
+
+            return test_impl
+
+        test_impl = gen_test_impl()
+        hpat_func = self.jit(gen_test_impl(do_jit=True))
+
+        n, m = 1000, 300
+        np.random.seed(0)
+        S = pd.Series(gen_frand_array(n, nancount=n // 3))
+        by = np.random.choice(np.arange(m), n)
+        pd.testing.assert_frame_equal(hpat_func(S, by), test_impl(S, by), check_names=False)
+
+    def test_dataframe_groupby_cumcount(self):
+        def test_impl(df, ascending):
+            return df.groupby('A').cumcount(ascending=ascending)
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        for ascending in [True, False]:
+            with self.subTest(ascending=ascending):
+                pd.testing.assert_series_equal(hpat_func(df, ascending), test_impl(df, ascending))
+
+    def test_dataframe_groupby_cumsum(self):
+        def test_impl(df):
+            return df.groupby('A').cumsum()
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        pd.testing.assert_frame_equal(hpat_func(df), test_impl(df))
+
+    def test_dataframe_groupby_shift(self):
+        def test_impl(df, periods):
+            return df.groupby('A').shift(periods)
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        for periods in [1, 2, -1, 0, 5]:
+            with self.subTest(periods=periods):
+                pd.testing.assert_frame_equal(hpat_func(df, periods), test_impl(df, periods))
+
+    def test_dataframe_groupby_diff(self):
+        def test_impl(df, periods):
+            return df.groupby('A').diff(periods)
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        for periods in [1, 2, -1]:
+            with self.subTest(periods=periods):
+                pd.testing.assert_frame_equal(hpat_func(df, periods), test_impl(df, periods))
+
+    def test_dataframe_groupby_rank(self):
+        def gen_test_impl(method):
+            def test_impl(df, ascending, pct):
+                return df.groupby('A').rank(method=method, ascending=ascending, pct=pct)
+            return test_impl
+
+        df = pd.DataFrame({
+            'A': [2, 1, 2, 1, 2, 2, 1, 0, 3, 1, 3],
+            'B': [1, 5, 1, 5, 3, 1, -2, 0, 7, 5, 7],
+            'C': [np.nan, 2., -1.3, np.nan, 3.5, 3.5, 10, 0.42, np.nan, 2., 23],
+        })
+        for method, ascending, pct in product(['average', 'min', 'max', 'first', 'dense'],
+                                              [True, False], [True, False]):
+            with self.subTest(method=method, ascending=ascending, pct=pct):
+                test_impl = gen_test_impl(method)
+                hpat_func = self.jit(test_impl)
+                pd.testing.assert_frame_equal(hpat_func(df, ascending, pct), test_impl(df, ascending, pct))
+
+    def test_dataframe_groupby_transform(self):
+        test_impls = {
+            'count': lambda df: df.groupby('A').transform('count'),
+            'max': lambda df: df.groupby('A').transform('max'),
+            'mean': lambda df: df.groupby('A').transform('mean'),
+            'std': lambda df: df.groupby('A').transform('std'),
+            'sum': lambda df: df.groupby('A').transform('sum'),
+        }
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        for method_name, test_impl in test_impls.items():
+            with self.subTest(method=method_name):
+                hpat_func = self.jit(test_impl)
+                pd.testing.assert_frame_equal(hpat_func(df), test_impl(df))
+
+    def test_series_groupby_transformations(self):
+        test_impls = {
+            'cumcount': lambda S, by: S.groupby(by).cumcount(),
+            'cumsum': lambda S, by: S.groupby(by).cumsum(),
+            'diff': lambda S, by: S.groupby(by).diff(),
+            'rank': lambda S, by: S.groupby(by).rank(),
+            'shift': lambda S, by: S.groupby(by).shift(),
+            'transform': lambda S, by: S.groupby(by).transform('mean'),
+        }
+
+        n, m = 1000, 300
+        np.random.seed(0)
+        S = pd.Series(gen_frand_array(n, nancount=n // 3))
+        by = np.random.choice(np.arange(m), n)
+
+        for method_name, test_impl in test_impls.items():
+            with self.subTest(method=method_name):
+                hpat_func = self.jit(test_impl)
+                pd.testing.assert_series_equal(hpat_func(S, by), test_impl(S, by))
+
+    def test_series_groupby_rolling(self):
+        test_impls = {
+            'apply': lambda S, by: S.groupby(by).rolling(3).apply(lambda x: x.max() - x.min()),
+            'count': lambda S, by: S.groupby(by).rolling(3).count(),
+            'kurt': lambda S, by: S.groupby(by).rolling(5, min_periods=4).kurt(),
+            'max': lambda S, by: S.groupby(by).rolling(3, min_periods=1).max(),
+            'mean': lambda S, by: S.groupby(by).rolling(3, min_periods=1, center=True).mean(),
+            'median': lambda S, by: S.groupby(by).rolling(4, min_periods=2).median(),
+            'min': lambda S, by: S.groupby(by).rolling(3).min(),
+            'quantile': lambda S, by: S.groupby(by).rolling(4, min_periods=2).quantile(0.25),
+            'skew': lambda S, by: S.groupby(by).rolling(4).skew(),
+            'std': lambda S, by: S.groupby(by).rolling(3, min_periods=2).std(),
+            'sum': lambda S, by: S.groupby(by).rolling(2, min_periods=0).sum(),
+            'var': lambda S, by: S.groupby(by).rolling(3, min_periods=2).var(ddof=0),
+        }
+
+        n, m = 1000, 30
+        np.random.seed(0)
+        S = pd.Series(gen_frand_array(n, nancount=n // 10), name='data')
+        by = np.random.choice(np.arange(m), n).astype(np.float64)
+        by[::17] = np.nan
+
+        for method_name, test_impl in test_impls.items():
+            with self.subTest(method=method_name):
+                hpat_func = self.jit(test_impl)
+                # result is in the original order of rows instead of indexed by groups keys
+                expected = test_impl(S, by).reset_index(level=0, drop=True).reindex(S.index)
+                pd.testing.assert_series_equal(hpat_func(S, by), expected)
+
+    def test_dataframe_groupby_rolling(self):
+        def test_impl(df):
+            return df.groupby('A').rolling(2, min_periods=1).sum()
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame({col: _default_df_numeric_data[col] for col in 'ABCD'})
+        # pandas also rolls the key column, result is in the original order of rows
+        expected = test_impl(df).drop(columns='A').reset_index(level=0, drop=True).reindex(df.index)
+        pd.testing.assert_frame_equal(hpat_func(df), expected)
+
+    def test_dataframe_groupby_ngroups(self):
+        def test_impl(df):
+            return df.groupby('A').ngroups
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        self.assertEqual(hpat_func(df), test_impl(df))
+
+    def test_series_groupby_ngroups(self):
+        def test_impl(S, by):
+            return S.groupby(by).ngroups
+        hpat_func = self.jit(test_impl)
+
+        S = pd.Series(_default_df_numeric_data['D'])
+        by = np.asarray(_default_df_numeric_data['A'])
+        self.assertEqual(hpat_func(S, by), test_impl(S, by))
+
+    def test_dataframe_groupby_indices(self):
+        def test_impl(df):
+            return df.groupby('A').indices
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data)
+        result = hpat_func(df)
+        result_ref = test_impl(df)
+        self.assertEqual(sorted(result.keys()), sorted(result_ref.keys()))
+        for key in result_ref:
+            np.testing.assert_array_equal(result[key], result_ref[key])
+
+    def test_dataframe_groupby_groups(self):
+        def test_impl(df):
+            return df.groupby('A').groups
+        hpat_func = self.jit(test_impl)
+
+        df = pd.DataFrame(_default_df_numeric_data, index=np.arange(11, 0, -1))
+        result = hpat_func(df)
+        result_ref = test_impl(df)
+        self.assertEqual(sorted(result.keys()), sorted(result_ref.keys()))
+        for key in result_ref:
+            np.testing.assert_array_equal(result[key], result_ref[key])
+
     @skip_numba_jit
     def test_agg_seq(self):
         def test_impl(df):
@@ -481,7 +928,6 @@ class TestGroupBy(TestCase):
         result_ref = test_impl(df)
         pd.testing.assert_series_equal(result, result_ref, check_names=False)
 
-    @skip_numba_jit
     def test_agg_seq_as_index(self):
         def test_impl(df):
             df2 = df.groupby('A', as_index=False).mean()
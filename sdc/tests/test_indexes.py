@@ -282,6 +282,19 @@ class TestRangeIndex(TestCase):
                 result_ref = test_impl(index)
                 self.assertEqual(result, result_ref)
 
+    def test_range_index_attribute_flags(self):
+        def test_impl(*args):
+            index = pd.RangeIndex(*args)
+            return index.is_monotonic_increasing, index.is_monotonic_decreasing, index.is_unique, index.hasnans
+        sdc_func = self.jit(test_impl)
+
+        for params in _generate_valid_range_params():
+            start, stop, step = params
+            with self.subTest(start=start, stop=stop, step=step):
+                result = sdc_func(*params)
+                result_ref = test_impl(*params)
+                self.assertEqual(result, result_ref)
+
     def test_range_index_len(self):
         def test_impl(*args):
             index = pd.RangeIndex(*args)
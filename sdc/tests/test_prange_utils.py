@@ -26,7 +26,7 @@
 
 from sdc.tests.test_base import TestCase
 
-from sdc.utilities.prange_utils import get_chunks, Chunk
+from sdc.utilities.prange_utils import get_chunks, get_window_chunks, get_window_pool_size, Chunk
 
 
 class ChunkTest(TestCase):
@@ -82,3 +82,36 @@ class ChunkTest(TestCase):
         for args, expected_chunks in self._get_chunks_data():
             with self.subTest(args=args):
                 self._check_get_chunks(args, expected_chunks)
+
+    def test_get_window_pool_size(self):
+        pyfunc = get_window_pool_size
+        cfunc = self.jit(pyfunc)
+
+        # (size, window, pool_size), expected number of chunks
+        data = [
+            ((100, 0, 4), 4),
+            ((100, 1, 4), 4),
+            ((100, 10, 4), 4),
+            ((100, 34, 4), 3),
+            ((100, 51, 4), 2),
+            ((100, 100, 4), 1),
+            ((100, 1000, 4), 1),
+            ((0, 10, 4), 1),
+        ]
+        for args, expected in data:
+            with self.subTest(args=args):
+                self.assertEqual(pyfunc(*args), expected)
+                self.assertEqual(cfunc(*args), expected)
+
+    def test_get_window_chunks(self):
+        pyfunc = get_window_chunks
+        cfunc = self.jit(pyfunc)
+
+        args = (9, 4, 4)
+        expected_chunks = [
+            Chunk(start=0, stop=3),
+            Chunk(start=3, stop=6),
+            Chunk(start=6, stop=9),
+        ]
+        self.assertEqual(pyfunc(*args), expected_chunks)
+        self.assertEqual(cfunc(*args), expected_chunks)
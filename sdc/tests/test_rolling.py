@@ -35,6 +35,11 @@ from itertools import product
 import numpy as np
 import pandas as pd
 
+try:
+    import scipy
+except ImportError:
+    scipy = None
+
 from numba.core.errors import TypingError
 from sdc.hiframes.rolling import supported_rolling_funcs
 from sdc.tests.test_base import TestCase
@@ -894,6 +899,24 @@ class TestRolling(TestCase):
 
         self._test_rolling_unsupported_types(df)
 
+    def test_df_rolling_agg(self):
+        def test_impl(df, window, min_periods, center):
+            return df.rolling(window, min_periods, center).agg(['mean', 'std', 'min', 'max', 'count', 'skew'])
+
+        hpat_func = self.jit(test_impl)
+
+        all_data = test_global_input_data_float64 + [list(range(10))]
+        length = min(len(d) for d in all_data)
+        data = {n: d[:length] for n, d in zip(string.ascii_uppercase, all_data)}
+        df = pd.DataFrame(data)
+        for window, center in product(range(0, length + 2, 2), [False, True]):
+            for min_periods in range(0, window + 1, 2):
+                with self.subTest(window=window, min_periods=min_periods, center=center):
+                    jit_result = hpat_func(df, window, min_periods, center)
+                    ref_result = test_impl(df, window, min_periods, center)
+                    ref_result.columns = [f'{col}_{func}' for col, func in ref_result.columns]
+                    pd.testing.assert_frame_equal(jit_result, ref_result)
+
     def test_df_rolling_apply_mean(self):
         all_data = [
             list(range(10)), [1., -1., 0., 0.1, -0.1],
@@ -1518,6 +1541,31 @@ class TestRolling(TestCase):
         series = pd.Series(test_global_input_data_float64[0])
         self._test_rolling_unsupported_types(series)
 
+    def test_series_rolling_agg(self):
+        def test_impl(series, window, min_periods, center):
+            return series.rolling(window, min_periods, center).agg(['sum', 'var', 'max', 'min', 'kurt'])
+
+        hpat_func = self.jit(test_impl)
+
+        all_data = test_global_input_data_float64 + [list(range(10))]
+        for data in all_data:
+            series = pd.Series(data)
+            for window, center in product(range(0, len(series) + 2, 2), [False, True]):
+                for min_periods in range(0, window + 1, 2):
+                    with self.subTest(series=series, window=window, min_periods=min_periods, center=center):
+                        jit_result = hpat_func(series, window, min_periods, center)
+                        ref_result = test_impl(series, window, min_periods, center)
+                        pd.testing.assert_frame_equal(jit_result, ref_result)
+
+    def test_series_rolling_agg_single(self):
+        def test_impl(series, window):
+            return series.rolling(window).agg('mean')
+
+        hpat_func = self.jit(test_impl)
+
+        series = pd.Series(test_global_input_data_float64[0])
+        pd.testing.assert_series_equal(hpat_func(series, 3), test_impl(series, 3))
+
     def test_series_rolling_apply_mean(self):
         all_data = [
             list(range(10)), [1., -1., 0., 0.1, -0.1],
@@ -1529,6 +1577,24 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_apply_mean(series)
 
+    def test_series_rolling_apply_raw(self):
+        def test_impl(series, window, min_periods):
+            def func(x):
+                return len(x) + 10 * np.isnan(x).sum()
+
+            return series.rolling(window, min_periods).apply(func, raw=True)
+
+        hpat_func = self.jit(test_impl)
+
+        data = [1., np.nan, 2., np.inf, 3., 4., 5., np.nan, np.NINF, 6., 7., 8.]
+        series = pd.Series(data * 5, name='A')
+        for window in [0, 1, 3, 7]:
+            for min_periods in range(0, window + 1, 2):
+                with self.subTest(window=window, min_periods=min_periods):
+                    jit_result = hpat_func(series, window, min_periods)
+                    ref_result = test_impl(series, window, min_periods)
+                    pd.testing.assert_series_equal(jit_result, ref_result)
+
     def test_series_rolling_apply_unsupported_types(self):
         series = pd.Series([1., -1., 0., 0.1, -0.1])
         self._test_rolling_apply_unsupported_types(series)
@@ -1702,6 +1768,304 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_min(series)
 
+    def test_series_rolling_min_max_monotonic(self):
+        def test_impl_max(obj, window, min_periods):
+            return obj.rolling(window, min_periods).max()
+
+        def test_impl_min(obj, window, min_periods):
+            return obj.rolling(window, min_periods).min()
+
+        n = 10 ** 5
+        data = np.arange(n, dtype=np.float64)
+        data[::997] = np.nan
+        all_data = [data, data[::-1], np.repeat(data[:n // 10], 10)]
+        for test_impl in [test_impl_max, test_impl_min]:
+            hpat_func = self.jit(test_impl)
+            for data, window in product(all_data, [3, 1000, 10 ** 4, n + 1]):
+                series = pd.Series(data, name='A')
+                with self.subTest(func=test_impl.__name__, data=data, window=window):
+                    pd.testing.assert_series_equal(hpat_func(series, window, window // 2),
+                                                   test_impl(series, window, window // 2))
+
+    def test_series_rolling_median_quantile_large_window(self):
+        def test_impl_median(obj, window, min_periods):
+            return obj.rolling(window, min_periods).median()
+
+        def test_impl_quantile(obj, window, min_periods):
+            return obj.rolling(window, min_periods).quantile(0.3)
+
+        n = 10 ** 5
+        np.random.seed(0)
+        data = np.random.randint(0, 1000, n).astype(np.float64)
+        data[::997] = np.nan
+        data[::1009] = np.inf
+        for test_impl in [test_impl_median, test_impl_quantile]:
+            hpat_func = self.jit(test_impl)
+            for window in [4, 1000, n + 1]:
+                series = pd.Series(data, name='A')
+                with self.subTest(func=test_impl.__name__, window=window):
+                    pd.testing.assert_series_equal(hpat_func(series, window, window // 2),
+                                                   test_impl(series, window, window // 2))
+
+    def test_series_rolling_center(self):
+        n = 1000
+        np.random.seed(0)
+        data = np.random.randint(0, 100, n).astype(np.float64)
+        data[::7] = np.nan
+        data[::11] = np.inf
+        other = np.random.ranf(n - 5)
+        method_calls = ['count()', 'kurt()', 'max()', 'mean()', 'median()', 'min()', 'quantile(0.25)',
+                        'skew()', 'std()', 'sum()', 'var(ddof=0)', 'corr(other)', 'cov(other)']
+        for method_call in method_calls:
+            func_text = 'def impl(data, other, window, min_periods):\n'
+            func_text += '  series = pd.Series(data)\n'
+            func_text += '  other = pd.Series(other)\n'
+            func_text += f'  return series.rolling(window, min_periods, center=True).{method_call}\n'
+            loc_vars = {}
+            exec(func_text, {'pd': pd}, loc_vars)
+            test_impl = loc_vars['impl']
+            hpat_func = self.jit(test_impl)
+            for window, min_periods in [(1, 0), (4, 2), (5, None), (50, 10), (n + 2, 1)]:
+                with self.subTest(method=method_call, window=window, min_periods=min_periods):
+                    pd.testing.assert_series_equal(hpat_func(data, other, window, min_periods),
+                                                   test_impl(data, other, window, min_periods))
+
+    def test_rolling_bounds_kernel(self):
+        from sdc.datatypes.hpat_pandas_series_rolling_functions import sdc_pandas_series_rolling_sum_kernels
+
+        bounds_kernel = sdc_pandas_series_rolling_sum_kernels[1]
+
+        def test_impl(data, starts, ends, minp):
+            return bounds_kernel(data, starts, ends, minp, 0)
+        hpat_func = self.jit(test_impl)
+
+        n = 1000
+        np.random.seed(0)
+        data = np.random.ranf(n)
+        data[::7] = np.nan
+        for half_window in [0, 3, 100, n]:
+            positions = np.arange(n)
+            starts = np.maximum(positions - half_window, 0)
+            ends = np.minimum(positions + half_window + 1, n)
+            expected = np.array([np.nansum(data[s:e]) if np.count_nonzero(~np.isnan(data[s:e])) >= 2 else np.nan
+                                 for s, e in zip(starts, ends)])
+            with self.subTest(half_window=half_window):
+                np.testing.assert_allclose(hpat_func(data, starts, ends, 2), expected)
+
+    @unittest.skipIf(scipy is None, 'pandas requires scipy for weighted windows')
+    def test_series_rolling_win_type(self):
+        def test_impl(data, window, min_periods, center, win_type):
+            series = pd.Series(data)
+            rolling = series.rolling(window, min_periods, center=center, win_type=win_type)
+            return rolling.sum(), rolling.mean()
+
+        def test_impl_gaussian(data, window, center):
+            return pd.Series(data).rolling(window, center=center, win_type='gaussian').mean(std=1.5)
+
+        def test_impl_exponential(data, window, center):
+            return pd.Series(data).rolling(window, center=center, win_type='exponential').sum(tau=3.)
+
+        n = 1000
+        np.random.seed(0)
+        data = np.random.ranf(n)
+        data[::7] = np.nan
+        data[::11] = np.inf
+        hpat_func = self.jit(test_impl)
+        for window, min_periods, center, win_type in product([1, 4, 7], [None, 1], [False, True],
+                                                             ['triang', 'hamming']):
+            with self.subTest(window=window, min_periods=min_periods, center=center, win_type=win_type):
+                result, result_mean = hpat_func(data, window, min_periods, center, win_type)
+                result_ref, result_mean_ref = test_impl(data, window, min_periods, center, win_type)
+                pd.testing.assert_series_equal(result, result_ref)
+                pd.testing.assert_series_equal(result_mean, result_mean_ref)
+
+        for func in [test_impl_gaussian, test_impl_exponential]:
+            hpat_func = self.jit(func)
+            for window, center in product([1, 6], [False, True]):
+                with self.subTest(func=func.__name__, window=window, center=center):
+                    pd.testing.assert_series_equal(hpat_func(data, window, center), func(data, window, center))
+
+    def test_series_rolling_win_type_unsupported(self):
+        def test_impl(data):
+            return pd.Series(data).rolling(3, win_type='boxcar').sum()
+
+        with self.assertRaises(ValueError) as raises:
+            self.jit(test_impl)(np.arange(5.))
+        self.assertIn('Invalid win_type', str(raises.exception))
+
+        with self.assertRaises(TypingError):
+            self.jit(lambda data: pd.Series(data).rolling(3, win_type='triang').max())(np.arange(5.))
+
+    def test_df_rolling_center(self):
+        def test_impl(df):
+            return df.rolling(4, center=True).mean()
+
+        def test_impl_win_type(df):
+            return df.rolling(5, center=True, win_type='triang').sum()
+
+        n = 100
+        np.random.seed(0)
+        df = pd.DataFrame({'A': np.random.ranf(n), 'B': np.arange(n, dtype=np.float64)})
+        funcs = [test_impl] if scipy is None else [test_impl, test_impl_win_type]
+        for func in funcs:
+            with self.subTest(func=func.__name__):
+                pd.testing.assert_frame_equal(self.jit(func)(df), func(df))
+
+    def test_series_rolling_offset(self):
+        n = 1000
+        np.random.seed(0)
+        data = np.random.randint(0, 100, n).astype(np.float64)
+        data[::7] = np.nan
+        data[::11] = np.inf
+        seconds = np.sort(np.random.randint(0, 3 * n, n))
+        times = (np.datetime64('2020-01-01', 'ns') + seconds * 10 ** 9).astype('datetime64[ns]')
+        for method_name in ['kurt', 'max', 'mean', 'median', 'min', 'skew', 'std', 'sum', 'var']:
+            func_text = 'def impl(data, times, window, closed):\n'
+            func_text += f'  return pd.Series(data, times).rolling(window, closed=closed).{method_name}()\n'
+            loc_vars = {}
+            exec(func_text, {'pd': pd}, loc_vars)
+            test_impl = loc_vars['impl']
+            hpat_func = self.jit(test_impl)
+            for window, closed in product(['5min', '10s', '1s', 'H'], ['right', 'left', 'both', 'neither']):
+                with self.subTest(method=method_name, window=window, closed=closed):
+                    pd.testing.assert_series_equal(hpat_func(data, times, window, closed),
+                                                   test_impl(data, times, window, closed))
+
+    def test_series_rolling_offset_unsupported(self):
+        def test_impl(data, times):
+            return pd.Series(data, times).rolling('5min').sum()
+
+        hpat_func = self.jit(test_impl)
+        times = np.array(['2020-01-01T00:01', '2020-01-01T00:00'], dtype='datetime64[ns]')
+        with self.assertRaises(ValueError) as raises:
+            hpat_func(np.arange(2.), times)
+        self.assertIn('index must be monotonic', str(raises.exception))
+
+        with self.assertRaises(TypingError):
+            self.jit(lambda data: pd.Series(data).rolling('5min').sum())(np.arange(2.))
+
+    def test_df_rolling_offset_on(self):
+        def test_impl(df):
+            return df.rolling('2s', on='ts', closed='left').sum()
+
+        def test_impl_minp(df):
+            return df.rolling('3s', min_periods=2, on='ts').max()
+
+        n = 1000
+        np.random.seed(0)
+        milliseconds = np.sort(np.random.randint(0, 500 * n, n))
+        df = pd.DataFrame({
+            'A': np.random.ranf(n),
+            'ts': (np.datetime64('2020-01-01', 'ns') + milliseconds * 10 ** 6).astype('datetime64[ns]'),
+            'B': np.random.randint(0, 100, n).astype(np.float64),
+        })
+        for func in [test_impl, test_impl_minp]:
+            with self.subTest(func=func.__name__):
+                pd.testing.assert_frame_equal(self.jit(func)(df), func(df))
+
+    def test_series_expanding(self):
+        n = 1000
+        np.random.seed(0)
+        data = np.random.randint(0, 100, n).astype(np.float64)
+        data[::7] = np.nan
+        data[::11] = np.inf
+        other = np.random.ranf(n - 5)
+        method_calls = ['mean()', 'sum()', 'var()', 'std(ddof=0)', 'corr(other)', 'cov(other)']
+        for method_call in method_calls:
+            func_text = 'def impl(data, other, min_periods):\n'
+            func_text += '  series = pd.Series(data)\n'
+            func_text += '  other = pd.Series(other)\n'
+            func_text += f'  return series.expanding(min_periods).{method_call}\n'
+            loc_vars = {}
+            exec(func_text, {'pd': pd}, loc_vars)
+            test_impl = loc_vars['impl']
+            hpat_func = self.jit(test_impl)
+            for min_periods in [0, 1, 10, n + 1]:
+                with self.subTest(method=method_call, min_periods=min_periods):
+                    pd.testing.assert_series_equal(hpat_func(data, other, min_periods),
+                                                   test_impl(data, other, min_periods))
+
+    def test_series_expanding_var_large_offset(self):
+        """Verifies expanding var/std don't lose precision on values with large common offset"""
+        def test_impl(series):
+            return series.expanding().var(), series.expanding().std()
+        hpat_func = self.jit(test_impl)
+
+        n = 10000
+        np.random.seed(0)
+        series = pd.Series(1e9 + np.random.ranf(n))
+        for result, result_ref in zip(hpat_func(series), test_impl(series)):
+            np.testing.assert_allclose(result.values, result_ref.values, rtol=1e-6)
+
+    def test_df_expanding(self):
+        def test_impl(df):
+            return df.expanding(2).mean()
+
+        def test_impl_cov(df, other):
+            return df.expanding().cov(other)
+
+        def test_impl_corr(df):
+            return df.expanding().corr(pairwise=False)
+
+        n = 100
+        np.random.seed(0)
+        df = pd.DataFrame({'A': np.random.ranf(n), 'B': np.arange(n, dtype=np.float64)})
+        other = pd.DataFrame({'B': np.random.ranf(n - 5), 'C': np.random.ranf(n - 5)})
+        pd.testing.assert_frame_equal(self.jit(test_impl)(df), test_impl(df))
+        pd.testing.assert_frame_equal(self.jit(test_impl_cov)(df, other), test_impl_cov(df, other))
+        pd.testing.assert_frame_equal(self.jit(test_impl_corr)(df), test_impl_corr(df))
+
+    def test_series_ewm(self):
+        n = 1000
+        np.random.seed(0)
+        data = np.random.randint(0, 100, n).astype(np.float64)
+        data[::7] = np.nan
+        data[::11] = np.inf
+        other = np.random.ranf(n - 5)
+        method_calls = ['mean()', 'var()', 'std(bias=True)', 'corr(other)', 'cov(other)']
+        decays = ['com=0.5', 'span=10', 'halflife=3', 'alpha=1']
+        for method_call, decay in product(method_calls, decays):
+            func_text = 'def impl(data, other, min_periods, adjust, ignore_na):\n'
+            func_text += '  series = pd.Series(data)\n'
+            func_text += '  other = pd.Series(other)\n'
+            func_text += f'  ewm = series.ewm({decay}, min_periods=min_periods, adjust=adjust, ignore_na=ignore_na)\n'
+            func_text += f'  return ewm.{method_call}\n'
+            loc_vars = {}
+            exec(func_text, {'pd': pd}, loc_vars)
+            test_impl = loc_vars['impl']
+            hpat_func = self.jit(test_impl)
+            for min_periods, adjust, ignore_na in product([0, 10], [True, False], [True, False]):
+                with self.subTest(method=method_call, decay=decay, min_periods=min_periods,
+                                  adjust=adjust, ignore_na=ignore_na):
+                    args = (data, other, min_periods, adjust, ignore_na)
+                    pd.testing.assert_series_equal(hpat_func(*args), test_impl(*args))
+
+    def test_series_ewm_unsupported(self):
+        def test_impl(data):
+            return pd.Series(data).ewm(com=0.5, span=10).mean()
+
+        with self.assertRaises(ValueError) as raises:
+            self.jit(test_impl)(np.arange(10.))
+        self.assertIn('mutually exclusive', str(raises.exception))
+
+    def test_df_ewm(self):
+        def test_impl(df):
+            return df.ewm(span=5, min_periods=3).mean()
+
+        def test_impl_cov(df, other):
+            return df.ewm(alpha=0.3, adjust=False).cov(other)
+
+        def test_impl_corr(df):
+            return df.ewm(com=2).corr(pairwise=False)
+
+        n = 100
+        np.random.seed(0)
+        df = pd.DataFrame({'A': np.random.ranf(n), 'B': np.arange(n, dtype=np.float64)})
+        other = pd.DataFrame({'B': np.random.ranf(n - 5), 'C': np.random.ranf(n - 5)})
+        pd.testing.assert_frame_equal(self.jit(test_impl)(df), test_impl(df))
+        pd.testing.assert_frame_equal(self.jit(test_impl_cov)(df, other), test_impl_cov(df, other))
+        pd.testing.assert_frame_equal(self.jit(test_impl_corr)(df), test_impl_corr(df))
+
     def test_series_rolling_quantile(self):
         all_data = [
             list(range(10)), [1., -1., 0., 0.1, -0.1],
@@ -1765,6 +2129,34 @@ class TestRolling(TestCase):
             series = pd.Series(data, index, name='A')
             self._test_rolling_var(series)
 
+    def test_series_rolling_moments_price_level(self):
+        def test_impl(series, window):
+            rolling = series.rolling(window)
+            return rolling.var(), rolling.std(), rolling.skew(), rolling.kurt()
+
+        def moments_ref(data, window):
+            var, std, skew, kurt = (np.full(len(data), np.nan) for _ in range(4))
+            for i in range(window - 1, len(data)):
+                values = data[i + 1 - window:i + 1]
+                n = len(values)
+                deviations = values - values.mean()
+                m2, m3, m4 = ((deviations ** k).mean() for k in (2, 3, 4))
+                var[i] = values.var(ddof=1)
+                std[i] = values.std(ddof=1)
+                skew[i] = np.sqrt(n * (n - 1)) / (n - 2) * m3 / m2 ** 1.5
+                kurt[i] = ((n * n - 1) * m4 / m2 ** 2 - 3 * (n - 1) ** 2) / ((n - 2) * (n - 3))
+            return var, std, skew, kurt
+
+        hpat_func = self.jit(test_impl)
+
+        np.random.seed(0)
+        # values about 1e5 with tiny variance lose all the digits of raw power sums
+        data = 1e5 + np.random.randn(1000) * 1e-3
+        window = 20
+        jit_results = hpat_func(pd.Series(data), window)
+        for jit_result, ref_result in zip(jit_results, moments_ref(data, window)):
+            np.testing.assert_allclose(jit_result.values, ref_result, rtol=1e-4, atol=1e-4)
+
     def test_series_rolling_var_exception_unsupported_ddof(self):
         series = pd.Series([1., -1., 0., 0.1, -0.1])
         self._test_rolling_var_exception_unsupported_ddof(series)
@@ -214,6 +214,32 @@ class TestArrays(TestCase):
             with self.subTest(case=data):
                 np.testing.assert_array_equal(sdc_func(a), ref_impl(a))
 
+    def test_array_equal(self):
+        def ref_impl(a, b):
+            return np.array_equal(a, b)
+
+        def sdc_impl(a, b):
+            return numpy_like.array_equal(a, b)
+
+        sdc_func = self.jit(sdc_impl)
+
+        a = np.arange(10, dtype=np.int64)
+        cases = [
+            np.arange(10, dtype=np.int64),
+            np.arange(10, dtype=np.float64),
+            np.arange(1, 11),
+            np.arange(9),
+            np.array([0, 1, 2, 3, 4, 42, 6, 7, 8, 9]),
+            np.array([42, 1, 2, 3, 4, 5, 6, 7, 8, 9]),
+            np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 42]),
+        ]
+        for b in cases:
+            with self.subTest(b=b):
+                self.assertEqual(sdc_func(a, b), ref_impl(a, b))
+
+        empty = np.empty(0, dtype=np.int64)
+        self.assertEqual(sdc_func(empty, empty), ref_impl(empty, empty))
+
     def test_copy_int(self):
         def ref_impl():
             a = np.array([5, 2, 0, 333, -4])
@@ -369,6 +395,61 @@ class TestArrays(TestCase):
             with self.subTest(data=case):
                 np.testing.assert_array_equal(ref_impl(array0), sdc_func(array1))
 
+    def test_parallel_argsort(self):
+        np.random.seed(0)
+
+        def ref_impl(a, ascending):
+            # unlike Series.sort_values, DataFrame.sort_values by single column with mergesort is stable
+            # in both directions and places NaNs last
+            return pd.DataFrame({'a': a}).sort_values('a', ascending=ascending, kind='mergesort').index.values
+
+        def sdc_impl(a, ascending):
+            return sort.parallel_argsort(a, ascending)
+
+        sdc_func = self.jit(sdc_impl)
+
+        float_array = np.random.randint(0, 20, 10**3).astype(np.float64)
+        float_array[::7] = np.nan
+        int_arryay = np.random.randint(0, 127, 10**3)
+
+        cases = [float_array.astype(case) for case in ['float32', 'float64']]
+        int_cases = ['int8', 'uint8', 'int16', 'uint16', 'int32', 'uint32', 'int64', 'uint64']
+        cases += [int_arryay.astype(case) for case in int_cases]
+        for array, ascending in product(cases, [True, False]):
+            with self.subTest(data=array.dtype, ascending=ascending):
+                np.testing.assert_array_equal(ref_impl(array, ascending), sdc_func(array, ascending))
+
+    def test_parallel_radix_argsort(self):
+        np.random.seed(0)
+
+        def ref_impl(a, ascending):
+            # unlike Series.sort_values, DataFrame.sort_values by single column with mergesort is stable
+            # in both directions and places NaNs and NaTs last
+            return pd.DataFrame({'a': a}).sort_values('a', ascending=ascending, kind='mergesort').index.values
+
+        def sdc_impl(a, ascending):
+            return sort.parallel_radix_argsort(a, ascending)
+
+        sdc_func = self.jit(sdc_impl)
+
+        float_array = np.random.randint(-20, 20, 10**4).astype(np.float64)
+        float_array[::7] = np.nan
+        float_array[::11] = -0.
+        float_array[::13] = -np.inf
+        int_arryay = np.random.randint(-128, 127, 10**4)
+        datetime_array = np.random.randint(-10**6, 10**6, 10**4).astype('datetime64[ns]')
+        datetime_array[::5] = np.datetime64('NaT')
+
+        cases = [float_array.astype(case) for case in ['float32', 'float64']]
+        int_cases = ['int8', 'int16', 'int32', 'int64']
+        cases += [int_arryay.astype(case) for case in int_cases]
+        uint_cases = ['uint8', 'uint16', 'uint32', 'uint64']
+        cases += [np.abs(int_arryay).astype(case) for case in uint_cases]
+        cases += [datetime_array, np.random.randint(0, 1 << 40, 10**4)]
+        for array, ascending in product(cases, [True, False]):
+            with self.subTest(data=array.dtype, ascending=ascending):
+                np.testing.assert_array_equal(ref_impl(array, ascending), sdc_func(array, ascending))
+
     def _test_fillna_numeric(self, pyfunc, cfunc, inplace):
         data_to_test = [
             [True, False, False, True, True],
@@ -503,6 +503,42 @@ class TestSeries(
         S = pd.Series(np.arange(n))
         self.assertEqual(hpat_func(S), test_impl(S))
 
+    def test_series_getattr_is_monotonic(self):
+        """Verifies getting Series attributes is_monotonic_increasing and is_monotonic_decreasing"""
+        def test_impl(S):
+            return S.is_monotonic_increasing, S.is_monotonic_decreasing, S.is_monotonic
+        hpat_func = self.jit(test_impl)
+
+        n = 1001
+        for data in [np.arange(n), np.arange(n)[::-1], np.ones(n), np.sort(np.random.ranf(n)),
+                     np.random.ranf(n), [1., np.nan, 2.], [2., 1., np.nan], [np.nan], [1], [],
+                     ['a', 'b', 'b', 'c'], ['c', 'b', 'a'], ['a', 'c', 'b']]:
+            S = pd.Series(data)
+            with self.subTest(S=S):
+                self.assertEqual(hpat_func(S), test_impl(S))
+
+    def test_series_getattr_is_unique(self):
+        """Verifies getting Series attribute is_unique"""
+        def test_impl(S):
+            return S.is_unique
+        hpat_func = self.jit(test_impl)
+
+        for data in [np.arange(11), [1, 2, 1], [1., np.nan, 2.], [np.nan, 1., np.nan], ['a', 'b', 'a']]:
+            S = pd.Series(data)
+            with self.subTest(S=S):
+                self.assertEqual(hpat_func(S), test_impl(S))
+
+    def test_series_getattr_hasnans(self):
+        """Verifies getting Series attribute hasnans"""
+        def test_impl(S):
+            return S.hasnans
+        hpat_func = self.jit(test_impl)
+
+        for data in [np.arange(11), [1., np.nan, 2.], np.ones(1001), ['a', None, 'b'], ['a', 'b']]:
+            S = pd.Series(data)
+            with self.subTest(S=S):
+                self.assertEqual(hpat_func(S), test_impl(S))
+
     def test_series_getattr_T(self):
         """Verifies getting Series attribute T is supported"""
         def test_impl(S):
@@ -1183,6 +1219,20 @@ class TestSeries(
         for n in cases:
             pd.testing.assert_series_equal(hpat_func(S, n), test_impl(S, n))
 
+    def test_series_loc_array_duplicates(self):
+        def test_impl(A, n):
+            return A.loc[n]
+        hpat_func = self.jit(test_impl)
+
+        series_and_labels = [
+            (pd.Series([1., 2., 4., np.nan, 6., 0.], [5, 2, 4, 5, 6, 2], name='A'), [2, 6, 5, 2]),
+            (pd.Series(['a', 'b', '', 'c', None], ['1', '3', '5', '3', '1'], name='A'), ['3', '5', '1']),
+            (pd.Series([3, 7, 1, 2, 9], name='A'), [4, 0, 0, 2]),
+        ]
+        for S, n in series_and_labels:
+            with self.subTest(series=S, labels=n):
+                pd.testing.assert_series_equal(hpat_func(S, n), test_impl(S, n))
+
     def test_series_at_str(self):
         def test_impl(A):
             return A.at['1']
@@ -4076,6 +4126,85 @@ class TestSeries(
                             np.testing.assert_array_equal(ref_result.data, jit_result.data)
                             self.assertEqual(ref, jit)
 
+    def test_series_sort_values_large(self):
+        """Verifies Series.sort_values on arrays large enough to use parallel argsort"""
+        def test_impl(S, ascending, na_position):
+            return S.sort_values(ascending=ascending, kind='mergesort', na_position=na_position)
+        hpat_func = self.jit(test_impl)
+
+        n = 1 << 17
+        np.random.seed(0)
+        float_data = np.random.randint(0, 100, n).astype(np.float64)
+        float_data[np.random.randint(0, n, 1000)] = np.nan
+        data_to_test = [float_data, np.random.randint(-100, 100, n)]
+        for data in data_to_test:
+            S = pd.Series(data)
+            for ascending, na_position in product([True, False], ['first', 'last']):
+                with self.subTest(dtype=data.dtype, ascending=ascending, na_position=na_position):
+                    pd.testing.assert_series_equal(hpat_func(S, ascending, na_position),
+                                                   test_impl(S, ascending, na_position))
+
+    def test_series_sort_values_radix(self):
+        def test_impl(S, ascending, na_position):
+            return S.sort_values(ascending=ascending, kind='radix', na_position=na_position)
+
+        def ref_impl(S, ascending, na_position):
+            return S.sort_values(ascending=ascending, kind='mergesort', na_position=na_position)
+        hpat_func = self.jit(test_impl)
+
+        n = 1011
+        np.random.seed(0)
+        float_data = np.random.randint(0, 100, n).astype(np.float64)
+        float_data[::9] = np.nan
+        data_to_test = [float_data, np.random.randint(-100, 100, n), np.random.randint(0, 1 << 40, n)]
+        for data in data_to_test:
+            S = pd.Series(data)
+            for ascending, na_position in product([True, False], ['first', 'last']):
+                with self.subTest(data=data, ascending=ascending, na_position=na_position):
+                    pd.testing.assert_series_equal(hpat_func(S, ascending, na_position),
+                                                   ref_impl(S, ascending, na_position))
+
+    def test_series_argsort_radix(self):
+        def test_impl(S):
+            return S.argsort(kind='radix')
+
+        def ref_impl(S):
+            return S.argsort(kind='mergesort')
+        hpat_func = self.jit(test_impl)
+
+        np.random.seed(0)
+        data = np.random.randint(0, 100, 1011).astype(np.float64)
+        data[::9] = np.nan
+        for S in [pd.Series(data), pd.Series(np.random.randint(-9, 9, 1011))]:
+            with self.subTest(dtype=S.dtype):
+                pd.testing.assert_series_equal(hpat_func(S), ref_impl(S))
+
+    def test_series_argsort_nlargest_nsmallest_large(self):
+        def test_impl_argsort(S):
+            return S.argsort()
+
+        def ref_impl_argsort(S):
+            # parallel argsort is stable, while default quicksort does not define the order of equal values
+            return S.argsort(kind='mergesort')
+
+        def test_impl_nlargest(S):
+            return S.nlargest(100)
+
+        def test_impl_nsmallest(S):
+            return S.nsmallest(100)
+
+        n = 1 << 17
+        np.random.seed(0)
+        data = np.random.randint(0, 1000, n).astype(np.float64)
+        data[np.random.randint(0, n, 1000)] = np.nan
+        S = pd.Series(data)
+        cases = [(test_impl_argsort, ref_impl_argsort), (test_impl_nlargest, test_impl_nlargest),
+                 (test_impl_nsmallest, test_impl_nsmallest)]
+        for test_impl, ref_impl in cases:
+            hpat_func = self.jit(test_impl)
+            with self.subTest(func=test_impl.__name__):
+                pd.testing.assert_series_equal(hpat_func(S), ref_impl(S))
+
     @skip_numba_jit
     def test_series_sort_values_parallel1(self):
         # create `kde.parquet` file
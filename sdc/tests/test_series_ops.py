@@ -81,7 +81,7 @@ class TestSeries_ops(TestCase):
                 with self.subTest(left=data_left, right=data_right, operator=operator):
                     S1 = pd.Series(data_left)
                     S2 = pd.Series(data_right)
-                    # check_dtype=False because SDC implementation always returns float64 Series
+                    # check_dtype=False because SDC returns float64 for integer Series that can be aligned with NaNs
                     pd.testing.assert_series_equal(hpat_func(S1, S2), test_impl(S1, S2), check_dtype=False)
 
     def test_series_operators_int_scalar(self):
@@ -108,7 +108,7 @@ class TestSeries_ops(TestCase):
                     right = abs(right)
 
                 with self.subTest(left=left, right=right, operator=operator):
-                    # check_dtype=False because SDC implementation always returns float64 Series
+                    # check_dtype=False because SDC returns float64 for integer division, modulo and power
                     pd.testing.assert_series_equal(hpat_func(left, right), test_impl(left, right), check_dtype=False)
 
     def test_series_operators_float(self):
@@ -127,8 +127,7 @@ class TestSeries_ops(TestCase):
                 with self.subTest(left=data_left, right=data_right, operator=operator):
                     S1 = pd.Series(data_left)
                     S2 = pd.Series(data_right)
-                    # check_dtype=False because SDC implementation always returns float64 Series
-                    pd.testing.assert_series_equal(hpat_func(S1, S2), test_impl(S1, S2), check_dtype=False)
+                    pd.testing.assert_series_equal(hpat_func(S1, S2), test_impl(S1, S2))
 
     def test_series_operators_float_scalar(self):
         """Verifies using all various Series arithmetic binary operators
@@ -148,7 +147,86 @@ class TestSeries_ops(TestCase):
                 S = pd.Series(data)
                 left, right = (S, scalar) if swap_operands else (scalar, S)
                 with self.subTest(left=left, right=right, operator=operator):
-                    pd.testing.assert_series_equal(hpat_func(S, scalar), test_impl(S, scalar), check_dtype=False)
+                    pd.testing.assert_series_equal(hpat_func(S, scalar), test_impl(S, scalar))
+
+    def test_series_operators_narrow_dtypes(self):
+        """Verifies that arithmetic binary operators keep dtypes of operands by numpy promotion rules"""
+        def test_impl(S1, S2):
+            return S1.add(S2, fill_value=0), S1.mul(S2), S1 - S2, S1 * 2
+        hpat_func = self.jit(test_impl)
+
+        n = 11
+        data_to_test = [
+            (np.arange(n, dtype=np.float32), np.ones(n, dtype=np.float32)),
+            (np.arange(n, dtype=np.int32), np.full(n, 3, dtype=np.int32)),
+            (np.arange(n, dtype=np.int16), np.arange(n, dtype=np.float32)),
+        ]
+        for data_left, data_right in data_to_test:
+            S1, S2 = pd.Series(data_left), pd.Series(data_right)
+            with self.subTest(left=S1.dtype, right=S2.dtype):
+                result, result_ref = hpat_func(S1, S2), test_impl(S1, S2)
+                # results of integer Series without fill_value are float64, since they can be aligned with NaNs
+                pd.testing.assert_series_equal(result[0], result_ref[0])
+                pd.testing.assert_series_equal(result[1], result_ref[1], check_dtype=S1.dtype.kind == 'f')
+                pd.testing.assert_series_equal(result[2], result_ref[2], check_dtype=S1.dtype.kind == 'f')
+                # integer Series are promoted to int64 by int scalar, since its value is unknown at compile time
+                pd.testing.assert_series_equal(result[3], result_ref[3], check_dtype=S1.dtype.kind == 'f')
+                if S1.dtype.kind == 'i':
+                    self.assertEqual(result[3].dtype, np.int64)
+
+    def test_series_operators_int_scalar_out_of_range(self):
+        """Verifies that integer scalars not fitting into integer Series dtype are not truncated"""
+        def test_impl(S, value):
+            return S + value, S.mul(value), S.sub(2, fill_value=value), S.add(S, fill_value=value)
+        hpat_func = self.jit(test_impl)
+
+        n = 11
+        for dtype, value in product([np.int8, np.int32, np.uint8, np.uint32], [1000, 2 ** 40, -2 ** 40]):
+            S = pd.Series(np.arange(n, dtype=dtype))
+            # reference is computed for int64 Series, since pandas promotes by scalar value, not by its type
+            S_ref = S.astype(np.int64)
+            with self.subTest(dtype=dtype, value=value):
+                result, result_ref = hpat_func(S, value), test_impl(S_ref, value)
+                for res, ref in zip(result, result_ref):
+                    pd.testing.assert_series_equal(res, ref, check_dtype=True)
+
+    def test_series_operators_fused_expr(self):
+        """Verifies chains of operators on Series with default index, which are evaluated in a single loop"""
+        def test_impl(S1, S2, S3, S4, S5):
+            return (S1 * S2 + S3) / S4 - S5 // 2 + 2 ** S1 % 7
+
+        hpat_func = self.jit(test_impl)
+
+        n = 17
+        for dtype in [np.float64, np.float32, np.int64, np.int32]:
+            series = [pd.Series(np.arange(k, n + k, dtype=dtype)) for k in range(1, 6)]
+            with self.subTest(dtype=dtype):
+                pd.testing.assert_series_equal(hpat_func(*series), test_impl(*series))
+
+    def test_series_operators_fused_expr_scalars(self):
+        """Verifies name and index of Series computed by a chain of operators with scalars are preserved"""
+        def test_impl(S, a, b):
+            return (S * a + b) ** 2 - a
+
+        hpat_func = self.jit(test_impl)
+
+        n = 11
+        for dtype in [np.float64, np.int64]:
+            S = pd.Series(np.arange(n, dtype=dtype), name='A')
+            with self.subTest(dtype=dtype):
+                pd.testing.assert_series_equal(hpat_func(S, 3, 0.5), test_impl(S, 3, 0.5))
+
+    def test_series_operators_fused_expr_different_sizes(self):
+        """Verifies chains of operators on Series of different lengths are aligned as separate operators"""
+        def test_impl(S1, S2, S3):
+            return S1 + S2 * S3
+
+        hpat_func = self.jit(test_impl)
+
+        S1 = pd.Series(np.arange(7, dtype=np.float64))
+        S2 = pd.Series(np.arange(5, dtype=np.float64))
+        S3 = pd.Series(np.arange(9, dtype=np.float64))
+        pd.testing.assert_series_equal(hpat_func(S1, S2, S3), test_impl(S1, S2, S3))
 
     @skip_numba_jit('Not implemented in new-pipeline yet')
     def test_series_operators_inplace(self):
@@ -461,6 +539,25 @@ class TestSeries_ops(TestCase):
         B = pd.Series(np.random.ranf(n), index=index2)
         pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B), check_dtype=False, check_names=False)
 
+    def test_series_operator_add_align_index_sorted(self):
+        """Verifies implementation of Series.operator.add and alignment of sorted and unsorted numeric indexes"""
+        def test_impl(A, B):
+            return A + B
+        hpat_func = self.jit(test_impl)
+
+        n = 1000
+        np.random.seed(0)
+        sorted_index1 = np.sort(np.random.randint(-100, 100, n))
+        sorted_index2 = np.sort(np.random.randint(-50, 150, n)).astype(np.float64)
+        indexes_to_test = [(sorted_index1, sorted_index2),
+                           (sorted_index1, np.random.permutation(sorted_index2)),
+                           (np.random.permutation(sorted_index1), sorted_index2)]
+        for index1, index2 in indexes_to_test:
+            A = pd.Series(np.random.ranf(n), index=index1)
+            B = pd.Series(np.random.ranf(n), index=index2)
+            with self.subTest(index1=index1, index2=index2):
+                pd.testing.assert_series_equal(hpat_func(A, B), test_impl(A, B), check_names=False)
+
     def test_series_operator_add_align_index_str_capacity(self):
         """Verifies implementation of Series.operator.add and alignment of string indexes of large size"""
         def test_impl(A, B):
@@ -202,3 +202,9 @@ class TestDFGroupByMethods(TestBase):
                                      usecase_name='by_str_mean',
                                      input_data=[gen_strlist(n_groups_default, 3, 'abcdef')],
                                      groupby_params={'sort': 'False'})
+
+    def test_df_groupby_sum_high_cardinality(self):
+        self._test_df_groupby_method('sum',
+                                     usecase_name='high_cardinality_sum',
+                                     input_data=[numpy.arange(10 ** 5)],
+                                     groupby_params={'sort': 'False'})
@@ -91,15 +91,18 @@ class TestSeriesRollingMethods(TestBase):
             'kurt': (100, [8 * 10 ** 5]),
             'max': (100, [4 * 10 ** 5]),
             'mean': (100, [8 * 10 ** 5]),
+            'median': (100, [4 * 10 ** 5]),
             'min': (100, [4 * 10 ** 5]),
+            'quantile': (100, [4 * 10 ** 5]),
             'skew': (100, [8 * 10 ** 5]),
             'sum': (100, [8 * 10 ** 5]),
             'std': (100, [8 * 10 ** 5]),
             'var': (100, [8 * 10 ** 5]),
         }
 
-    def _test_case(self, pyfunc, name, total_data_length, input_data=None, data_num=1, data_gens=None):
-        test_name = 'Series.rolling.{}'.format(name)
+    def _test_case(self, pyfunc, name, total_data_length, input_data=None, data_num=1, data_gens=None,
+                   test_name=None):
+        test_name = test_name or 'Series.rolling.{}'.format(name)
 
         data_num = len(data_gens) if data_gens is not None else data_num
         default_data_gens = [gen_series] * data_num
@@ -128,6 +131,22 @@ class TestSeriesRollingMethods(TestBase):
             data_num += len(extra_usecase_params.split(', '))
         self._test_case(usecase, name, total_data_length, data_num=data_num)
 
+    def _test_series_rolling_price_method(self, name):
+        """Test rolling method over price-level data: large values with tiny variance"""
+        ncalls, total_data_length = self.map_ncalls_dlength[name]
+        usecase = gen_series_rolling_usecase(name, ncalls=ncalls)
+        input_data = [1e5 + np.linspace(-1e-2, 1e-2, 1001)]
+        self._test_case(usecase, name, total_data_length, input_data=input_data,
+                        test_name='Series.rolling.{}.price'.format(name))
+
+    def _test_series_rolling_large_window_method(self, name, method_params=''):
+        """Test rolling method over windows much larger than the default one, split into parallel chunks"""
+        ncalls, total_data_length = self.map_ncalls_dlength[name]
+        usecase = gen_series_rolling_usecase(name, rolling_params=get_rolling_params(window=5000),
+                                             method_params=method_params, ncalls=ncalls)
+        self._test_case(usecase, name, total_data_length,
+                        test_name='Series.rolling.{}.large_window'.format(name))
+
     def test_series_rolling_corr(self):
         self._test_series_rolling_method('corr', extra_usecase_params='other',
                                          method_params='other=other')
@@ -142,27 +161,45 @@ class TestSeriesRollingMethods(TestBase):
     def test_series_rolling_kurt(self):
         self._test_series_rolling_method('kurt')
 
+    def test_series_rolling_kurt_price(self):
+        self._test_series_rolling_price_method('kurt')
+
     def test_series_rolling_max(self):
         self._test_series_rolling_method('max')
 
     def test_series_rolling_mean(self):
         self._test_series_rolling_method('mean')
 
+    def test_series_rolling_median_large_window(self):
+        self._test_series_rolling_large_window_method('median')
+
     def test_series_rolling_min(self):
         self._test_series_rolling_method('min')
 
+    def test_series_rolling_quantile_large_window(self):
+        self._test_series_rolling_large_window_method('quantile', method_params='0.2')
+
     def test_series_rolling_skew(self):
         self._test_series_rolling_method('skew')
 
+    def test_series_rolling_skew_price(self):
+        self._test_series_rolling_price_method('skew')
+
     def test_series_rolling_sum(self):
         self._test_series_rolling_method('sum')
 
     def test_series_rolling_std(self):
         self._test_series_rolling_method('std')
 
+    def test_series_rolling_std_price(self):
+        self._test_series_rolling_price_method('std')
+
     def test_series_rolling_var(self):
         self._test_series_rolling_method('var')
 
+    def test_series_rolling_var_price(self):
+        self._test_series_rolling_price_method('var')
+
 
 cases = [
     TC(name='apply', size=[10 ** 7], params='func=lambda x: np.nan if len(x) == 0 else x.mean()'),
@@ -67,3 +67,28 @@ def get_chunks(size, pool_size):
 @sdc_register_jitable
 def parallel_chunks(size):
     return get_chunks(size, get_pool_size())
+
+
+@sdc_register_jitable
+def get_window_pool_size(size, window, pool_size):
+    """
+    Number of chunks to split data of the given size for rolling windows of fixed size.
+    Each chunk recomputes a prelude of up to window - 1 values preceding it, so the number of chunks
+    is reduced until every chunk is at least as long as its prelude, i.e. the redundant work
+    never exceeds the useful one.
+    """
+    prelude = window - 1
+    if prelude < 1:
+        return pool_size
+
+    return max(1, min(pool_size, size // prelude))
+
+
+@sdc_register_jitable
+def get_window_chunks(size, window, pool_size):
+    return get_chunks(size, get_window_pool_size(size, window, pool_size))
+
+
+@sdc_register_jitable
+def parallel_window_chunks(size, window):
+    return get_window_chunks(size, window, get_pool_size())
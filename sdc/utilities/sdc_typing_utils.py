@@ -125,6 +125,24 @@ def has_python_value(var, value):
         return var == value
 
 
+def literal_func_names(func):
+    """Returns name of aggregation function or tuple of names if func is a sequence of them,
+    None is returned if func is not a literal"""
+    if isinstance(func, str):
+        return func
+
+    if isinstance(func, types.StringLiteral):
+        return func.literal_value
+
+    if isinstance(func, types.BaseTuple) and all(isinstance(a, types.StringLiteral) for a in func):
+        return tuple(a.literal_value for a in func)
+
+    if isinstance(func, types.List) and getattr(func, 'initial_value', None) is not None:
+        return tuple(func.initial_value)
+
+    return None
+
+
 def check_is_numeric_array(type_var):
     """Used during typing to check that type_var is a numeric numpy arrays"""
     return check_is_array_of_dtype(type_var, types.Number)
@@ -176,6 +194,44 @@ def find_common_dtype_from_numpy_dtypes(array_types, scalar_types):
     return numba_common_dtype
 
 
+def find_operator_result_dtype(op, left, right, fill_value=None):
+    """
+    Used to find numba dtype of the result of op applied to operands, each being series or scalar,
+    by numpy promotion rules, e.g. float32 series multiplied by float scalar is float32 series.
+    Integer scalars promote integer series by their type (or value if it is literal), so that the result
+    holds them, e.g. int8 series plus int64 scalar is int64 series.
+    Missing values of series operands are replaced with fill_value scalar if it is given.
+    Returns float64 if numpy doesn't define op for the operands dtypes (or values, e.g. negative powers).
+    """
+    def as_operand(ty):
+        if isinstance(ty, types.IntegerLiteral):
+            return ty.literal_value
+
+        if isinstance(ty, types.Integer):
+            # value of integer scalar is unknown, so the extreme value of its type is used to promote
+            # integer series dtype to the one holding any scalar of this type, float series are not promoted
+            limits = numpy.iinfo(numpy_support.as_dtype(ty))
+            return int(limits.min if ty.signed else limits.max)
+
+        if isinstance(ty, (types.Number, types.Boolean)):
+            # python scalars don't take part in promotion of arrays of the same kind, as in pandas
+            return numpy_support.as_dtype(ty).type(1).item()
+
+        operand = numpy.ones(1, dtype=numpy_support.as_dtype(ty.dtype))
+        if fill_value is not None:
+            operand = operand.astype(numpy.result_type(operand, as_operand(fill_value)))
+
+        return operand
+
+    try:
+        with numpy.errstate(all='ignore'):
+            np_result_dtype = numpy.asarray(op(as_operand(left), as_operand(right))).dtype
+    except (TypeError, ValueError):
+        return types.float64
+
+    return numpy_support.from_dtype(np_result_dtype)
+
+
 def find_index_common_dtype(self, other):
     """Used to find common dtype for indexes of two series and verify if index dtypes are equal"""
 
@@ -167,6 +167,8 @@ ext_sort = Extension(name="sdc.concurrent_sort",
                      sources=[
                         "sdc/native/sort.cpp",
                         "sdc/native/stable_sort.cpp",
+                        "sdc/native/argsort.cpp",
+                        "sdc/native/radix_argsort.cpp",
                         "sdc/native/module.cpp",
                         "sdc/native/utils.cpp"],
                      extra_compile_args=eca,